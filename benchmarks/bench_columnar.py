@@ -0,0 +1,115 @@
+"""Benchmark the Python and NumPy backends of analyze_spans and classify.
+
+Generates synthetic span dictionaries in memory, then times
+``analyze_spans`` and ``FailureClassifier.classify`` with each backend
+(including the computation of every reported percentile), checks that the
+results are identical, and times the NumPy backend again with one shared
+``SpanColumns`` extraction::
+
+    python benchmarks/bench_columnar.py --spans 1000000
+
+Requires the ``columnar`` extra (numpy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from voiceobs.analyzer import analyze_spans
+from voiceobs.classifier import FailureClassifier
+from voiceobs.columnar import SpanColumns, analyze_columns, classify_columns
+
+
+def make_spans(count: int) -> list[dict]:
+    """Stage, turn and eval spans with some threshold breaches."""
+    rng = random.Random(1)
+    spans = []
+    for i in range(count):
+        conv_id = f"conv-{i // 200}"
+        kind = i % 8
+        if kind < 5:
+            stage = ("asr", "llm", "tts", "llm", "asr")[kind]
+            attrs: dict[str, Any] = {"voice.conversation.id": conv_id, "voice.stage.type": stage}
+            if stage == "asr":
+                attrs["voice.asr.confidence"] = rng.uniform(0.4, 1.0)
+            spans.append(
+                {
+                    "name": f"voice.{stage}",
+                    "duration_ms": rng.lognormvariate(6.5, 0.6),
+                    "attributes": attrs,
+                }
+            )
+        elif kind < 7:
+            spans.append(
+                {
+                    "name": "voice.turn",
+                    "duration_ms": 1000.0,
+                    "attributes": {
+                        "voice.conversation.id": conv_id,
+                        "voice.actor": "agent" if kind == 6 else "user",
+                        "voice.turn.index": i // 8,
+                        "voice.silence.after_user_ms": rng.uniform(100.0, 4000.0),
+                        "voice.turn.overlap_ms": rng.uniform(-500.0, 200.0),
+                    },
+                }
+            )
+        else:
+            spans.append(
+                {
+                    "name": "voiceobs.eval",
+                    "attributes": {
+                        "voice.conversation.id": conv_id,
+                        "eval.intent_correct": rng.random() < 0.9,
+                        "eval.relevance_score": rng.random(),
+                    },
+                }
+            )
+    return spans
+
+
+def timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    """Run fn and return its result and elapsed seconds."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    spans = make_spans(args.spans)
+    print(f"{args.spans} spans")
+
+    # to_dict() computes every percentile, so it is part of the measurement
+    py_analysis, py_analyze_s = timed(lambda: analyze_spans(spans).to_dict())
+    np_analysis, np_analyze_s = timed(lambda: analyze_spans(spans, backend="numpy").to_dict())
+    py_failures, py_classify_s = timed(lambda: FailureClassifier().classify(spans))
+    np_failures, np_classify_s = timed(lambda: FailureClassifier(backend="numpy").classify(spans))
+
+    assert np_analysis == py_analysis, "analysis results differ"
+    assert np_failures.failures == py_failures.failures, "failures differ"
+
+    def shared() -> None:
+        columns = SpanColumns.from_spans(spans)
+        analyze_columns(columns).to_dict()
+        classify_columns(columns)
+
+    _, shared_s = timed(shared)
+
+    print(f"  {py_failures.failure_count} failures, results identical")
+    print(f"  analyze   python: {py_analyze_s:6.2f}s  numpy: {np_analyze_s:6.2f}s")
+    print(f"  classify  python: {py_classify_s:6.2f}s  numpy: {np_classify_s:6.2f}s")
+    print(
+        f"  both      python: {py_analyze_s + py_classify_s:6.2f}s  "
+        f"numpy (shared columns): {shared_s:6.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
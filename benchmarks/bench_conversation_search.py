@@ -0,0 +1,235 @@
+"""Benchmark conversation search on summaries against the old span self-join.
+
+Seeds conversations with spans, turns and failures, then times one page of
+``ConversationRepository.search`` (served from ``conversation_summaries``)
+and the query it replaced, which joined ``spans`` to itself and grouped
+every conversation before sorting. The plan of the newest-page query is
+printed so index use can be checked.
+
+Requires a PostgreSQL database. The benchmark truncates ``conversations``,
+``spans``, ``turns`` and ``failures``, so point it at a scratch database::
+
+    VOICEOBS_DATABASE_URL=postgresql://localhost/voiceobs_bench \\
+        python benchmarks/bench_conversation_search.py --conversations 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories import ConversationRepository
+
+TRANSCRIPTS = [
+    "I would like to check my order status",
+    "Can you tell me when my package arrives",
+    "Sure, let me look that up for you",
+    "I need to change my delivery address",
+    "Thanks, that is all I needed",
+    "I want a refund for my last purchase",
+]
+
+# The search query before conversation_summaries, kept for comparison
+LEGACY_SEARCH = """
+SELECT
+    c.id,
+    c.conversation_id,
+    COUNT(DISTINCT s.id) as span_count,
+    COUNT(DISTINCT t.id) as turn_count,
+    EXISTS(SELECT 1 FROM failures f WHERE f.conversation_id = c.id) as has_failures,
+    MIN(span_times.start_time) as min_start_time,
+    AVG(span_times.duration_ms) as avg_latency
+FROM conversations c
+LEFT JOIN spans s ON s.conversation_id = c.id
+LEFT JOIN spans span_times ON span_times.conversation_id = c.id
+LEFT JOIN turns t ON t.conversation_id = c.id
+{where}
+GROUP BY c.id, c.conversation_id
+ORDER BY {order_by}
+LIMIT 50
+"""
+
+LEGACY_CONDITIONS = {
+    "query": """
+        (c.conversation_id ILIKE '%refund%'
+        OR EXISTS (
+            SELECT 1 FROM turns t
+            WHERE t.conversation_id = c.id
+            AND to_tsvector('english', COALESCE(t.transcript, ''))
+                @@ plainto_tsquery('english', 'refund')
+        ))
+    """,
+    "start_time": """
+        EXISTS (
+            SELECT 1 FROM spans s
+            WHERE s.conversation_id = c.id
+            AND s.start_time >= '{since}'
+        )
+    """,
+    "has_failures": "EXISTS (SELECT 1 FROM failures f WHERE f.conversation_id = c.id)",
+    "min_latency_ms": """
+        EXISTS (
+            SELECT 1 FROM spans s
+            WHERE s.conversation_id = c.id
+            AND s.duration_ms >= 1000
+        )
+    """,
+}
+
+
+async def seed(db: Database, conversations: int, spans: int, turns: int, days: int) -> None:
+    """Seed conversations spread over the last days.
+
+    Every conversation gets ``spans`` spans, the first ``turns`` of which are
+    turn spans with transcripts; one in twenty has a failure.
+    """
+    await db.execute("TRUNCATE failures, turns, spans, conversations CASCADE")
+    await db.execute(
+        """
+        INSERT INTO conversations (conversation_id, created_at)
+        SELECT 'bench-conv-' || g, NOW() - make_interval(secs => g * $2::float / $1)
+        FROM generate_series(1, $1) AS g
+        """,
+        conversations,
+        days * 86400,
+    )
+    await db.execute(
+        """
+        INSERT INTO spans (name, start_time, duration_ms, conversation_id)
+        SELECT
+            CASE WHEN k <= $2 THEN 'voice.turn' ELSE 'voice.llm' END,
+            c.created_at + make_interval(secs => k * 5),
+            20 + (hashtext(c.conversation_id || k) & 1023),
+            c.id
+        FROM conversations c, generate_series(1, $1) AS k
+        """,
+        spans,
+        turns,
+    )
+    await db.execute(
+        """
+        INSERT INTO turns (conversation_id, span_id, actor, turn_index, transcript)
+        SELECT
+            s.conversation_id,
+            s.id,
+            CASE WHEN n % 2 = 0 THEN 'user' ELSE 'agent' END,
+            n,
+            ($1::text[])[(hashtext(s.id::text) & 1023) % array_length($1::text[], 1) + 1]
+        FROM (
+            SELECT s.*, row_number() OVER (
+                PARTITION BY s.conversation_id ORDER BY s.start_time
+            ) AS n
+            FROM spans s
+            WHERE s.name = 'voice.turn'
+        ) s
+        """,
+        TRANSCRIPTS,
+    )
+    await db.execute(
+        """
+        INSERT INTO failures (conversation_id, failure_type, severity, message)
+        SELECT id, 'slow_response', 'high', 'Response exceeded threshold'
+        FROM conversations
+        WHERE hashtext(conversation_id) % 20 = 0
+        """
+    )
+    for table in ("conversations", "spans", "turns", "failures", "conversation_summaries"):
+        await db.execute(f"VACUUM ANALYZE {table}")
+
+
+async def timed(repeat: int, fn):
+    """Run an async callable repeat times and return seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=100_000)
+    parser.add_argument("--spans", type=int, default=10, help="Spans per conversation")
+    parser.add_argument("--turns", type=int, default=4, help="Turns per conversation")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the new queries")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("VOICEOBS_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("Set VOICEOBS_DATABASE_URL to a scratch PostgreSQL database")
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    await db.init_schema()
+    repo = ConversationRepository(db)
+
+    try:
+        if not args.skip_seed:
+            start = time.perf_counter()
+            await seed(db, args.conversations, args.spans, args.turns, args.days)
+            print(
+                f"seeded {args.conversations} conversations x {args.spans} spans "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+        print()
+
+        since = datetime.now(timezone.utc) - timedelta(days=1)
+        cases = [
+            ("newest page", {}, [], "MIN(span_times.start_time) DESC"),
+            ("slowest page", {"sort": "latency"}, [], "AVG(span_times.duration_ms) DESC"),
+            ("transcript query", {"query": "refund"}, ["query"], "c.created_at DESC"),
+            (
+                "last day",
+                {"start_time": since},
+                ["start_time"],
+                "MIN(span_times.start_time) DESC",
+            ),
+            (
+                "failed and slow",
+                {"has_failures": True, "min_latency_ms": 1000},
+                ["has_failures", "min_latency_ms"],
+                "MIN(span_times.start_time) DESC",
+            ),
+        ]
+        print(f"  {'query':18s} {'self-join':>11s} {'summaries':>11s} {'speedup':>8s}")
+        for label, filters, legacy_filters, legacy_order in cases:
+            new_s = await timed(args.repeat, lambda f=filters: repo.search(**f))
+            if args.skip_legacy:
+                print(f"  {label:18s} {'-':>11s} {new_s * 1000:9.1f}ms")
+                continue
+            conditions = [
+                LEGACY_CONDITIONS[name].format(since=since.isoformat()) for name in legacy_filters
+            ]
+            where = "WHERE " + " AND ".join(conditions) if conditions else ""
+            legacy_sql = LEGACY_SEARCH.format(where=where, order_by=legacy_order)
+            old_s = await timed(1, lambda sql=legacy_sql: db.fetch(sql))
+            print(
+                f"  {label:18s} {old_s * 1000:9.1f}ms {new_s * 1000:9.1f}ms {old_s / new_s:7.1f}x"
+            )
+
+        # Show that the default page is read from the start time index
+        plan = await db.fetch(
+            """
+            EXPLAIN SELECT c.id, c.conversation_id, cs.span_count
+            FROM conversation_summaries cs
+            JOIN conversations c ON c.id = cs.conversation_id
+            ORDER BY cs.first_start_time DESC, cs.conversation_id DESC
+            LIMIT 50
+            """
+        )
+        print()
+        print("newest page plan:")
+        for row in plan:
+            print(f"  {row[0]}")
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
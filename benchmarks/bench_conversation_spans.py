@@ -0,0 +1,116 @@
+"""Benchmark conversation-scoped span reads against full-table filtering.
+
+Compares the old ``/analyze/{conversation_id}`` and ``/conversations/{id}``
+read path (load every span with ``get_spans_as_dicts`` and filter in Python)
+with ``get_conversation_spans_as_dicts``, which filters in SQL through the
+``conversation_id`` foreign key.
+
+Requires a PostgreSQL database. The benchmark truncates ``spans`` and
+``conversations`` and seeds them server-side, so point it at a scratch
+database::
+
+    VOICEOBS_DATABASE_URL=postgresql://localhost/voiceobs_bench \\
+        python benchmarks/bench_conversation_spans.py --spans 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories import ConversationRepository, SpanRepository
+from voiceobs.server.dependencies import PostgresSpanStoreAdapter
+
+
+async def seed(db: Database, spans: int, spans_per_conversation: int) -> None:
+    """Seed conversations and spans with generate_series."""
+    conversations = max(1, spans // spans_per_conversation)
+    await db.execute("TRUNCATE spans, conversations CASCADE")
+    await db.execute(
+        """
+        INSERT INTO conversations (conversation_id)
+        SELECT 'bench-conv-' || g FROM generate_series(0, $1 - 1) AS g
+        """,
+        conversations,
+    )
+    await db.execute(
+        """
+        INSERT INTO spans (name, duration_ms, attributes, conversation_id, created_at)
+        SELECT
+            (ARRAY['voice.asr', 'voice.llm', 'voice.tts', 'voice.turn'])[g % 4 + 1],
+            100 + (g % 250),
+            jsonb_build_object(
+                'voice.conversation.id', 'bench-conv-' || (g % $2),
+                'voice.stage.type', (ARRAY['asr', 'llm', 'tts', 'turn'])[g % 4 + 1],
+                'voice.actor', CASE WHEN g % 2 = 0 THEN 'user' ELSE 'agent' END
+            ),
+            c.id,
+            NOW() - (g || ' milliseconds')::interval
+        FROM generate_series(0, $1 - 1) AS g
+        JOIN conversations c ON c.conversation_id = 'bench-conv-' || (g % $2)
+        """,
+        spans,
+        conversations,
+    )
+    await db.execute("ANALYZE spans")
+    await db.execute("ANALYZE conversations")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    parser.add_argument("--spans-per-conversation", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("VOICEOBS_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("Set VOICEOBS_DATABASE_URL to a scratch PostgreSQL database")
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    await db.init_schema()
+    storage = PostgresSpanStoreAdapter(
+        span_repo=SpanRepository(db),
+        conversation_repo=ConversationRepository(db),
+    )
+
+    try:
+        if not args.skip_seed:
+            start = time.perf_counter()
+            await seed(db, args.spans, args.spans_per_conversation)
+            print(f"seeded {args.spans} spans in {time.perf_counter() - start:.1f}s")
+
+        conversation_id = "bench-conv-7"
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            all_spans = await storage.get_spans_as_dicts()
+            expected = [
+                span
+                for span in all_spans
+                if span.get("attributes", {}).get("voice.conversation.id") == conversation_id
+            ]
+        full_scan = (time.perf_counter() - start) / args.repeat
+        del all_spans
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            scoped = await storage.get_conversation_spans_as_dicts(conversation_id)
+        pushed_down = (time.perf_counter() - start) / args.repeat
+
+        assert len(scoped) == len(expected), (len(scoped), len(expected))
+        print(f"{len(scoped)} spans in conversation {conversation_id!r}")
+        print(f"  full scan + filter: {full_scan * 1000:10.1f} ms/request")
+        print(f"  conversation query: {pushed_down * 1000:10.1f} ms/request")
+        print(f"  speedup:            {full_scan / pushed_down:10.0f}x")
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Benchmark span ingestion: per-span inserts vs. the bulk COPY path.
+
+Compares ``PostgresSpanStoreAdapter.add_span`` called once per span (the
+original ``POST /ingest`` behaviour) with ``PostgresSpanStoreAdapter.add_spans``
+(one conversation upsert plus one COPY per batch).
+
+Requires a PostgreSQL database. The benchmark creates the schema if needed and
+clears the ``spans`` and ``conversations`` tables between runs, so point it at a
+scratch database::
+
+    VOICEOBS_DATABASE_URL=postgresql://localhost/voiceobs_bench \\
+        python benchmarks/bench_ingest.py --batch-size 500 --batches 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories import ConversationRepository, SpanRepository
+from voiceobs.server.dependencies import PostgresSpanStoreAdapter
+
+
+def make_batch(batch_num: int, batch_size: int, spans_per_conversation: int) -> list[dict]:
+    """Build one batch of synthetic voice spans."""
+    stages = ("voice.asr", "voice.llm", "voice.tts", "voice.turn")
+    spans: list[dict[str, Any]] = []
+    for i in range(batch_size):
+        conv_num = (batch_num * batch_size + i) // spans_per_conversation
+        spans.append(
+            {
+                "name": stages[i % len(stages)],
+                "start_time": "2024-01-15T10:00:00+00:00",
+                "end_time": "2024-01-15T10:00:00.250000+00:00",
+                "duration_ms": 100.0 + (i % 250),
+                "attributes": {
+                    "voice.conversation.id": f"bench-conv-{conv_num}",
+                    "voice.stage.type": stages[i % len(stages)].split(".")[1],
+                    "voice.turn.index": i % 20,
+                },
+                "trace_id": f"{batch_num:016x}{i:016x}",
+                "span_id": f"{i:016x}",
+            }
+        )
+    return spans
+
+
+async def reset(db: Database) -> None:
+    """Remove data written by a previous run."""
+    await db.execute("TRUNCATE spans, conversations CASCADE")
+
+
+async def run_per_span(adapter: PostgresSpanStoreAdapter, batches: list[list[dict]]) -> float:
+    """Ingest every span with its own round trips."""
+    start = time.perf_counter()
+    for batch in batches:
+        for span in batch:
+            await adapter.add_span(**span)
+    return time.perf_counter() - start
+
+
+async def run_bulk(adapter: PostgresSpanStoreAdapter, batches: list[list[dict]]) -> float:
+    """Ingest each batch through the bulk path."""
+    start = time.perf_counter()
+    for batch in batches:
+        await adapter.add_spans(batch)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--spans-per-conversation", type=int, default=50)
+    args = parser.parse_args()
+
+    database_url = os.environ.get("VOICEOBS_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("Set VOICEOBS_DATABASE_URL to a scratch PostgreSQL database")
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    await db.init_schema()
+    adapter = PostgresSpanStoreAdapter(
+        span_repo=SpanRepository(db),
+        conversation_repo=ConversationRepository(db),
+    )
+
+    batches = [
+        make_batch(n, args.batch_size, args.spans_per_conversation) for n in range(args.batches)
+    ]
+    total = args.batch_size * args.batches
+
+    try:
+        print(f"{total} spans in {args.batches} batches of {args.batch_size}")
+        for label, runner in (("per-span", run_per_span), ("bulk", run_bulk)):
+            await reset(db)
+            elapsed = await runner(adapter, batches)
+            stored = await db.fetchval("SELECT COUNT(*) FROM spans")
+            assert stored == total, f"{label}: expected {total} spans, found {stored}"
+            print(f"{label:>10}: {elapsed:8.3f}s  {total / elapsed:10.0f} spans/s")
+        await reset(db)
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
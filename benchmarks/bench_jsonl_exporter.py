@@ -0,0 +1,92 @@
+"""Benchmark JSONL span export throughput.
+
+Compares the previous exporter behaviour (reopen the file and write each span
+separately on every export) with ``JSONLSpanExporter``'s persistent buffered
+writer, with and without a flush interval and compression::
+
+    python benchmarks/bench_jsonl_exporter.py --spans 50000 --batch-size 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from voiceobs.exporters import JSONLSpanExporter
+
+
+class ReopeningJSONLExporter(JSONLSpanExporter):
+    """The old export path: open in append mode and write span by span."""
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with self._lock:
+            with open(self._file_path, "a") as f:
+                for span in spans:
+                    f.write(json.dumps(self._span_to_dict(span)) + "\n")
+        return SpanExportResult.SUCCESS
+
+
+def make_spans(count: int) -> list[ReadableSpan]:
+    """Create finished spans with typical voice attributes."""
+    tracer = TracerProvider().get_tracer("bench")
+    spans = []
+    for i in range(count):
+        span = tracer.start_span("voice.turn")
+        span.set_attribute("voice.actor", "agent" if i % 2 else "user")
+        span.set_attribute("voice.conversation.id", f"conv-{i // 50}")
+        span.set_attribute("voice.turn.index", i)
+        span.end()
+        spans.append(span)
+    return spans
+
+
+def measure(exporter: SpanExporter, spans: list[ReadableSpan], batch_size: int) -> float:
+    """Export all spans in batches and return spans per second."""
+    start = time.perf_counter()
+    for i in range(0, len(spans), batch_size):
+        exporter.export(spans[i : i + batch_size])
+    exporter.shutdown()
+    return len(spans) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=1)
+    args = parser.parse_args()
+
+    spans = make_spans(args.spans)
+    print(f"{args.spans} spans, {args.batch_size} per export")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        cases = [
+            ("reopen per export", ReopeningJSONLExporter(str(path / "old.jsonl"))),
+            ("persistent, flush each", JSONLSpanExporter(str(path / "a.jsonl"))),
+            (
+                "persistent, 1s interval",
+                JSONLSpanExporter(str(path / "b.jsonl"), flush_interval_ms=1000),
+            ),
+            (
+                "gzip, 1s interval",
+                JSONLSpanExporter(
+                    str(path / "c.jsonl.gz"), flush_interval_ms=1000, compression="gzip"
+                ),
+            ),
+        ]
+        baseline = None
+        for label, exporter in cases:
+            rate = measure(exporter, spans, args.batch_size)
+            baseline = baseline or rate
+            print(f"  {label:24s} {rate:10.0f} spans/s  ({rate / baseline:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark dashboard metrics queries with and without rollups.
+
+Seeds spans spread over several days, refreshes the rollups, then times
+``get_latency_breakdown``, ``get_trends`` and ``get_conversation_volume``
+on a plain ``MetricsRepository`` and on one backed by
+``MetricsRollupRepository``.
+
+Requires a PostgreSQL database. The benchmark truncates ``spans``,
+``conversations`` and the rollup tables, so point it at a scratch database::
+
+    VOICEOBS_DATABASE_URL=postgresql://localhost/voiceobs_bench \\
+        python benchmarks/bench_metrics_rollups.py --spans 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories import MetricsRepository, MetricsRollupRepository
+
+
+async def seed(db: Database, spans: int, days: int) -> None:
+    """Seed spans and conversations spread evenly over the last days.
+
+    Rows are created at their start time, as if they had been ingested live.
+    """
+    await db.execute(
+        "TRUNCATE failures, turns, spans, conversations, "
+        "span_rollups, event_rollups, rollup_watermarks CASCADE"
+    )
+    await db.execute(
+        """
+        INSERT INTO spans (name, start_time, duration_ms, attributes, created_at)
+        SELECT
+            'voice.stage',
+            t,
+            20 + (g::bigint * 7919 % 1000),
+            jsonb_build_object('voice.stage.type', (ARRAY['asr', 'llm', 'tts'])[g % 3 + 1]),
+            t
+        FROM generate_series(1, $1) AS g,
+        LATERAL (SELECT NOW() - make_interval(secs => g * $2::float / $1) AS t) times
+        """,
+        spans,
+        days * 86400,
+    )
+    await db.execute(
+        """
+        INSERT INTO conversations (conversation_id, created_at)
+        SELECT 'bench-conv-' || g, NOW() - make_interval(secs => g * $2::float / $1)
+        FROM generate_series(1, $1) AS g
+        """,
+        spans // 20,
+        days * 86400,
+    )
+    for table in ("spans", "conversations"):
+        await db.execute(f"ANALYZE {table}")
+
+
+async def timed(repeat: int, fn):
+    """Run an async callable repeat times and return seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("VOICEOBS_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("Set VOICEOBS_DATABASE_URL to a scratch PostgreSQL database")
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    await db.init_schema()
+    rollups = MetricsRollupRepository(db)
+    raw = MetricsRepository(db)
+    rolled = MetricsRepository(db, rollups=rollups)
+
+    try:
+        if not args.skip_seed:
+            start = time.perf_counter()
+            await seed(db, args.spans, args.days)
+            print(f"seeded {args.spans} spans in {time.perf_counter() - start:.1f}s")
+
+            start = time.perf_counter()
+            await rollups.refresh(full=True)
+            print(f"full rollup refresh:       {time.perf_counter() - start:8.2f}s")
+
+        # One minute of live traffic, then an incremental refresh
+        await db.execute(
+            """
+            INSERT INTO spans (name, start_time, duration_ms, attributes)
+            SELECT 'voice.stage', NOW() - make_interval(secs => g % 60), 20 + g % 1000,
+                   '{"voice.stage.type": "llm"}'::jsonb
+            FROM generate_series(1, $1) AS g
+            """,
+            max(1, args.spans // (args.days * 1440)),
+        )
+        start = time.perf_counter()
+        await rollups.refresh()
+        print(f"incremental refresh:       {(time.perf_counter() - start) * 1000:8.1f} ms")
+        print()
+
+        since = datetime.now(timezone.utc) - timedelta(days=args.days - 1, minutes=17)
+        cases = [
+            ("latency breakdown", lambda repo: repo.get_latency_breakdown()),
+            (
+                "latency breakdown, range",
+                lambda repo: repo.get_latency_breakdown(start_time=since),
+            ),
+            ("latency trend 1h", lambda repo: repo.get_trends("latency", "1h")),
+            ("conversation trend 1d", lambda repo: repo.get_trends("conversations", "1d")),
+            ("conversation volume", lambda repo: repo.get_conversation_volume("hour")),
+        ]
+        print(f"  {'query':26s} {'raw':>10s} {'rollups':>10s} {'speedup':>8s}")
+        for label, query in cases:
+            raw_s = await timed(args.repeat, lambda q=query: q(raw))
+            rolled_s = await timed(args.repeat, lambda q=query: q(rolled))
+            print(
+                f"  {label:26s} {raw_s * 1000:8.1f}ms {rolled_s * 1000:8.1f}ms "
+                f"{raw_s / rolled_s:7.1f}x"
+            )
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
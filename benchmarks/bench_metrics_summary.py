@@ -0,0 +1,185 @@
+"""Benchmark the metrics summary query against the previous fan-out join.
+
+Seeds conversations with spans, turns and failures, then times the old
+``conversations LEFT JOIN spans LEFT JOIN turns LEFT JOIN failures`` query
+and ``MetricsRepository.get_summary``. Both are checked against exact
+values computed directly from the spans, turns and failures tables.
+
+Requires a PostgreSQL database. The benchmark truncates ``failures``,
+``turns``, ``spans`` and ``conversations``, so point it at a scratch
+database::
+
+    VOICEOBS_DATABASE_URL=postgresql://localhost/voiceobs_bench \\
+        python benchmarks/bench_metrics_summary.py --conversations 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import time
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories import MetricsRepository
+
+OLD_QUERY = """
+SELECT
+    COUNT(DISTINCT c.id) as total_conversations,
+    COUNT(DISTINCT t.id) as total_turns,
+    SUM(COALESCE(s.duration_ms, 0)) as total_duration_ms,
+    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY s.duration_ms) as p50_latency,
+    PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY s.duration_ms) as p95_latency,
+    PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY s.duration_ms) as p99_latency,
+    COUNT(DISTINCT f.id) as total_failures
+FROM conversations c
+LEFT JOIN spans s ON s.conversation_id = c.id
+LEFT JOIN turns t ON t.conversation_id = c.id
+LEFT JOIN failures f ON f.conversation_id = c.id
+"""
+
+EXACT_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM conversations) as total_conversations,
+    (SELECT COUNT(*) FROM turns) as total_turns,
+    SUM(duration_ms) as total_duration_ms,
+    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY duration_ms) as p50_latency,
+    PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY duration_ms) as p95_latency,
+    PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY duration_ms) as p99_latency,
+    (SELECT COUNT(*) FROM failures) as total_failures
+FROM spans
+"""
+
+
+async def seed(
+    db: Database, conversations: int, spans_per: int, turns_per: int, failures_per: int
+) -> None:
+    """Seed conversations, spans, turns and failures with generate_series.
+
+    Conversations with more turns get slower spans, so the fan-out join
+    over-weights slow conversations and skews the percentiles.
+    """
+    await db.execute("TRUNCATE failures, turns, spans, conversations CASCADE")
+    await db.execute(
+        """
+        INSERT INTO conversations (conversation_id)
+        SELECT 'bench-conv-' || g FROM generate_series(0, $1 - 1) AS g
+        """,
+        conversations,
+    )
+    await db.execute(
+        """
+        INSERT INTO spans (name, start_time, duration_ms, attributes, conversation_id)
+        SELECT
+            'voice.llm',
+            NOW() - (g || ' seconds')::interval,
+            50 + (g % 100) * (1 + (c.n % 4)) * 5,
+            '{"voice.stage.type": "llm"}'::jsonb,
+            c.id
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY conversation_id) AS n FROM conversations
+        ) c
+        CROSS JOIN generate_series(0, $1 - 1) AS g
+        """,
+        spans_per,
+    )
+    await db.execute(
+        """
+        INSERT INTO turns (conversation_id, span_id, actor, turn_index)
+        SELECT c.id, s.id, 'agent', g
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY conversation_id) AS n FROM conversations
+        ) c
+        JOIN LATERAL (
+            SELECT id FROM spans WHERE conversation_id = c.id LIMIT 1
+        ) s ON TRUE
+        CROSS JOIN generate_series(0, $1 * (1 + c.n % 4) / 2 - 1) AS g
+        """,
+        turns_per,
+    )
+    await db.execute(
+        """
+        INSERT INTO failures (failure_type, severity, message, conversation_id)
+        SELECT 'slow_response', 'medium', 'slow', c.id
+        FROM conversations c
+        CROSS JOIN generate_series(1, $1) AS g
+        """,
+        failures_per,
+    )
+    for table in ("conversations", "spans", "turns", "failures"):
+        await db.execute(f"ANALYZE {table}")
+
+
+async def timed(repeat: int, fn):
+    """Run an async callable repeat times and return (result, seconds per call)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = await fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=10_000)
+    parser.add_argument("--spans-per-conversation", type=int, default=20)
+    parser.add_argument("--turns-per-conversation", type=int, default=8)
+    parser.add_argument("--failures-per-conversation", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("VOICEOBS_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("Set VOICEOBS_DATABASE_URL to a scratch PostgreSQL database")
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    await db.init_schema()
+    repo = MetricsRepository(db)
+
+    try:
+        if not args.skip_seed:
+            start = time.perf_counter()
+            await seed(
+                db,
+                args.conversations,
+                args.spans_per_conversation,
+                args.turns_per_conversation,
+                args.failures_per_conversation,
+            )
+            print(
+                f"seeded {args.conversations} conversations in {time.perf_counter() - start:.1f}s"
+            )
+
+        exact = await db.fetchrow(EXACT_QUERY)
+        old, old_s = await timed(args.repeat, lambda: db.fetchrow(OLD_QUERY))
+        new, new_s = await timed(args.repeat, repo.get_summary)
+
+        print(f"  fan-out join:          {old_s * 1000:10.1f} ms")
+        print(f"  independent aggregates:{new_s * 1000:10.1f} ms")
+        print(f"  speedup:               {old_s / new_s:10.1f}x")
+        print()
+        print(f"  {'metric':20s} {'exact':>14s} {'fan-out':>14s} {'get_summary':>14s}")
+        pairs = [
+            ("total_turns", "total_turns"),
+            ("total_failures", "total_failures"),
+            ("total_duration_ms", "total_duration_ms"),
+            ("p50_latency", "avg_latency_p50_ms"),
+            ("p95_latency", "avg_latency_p95_ms"),
+            ("p99_latency", "avg_latency_p99_ms"),
+        ]
+        for column, key in pairs:
+            expected = float(exact[column])
+            print(
+                f"  {column:20s} {expected:14.1f} {float(old[column]):14.1f} "
+                f"{float(new[key]):14.1f}"
+            )
+            assert math.isclose(float(new[key]), expected, rel_tol=1e-9), column
+        print("get_summary matches the exact values")
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
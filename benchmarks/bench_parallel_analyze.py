@@ -0,0 +1,64 @@
+"""Benchmark multi-file trace analysis across worker process counts.
+
+Writes a directory of synthetic JSONL trace files (one per worker per hour,
+as the JSONL exporter produces in production), then times
+``analyze_files`` with 1, 2, 4, ... workers up to the CPU count and reports
+the speedup over a single process::
+
+    python benchmarks/bench_parallel_analyze.py --files 16 --spans-per-file 250000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from bench_streaming_analyze import write_trace
+
+from voiceobs.analyzer import analyze_files
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """Powers of two up to max_workers, plus max_workers itself."""
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--spans-per-file", type=int, default=250_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--exact", action="store_true", help="Keep every sample (no sketches)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = Path(tmp) / f"worker-{i:02d}.jsonl"
+            write_trace(path, args.spans_per_file)
+            paths.append(path)
+        size_mb = sum(p.stat().st_size for p in paths) / 1e6
+        print(f"{args.files} files x {args.spans_per_file} spans, {size_mb:.0f} MB JSONL")
+
+        baseline = None
+        print(f"  {'workers':>7s} {'time':>8s} {'speedup':>8s}")
+        for workers in worker_counts(args.max_workers):
+            start = time.perf_counter()
+            result = analyze_files(paths, streaming=not args.exact, workers=workers)
+            result.to_dict()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {workers:7d} {elapsed:7.2f}s {baseline / elapsed:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark report generation: separate passes vs. the single-pass pipeline.
+
+Writes a synthetic JSONL trace file, then builds the report data two ways:
+
+* two passes, as ``generate_report_from_file`` used to: ``analyze_spans`` over
+  the parsed file, then ``classify_file`` (which parses it again);
+* one pass with ``build_report_data(iter_jsonl(path))``, which streams spans
+  through the analyzer, classifier and a metric plugin together.
+
+Both include rendering the markdown report::
+
+    python benchmarks/bench_report.py --spans 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from voiceobs.analyzer import analyze_spans, iter_jsonl, parse_jsonl
+from voiceobs.classifier import classify_file
+from voiceobs.pipeline import MetricPlugin, NormalizedSpan
+from voiceobs.report import ReportData, build_report_data, generate_markdown_report
+
+
+class SlowTurns(MetricPlugin):
+    """Example plugin: agent turns longer than five seconds."""
+
+    name = "slow_turns"
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def visit(self, span: NormalizedSpan) -> None:
+        if span.kind == "turn" and (span.duration_ms or 0) > 5000:
+            self.count += 1
+
+    def result(self) -> dict[str, Any]:
+        return {"count": self.count}
+
+
+def write_trace(path: Path, spans: int) -> None:
+    """Write a synthetic trace with stage, turn and eval spans."""
+    rng = random.Random(1)
+    with path.open("w") as f:
+        for i in range(spans):
+            attrs: dict[str, Any] = {
+                "voice.conversation.id": f"conv-{i // 200}",
+                "voice.turn.id": f"turn-{i // 8}",
+                "voice.turn.index": i // 8 % 25,
+            }
+            kind = i % 8
+            if kind < 5:
+                stage = ("asr", "llm", "tts", "llm", "asr")[kind]
+                attrs["voice.stage.type"] = stage
+                if stage == "asr":
+                    attrs["voice.asr.confidence"] = rng.uniform(0.4, 1.0)
+                span = {
+                    "name": f"voice.{stage}",
+                    "duration_ms": rng.lognormvariate(6.5, 0.6),
+                    "attributes": attrs,
+                }
+            elif kind < 7:
+                attrs["voice.actor"] = "agent" if kind == 6 else "user"
+                attrs["voice.silence.after_user_ms"] = rng.uniform(100.0, 4000.0)
+                attrs["voice.turn.overlap_ms"] = rng.uniform(-500.0, 200.0)
+                span = {
+                    "name": "voice.turn",
+                    "duration_ms": rng.uniform(500.0, 8000.0),
+                    "attributes": attrs,
+                }
+            else:
+                attrs["eval.intent_correct"] = rng.random() < 0.9
+                attrs["eval.relevance_score"] = rng.random()
+                span = {"name": "voiceobs.eval", "attributes": attrs}
+            f.write(json.dumps(span) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "trace.jsonl"
+        write_trace(path, args.spans)
+        size_mb = path.stat().st_size / 1e6
+        print(f"{args.spans} spans, {size_mb:.0f} MB JSONL")
+
+        start = time.perf_counter()
+        separate = ReportData(
+            analysis=analyze_spans(parse_jsonl(path)), failures=classify_file(path)
+        )
+        separate_report = generate_markdown_report(separate)
+        separate_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fused = build_report_data(iter_jsonl(path), plugins=[SlowTurns()])
+        fused.custom_metrics = {}
+        fused_report = generate_markdown_report(fused)
+        fused_s = time.perf_counter() - start
+
+    assert fused_report == separate_report, "reports differ"
+    print(f"  {separate.failures.failure_count} failures, reports identical")
+    print(f"  separate passes: {separate_s:6.2f}s")
+    print(f"  single pass:     {fused_s:6.2f}s  ({separate_s / fused_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark S3Storage throughput under concurrent uploads and ranged reads.
+
+Runs a mix of concurrent ``save`` calls and ``iter_range`` reads, similar to
+preview-audio generation and playback, against an S3-compatible endpoint.
+The same workload is run with ``S3Storage``'s dedicated pool and with every
+call sent through the event loop's default executor, as before. Meanwhile
+unrelated ``run_in_executor(None, ...)`` work is timed to show how much the
+default executor is held up.
+
+By default a moto server is started in-process (``pip install 'moto[server]'``)::
+
+    python benchmarks/bench_s3_storage.py --requests 500 --concurrency 64
+
+Or point it at MinIO or another S3-compatible endpoint::
+
+    python benchmarks/bench_s3_storage.py --endpoint-url http://localhost:9000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from voiceobs.server.storage import S3Storage
+
+BUCKET = "voiceobs-bench"
+
+
+class DefaultExecutorS3Storage(S3Storage):
+    """S3Storage that sends every call through the loop's default executor."""
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: func(*args))
+
+
+async def probe_default_executor(stop: asyncio.Event, latencies: list[float]) -> None:
+    """Time trivial jobs on the default executor until stopped."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = time.perf_counter()
+        await loop.run_in_executor(None, lambda: None)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def run_workload(
+    storage: S3Storage, requests: int, concurrency: int, audio: bytes
+) -> tuple[float, float]:
+    """Run the mixed workload and return (seconds, p99 default-executor wait)."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            if i % 2 == 0:
+                await storage.save(audio, f"bench-{i}")
+            else:
+                key = f"bench-{i - 1}" if i > 1 else "bench-seed"
+                async for _ in storage.iter_range(key, 0, min(len(audio), 256 * 1024) - 1):
+                    pass
+
+    await storage.save(audio, "bench-seed")
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    probe = asyncio.create_task(probe_default_executor(stop, latencies))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    return elapsed, p99
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoint-url", default=os.environ.get("VOICEOBS_AUDIO_S3_ENDPOINT_URL"))
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument("--size-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    server = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        from moto.server import ThreadedMotoServer
+
+        server = ThreadedMotoServer(port=0)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint_url = f"http://{host}:{port}"
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    audio = os.urandom(args.size_kb * 1024)
+    try:
+        results = {}
+        for label, cls in (
+            ("default executor", DefaultExecutorS3Storage),
+            ("dedicated pool", S3Storage),
+        ):
+            storage = cls(
+                bucket_name=BUCKET,
+                endpoint_url=endpoint_url,
+                max_concurrency=args.max_concurrency,
+            )
+            try:
+                storage.s3_client.create_bucket(Bucket=BUCKET)
+            except Exception:
+                pass  # Already created by the previous run
+            try:
+                results[label] = await run_workload(storage, args.requests, args.concurrency, audio)
+            finally:
+                storage.close()
+
+        print(f"{args.requests} requests of {args.size_kb} KiB, {args.concurrency} in flight")
+        for label, (elapsed, p99) in results.items():
+            print(
+                f"  {label:16s} {args.requests / elapsed:8.1f} req/s"
+                f"  default-executor p99 wait {p99 * 1000:8.1f} ms"
+            )
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Benchmark peak memory of list-based vs. streaming trace analysis.
+
+Writes a synthetic JSONL trace file, then analyzes it with
+``analyze_file(path)`` (parse everything, exact percentiles) and
+``analyze_file(path, streaming=True)`` (lazy parsing, quantile sketches),
+reporting wall time, peak traced memory and the largest percentile error::
+
+    python benchmarks/bench_streaming_analyze.py --spans 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from voiceobs.analyzer import AnalysisResult, analyze_file
+
+
+def write_trace(path: Path, spans: int) -> None:
+    """Write a synthetic trace file with stage and turn spans."""
+    rng = random.Random(1)
+    with path.open("w") as f:
+        for i in range(spans):
+            if i % 4 == 3:
+                span = {
+                    "name": "voice.turn",
+                    "duration_ms": 1000.0,
+                    "attributes": {
+                        "voice.actor": "agent",
+                        "voice.conversation.id": f"conv-{i // 200}",
+                        "voice.silence.after_user_ms": rng.uniform(100.0, 3000.0),
+                    },
+                }
+            else:
+                stage = ("asr", "llm", "tts")[i % 4]
+                span = {
+                    "name": f"voice.{stage}",
+                    "duration_ms": rng.lognormvariate(5.0, 0.8),
+                    "attributes": {
+                        "voice.conversation.id": f"conv-{i // 200}",
+                        "voice.stage.type": stage,
+                    },
+                }
+            f.write(json.dumps(span) + "\n")
+
+
+def measure(path: Path, streaming: bool) -> tuple[AnalysisResult, float, int]:
+    """Analyze a file and return the result, elapsed seconds and peak bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = analyze_file(path, streaming=streaming)
+    # Percentiles are computed lazily; include them in the measurement
+    result.to_dict()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "trace.jsonl"
+        write_trace(path, args.spans)
+        size_mb = path.stat().st_size / 1e6
+        print(f"{args.spans} spans, {size_mb:.0f} MB JSONL")
+
+        exact, exact_s, exact_peak = measure(path, streaming=False)
+        streamed, stream_s, stream_peak = measure(path, streaming=True)
+
+    print(f"  list-based: {exact_s:6.2f}s  peak {exact_peak / 1e6:8.1f} MB")
+    print(f"  streaming:  {stream_s:6.2f}s  peak {stream_peak / 1e6:8.1f} MB")
+
+    worst = 0.0
+    pairs = [
+        (exact.asr_metrics.p95_ms, streamed.asr_metrics.p95_ms),
+        (exact.asr_metrics.p99_ms, streamed.asr_metrics.p99_ms),
+        (exact.llm_metrics.p95_ms, streamed.llm_metrics.p95_ms),
+        (exact.llm_metrics.p99_ms, streamed.llm_metrics.p99_ms),
+        (exact.tts_metrics.p95_ms, streamed.tts_metrics.p95_ms),
+        (exact.tts_metrics.p99_ms, streamed.tts_metrics.p99_ms),
+        (exact.turn_metrics.silence_p95_ms, streamed.turn_metrics.silence_p95_ms),
+    ]
+    for exact_value, estimate in pairs:
+        assert exact_value is not None and estimate is not None
+        worst = max(worst, abs(estimate - exact_value) / exact_value)
+    print(f"  worst p95/p99 relative error: {worst:.4%}")
+
+
+if __name__ == "__main__":
+    main()
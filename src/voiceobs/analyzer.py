@@ -3,32 +3,129 @@
 This module provides functions to parse JSONL span data and compute
 observability metrics like latency percentiles, silence duration, and
 interruption rates.
+
+Two modes are available. ``analyze_spans`` keeps every sample in memory and
+computes exact percentiles. ``analyze_stream`` consumes spans from any iterable
+(for example ``iter_jsonl``) and keeps quantile sketches instead, so memory
+stays bounded no matter how large the trace file is.
+
+``analyze_files`` analyzes many trace files (one per worker per hour, say) in
+parallel processes. Each file yields a partial ``AnalysisResult`` and the
+partials are folded together with ``AnalysisResult.merge``.
+
+``analyze_file`` reads from a file's index (``voiceobs.tracestore``) instead
+of parsing it when an up-to-date one exists.
+
+Trace files ending in ``.gz`` or ``.zst`` (as written by ``JSONLSpanExporter``
+with compression) are decompressed while they are read.
 """
 
 from __future__ import annotations
 
+import glob
+import gzip
+import io
 import json
+import os
 import statistics
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import TextIO
+from typing import IO, Literal, TextIO
+
+from voiceobs.sketch import DEFAULT_RELATIVE_ACCURACY, QuantileSketch
+
+Backend = Literal["python", "numpy"]
+"""Implementation used by analyze_spans and FailureClassifier.
+
+"numpy" selects the columnar backend in ``voiceobs.columnar`` (requires the
+``columnar`` extra); results are the same as with "python".
+"""
+
+
+def _percentile(values: list[float], sketch: QuantileSketch | None, q: float) -> float | None:
+    """Percentile from a sketch if present, otherwise from the raw values.
+
+    With fewer than two samples the mean is returned, matching the historic
+    behaviour of the list-based metrics.
+    """
+    if sketch is not None:
+        if sketch.count < 2:
+            return sketch.mean
+        return sketch.quantile(q)
+    if len(values) < 2:
+        return statistics.mean(values) if values else None
+    sorted_values = sorted(values)
+    index = int(len(sorted_values) * q)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def _merge_samples(
+    values: list[float],
+    sketch: QuantileSketch | None,
+    other_values: list[float],
+    other_sketch: QuantileSketch | None,
+) -> QuantileSketch | None:
+    """Fold another metric's samples into ``values``/``sketch``.
+
+    Raw values are extended in place. If either side is sketch-backed the
+    result is a sketch: raw values are moved into it and ``values`` is
+    cleared.
+
+    Returns:
+        The sketch that now holds the samples, or None if both sides are
+        list-based.
+    """
+    if sketch is None and other_sketch is None:
+        values.extend(other_values)
+        return None
+    if sketch is None:
+        assert other_sketch is not None
+        sketch = QuantileSketch(relative_accuracy=other_sketch.relative_accuracy)
+    for value in values:
+        sketch.add(value)
+    values.clear()
+    if other_sketch is not None:
+        sketch.merge(other_sketch)
+    for value in other_values:
+        sketch.add(value)
+    return sketch
 
 
 @dataclass
 class StageMetrics:
-    """Metrics for a stage type (ASR, LLM, TTS)."""
+    """Metrics for a stage type (ASR, LLM, TTS).
+
+    By default every duration is kept in ``durations_ms`` and percentiles are
+    exact. When ``sketch`` is set, durations are added to the sketch instead
+    and percentiles are estimates within the sketch's relative accuracy.
+    """
 
     stage_type: str
     durations_ms: list[float] = field(default_factory=list)
+    sketch: QuantileSketch | None = None
+
+    def add(self, duration_ms: float) -> None:
+        """Record a stage duration."""
+        if self.sketch is not None:
+            self.sketch.add(duration_ms)
+        else:
+            self.durations_ms.append(duration_ms)
 
     @property
     def count(self) -> int:
         """Number of spans for this stage."""
+        if self.sketch is not None:
+            return self.sketch.count
         return len(self.durations_ms)
 
     @property
     def mean_ms(self) -> float | None:
         """Mean duration in milliseconds."""
+        if self.sketch is not None:
+            return self.sketch.mean
         if not self.durations_ms:
             return None
         return statistics.mean(self.durations_ms)
@@ -36,6 +133,8 @@ class StageMetrics:
     @property
     def p50_ms(self) -> float | None:
         """Median (p50) duration in milliseconds."""
+        if self.sketch is not None:
+            return self.sketch.quantile(0.5)
         if not self.durations_ms:
             return None
         return statistics.median(self.durations_ms)
@@ -43,20 +142,18 @@ class StageMetrics:
     @property
     def p95_ms(self) -> float | None:
         """95th percentile duration in milliseconds."""
-        if len(self.durations_ms) < 2:
-            return self.mean_ms
-        sorted_durations = sorted(self.durations_ms)
-        index = int(len(sorted_durations) * 0.95)
-        return sorted_durations[min(index, len(sorted_durations) - 1)]
+        return _percentile(self.durations_ms, self.sketch, 0.95)
 
     @property
     def p99_ms(self) -> float | None:
         """99th percentile duration in milliseconds."""
-        if len(self.durations_ms) < 2:
-            return self.mean_ms
-        sorted_durations = sorted(self.durations_ms)
-        index = int(len(sorted_durations) * 0.99)
-        return sorted_durations[min(index, len(sorted_durations) - 1)]
+        return _percentile(self.durations_ms, self.sketch, 0.99)
+
+    def merge(self, other: StageMetrics) -> None:
+        """Fold another stage's samples into this one."""
+        self.sketch = _merge_samples(
+            self.durations_ms, self.sketch, other.durations_ms, other.sketch
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -72,16 +169,45 @@ class StageMetrics:
 
 @dataclass
 class TurnMetrics:
-    """Metrics for turn-level timing."""
+    """Metrics for turn-level timing.
+
+    Like StageMetrics, samples go to the lists by default, or to
+    ``silence_sketch``/``overlap_sketch`` when those are set.
+    """
 
     silence_after_user_ms: list[float] = field(default_factory=list)
     overlap_ms: list[float] = field(default_factory=list)
     interruptions: int = 0
     total_agent_turns: int = 0
+    silence_sketch: QuantileSketch | None = None
+    overlap_sketch: QuantileSketch | None = None
+
+    def add_silence(self, silence_ms: float) -> None:
+        """Record a silence-after-user sample."""
+        if self.silence_sketch is not None:
+            self.silence_sketch.add(silence_ms)
+        else:
+            self.silence_after_user_ms.append(silence_ms)
+
+    def add_overlap(self, overlap_ms: float) -> None:
+        """Record a turn overlap sample."""
+        if self.overlap_sketch is not None:
+            self.overlap_sketch.add(overlap_ms)
+        else:
+            self.overlap_ms.append(overlap_ms)
+
+    @property
+    def silence_samples(self) -> int:
+        """Number of silence-after-user samples."""
+        if self.silence_sketch is not None:
+            return self.silence_sketch.count
+        return len(self.silence_after_user_ms)
 
     @property
     def silence_mean_ms(self) -> float | None:
         """Mean silence after user in milliseconds."""
+        if self.silence_sketch is not None:
+            return self.silence_sketch.mean
         if not self.silence_after_user_ms:
             return None
         return statistics.mean(self.silence_after_user_ms)
@@ -89,11 +215,7 @@ class TurnMetrics:
     @property
     def silence_p95_ms(self) -> float | None:
         """95th percentile silence after user in milliseconds."""
-        if len(self.silence_after_user_ms) < 2:
-            return self.silence_mean_ms
-        sorted_silence = sorted(self.silence_after_user_ms)
-        index = int(len(sorted_silence) * 0.95)
-        return sorted_silence[min(index, len(sorted_silence) - 1)]
+        return _percentile(self.silence_after_user_ms, self.silence_sketch, 0.95)
 
     @property
     def interruption_rate(self) -> float | None:
@@ -102,10 +224,24 @@ class TurnMetrics:
             return None
         return (self.interruptions / self.total_agent_turns) * 100
 
+    def merge(self, other: TurnMetrics) -> None:
+        """Fold another set of turn metrics into this one."""
+        self.silence_sketch = _merge_samples(
+            self.silence_after_user_ms,
+            self.silence_sketch,
+            other.silence_after_user_ms,
+            other.silence_sketch,
+        )
+        self.overlap_sketch = _merge_samples(
+            self.overlap_ms, self.overlap_sketch, other.overlap_ms, other.overlap_sketch
+        )
+        self.interruptions += other.interruptions
+        self.total_agent_turns += other.total_agent_turns
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            "silence_samples": len(self.silence_after_user_ms),
+            "silence_samples": self.silence_samples,
             "silence_mean_ms": self.silence_mean_ms,
             "silence_p95_ms": self.silence_p95_ms,
             "total_agent_turns": self.total_agent_turns,
@@ -126,6 +262,14 @@ class EvalMetrics:
     intent_correct_count: int = 0
     intent_incorrect_count: int = 0
     relevance_scores: list[float] = field(default_factory=list)
+    relevance_sketch: QuantileSketch | None = None
+
+    def add_relevance_score(self, score: float) -> None:
+        """Record a relevance score."""
+        if self.relevance_sketch is not None:
+            self.relevance_sketch.add(score)
+        else:
+            self.relevance_scores.append(score)
 
     @property
     def intent_correct_rate(self) -> float | None:
@@ -144,6 +288,8 @@ class EvalMetrics:
     @property
     def avg_relevance_score(self) -> float | None:
         """Average relevance score (0.0 to 1.0)."""
+        if self.relevance_sketch is not None:
+            return self.relevance_sketch.mean
         if not self.relevance_scores:
             return None
         return statistics.mean(self.relevance_scores)
@@ -151,6 +297,8 @@ class EvalMetrics:
     @property
     def min_relevance_score(self) -> float | None:
         """Minimum relevance score."""
+        if self.relevance_sketch is not None:
+            return self.relevance_sketch.min
         if not self.relevance_scores:
             return None
         return min(self.relevance_scores)
@@ -158,10 +306,24 @@ class EvalMetrics:
     @property
     def max_relevance_score(self) -> float | None:
         """Maximum relevance score."""
+        if self.relevance_sketch is not None:
+            return self.relevance_sketch.max
         if not self.relevance_scores:
             return None
         return max(self.relevance_scores)
 
+    def merge(self, other: EvalMetrics) -> None:
+        """Fold another set of evaluation metrics into this one."""
+        self.total_evals += other.total_evals
+        self.intent_correct_count += other.intent_correct_count
+        self.intent_incorrect_count += other.intent_incorrect_count
+        self.relevance_sketch = _merge_samples(
+            self.relevance_scores,
+            self.relevance_sketch,
+            other.relevance_scores,
+            other.relevance_sketch,
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -178,7 +340,12 @@ class EvalMetrics:
 
 @dataclass
 class AnalysisResult:
-    """Complete analysis result from a JSONL file."""
+    """Complete analysis result from a JSONL file.
+
+    ``conversation_ids`` holds the distinct conversation IDs seen, so that
+    results for different files can be merged without double counting a
+    conversation whose spans are split across files.
+    """
 
     total_spans: int = 0
     total_conversations: int = 0
@@ -191,6 +358,35 @@ class AnalysisResult:
     turn_metrics: TurnMetrics = field(default_factory=TurnMetrics)
     eval_metrics: EvalMetrics = field(default_factory=EvalMetrics)
 
+    conversation_ids: set[str] = field(default_factory=set, repr=False)
+
+    def merge(self, other: AnalysisResult) -> AnalysisResult:
+        """Fold another partial result into this one.
+
+        Counts are summed and samples combined. If either side is
+        sketch-backed, the merged metric is sketch-backed too.
+
+        Args:
+            other: Partial result to merge, e.g. from another trace file.
+
+        Returns:
+            This result, for chaining.
+        """
+        self.total_spans += other.total_spans
+        self.total_turns += other.total_turns
+        if self.conversation_ids or other.conversation_ids:
+            self.conversation_ids |= other.conversation_ids
+            self.total_conversations = len(self.conversation_ids)
+        else:
+            self.total_conversations += other.total_conversations
+
+        self.asr_metrics.merge(other.asr_metrics)
+        self.llm_metrics.merge(other.llm_metrics)
+        self.tts_metrics.merge(other.tts_metrics)
+        self.turn_metrics.merge(other.turn_metrics)
+        self.eval_metrics.merge(other.eval_metrics)
+        return self
+
     def format_report(self) -> str:
         """Format the analysis result as a plain text report."""
         lines = []
@@ -226,9 +422,8 @@ class AnalysisResult:
         lines.append("Response Latency (silence after user)")
         lines.append("-" * 30)
 
-        if self.turn_metrics.silence_after_user_ms:
-            n = len(self.turn_metrics.silence_after_user_ms)
-            lines.append(f"  Samples: {n}")
+        if self.turn_metrics.silence_samples:
+            lines.append(f"  Samples: {self.turn_metrics.silence_samples}")
             lines.append(f"  mean: {self.turn_metrics.silence_mean_ms:.1f}ms")
             lines.append(f"  p95:  {self.turn_metrics.silence_p95_ms:.1f}ms")
         else:
@@ -302,25 +497,85 @@ class AnalysisResult:
         }
 
 
-def parse_jsonl(file_path: str | Path) -> list[dict]:
-    """Parse a JSONL file into a list of span dictionaries.
+COMPRESSED_TRACE_SUFFIXES = (".gz", ".zst")
+"""File suffixes of compressed trace files, see :func:`open_trace_file`."""
+
+
+def is_compressed_trace(file_path: str | Path) -> bool:
+    """Return True if a trace file is gzip or zstd compressed (by its suffix)."""
+    return Path(file_path).suffix in COMPRESSED_TRACE_SUFFIXES
+
+
+def open_trace_file(file_path: str | Path, mode: Literal["r", "rb"] = "r") -> IO:
+    """Open a trace file for reading, decompressing ``.gz`` and ``.zst`` files.
 
     Args:
         file_path: Path to the JSONL file.
+        mode: "r" for a text stream, "rb" for a binary one.
 
     Returns:
-        List of span dictionaries.
+        A readable stream of the (uncompressed) JSONL.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ImportError: If the file is zstd compressed and zstandard is not
+            installed.
     """
-    spans = []
     path = Path(file_path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt" if mode == "r" else "rb")
+    if path.suffix == ".zst":
+        from voiceobs.exporters.exporters import _import_zstandard
+
+        zstandard = _import_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            path.open("rb"), read_across_frames=True, closefd=True
+        )
+        binary = io.BufferedReader(reader)
+        return io.TextIOWrapper(binary) if mode == "r" else binary
+    return path.open(mode)
+
+
+def iter_jsonl(file_path: str | Path) -> Iterator[dict]:
+    """Lazily parse a JSONL file, yielding one span dictionary at a time.
+
+    Args:
+        file_path: Path to the JSONL file, optionally gzip or zstd
+            compressed (see :func:`open_trace_file`).
+
+    Yields:
+        Span dictionaries.
+    """
+    with open_trace_file(file_path) as f:
+        yield from iter_jsonl_stream(f)
+
+
+def iter_jsonl_stream(stream: TextIO) -> Iterator[dict]:
+    """Lazily parse JSONL from a stream, yielding one span dictionary at a time.
+
+    Args:
+        stream: Text stream to read from.
 
-    with path.open() as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                spans.append(json.loads(line))
+    Yields:
+        Span dictionaries.
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
 
-    return spans
+
+def parse_jsonl(file_path: str | Path) -> list[dict]:
+    """Parse a JSONL file into a list of span dictionaries.
+
+    Args:
+        file_path: Path to the JSONL file, optionally gzip or zstd
+            compressed.
+
+    Returns:
+        List of span dictionaries.
+    """
+    return list(iter_jsonl(file_path))
 
 
 def parse_jsonl_stream(stream: TextIO) -> list[dict]:
@@ -332,113 +587,342 @@ def parse_jsonl_stream(stream: TextIO) -> list[dict]:
     Returns:
         List of span dictionaries.
     """
-    spans = []
-    for line in stream:
-        line = line.strip()
-        if line:
-            spans.append(json.loads(line))
-    return spans
+    return list(iter_jsonl_stream(stream))
+
+
+# Stage spans - support both voice.asr and voice.stage.asr naming
+_STAGE_NAMES = frozenset(
+    {
+        "voice.asr",
+        "voice.llm",
+        "voice.tts",
+        "voice.stage.asr",
+        "voice.stage.llm",
+        "voice.stage.tts",
+    }
+)
+
+
+def resolve_stage(span: dict) -> tuple[str, float | None] | None:
+    """Resolve the stage type and duration of a stage span.
 
+    This is the single place that maps stage span names to stage types, for
+    the analyzer, classifier, columnar backend, trace index and pipeline.
 
-def analyze_spans(spans: list[dict]) -> AnalysisResult:
+    Args:
+        span: Span dictionary.
+
+    Returns:
+        ``(stage_type, duration_ms)`` for a stage span, or None for any other
+        span. The ``voice.stage.type`` attribute wins over the span name, and
+        the ``voice.stage.duration_ms`` attribute (from metrics events) wins
+        over the span's own duration (from context manager timing).
+    """
+    name = span.get("name", "")
+    if name not in _STAGE_NAMES:
+        return None
+    attrs = span.get("attributes", {})
+    stage_type = attrs.get(
+        "voice.stage.type",
+        name.replace("voice.stage.", "").replace("voice.", ""),
+    )
+    return stage_type, attrs.get("voice.stage.duration_ms", span.get("duration_ms"))
+
+
+def _accumulate_span(result: AnalysisResult, span: dict, conversation_ids: set[str]) -> None:
+    """Fold a single span into an analysis result.
+
+    Args:
+        result: Result being accumulated.
+        span: Span dictionary.
+        conversation_ids: Set of conversation IDs seen so far (updated in place).
+    """
+    result.total_spans += 1
+
+    name = span.get("name", "")
+    attrs = span.get("attributes", {})
+
+    # Track conversations
+    conv_id = attrs.get("voice.conversation.id")
+    if conv_id:
+        conversation_ids.add(conv_id)
+
+    stage = resolve_stage(span)
+    if stage is not None:
+        add_stage(result, *stage)
+
+    # Turn spans
+    elif name == "voice.turn":
+        add_turn(result, attrs)
+
+    # Evaluation records
+    elif name == "voiceobs.eval":
+        add_eval(result, attrs)
+
+
+def add_stage(result: AnalysisResult, stage_type: str, stage_duration: float | None) -> None:
+    """Record a stage span's duration under its stage type."""
+    if stage_duration is not None:
+        if stage_type == "asr":
+            result.asr_metrics.add(stage_duration)
+        elif stage_type == "llm":
+            result.llm_metrics.add(stage_duration)
+        elif stage_type == "tts":
+            result.tts_metrics.add(stage_duration)
+
+
+def add_turn(result: AnalysisResult, attrs: dict) -> None:
+    """Record a voice.turn span."""
+    result.total_turns += 1
+    actor = attrs.get("voice.actor")
+
+    if actor == "agent":
+        result.turn_metrics.total_agent_turns += 1
+
+        # Silence after user
+        silence = attrs.get("voice.silence.after_user_ms")
+        if silence is not None:
+            result.turn_metrics.add_silence(silence)
+
+        # Overlap
+        overlap = attrs.get("voice.turn.overlap_ms")
+        if overlap is not None:
+            result.turn_metrics.add_overlap(overlap)
+
+        # Interruption
+        interrupted = attrs.get("voice.interruption.detected")
+        if interrupted:
+            result.turn_metrics.interruptions += 1
+
+
+def add_eval(result: AnalysisResult, attrs: dict) -> None:
+    """Record a voiceobs.eval record."""
+    result.eval_metrics.total_evals += 1
+
+    intent_correct = attrs.get("eval.intent_correct")
+    if intent_correct is True:
+        result.eval_metrics.intent_correct_count += 1
+    elif intent_correct is False:
+        result.eval_metrics.intent_incorrect_count += 1
+
+    relevance_score = attrs.get("eval.relevance_score")
+    if relevance_score is not None:
+        result.eval_metrics.add_relevance_score(relevance_score)
+
+
+def analyze_spans(spans: list[dict], backend: Backend = "python") -> AnalysisResult:
     """Analyze a list of span dictionaries and compute metrics.
 
     Args:
         spans: List of span dictionaries (from parse_jsonl).
+        backend: "python" walks the spans one at a time; "numpy" extracts
+            them into arrays and computes the metrics vectorized.
 
     Returns:
         AnalysisResult with computed metrics.
     """
+    if backend == "numpy":
+        from voiceobs.columnar import SpanColumns, analyze_columns
+
+        return analyze_columns(SpanColumns.from_spans(spans))
+
     result = AnalysisResult()
-    result.total_spans = len(spans)
+    conversation_ids: set[str] = set()
+
+    for span in spans:
+        _accumulate_span(result, span, conversation_ids)
+
+    result.conversation_ids = conversation_ids
+    result.total_conversations = len(conversation_ids)
+
+    return result
+
+
+def create_streaming_result(
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> AnalysisResult:
+    """Create an empty AnalysisResult whose metrics are backed by quantile sketches.
+
+    Args:
+        relative_accuracy: Relative error bound for percentile estimates.
+
+    Returns:
+        AnalysisResult that records samples in sketches instead of lists.
+    """
+
+    def sketch() -> QuantileSketch:
+        return QuantileSketch(relative_accuracy=relative_accuracy)
+
+    return AnalysisResult(
+        asr_metrics=StageMetrics("asr", sketch=sketch()),
+        llm_metrics=StageMetrics("llm", sketch=sketch()),
+        tts_metrics=StageMetrics("tts", sketch=sketch()),
+        turn_metrics=TurnMetrics(silence_sketch=sketch(), overlap_sketch=sketch()),
+        eval_metrics=EvalMetrics(relevance_sketch=sketch()),
+    )
+
+
+def analyze_stream(
+    spans: Iterable[dict],
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> AnalysisResult:
+    """Analyze spans from any iterable in bounded memory.
 
+    Unlike analyze_spans, samples are folded into quantile sketches as they
+    arrive, so memory does not grow with the number of spans (only with the
+    number of distinct conversation IDs). Counts, means, minimums and maximums
+    are exact; percentiles are within ``relative_accuracy`` of the exact
+    values.
+
+    Args:
+        spans: Iterable of span dictionaries, e.g. ``iter_jsonl(path)``.
+        relative_accuracy: Relative error bound for percentile estimates.
+
+    Returns:
+        AnalysisResult with sketch-backed metrics.
+    """
+    result = create_streaming_result(relative_accuracy)
     conversation_ids: set[str] = set()
 
     for span in spans:
-        name = span.get("name", "")
-        attrs = span.get("attributes", {})
-        duration_ms = span.get("duration_ms")
-
-        # Track conversations
-        conv_id = attrs.get("voice.conversation.id")
-        if conv_id:
-            conversation_ids.add(conv_id)
-
-        # Stage spans - support both voice.asr and voice.stage.asr naming
-        stage_names = (
-            "voice.asr",
-            "voice.llm",
-            "voice.tts",
-            "voice.stage.asr",
-            "voice.stage.llm",
-            "voice.stage.tts",
-        )
-        if name in stage_names:
-            stage_type = attrs.get(
-                "voice.stage.type",
-                name.replace("voice.stage.", "").replace("voice.", ""),
-            )
-            # Prefer voice.stage.duration_ms attribute (from metrics events)
-            # Fall back to span duration (from context manager timing)
-            stage_duration = attrs.get("voice.stage.duration_ms", duration_ms)
-            if stage_duration is not None:
-                if stage_type == "asr":
-                    result.asr_metrics.durations_ms.append(stage_duration)
-                elif stage_type == "llm":
-                    result.llm_metrics.durations_ms.append(stage_duration)
-                elif stage_type == "tts":
-                    result.tts_metrics.durations_ms.append(stage_duration)
-
-        # Turn spans
-        elif name == "voice.turn":
-            result.total_turns += 1
-            actor = attrs.get("voice.actor")
-
-            if actor == "agent":
-                result.turn_metrics.total_agent_turns += 1
-
-                # Silence after user
-                silence = attrs.get("voice.silence.after_user_ms")
-                if silence is not None:
-                    result.turn_metrics.silence_after_user_ms.append(silence)
-
-                # Overlap
-                overlap = attrs.get("voice.turn.overlap_ms")
-                if overlap is not None:
-                    result.turn_metrics.overlap_ms.append(overlap)
-
-                # Interruption
-                interrupted = attrs.get("voice.interruption.detected")
-                if interrupted:
-                    result.turn_metrics.interruptions += 1
-
-        # Evaluation records
-        elif name == "voiceobs.eval":
-            result.eval_metrics.total_evals += 1
-
-            intent_correct = attrs.get("eval.intent_correct")
-            if intent_correct is True:
-                result.eval_metrics.intent_correct_count += 1
-            elif intent_correct is False:
-                result.eval_metrics.intent_incorrect_count += 1
-
-            relevance_score = attrs.get("eval.relevance_score")
-            if relevance_score is not None:
-                result.eval_metrics.relevance_scores.append(relevance_score)
+        _accumulate_span(result, span, conversation_ids)
 
+    result.conversation_ids = conversation_ids
     result.total_conversations = len(conversation_ids)
 
     return result
 
 
-def analyze_file(file_path: str | Path) -> AnalysisResult:
+def analyze_file(
+    file_path: str | Path,
+    streaming: bool = False,
+    conversation_id: str | None = None,
+) -> AnalysisResult:
     """Analyze a JSONL file and return metrics.
 
+    If the file has an up-to-date index (see ``voiceobs.tracestore``), the
+    metrics are computed from the index columns instead of parsing the file.
+
     Args:
         file_path: Path to the JSONL file.
+        streaming: If True, read the file lazily and use analyze_stream so
+            memory stays bounded; percentiles are then approximate.
+        conversation_id: Only analyze spans from this conversation.
 
     Returns:
         AnalysisResult with computed metrics.
     """
-    spans = parse_jsonl(file_path)
-    return analyze_spans(spans)
+    from voiceobs.tracestore import open_fresh_index
+
+    store = open_fresh_index(file_path)
+    if store is not None:
+        with store:
+            return store.analyze(conversation_id, streaming=streaming)
+
+    spans: Iterable[dict] = iter_jsonl(file_path)
+    if conversation_id is not None:
+        spans = (
+            span
+            for span in spans
+            if span.get("attributes", {}).get("voice.conversation.id") == conversation_id
+        )
+    if streaming:
+        return analyze_stream(spans)
+    return analyze_spans(list(spans))
+
+
+def expand_trace_paths(inputs: Iterable[str | Path]) -> list[Path]:
+    """Resolve files, directories and glob patterns to a list of trace files.
+
+    Directories are searched recursively for ``*.jsonl`` files and their
+    compressed ``*.jsonl.gz`` and ``*.jsonl.zst`` variants. Duplicates
+    are dropped; order follows the inputs, with matches sorted by path.
+
+    Args:
+        inputs: File paths, directories or glob patterns.
+
+    Returns:
+        List of trace file paths.
+
+    Raises:
+        FileNotFoundError: If an input matches no file.
+    """
+    paths: dict[Path, None] = {}
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(
+                p
+                for pattern in ("*.jsonl", "*.jsonl.gz", "*.jsonl.zst")
+                for p in path.rglob(pattern)
+                if p.is_file()
+            )
+        elif path.is_file():
+            matches = [path]
+        elif any(char in str(item) for char in "*?["):
+            matches = sorted(Path(p) for p in glob.glob(str(item), recursive=True))
+            matches = [p for p in matches if p.is_file()]
+        else:
+            matches = []
+        if not matches:
+            raise FileNotFoundError(f"No trace files match: {item}")
+        paths.update(dict.fromkeys(matches))
+    return list(paths)
+
+
+def analyze_files(
+    paths: Sequence[str | Path],
+    streaming: bool = False,
+    workers: int | None = None,
+    conversation_id: str | None = None,
+) -> AnalysisResult:
+    """Analyze several JSONL files in parallel and merge the results.
+
+    Each file is analyzed with analyze_file in a worker process and the
+    partial results are merged in file order. With a single file or a single
+    worker, everything runs in the calling process.
+
+    Streaming keeps partials small (sketches instead of every sample), which
+    matters when many large files are combined.
+
+    Args:
+        paths: Trace files to analyze.
+        streaming: Analyze each file with analyze_stream; percentiles are then
+            approximate.
+        workers: Maximum number of worker processes. Defaults to the number
+            of CPUs.
+        conversation_id: Only analyze spans from this conversation.
+
+    Returns:
+        Merged AnalysisResult.
+
+    Raises:
+        ValueError: If paths is empty or workers is less than 1.
+    """
+    if not paths:
+        raise ValueError("No trace files to analyze")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    workers = min(workers, len(paths))
+
+    if workers == 1:
+        partials: Iterator[AnalysisResult] = (
+            analyze_file(p, streaming=streaming, conversation_id=conversation_id) for p in paths
+        )
+        return _reduce(partials)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _reduce(
+            executor.map(analyze_file, paths, repeat(streaming), repeat(conversation_id))
+        )
+
+
+def _reduce(partials: Iterable[AnalysisResult]) -> AnalysisResult:
+    """Merge partial results into the first one."""
+    iterator = iter(partials)
+    result = next(iterator)
+    for partial in iterator:
+        result.merge(partial)
+    return result
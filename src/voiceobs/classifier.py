@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from voiceobs.analyzer import parse_jsonl
+from voiceobs.analyzer import Backend, parse_jsonl, resolve_stage
 from voiceobs.failures import (
     DEFAULT_THRESHOLDS,
     Failure,
@@ -75,14 +75,21 @@ class FailureClassifier:
             print(f"{failure.type}: {failure.message}")
     """
 
-    def __init__(self, thresholds: FailureThresholds | None = None) -> None:
+    def __init__(
+        self,
+        thresholds: FailureThresholds | None = None,
+        backend: Backend = "python",
+    ) -> None:
         """Initialize the classifier with thresholds.
 
         Args:
             thresholds: Custom thresholds for failure detection.
                        Uses DEFAULT_THRESHOLDS if not provided.
+            backend: "python" checks spans one at a time; "numpy" evaluates
+                the thresholds as vectorized masks (same results).
         """
         self.thresholds = thresholds or DEFAULT_THRESHOLDS
+        self.backend = backend
 
     def classify(self, spans: list[dict]) -> ClassificationResult:
         """Classify failures in a list of span dictionaries.
@@ -93,108 +100,118 @@ class FailureClassifier:
         Returns:
             ClassificationResult with detected failures.
         """
+        if self.backend == "numpy":
+            from voiceobs.columnar import SpanColumns, classify_columns
+
+            return classify_columns(SpanColumns.from_spans(spans), self.thresholds)
+
         result = ClassificationResult(total_spans=len(spans))
 
         for span in spans:
             name = span.get("name", "")
             attrs = span.get("attributes", {})
-            duration_ms = span.get("duration_ms")
+
+            # Check stage spans - support both naming conventions
+            stage = resolve_stage(span)
+            if stage is not None:
+                self.classify_stage(result, *stage, attrs)
+
+            # Check turn spans
+            elif name == "voice.turn":
+                self.classify_turn(result, attrs)
+
+        return result
+
+    def classify_stage(
+        self,
+        result: ClassificationResult,
+        stage_type: str,
+        stage_duration: float | None,
+        attrs: dict,
+    ) -> None:
+        """Check a stage span for slow response and low ASR confidence."""
+        # Extract common context
+        conv_id = attrs.get("voice.conversation.id")
+        turn_id = attrs.get("voice.turn.id")
+        turn_index = attrs.get("voice.turn.index")
+
+        if stage_duration is not None:
+            failure = self._check_slow_response(
+                stage_type=stage_type,
+                duration_ms=stage_duration,
+                conv_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+            )
+            if failure:
+                result.failures.append(failure)
+
+        # Check ASR confidence
+        if stage_type == "asr":
+            confidence = attrs.get("voice.asr.confidence")
+            if confidence is not None:
+                failure = self._check_asr_confidence(
+                    confidence=confidence,
+                    conv_id=conv_id,
+                    turn_id=turn_id,
+                    turn_index=turn_index,
+                )
+                if failure:
+                    result.failures.append(failure)
+
+    def classify_turn(self, result: ClassificationResult, attrs: dict) -> None:
+        """Count a voice.turn span and check agent turns for silence and interruptions."""
+        result.total_turns += 1
+        actor = attrs.get("voice.actor")
+
+        if actor == "agent":
+            result.total_agent_turns += 1
 
             # Extract common context
             conv_id = attrs.get("voice.conversation.id")
             turn_id = attrs.get("voice.turn.id")
             turn_index = attrs.get("voice.turn.index")
 
-            # Check stage spans for slow response - support both naming conventions
-            stage_names = (
-                "voice.asr",
-                "voice.llm",
-                "voice.tts",
-                "voice.stage.asr",
-                "voice.stage.llm",
-                "voice.stage.tts",
-            )
-            if name in stage_names:
-                stage_type = attrs.get(
-                    "voice.stage.type",
-                    name.replace("voice.stage.", "").replace("voice.", ""),
+            # Check for excessive silence
+            silence = attrs.get("voice.silence.after_user_ms")
+            if silence is not None:
+                failure = self._check_excessive_silence(
+                    silence_ms=silence,
+                    conv_id=conv_id,
+                    turn_id=turn_id,
+                    turn_index=turn_index,
+                )
+                if failure:
+                    result.failures.append(failure)
+
+            # Check for interruption
+            overlap = attrs.get("voice.turn.overlap_ms")
+            interrupted = attrs.get("voice.interruption.detected", False)
+
+            if overlap is not None and overlap > self.thresholds.interruption_overlap_ms:
+                failure = self._check_interruption(
+                    overlap_ms=overlap,
+                    conv_id=conv_id,
+                    turn_id=turn_id,
+                    turn_index=turn_index,
                 )
-                # Prefer voice.stage.duration_ms attribute (from metrics events)
-                stage_duration = attrs.get("voice.stage.duration_ms", duration_ms)
-                if stage_duration is not None:
-                    failure = self._check_slow_response(
-                        stage_type=stage_type,
-                        duration_ms=stage_duration,
-                        conv_id=conv_id,
+                if failure:
+                    result.failures.append(failure)
+            elif interrupted:
+                # Boolean flag without overlap value
+                result.failures.append(
+                    Failure(
+                        type=FailureType.INTERRUPTION,
+                        severity=Severity.LOW,
+                        message="Agent interrupted user (detected via flag)",
+                        conversation_id=conv_id,
                         turn_id=turn_id,
                         turn_index=turn_index,
+                        signal_name="voice.interruption.detected",
+                        signal_value=1.0,
+                        threshold=0.0,
                     )
-                    if failure:
-                        result.failures.append(failure)
-
-                # Check ASR confidence
-                if stage_type == "asr":
-                    confidence = attrs.get("voice.asr.confidence")
-                    if confidence is not None:
-                        failure = self._check_asr_confidence(
-                            confidence=confidence,
-                            conv_id=conv_id,
-                            turn_id=turn_id,
-                            turn_index=turn_index,
-                        )
-                        if failure:
-                            result.failures.append(failure)
-
-            # Check turn spans
-            elif name == "voice.turn":
-                result.total_turns += 1
-                actor = attrs.get("voice.actor")
-
-                if actor == "agent":
-                    result.total_agent_turns += 1
-
-                    # Check for excessive silence
-                    silence = attrs.get("voice.silence.after_user_ms")
-                    if silence is not None:
-                        failure = self._check_excessive_silence(
-                            silence_ms=silence,
-                            conv_id=conv_id,
-                            turn_id=turn_id,
-                            turn_index=turn_index,
-                        )
-                        if failure:
-                            result.failures.append(failure)
-
-                    # Check for interruption
-                    overlap = attrs.get("voice.turn.overlap_ms")
-                    interrupted = attrs.get("voice.interruption.detected", False)
-
-                    if overlap is not None and overlap > self.thresholds.interruption_overlap_ms:
-                        failure = self._check_interruption(
-                            overlap_ms=overlap,
-                            conv_id=conv_id,
-                            turn_id=turn_id,
-                            turn_index=turn_index,
-                        )
-                        if failure:
-                            result.failures.append(failure)
-                    elif interrupted:
-                        # Boolean flag without overlap value
-                        result.failures.append(
-                            Failure(
-                                type=FailureType.INTERRUPTION,
-                                severity=Severity.LOW,
-                                message="Agent interrupted user (detected via flag)",
-                                conversation_id=conv_id,
-                                turn_id=turn_id,
-                                turn_index=turn_index,
-                                signal_name="voice.interruption.detected",
-                                signal_value=1.0,
-                                threshold=0.0,
-                            )
-                        )
-
-        return result
+                )
 
     def classify_file(self, file_path: str | Path) -> ClassificationResult:
         """Classify failures in a JSONL file.
@@ -352,15 +369,17 @@ def classify_file(
 def classify_spans(
     spans: list[dict],
     thresholds: FailureThresholds | None = None,
+    backend: Backend = "python",
 ) -> ClassificationResult:
     """Convenience function to classify failures in a list of spans.
 
     Args:
         spans: List of span dictionaries.
         thresholds: Optional custom thresholds.
+        backend: "python" or "numpy" (see FailureClassifier).
 
     Returns:
         ClassificationResult with detected failures.
     """
-    classifier = FailureClassifier(thresholds)
+    classifier = FailureClassifier(thresholds, backend=backend)
     return classifier.classify(spans)
@@ -3,9 +3,12 @@
 import asyncio
 import json
 import os
+import sys
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import typer
 
@@ -208,27 +211,53 @@ def doctor() -> None:
 
 @app.command()
 def analyze(
-    input_file: Path = typer.Option(
+    inputs: list[str] = typer.Option(
         ...,
         "--input",
         "-i",
-        help="Path to the JSONL file to analyze",
-        exists=True,
-        readable=True,
+        help="JSONL file, directory or glob to analyze (repeat for several)",
     ),
     output_json: bool = typer.Option(
         False,
         "--json",
         help="Output results as JSON for machine processing",
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Analyze in bounded memory; percentiles are approximate (within 1%)",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker processes for multiple files (default: number of CPUs)",
+    ),
+    conversation: str | None = typer.Option(
+        None,
+        "--conversation",
+        "-c",
+        help="Only analyze spans from this conversation ID",
+    ),
 ) -> None:
-    """Analyze a JSONL trace file and print latency metrics.
+    """Analyze a JSONL trace file (or many) and print latency metrics.
 
-    Reads spans from a JSONL file and computes:
+    Reads spans from one or more JSONL files and computes:
     - ASR / LLM / TTS latency percentiles
     - Average and p95 response latency (silence after user)
     - Interruption rate
 
+    --input accepts files, directories (searched recursively for *.jsonl) and
+    glob patterns, and may be repeated. Multiple files are analyzed in
+    parallel worker processes and combined into a single report.
+
+    Use --stream for trace files too large to load into memory. Spans are then
+    read one at a time and percentiles come from quantile sketches.
+
+    Files indexed with 'voiceobs index' are analyzed from the index without
+    re-parsing the JSONL, which also makes --conversation lookups fast.
+
     To enable JSONL export, configure it in voiceobs.yaml:
         exporters:
           jsonl:
@@ -238,21 +267,29 @@ def analyze(
     Example:
         voiceobs analyze --input run.jsonl
         voiceobs analyze --input run.jsonl --json
+        voiceobs analyze --input nightly.jsonl --stream
+        voiceobs analyze --input traces/ --stream --workers 8
+        voiceobs analyze --input "traces/2026-03-*/*.jsonl"
+        voiceobs analyze --input run.jsonl --conversation conv-123
     """
-    from voiceobs.analyzer import analyze_file
+    from voiceobs.analyzer import analyze_files, expand_trace_paths
 
+    input_label = ", ".join(inputs)
     try:
-        result = analyze_file(input_file)
+        paths = expand_trace_paths(inputs)
+        result = analyze_files(
+            paths, streaming=stream, workers=workers, conversation_id=conversation
+        )
         if output_json:
             typer.echo(json.dumps(result.to_dict(), indent=2))
         else:
             typer.echo(result.format_report())
-    except FileNotFoundError:
-        typer.echo(f"Error: File not found: {input_file}", err=True)
+    except FileNotFoundError as e:
+        typer.echo(f"Error: File not found: {e}", err=True)
         typer.echo("Hint: Check the file path and ensure the file exists.", err=True)
         raise typer.Exit(1)
     except json.JSONDecodeError as e:
-        typer.echo(f"Error: Invalid JSON in file: {input_file}", err=True)
+        typer.echo(f"Error: Invalid JSON in file: {input_label}", err=True)
         typer.echo(
             f"Hint: Ensure the file contains valid JSONL (one JSON object per line). Details: {e}",
             err=True,
@@ -265,21 +302,17 @@ def analyze(
 
 @app.command()
 def compare(
-    baseline_file: Path = typer.Option(
+    baseline_inputs: list[str] = typer.Option(
         ...,
         "--baseline",
         "-b",
-        help="Path to the baseline JSONL file",
-        exists=True,
-        readable=True,
+        help="Baseline JSONL file, directory or glob (repeat for several)",
     ),
-    current_file: Path = typer.Option(
+    current_inputs: list[str] = typer.Option(
         ...,
         "--current",
         "-c",
-        help="Path to the current JSONL file to compare",
-        exists=True,
-        readable=True,
+        help="Current JSONL file, directory or glob to compare (repeat for several)",
     ),
     fail_on_regression: bool = typer.Option(
         False,
@@ -291,8 +324,15 @@ def compare(
         "--json",
         help="Output results as JSON for machine processing",
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker processes for multiple files (default: number of CPUs)",
+    ),
 ) -> None:
-    """Compare two JSONL trace files and detect regressions.
+    """Compare two JSONL trace files (or sets of files) and detect regressions.
 
     Compares metrics between a baseline and current run, highlighting:
     - Latency deltas (ASR, LLM, TTS p95)
@@ -300,25 +340,29 @@ def compare(
     - Interruption rate changes
     - Semantic score changes (intent correctness, relevance)
 
+    Each side accepts files, directories and glob patterns, like analyze;
+    all files on a side are analyzed in parallel and merged before comparing.
+
     Use --fail-on-regression in CI to fail the build on detected regressions.
 
     Example:
         voiceobs compare --baseline baseline.jsonl --current current.jsonl
         voiceobs compare -b baseline.jsonl -c current.jsonl --fail-on-regression
         voiceobs compare -b baseline.jsonl -c current.jsonl --json
+        voiceobs compare -b traces/last-week/ -c traces/today/
     """
-    from voiceobs.analyzer import analyze_file
+    from voiceobs.analyzer import analyze_files, expand_trace_paths
     from voiceobs.compare import compare_runs
 
     try:
-        baseline_result = analyze_file(baseline_file)
-        current_result = analyze_file(current_file)
+        baseline_result = analyze_files(expand_trace_paths(baseline_inputs), workers=workers)
+        current_result = analyze_files(expand_trace_paths(current_inputs), workers=workers)
 
         comparison = compare_runs(
             baseline=baseline_result,
             current=current_result,
-            baseline_file=str(baseline_file),
-            current_file=str(current_file),
+            baseline_file=", ".join(baseline_inputs),
+            current_file=", ".join(current_inputs),
         )
 
         if output_json:
@@ -371,6 +415,12 @@ def report(
         "-t",
         help="Custom report title",
     ),
+    plugins: list[str] = typer.Option(
+        None,
+        "--plugin",
+        "-p",
+        help="Metric plugin to include, as 'module:ClassName' (can be repeated)",
+    ),
 ) -> None:
     """Generate a report from a JSONL trace file.
 
@@ -385,13 +435,18 @@ def report(
     HTML (self-contained, suitable for sharing via email/Slack),
     or JSON (for machine processing and automation).
 
+    Markdown and HTML reports read the file once, computing metrics,
+    failures and any custom metric plugins in a single pass.
+
     Example:
         voiceobs report --input run.jsonl
         voiceobs report --input run.jsonl --format html --output report.html
         voiceobs report -i run.jsonl -f markdown -o report.md
         voiceobs report -i run.jsonl -f json
+        voiceobs report -i run.jsonl -p mypkg.metrics:LongTurns
     """
     from voiceobs.analyzer import analyze_file
+    from voiceobs.pipeline import load_metric_plugin
     from voiceobs.report import generate_report_from_file
 
     # Validate format
@@ -403,6 +458,13 @@ def report(
         )
         raise typer.Exit(1)
 
+    for spec in plugins or []:
+        try:
+            load_metric_plugin(spec)
+        except (ImportError, ValueError) as e:
+            typer.echo(f"Error: Could not load metric plugin {spec}: {e}", err=True)
+            raise typer.Exit(1)
+
     try:
         # Handle JSON format separately (uses analyzer directly)
         if format == "json":
@@ -436,6 +498,56 @@ def report(
         raise typer.Exit(1)
 
 
+@app.command("index")
+def index_command(
+    inputs: list[str] = typer.Option(
+        ...,
+        "--input",
+        "-i",
+        help="JSONL file, directory or glob to index (repeat for several)",
+    ),
+) -> None:
+    """Build local indexes for JSONL trace files.
+
+    Writes a compact index next to each trace file (run.jsonl ->
+    run.jsonl.vidx) with columnar span metrics and an offset index into the
+    file. analyze, compare and 'report --format json' then compute metrics
+    from the index instead of re-parsing the JSONL, and analyze --conversation
+    skips the rest of the file. Markdown and HTML reports and 'export otlp'
+    need every span attribute, so they still parse the JSONL. An index is
+    ignored once its trace file changes; run this command again to rebuild it.
+
+    Example:
+        voiceobs index --input run.jsonl
+        voiceobs index --input traces/
+    """
+    from voiceobs.analyzer import expand_trace_paths, is_compressed_trace
+    from voiceobs.tracestore import TraceStore, build_index
+
+    try:
+        for path in expand_trace_paths(inputs):
+            if is_compressed_trace(path):
+                typer.echo(f"Skipped compressed file (read without an index): {path}")
+                continue
+            index_path = build_index(path)
+            with TraceStore.open(path, index_path) as store:
+                typer.echo(
+                    f"Indexed {len(store)} spans, {len(store.conversations)} conversations: "
+                    f"{index_path}"
+                )
+    except FileNotFoundError as e:
+        typer.echo(f"Error: File not found: {e}", err=True)
+        typer.echo("Hint: Check the file path and ensure the file exists.", err=True)
+        raise typer.Exit(1)
+    except json.JSONDecodeError as e:
+        typer.echo(f"Error: Invalid JSON in file: {path}", err=True)
+        typer.echo(f"Hint: Ensure the file contains valid JSONL. Details: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error indexing file: {e}", err=True)
+        raise typer.Exit(1)
+
+
 @app.command()
 def server(
     host: str = typer.Option(
@@ -521,140 +633,341 @@ def _get_database_url() -> str | None:
         return None
 
 
+# Spans written per COPY during `voiceobs import`
+DEFAULT_IMPORT_BATCH_SIZE = 5000
+
+
+class SpanImportError(Exception):
+    """Raised when an import fails part-way through a file.
+
+    Attributes:
+        offset: Byte offset just past the last span committed to the
+            database. Passing it as ``start_offset`` resumes the import.
+        imported: Number of spans committed before the failure.
+    """
+
+    def __init__(self, message: str, offset: int, imported: int) -> None:
+        super().__init__(message)
+        self.offset = offset
+        self.imported = imported
+
+
+def _iter_span_batches(
+    input_file: Path,
+    start_offset: int,
+    batch_size: int,
+) -> Iterator[tuple[list[dict[str, Any]], int, int]]:
+    """Parse a JSONL span file into batches.
+
+    Args:
+        input_file: Path to the JSONL file, optionally gzip or zstd
+            compressed.
+        start_offset: Byte offset into the uncompressed JSONL to start
+            reading from. Must be the start of a line.
+        batch_size: Maximum number of spans per batch.
+
+    Yields:
+        Tuples of (spans, unparseable line count, byte offset after the
+        last line in the batch).
+    """
+    from voiceobs.analyzer import open_trace_file
+
+    with open_trace_file(input_file, "rb") as f:
+        if start_offset:
+            f.seek(start_offset)
+        offset = batch_end = start_offset
+        spans: list[dict[str, Any]] = []
+        errors = 0
+        for line in f:
+            offset += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                span_data = json.loads(line)
+                spans.append(
+                    {
+                        "name": span_data.get("name", "unknown"),
+                        "start_time": span_data.get("start_time"),
+                        "end_time": span_data.get("end_time"),
+                        "duration_ms": span_data.get("duration_ms"),
+                        "attributes": span_data.get("attributes") or {},
+                        "trace_id": span_data.get("trace_id"),
+                        "span_id": span_data.get("span_id"),
+                        "parent_span_id": span_data.get("parent_span_id"),
+                    }
+                )
+            except (ValueError, AttributeError):
+                errors += 1
+                continue
+            if len(spans) >= batch_size:
+                yield spans, errors, offset
+                spans, errors = [], 0
+                batch_end = offset
+        # Trailing errors or blank lines still advance the resume offset
+        if offset > batch_end:
+            yield spans, errors, offset
+
+
 def import_spans_to_db(
     input_file: Path,
     database_url: str,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    start_offset: int = 0,
+    progress: Callable[[int, int, float], None] | None = None,
 ) -> dict[str, Any]:
     """Import spans from a JSONL file to the database.
 
+    The file is parsed in a worker thread one batch ahead of the database
+    writes. For each batch, conversations not seen earlier in the file are
+    upserted in one statement and the spans are written with a single COPY.
+    Turns and failures are then derived from the batch the same way the
+    server derives them from ingested spans. If derivation fails, the spans
+    stay in the derivation backlog for the server's catch-up pass or
+    ``voiceobs db derive``.
+
     Args:
         input_file: Path to the JSONL file.
         database_url: Database URL to connect to.
+        batch_size: Number of spans written per COPY.
+        start_offset: Byte offset to resume from, as reported by a previous
+            run or by :class:`SpanImportError`.
+        progress: Optional callback invoked after each committed batch with
+            (spans imported, byte offset, seconds elapsed).
 
     Returns:
-        Dictionary with import results.
+        Dictionary with import results: ``imported``, ``errors``, ``offset``
+        (bytes read), ``underived`` (spans left in the derivation backlog),
+        ``elapsed_s`` and ``spans_per_sec``.
+
+    Raises:
+        SpanImportError: If writing a batch fails.
     """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
 
     async def _import() -> dict[str, Any]:
         # Lazy import to avoid requiring server dependencies unless needed
         # Import directly from modules to avoid importing server.__init__ which imports FastAPI
         from voiceobs.server.db.connection import Database
         from voiceobs.server.db.repositories.conversation import ConversationRepository
+        from voiceobs.server.db.repositories.failure import FailureRepository
         from voiceobs.server.db.repositories.span import SpanRepository
+        from voiceobs.server.db.repositories.turn import TurnRepository
+        from voiceobs.server.services.span_derivation import (
+            DERIVED_SPAN_NAMES,
+            IngestedSpan,
+            SpanDerivationQueue,
+        )
 
         db = Database(database_url=database_url)
         await db.connect()
-        await db.init_schema()
-
-        span_repo = SpanRepository(db)
-        conv_repo = ConversationRepository(db)
-
-        imported = 0
-        errors = 0
+        try:
+            await db.init_schema()
 
-        with open(input_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+            span_repo = SpanRepository(db)
+            conv_repo = ConversationRepository(db)
+            derivation = SpanDerivationQueue(
+                db, span_repo, TurnRepository(db), FailureRepository(db)
+            )
 
+            # External conversation ID -> conversation UUID, for the whole file
+            conversation_ids: dict[str, Any] = {}
+            imported = 0
+            errors = 0
+            underived = 0
+            offset = start_offset
+            started = time.perf_counter()
+
+            batches = _iter_span_batches(input_file, start_offset, batch_size)
+            next_batch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+            while (batch := await next_batch) is not None:
+                # Parse the next batch while this one is written
+                next_batch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+                spans, batch_errors, batch_offset = batch
                 try:
-                    span_data = json.loads(line)
-                    attrs = span_data.get("attributes", {})
-                    conversation_id = None
-
-                    # Auto-create conversation if span has conversation ID
-                    conv_external_id = attrs.get("voice.conversation.id")
-                    if conv_external_id:
-                        conv = await conv_repo.get_or_create(conv_external_id)
-                        conversation_id = conv.id
-
-                    await span_repo.add(
-                        name=span_data.get("name", "unknown"),
-                        start_time=span_data.get("start_time"),
-                        end_time=span_data.get("end_time"),
-                        duration_ms=span_data.get("duration_ms"),
-                        attributes=attrs,
-                        trace_id=span_data.get("trace_id"),
-                        span_id=span_data.get("span_id"),
-                        parent_span_id=span_data.get("parent_span_id"),
-                        conversation_id=conversation_id,
-                    )
-                    imported += 1
-                except Exception:
-                    errors += 1
-
-        await db.disconnect()
-        return {"imported": imported, "errors": errors}
+                    new_ids = {
+                        conv_id
+                        for span in spans
+                        if (conv_id := span["attributes"].get("voice.conversation.id"))
+                        and conv_id not in conversation_ids
+                    }
+                    if new_ids:
+                        conversation_ids.update(await conv_repo.get_or_create_many(new_ids))
+                    for span in spans:
+                        conv_id = span["attributes"].get("voice.conversation.id")
+                        span["conversation_id"] = conversation_ids[conv_id] if conv_id else None
+                    span_uuids = await span_repo.add_many(spans)
+                except Exception as e:
+                    next_batch.cancel()
+                    raise SpanImportError(str(e), offset=offset, imported=imported) from e
+
+                derivable = [
+                    IngestedSpan(span_uuid, span["conversation_id"], span)
+                    for span_uuid, span in zip(span_uuids, spans)
+                    if span["conversation_id"] is not None and span["name"] in DERIVED_SPAN_NAMES
+                ]
+                if derivable:
+                    try:
+                        await derivation.derive(derivable)
+                    except Exception:
+                        # The spans are committed; they stay in the derivation backlog
+                        underived += len(derivable)
+
+                imported += len(spans)
+                errors += batch_errors
+                offset = batch_offset
+                if progress is not None:
+                    progress(imported, offset, time.perf_counter() - started)
+
+            elapsed = time.perf_counter() - started
+            return {
+                "imported": imported,
+                "errors": errors,
+                "offset": offset,
+                "underived": underived,
+                "elapsed_s": elapsed,
+                "spans_per_sec": imported / elapsed if elapsed > 0 else 0.0,
+            }
+        finally:
+            await db.disconnect()
 
     return asyncio.run(_import())
 
 
-def export_spans_from_db(
-    database_url: str,
-    output_file: Path | None = None,
-    conversation_id: str | None = None,
-) -> dict[str, Any]:
-    """Export spans from the database to a JSONL file.
+def derive_span_backlog(database_url: str) -> int:
+    """Derive turns and failures for every span in the derivation backlog.
+
+    Batches that fail are left in the backlog and logged.
 
     Args:
         database_url: Database URL to connect to.
-        output_file: Path to write the JSONL file. If None, returns spans.
-        conversation_id: Optional conversation ID to filter by.
 
     Returns:
-        Dictionary with export results.
+        Number of spans derived.
     """
 
-    async def _export() -> dict[str, Any]:
+    async def _derive() -> int:
         # Lazy import to avoid requiring server dependencies unless needed
         # Import directly from modules to avoid importing server.__init__ which imports FastAPI
         from voiceobs.server.db.connection import Database
-        from voiceobs.server.db.repositories.conversation import ConversationRepository
+        from voiceobs.server.db.repositories.failure import FailureRepository
         from voiceobs.server.db.repositories.span import SpanRepository
+        from voiceobs.server.db.repositories.turn import TurnRepository
+        from voiceobs.server.services.span_derivation import SpanDerivationQueue
 
         db = Database(database_url=database_url)
         await db.connect()
+        try:
+            await db.init_schema()
+            derivation = SpanDerivationQueue(
+                db, SpanRepository(db), TurnRepository(db), FailureRepository(db)
+            )
+            return await derivation.catch_up()
+        finally:
+            await db.disconnect()
 
-        span_repo = SpanRepository(db)
-        conv_repo = ConversationRepository(db)
+    return asyncio.run(_derive())
 
-        if conversation_id:
-            # Find conversation by external ID
-            conv = await conv_repo.get_by_external_id(conversation_id)
-            if conv:
-                spans = await span_repo.get_by_conversation(conv.id)
-            else:
-                spans = []
-        else:
-            spans = await span_repo.get_all()
-
-        # Convert to dicts
-        span_dicts = []
-        for span in spans:
-            span_dict = {
-                "name": span.name,
-                "start_time": span.start_time,
-                "end_time": span.end_time,
-                "duration_ms": span.duration_ms,
-                "attributes": span.attributes,
-                "trace_id": span.trace_id,
-                "span_id": span.span_id,
-                "parent_span_id": span.parent_span_id,
-            }
-            span_dicts.append(span_dict)
 
+async def _iter_spans_from_db(
+    database_url: str,
+    conversation_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Read spans from the database through a server-side cursor.
+
+    Args:
+        database_url: Database URL to connect to.
+        conversation_id: Optional conversation ID to filter by.
+        since: Only include spans starting at or after this time.
+        until: Only include spans starting before this time.
+
+    Yields:
+        Span dictionaries, oldest first.
+    """
+    # Lazy import to avoid requiring server dependencies unless needed
+    # Import directly from modules to avoid importing server.__init__ which imports FastAPI
+    from voiceobs.server.db.connection import Database
+    from voiceobs.server.db.repositories.span import SpanRepository
+
+    db = Database(database_url=database_url)
+    await db.connect()
+    try:
+        async for span_dict in SpanRepository(db).iter_export(
+            conversation_id, since=since, until=until
+        ):
+            yield span_dict
+    finally:
         await db.disconnect()
 
-        if output_file:
-            with open(output_file, "w") as f:
-                for span_dict in span_dicts:
-                    f.write(json.dumps(span_dict) + "\n")
-            return {"exported": len(span_dicts), "path": str(output_file)}
-        else:
-            return {"exported": len(span_dicts), "spans": span_dicts}
 
-    return asyncio.run(_export())
+def stream_spans_from_db(
+    database_url: str,
+    out: TextIO,
+    conversation_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> int:
+    """Stream spans from the database to a text stream as JSONL.
+
+    Spans are written as they are read, so memory use does not grow with
+    the number of spans exported.
+
+    Args:
+        database_url: Database URL to connect to.
+        out: Text stream to write one JSON span per line to.
+        conversation_id: Optional conversation ID to filter by.
+        since: Only export spans starting at or after this time.
+        until: Only export spans starting before this time.
+
+    Returns:
+        Number of spans written.
+    """
+
+    async def _stream() -> int:
+        exported = 0
+        async for span_dict in _iter_spans_from_db(database_url, conversation_id, since, until):
+            out.write(json.dumps(span_dict) + "\n")
+            exported += 1
+        return exported
+
+    return asyncio.run(_stream())
+
+
+def export_spans_from_db(
+    database_url: str,
+    output_file: Path | None = None,
+    conversation_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> dict[str, Any]:
+    """Export spans from the database to a JSONL file.
+
+    Args:
+        database_url: Database URL to connect to.
+        output_file: Path to write the JSONL file. If None, returns spans.
+        conversation_id: Optional conversation ID to filter by.
+        since: Only export spans starting at or after this time.
+        until: Only export spans starting before this time.
+
+    Returns:
+        Dictionary with export results.
+    """
+    if output_file:
+        with open(output_file, "w") as f:
+            exported = stream_spans_from_db(database_url, f, conversation_id, since, until)
+        return {"exported": exported, "path": str(output_file)}
+
+    async def _collect() -> list[dict[str, Any]]:
+        return [
+            span_dict
+            async for span_dict in _iter_spans_from_db(database_url, conversation_id, since, until)
+        ]
+
+    span_dicts = asyncio.run(_collect())
+    return {"exported": len(span_dicts), "spans": span_dicts}
 
 
 # Database commands
@@ -780,6 +1093,40 @@ def db_history() -> None:
         raise typer.Exit(1)
 
 
+@db_app.command("derive")
+def db_derive() -> None:
+    """Derive turns and failures for spans in the derivation backlog.
+
+    Spans are added to the backlog when they are stored and leave it once
+    their turns and failures are written. The server drains it in the
+    background; this command does the same without a running server, e.g.
+    after an upgrade or a failed derivation during import.
+
+    Example:
+        voiceobs db derive
+    """
+    database_url = _get_database_url()
+    if not database_url:
+        typer.echo("Error: No database URL configured.", err=True)
+        typer.echo(
+            "Hint: Set VOICEOBS_DATABASE_URL or configure server.database_url in voiceobs.yaml",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    try:
+        derived = derive_span_backlog(database_url)
+    except ImportError:
+        typer.echo("Error: Server dependencies not installed.", err=True)
+        typer.echo("Hint: Install with: pip install voiceobs[server]", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error deriving spans: {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"Derived turns and failures for {derived} spans.")
+
+
 # Import command
 @app.command("import")
 def import_command(
@@ -791,14 +1138,31 @@ def import_command(
         exists=True,
         readable=True,
     ),
+    batch_size: int = typer.Option(
+        DEFAULT_IMPORT_BATCH_SIZE,
+        "--batch-size",
+        "-b",
+        help="Number of spans written per batch",
+        min=1,
+    ),
+    resume_from: int = typer.Option(
+        0,
+        "--resume-from",
+        help="Byte offset to resume from, as printed by a failed import",
+        min=0,
+    ),
 ) -> None:
     """Import spans from a JSONL file to the database.
 
-    Reads span data from a JSONL file and stores it in the database.
-    Automatically creates conversations for spans with voice.conversation.id.
+    Reads span data from a JSONL file and stores it in the database in
+    batches. Automatically creates conversations for spans with
+    voice.conversation.id. If the import fails part-way, the byte offset to
+    resume from is printed.
 
     Example:
         voiceobs import --input run.jsonl
+        voiceobs import --input run.jsonl --batch-size 10000
+        voiceobs import --input run.jsonl --resume-from 104857600
     """
     database_url = _get_database_url()
     if not database_url:
@@ -809,23 +1173,66 @@ def import_command(
         )
         raise typer.Exit(1)
 
+    total_bytes = input_file.stat().st_size
+    last_report = 0.0
+
+    def _report_progress(imported: int, offset: int, elapsed: float) -> None:
+        nonlocal last_report
+        if elapsed - last_report < 1.0 and offset < total_bytes:
+            return
+        last_report = elapsed
+        percent = 100.0 * offset / total_bytes if total_bytes else 100.0
+        rate = imported / elapsed if elapsed > 0 else 0.0
+        typer.echo(
+            f"  {imported} spans, {percent:.1f}% of file, {rate:.0f} spans/s",
+            err=True,
+        )
+
     try:
         typer.echo(f"Importing spans from: {input_file}")
-        result = import_spans_to_db(input_file, database_url)
+        result = import_spans_to_db(
+            input_file,
+            database_url,
+            batch_size=batch_size,
+            start_offset=resume_from,
+            progress=_report_progress,
+        )
 
-        typer.echo(f"Imported {result['imported']} spans")
+        typer.echo(
+            f"Imported {result['imported']} spans in {result['elapsed_s']:.1f}s "
+            f"({result['spans_per_sec']:.0f} spans/s)"
+        )
         if result["errors"] > 0:
             typer.echo(f"Errors: {result['errors']}", err=True)
+        if result["underived"] > 0:
+            typer.echo(
+                f"Warning: turns and failures were not derived for {result['underived']} spans.",
+                err=True,
+            )
+            typer.echo("Hint: Derive them with: voiceobs db derive", err=True)
 
-    except json.JSONDecodeError as e:
-        typer.echo(f"Error: Invalid JSON in file: {input_file}", err=True)
-        typer.echo(f"Details: {e}", err=True)
+    except SpanImportError as e:
+        typer.echo(f"Error importing spans: {e}", err=True)
+        typer.echo(f"Imported {e.imported} spans before the failure.", err=True)
+        typer.echo(
+            f"Hint: Resume with: voiceobs import --input {input_file} --resume-from {e.offset}",
+            err=True,
+        )
         raise typer.Exit(1)
     except Exception as e:
         typer.echo(f"Error importing spans: {e}", err=True)
         raise typer.Exit(1)
 
 
+# Accepted --since/--until formats; times without an offset are UTC
+EXPORT_TIME_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+]
+
+
 # Default export command (backward compatibility - exports JSONL)
 @export_app.callback(invoke_without_command=True)
 def export_callback(
@@ -842,6 +1249,18 @@ def export_callback(
         "-c",
         help="Filter by conversation ID",
     ),
+    since: datetime = typer.Option(
+        None,
+        "--since",
+        help="Only export spans starting at or after this time (UTC unless an offset is given)",
+        formats=EXPORT_TIME_FORMATS,
+    ),
+    until: datetime = typer.Option(
+        None,
+        "--until",
+        help="Only export spans starting before this time (UTC unless an offset is given)",
+        formats=EXPORT_TIME_FORMATS,
+    ),
 ) -> None:
     """Export spans from the database to a JSONL file.
 
@@ -854,12 +1273,14 @@ def export_callback(
         return
 
     # Otherwise, run the JSONL export
-    export_jsonl_impl(output_file, conversation)
+    export_jsonl_impl(output_file, conversation, since, until)
 
 
 def export_jsonl_impl(
     output_file: Path | None = None,
     conversation: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
 ) -> None:
     """Implementation of JSONL export (shared by callback and jsonl command)."""
     database_url = _get_database_url()
@@ -871,25 +1292,36 @@ def export_jsonl_impl(
         )
         raise typer.Exit(1)
 
+    since = _as_utc(since)
+    until = _as_utc(until)
     try:
-        result = export_spans_from_db(
-            database_url=database_url,
-            output_file=output_file,
-            conversation_id=conversation,
-        )
-
         if output_file:
+            result = export_spans_from_db(
+                database_url=database_url,
+                output_file=output_file,
+                conversation_id=conversation,
+                since=since,
+                until=until,
+            )
             typer.echo(f"Exported {result['exported']} spans to: {output_file}")
         else:
-            # Print to stdout
-            for span in result.get("spans", []):
-                typer.echo(json.dumps(span))
+            # Stream to stdout as spans are read
+            stream_spans_from_db(
+                database_url, sys.stdout, conversation_id=conversation, since=since, until=until
+            )
 
     except Exception as e:
         typer.echo(f"Error exporting spans: {e}", err=True)
         raise typer.Exit(1)
 
 
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Treat a naive command-line time as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 # Export JSONL command (explicit subcommand)
 @export_app.command("jsonl")
 def export_jsonl_command(
@@ -905,6 +1337,18 @@ def export_jsonl_command(
         "-c",
         help="Filter by conversation ID",
     ),
+    since: datetime = typer.Option(
+        None,
+        "--since",
+        help="Only export spans starting at or after this time (UTC unless an offset is given)",
+        formats=EXPORT_TIME_FORMATS,
+    ),
+    until: datetime = typer.Option(
+        None,
+        "--until",
+        help="Only export spans starting before this time (UTC unless an offset is given)",
+        formats=EXPORT_TIME_FORMATS,
+    ),
 ) -> None:
     """Export spans from the database to a JSONL file.
 
@@ -914,9 +1358,10 @@ def export_jsonl_command(
     Example:
         voiceobs export jsonl --output run.jsonl
         voiceobs export jsonl --conversation conv-123 --output run.jsonl
+        voiceobs export jsonl --since 2026-03-01 --until 2026-03-02
         voiceobs export jsonl
     """
-    export_jsonl_impl(output_file, conversation)
+    export_jsonl_impl(output_file, conversation, since, until)
 
 
 def _validate_otlp_export_args(
@@ -997,9 +1442,11 @@ def _load_spans_from_jsonl(input_file: Path) -> list[dict[str, Any]]:
     Raises:
         FileNotFoundError: If file doesn't exist.
     """
+    from voiceobs.analyzer import open_trace_file
+
     spans: list[dict[str, Any]] = []
 
-    with open(input_file) as f:
+    with open_trace_file(input_file) as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -0,0 +1,444 @@
+"""Columnar NumPy backend for span analysis and failure classification.
+
+The pure-Python ``analyze_spans`` and ``FailureClassifier.classify`` walk the
+span dictionaries one at a time, and running both walks them twice. This
+backend reads the attributes they need into NumPy arrays in one pass
+(:class:`SpanColumns`), then selects metric samples and evaluates the
+failure thresholds as vectorized masks. Only spans that actually fail become
+``Failure`` objects.
+
+Results are identical to the pure-Python path. Stage, silence, overlap and
+relevance samples are stored sorted, which does not change any reported
+metric and makes the percentile computations cheap.
+
+NumPy is an optional dependency (``pip install voiceobs[columnar]``). Select
+this backend with ``analyze_spans(spans, backend="numpy")`` or
+``FailureClassifier(backend="numpy")``, or build the columns once and pass
+them to both :func:`analyze_columns` and :func:`classify_columns`.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from voiceobs.analyzer import AnalysisResult, resolve_stage
+from voiceobs.classifier import ClassificationResult
+from voiceobs.failures import (
+    DEFAULT_THRESHOLDS,
+    Failure,
+    FailureThresholds,
+    FailureType,
+    Severity,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Stage codes stored in SpanColumns.stage_code
+STAGE_ASR = 0
+STAGE_LLM = 1
+STAGE_TTS = 2
+STAGE_OTHER = 3
+
+_STAGE_CODES = {"asr": STAGE_ASR, "llm": STAGE_LLM, "tts": STAGE_TTS}
+
+# Order of two failures detected on the same span, matching the Python path
+_FIRST = 0
+_SECOND = 1
+
+_SEVERITIES = (Severity.LOW, Severity.MEDIUM, Severity.HIGH)
+
+
+def _import_numpy() -> ModuleType:
+    """Import the optional numpy package.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "The numpy backend requires the numpy package. "
+            "Install with: pip install voiceobs[columnar]"
+        ) from e
+    return numpy
+
+
+@dataclass
+class SpanColumns:
+    """Span attributes used by the analyzer and classifier, as NumPy arrays.
+
+    Columns are kept per span kind: the ``stage_*`` arrays have one entry
+    per stage span, the ``turn_*`` arrays one per turn span and the
+    ``eval_*`` arrays one per evaluation record. Each group's ``*_rows``
+    array holds the span's position in the input. Missing numeric values
+    are NaN.
+    """
+
+    spans: Sequence[dict] = field(repr=False)
+    """The spans the columns were extracted from."""
+
+    conversation_ids: set[Any]
+    """Distinct non-empty voice.conversation.id values."""
+
+    stage_rows: np.ndarray
+    stage_code: np.ndarray
+    """STAGE_* code of each stage span; int8."""
+    stage_type: np.ndarray
+    """Stage type string of each stage span; object."""
+    stage_duration_ms: np.ndarray
+    """Stage duration, preferring voice.stage.duration_ms; float64."""
+    asr_confidence: np.ndarray
+    """voice.asr.confidence; float64."""
+
+    turn_rows: np.ndarray
+    turn_agent: np.ndarray
+    """voice.actor == "agent"; bool."""
+    turn_silence_ms: np.ndarray
+    """voice.silence.after_user_ms; float64."""
+    turn_overlap_ms: np.ndarray
+    """voice.turn.overlap_ms; float64."""
+    turn_interrupted: np.ndarray
+    """voice.interruption.detected is truthy; bool."""
+
+    eval_rows: np.ndarray
+    eval_intent: np.ndarray
+    """eval.intent_correct as 1 (True), -1 (False) or 0 (other); int8."""
+    eval_relevance: np.ndarray
+    """eval.relevance_score; float64."""
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[dict]) -> SpanColumns:
+        """Extract columns from span dictionaries in a single pass.
+
+        Args:
+            spans: Span dictionaries (from parse_jsonl).
+
+        Returns:
+            SpanColumns for the spans.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        np = _import_numpy()
+        nan = math.nan
+
+        conversation_ids: set[Any] = set()
+        stage_rows: list[int] = []
+        stage_types: list[Any] = []
+        stage_durations: list[float] = []
+        confidences: list[float] = []
+        turn_rows: list[int] = []
+        agents: list[bool] = []
+        silences: list[float] = []
+        overlaps: list[float] = []
+        interrupted: list[bool] = []
+        eval_rows: list[int] = []
+        intents: list[int] = []
+        relevances: list[float] = []
+
+        for row, span in enumerate(spans):
+            attrs = span.get("attributes", {})
+            conv_id = attrs.get("voice.conversation.id")
+            if conv_id:
+                conversation_ids.add(conv_id)
+
+            name = span.get("name", "")
+            stage = resolve_stage(span)
+            if stage is not None:
+                stage_type, duration = stage
+                stage_rows.append(row)
+                stage_types.append(stage_type)
+                stage_durations.append(nan if duration is None else duration)
+                confidence = attrs.get("voice.asr.confidence")
+                confidences.append(nan if confidence is None else confidence)
+            elif name == "voice.turn":
+                turn_rows.append(row)
+                agents.append(attrs.get("voice.actor") == "agent")
+                silence = attrs.get("voice.silence.after_user_ms")
+                silences.append(nan if silence is None else silence)
+                overlap = attrs.get("voice.turn.overlap_ms")
+                overlaps.append(nan if overlap is None else overlap)
+                interrupted.append(bool(attrs.get("voice.interruption.detected")))
+            elif name == "voiceobs.eval":
+                eval_rows.append(row)
+                intent_correct = attrs.get("eval.intent_correct")
+                intents.append(
+                    1 if intent_correct is True else -1 if intent_correct is False else 0
+                )
+                relevance = attrs.get("eval.relevance_score")
+                relevances.append(nan if relevance is None else relevance)
+
+        stage_type = np.empty(len(stage_types), dtype=object)
+        stage_type[:] = stage_types
+
+        return cls(
+            spans=spans,
+            conversation_ids=conversation_ids,
+            stage_rows=np.array(stage_rows, dtype=np.int64),
+            stage_code=np.array(
+                [_STAGE_CODES.get(t, STAGE_OTHER) for t in stage_types], dtype=np.int8
+            ),
+            stage_type=stage_type,
+            stage_duration_ms=np.array(stage_durations, dtype=np.float64),
+            asr_confidence=np.array(confidences, dtype=np.float64),
+            turn_rows=np.array(turn_rows, dtype=np.int64),
+            turn_agent=np.array(agents, dtype=bool),
+            turn_silence_ms=np.array(silences, dtype=np.float64),
+            turn_overlap_ms=np.array(overlaps, dtype=np.float64),
+            turn_interrupted=np.array(interrupted, dtype=bool),
+            eval_rows=np.array(eval_rows, dtype=np.int64),
+            eval_intent=np.array(intents, dtype=np.int8),
+            eval_relevance=np.array(relevances, dtype=np.float64),
+        )
+
+
+def analyze_columns(columns: SpanColumns) -> AnalysisResult:
+    """Compute analysis metrics from span columns.
+
+    Equivalent to ``analyze_spans`` over the same spans.
+
+    Args:
+        columns: Columns extracted with SpanColumns.from_spans.
+
+    Returns:
+        AnalysisResult with list-based (exact) metrics.
+    """
+    np = _import_numpy()
+    result = AnalysisResult()
+
+    def samples(values: np.ndarray) -> list[float]:
+        return np.sort(values[~np.isnan(values)]).tolist()
+
+    for code, metrics in (
+        (STAGE_ASR, result.asr_metrics),
+        (STAGE_LLM, result.llm_metrics),
+        (STAGE_TTS, result.tts_metrics),
+    ):
+        metrics.durations_ms = samples(columns.stage_duration_ms[columns.stage_code == code])
+
+    agent = columns.turn_agent
+    turns = result.turn_metrics
+    turns.total_agent_turns = int(agent.sum())
+    turns.silence_after_user_ms = samples(columns.turn_silence_ms[agent])
+    turns.overlap_ms = samples(columns.turn_overlap_ms[agent])
+    turns.interruptions = int((agent & columns.turn_interrupted).sum())
+
+    evals = result.eval_metrics
+    evals.total_evals = len(columns.eval_rows)
+    evals.intent_correct_count = int((columns.eval_intent == 1).sum())
+    evals.intent_incorrect_count = int((columns.eval_intent == -1).sum())
+    evals.relevance_scores = samples(columns.eval_relevance)
+
+    result.total_spans = len(columns)
+    result.total_turns = len(columns.turn_rows)
+    result.conversation_ids = set(columns.conversation_ids)
+    result.total_conversations = len(result.conversation_ids)
+    return result
+
+
+def _severities(np: ModuleType, values: np.ndarray, low_max: float, medium_max: float) -> list:
+    """Vectorized compute_*_severity: LOW up to low_max, MEDIUM up to medium_max."""
+    levels = np.select([values <= low_max, values <= medium_max], [0, 1], default=2)
+    return [_SEVERITIES[level] for level in levels.tolist()]
+
+
+def classify_columns(
+    columns: SpanColumns,
+    thresholds: FailureThresholds | None = None,
+) -> ClassificationResult:
+    """Classify failures from span columns.
+
+    Equivalent to ``FailureClassifier(thresholds).classify`` over the same
+    spans, including the order of the returned failures.
+
+    Args:
+        columns: Columns extracted with SpanColumns.from_spans.
+        thresholds: Custom thresholds. Uses DEFAULT_THRESHOLDS if not provided.
+
+    Returns:
+        ClassificationResult with detected failures.
+    """
+    np = _import_numpy()
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    spans = columns.spans
+
+    # Failures are built one check at a time; rows and order_keys record
+    # where each belongs in the Python path's span-by-span order.
+    failures: list[Failure] = []
+    rows: list[np.ndarray] = []
+    order_keys: list[np.ndarray] = []
+
+    def add(selected_rows: np.ndarray, order: int, batch: list[Failure]) -> None:
+        failures.extend(batch)
+        rows.append(selected_rows)
+        order_keys.append(np.full(len(selected_rows), order, dtype=np.int8))
+
+    def context(row: int) -> tuple[Any, Any, Any]:
+        attrs = spans[row].get("attributes", {})
+        return (
+            attrs.get("voice.conversation.id"),
+            attrs.get("voice.turn.id"),
+            attrs.get("voice.turn.index"),
+        )
+
+    # Slow stages. Unknown stage types use the LLM threshold, like the
+    # Python path; NaN compares False, so spans without a duration never match.
+    stage_threshold = np.select(
+        [columns.stage_code == STAGE_ASR, columns.stage_code == STAGE_TTS],
+        [thresholds.slow_asr_ms, thresholds.slow_tts_ms],
+        default=thresholds.slow_llm_ms,
+    )
+    (slow,) = np.nonzero(columns.stage_duration_ms > stage_threshold)
+    durations = columns.stage_duration_ms[slow]
+    slow_rows = columns.stage_rows[slow]
+    batch = []
+    for i, row, duration_ms, threshold, severity in zip(
+        slow.tolist(),
+        slow_rows.tolist(),
+        durations.tolist(),
+        stage_threshold[slow].tolist(),
+        _severities(np, durations, thresholds.slow_low_max_ms, thresholds.slow_medium_max_ms),
+    ):
+        stage = columns.stage_type[i]
+        conv_id, turn_id, turn_index = context(row)
+        batch.append(
+            Failure(
+                type=FailureType.SLOW_RESPONSE,
+                severity=severity,
+                message=f"{stage.upper()} took {duration_ms:.0f}ms (threshold: {threshold:.0f}ms)",
+                conversation_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+                signal_name=f"voice.{stage}.duration_ms",
+                signal_value=duration_ms,
+                threshold=threshold,
+            )
+        )
+    add(slow_rows, _FIRST, batch)
+
+    # Low ASR confidence (only stages whose type is exactly "asr")
+    confidence = columns.asr_confidence
+    (low,) = np.nonzero(
+        (columns.stage_type == "asr") & (confidence < thresholds.asr_min_confidence)
+    )
+    confidences = confidence[low]
+    low_rows = columns.stage_rows[low]
+    levels = np.select([confidences >= 0.5, confidences >= 0.3], [0, 1], default=2)
+    batch = []
+    for row, value, level in zip(low_rows.tolist(), confidences.tolist(), levels.tolist()):
+        conv_id, turn_id, turn_index = context(row)
+        batch.append(
+            Failure(
+                type=FailureType.ASR_LOW_CONFIDENCE,
+                severity=_SEVERITIES[level],
+                message=(
+                    f"ASR confidence {value:.0%} "
+                    f"below threshold {thresholds.asr_min_confidence:.0%}"
+                ),
+                conversation_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+                signal_name="voice.asr.confidence",
+                signal_value=value,
+                threshold=thresholds.asr_min_confidence,
+            )
+        )
+    add(low_rows, _SECOND, batch)
+
+    # Excessive silence after the user (agent turns only)
+    agent = columns.turn_agent
+    (silent,) = np.nonzero(agent & (columns.turn_silence_ms > thresholds.excessive_silence_ms))
+    silences = columns.turn_silence_ms[silent]
+    silent_rows = columns.turn_rows[silent]
+    batch = []
+    for row, silence_ms, severity in zip(
+        silent_rows.tolist(),
+        silences.tolist(),
+        _severities(np, silences, thresholds.silence_low_max_ms, thresholds.silence_medium_max_ms),
+    ):
+        conv_id, turn_id, turn_index = context(row)
+        batch.append(
+            Failure(
+                type=FailureType.EXCESSIVE_SILENCE,
+                severity=severity,
+                message=(
+                    f"Silence of {silence_ms:.0f}ms "
+                    f"(threshold: {thresholds.excessive_silence_ms:.0f}ms)"
+                ),
+                conversation_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+                signal_name="voice.silence.after_user_ms",
+                signal_value=silence_ms,
+                threshold=thresholds.excessive_silence_ms,
+            )
+        )
+    add(silent_rows, _FIRST, batch)
+
+    # Interruptions: overlap above the threshold, else the boolean flag
+    overlapping = agent & (columns.turn_overlap_ms > thresholds.interruption_overlap_ms)
+    (overlapped,) = np.nonzero(overlapping)
+    overlaps = columns.turn_overlap_ms[overlapped]
+    overlap_rows = columns.turn_rows[overlapped]
+    batch = []
+    for row, overlap_ms, severity in zip(
+        overlap_rows.tolist(),
+        overlaps.tolist(),
+        _severities(
+            np,
+            overlaps,
+            thresholds.interruption_low_max_ms,
+            thresholds.interruption_medium_max_ms,
+        ),
+    ):
+        conv_id, turn_id, turn_index = context(row)
+        batch.append(
+            Failure(
+                type=FailureType.INTERRUPTION,
+                severity=severity,
+                message=f"Agent interrupted user by {overlap_ms:.0f}ms",
+                conversation_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+                signal_name="voice.turn.overlap_ms",
+                signal_value=overlap_ms,
+                threshold=thresholds.interruption_overlap_ms,
+            )
+        )
+    add(overlap_rows, _SECOND, batch)
+
+    flagged_rows = columns.turn_rows[agent & ~overlapping & columns.turn_interrupted]
+    batch = []
+    for row in flagged_rows.tolist():
+        conv_id, turn_id, turn_index = context(row)
+        batch.append(
+            Failure(
+                type=FailureType.INTERRUPTION,
+                severity=Severity.LOW,
+                message="Agent interrupted user (detected via flag)",
+                conversation_id=conv_id,
+                turn_id=turn_id,
+                turn_index=turn_index,
+                signal_name="voice.interruption.detected",
+                signal_value=1.0,
+                threshold=0.0,
+            )
+        )
+    add(flagged_rows, _SECOND, batch)
+
+    order = np.lexsort((np.concatenate(order_keys), np.concatenate(rows)))
+    return ClassificationResult(
+        failures=[failures[i] for i in order.tolist()],
+        total_spans=len(columns),
+        total_turns=len(columns.turn_rows),
+        total_agent_turns=int(agent.sum()),
+    )
@@ -26,6 +26,10 @@ class ExporterJsonlConfig:
 
     enabled: bool = False
     path: str = "./voiceobs_run.jsonl"
+    flush_interval_ms: int = 0
+    max_bytes: int = 0
+    backup_count: int = 5
+    compression: Literal["none", "gzip", "zstd"] = "none"
 
 
 @dataclass
@@ -46,6 +50,8 @@ class ExporterOtlpConfig:
     batch_size: int = 512
     batch_timeout_ms: int = 5000
     max_retries: int = 3
+    max_queue_size: int = 2048
+    export_timeout_ms: int = 10000
 
 
 @dataclass
@@ -194,6 +200,41 @@ class ServerConfig:
     database_pool_min_size: int = 2
     database_pool_max_size: int = 10
 
+    # Seconds between metrics rollup refreshes (0 disables the refresh job)
+    metrics_rollup_interval_seconds: float = 60.0
+
+    # Background workers deriving turns and failures from ingested spans
+    # (0 disables derivation) and the maximum number of spans waiting for them
+    derivation_workers: int = 2
+    derivation_queue_size: int = 10000
+
+    # Seconds an authenticated user/organization/membership lookup is reused
+    # (0 disables the auth cache) and the maximum number of cached entries.
+    # The cache is per process: membership changes only invalidate it in the
+    # process that handled them, so with several workers or servers a removed
+    # member keeps access for up to the TTL.
+    auth_cache_ttl_seconds: float = 30.0
+    auth_cache_max_size: int = 10000
+
+    # Test scenarios run at once by this server (0 disables running tests
+    # here), at once per agent across all servers, and seconds without a
+    # heartbeat before a running execution is handed to another server.
+    # test_execution_runner selects how scenarios are run: "none" leaves them
+    # queued, "simulated" fakes the caller, agent and results (development only)
+    test_execution_workers: int = 0
+    test_execution_runner: str = "none"
+    test_execution_concurrency_per_agent: int = 4
+    test_execution_lease_seconds: float = 300.0
+
+    # Share synthesized TTS audio (e.g. persona previews) between records with
+    # the same provider, config and text. Audio no longer referenced is
+    # evicted after tts_cache_max_idle_seconds (0 keeps it) or, least
+    # recently used first, once the cache exceeds tts_cache_max_bytes (0 for
+    # no size limit)
+    tts_cache_enabled: bool = True
+    tts_cache_max_bytes: int = 1024 * 1024 * 1024
+    tts_cache_max_idle_seconds: float = 30 * 24 * 3600.0
+
 
 @dataclass
 class VoiceobsConfig:
@@ -280,8 +321,17 @@ def _validate_config(config: VoiceobsConfig) -> list[str]:
     errors: list[str] = []
 
     # Validate exporters
-    if config.exporters.jsonl.enabled and not config.exporters.jsonl.path:
-        errors.append("exporters.jsonl.path is required when jsonl exporter is enabled")
+    if config.exporters.jsonl.enabled:
+        if not config.exporters.jsonl.path:
+            errors.append("exporters.jsonl.path is required when jsonl exporter is enabled")
+        if config.exporters.jsonl.flush_interval_ms < 0:
+            errors.append("exporters.jsonl.flush_interval_ms must be >= 0")
+        if config.exporters.jsonl.max_bytes < 0:
+            errors.append("exporters.jsonl.max_bytes must be >= 0")
+        if config.exporters.jsonl.backup_count < 0:
+            errors.append("exporters.jsonl.backup_count must be >= 0")
+        if config.exporters.jsonl.compression not in ("none", "gzip", "zstd"):
+            errors.append("exporters.jsonl.compression must be 'none', 'gzip' or 'zstd'")
 
     # Validate OTLP exporter
     if config.exporters.otlp.enabled:
@@ -295,6 +345,10 @@ def _validate_config(config: VoiceobsConfig) -> list[str]:
             errors.append("exporters.otlp.batch_timeout_ms must be > 0")
         if config.exporters.otlp.max_retries < 0:
             errors.append("exporters.otlp.max_retries must be >= 0")
+        if config.exporters.otlp.max_queue_size <= 0:
+            errors.append("exporters.otlp.max_queue_size must be > 0")
+        if config.exporters.otlp.export_timeout_ms <= 0:
+            errors.append("exporters.otlp.export_timeout_ms must be > 0")
 
     # Validate failures thresholds (must be non-negative)
     failures = config.failures
@@ -328,6 +382,40 @@ def _validate_config(config: VoiceobsConfig) -> list[str]:
     if not 0 <= config.eval.temperature <= 2:
         errors.append("eval.temperature must be between 0 and 2")
 
+    # Validate server config
+    if config.server.metrics_rollup_interval_seconds < 0:
+        errors.append("server.metrics_rollup_interval_seconds must be >= 0")
+
+    if config.server.derivation_workers < 0:
+        errors.append("server.derivation_workers must be >= 0")
+
+    if config.server.derivation_queue_size < 1:
+        errors.append("server.derivation_queue_size must be >= 1")
+
+    if config.server.auth_cache_ttl_seconds < 0:
+        errors.append("server.auth_cache_ttl_seconds must be >= 0")
+
+    if config.server.auth_cache_max_size < 1:
+        errors.append("server.auth_cache_max_size must be >= 1")
+
+    if config.server.test_execution_workers < 0:
+        errors.append("server.test_execution_workers must be >= 0")
+
+    if config.server.test_execution_runner not in ("none", "simulated"):
+        errors.append("server.test_execution_runner must be one of: none, simulated")
+
+    if config.server.test_execution_concurrency_per_agent < 1:
+        errors.append("server.test_execution_concurrency_per_agent must be >= 1")
+
+    if config.server.test_execution_lease_seconds <= 0:
+        errors.append("server.test_execution_lease_seconds must be > 0")
+
+    if config.server.tts_cache_max_bytes < 0:
+        errors.append("server.tts_cache_max_bytes must be >= 0")
+
+    if config.server.tts_cache_max_idle_seconds < 0:
+        errors.append("server.tts_cache_max_idle_seconds must be >= 0")
+
     return errors
 
 
@@ -410,6 +498,12 @@ exporters:
   jsonl:
     enabled: false
     path: "./voiceobs_run.jsonl"
+    flush_interval_ms: 0  # 0 flushes after every export
+    max_bytes: 0  # rotate after this many bytes; 0 disables rotation
+    backup_count: 5
+    # "gzip" or "zstd" (requires zstandard); end the path in .gz or .zst so
+    # analyze and report decompress the file
+    compression: "none"
 
   # Console exporter (prints spans to stdout)
   console:
@@ -424,6 +518,8 @@ exporters:
     batch_size: 512
     batch_timeout_ms: 5000
     max_retries: 3
+    max_queue_size: 2048  # spans beyond this are dropped while the backend is slow
+    export_timeout_ms: 10000
 
 # Failure detection thresholds
 failures:
@@ -505,6 +601,52 @@ server:
   # Connection pool settings (only used when database_url is set)
   database_pool_min_size: 2
   database_pool_max_size: 10
+
+  # Seconds between metrics rollup refreshes; dashboard metrics read whole
+  # minutes and hours from rollups and only newer data from raw spans.
+  # Set to 0 to disable rollups.
+  metrics_rollup_interval_seconds: 60
+
+  # Background workers that derive turns and failures from ingested spans,
+  # and the maximum number of spans waiting for them (ingest waits when the
+  # queue is full). Spans the queue loses (failed batches, shutdown) stay in
+  # the derivation backlog, which the workers re-check every minute. Set
+  # derivation_workers to 0 to disable derivation; run "voiceobs db derive"
+  # to derive the backlog by hand.
+  derivation_workers: 2
+  derivation_queue_size: 10000
+
+  # Seconds to reuse an authenticated request's user, organization and
+  # membership lookups, and the maximum number of cached (user, org) pairs.
+  # Membership changes invalidate entries immediately, but only in the
+  # process that handled the change: with several workers or servers, a
+  # removed member keeps access elsewhere for up to the TTL. Lower the TTL
+  # to shorten that window, or set it to 0 to disable the cache. Counters
+  # are at GET /api/v1/auth/cache.
+  auth_cache_ttl_seconds: 30
+  auth_cache_max_size: 10000
+
+  # Test runs queue one execution per scenario in the database; every server
+  # with test_execution_workers > 0 and a test_execution_runner claims and
+  # runs them. The per-agent limit applies across all servers. Executions
+  # whose server stops sending heartbeats for test_execution_lease_seconds
+  # are requeued. With the default runner "none", executions stay queued.
+  # "simulated" invents transcripts, latencies and passing results; use it
+  # for local development only.
+  test_execution_workers: 0
+  test_execution_runner: none
+  test_execution_concurrency_per_agent: 4
+  test_execution_lease_seconds: 300
+
+  # Synthesized TTS audio (persona previews) is stored once per distinct
+  # provider, config and text and shared, e.g. by the system personas of
+  # every organization. Audio no longer used by any persona is kept for
+  # reuse until it has been idle for tts_cache_max_idle_seconds (0 = no idle
+  # limit) or, least recently used first, until the cache fits in
+  # tts_cache_max_bytes (0 = no size limit).
+  tts_cache_enabled: true
+  tts_cache_max_bytes: 1073741824
+  tts_cache_max_idle_seconds: 2592000
 """
 
 
@@ -0,0 +1,313 @@
+"""On-disk cache for semantic evaluation results.
+
+Results are stored in SQLite databases in WAL mode, sharded by the first
+byte of ``EvalInput.content_hash()``. Each write touches only the rows it
+adds, WAL lets readers and writers in different processes work at the
+same time, and shards are only opened when a key that hashes to them is
+first read or written.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from voiceobs.eval.types import EvalResult
+
+logger = logging.getLogger(__name__)
+
+LEGACY_CACHE_FILE = "eval_cache.json"
+"""Single-file JSON cache written by earlier versions, imported on first use."""
+
+_EVICT_EVERY = 1000
+"""Run eviction on a shard after this many writes to it."""
+
+_MAX_QUERY_KEYS = 500
+"""Keys per lookup query, below SQLite's bound-parameter limit."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eval_cache (
+    content_hash TEXT PRIMARY KEY,
+    intent_correct INTEGER NOT NULL,
+    relevance_score REAL NOT NULL,
+    explanation TEXT NOT NULL,
+    conversation_id TEXT,
+    turn_id TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_eval_cache_created_at ON eval_cache (created_at);
+"""
+
+
+class EvalCache:
+    """Sharded SQLite cache of evaluation results keyed by content hash.
+
+    Entries older than ``max_age_days`` are ignored and deleted, and each
+    shard keeps at most ``max_entries / shards`` entries, dropping the
+    oldest first. Eviction runs when a shard is opened and then after
+    every thousand writes to it.
+
+    Example:
+        cache = EvalCache(".voiceobs_cache")
+        result = cache.get(eval_input.content_hash())
+        if result is None:
+            result = evaluate(eval_input)
+            cache.put(result)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        shards: int = 16,
+        max_entries: int = 1_000_000,
+        max_age_days: float | None = 90.0,
+    ) -> None:
+        """Initialize the cache. No files are opened until first use.
+
+        Args:
+            cache_dir: Directory holding the shard databases.
+            shards: Number of shard databases (1-256).
+            max_entries: Maximum number of entries across all shards.
+            max_age_days: Maximum entry age in days, or None for no limit.
+
+        Raises:
+            ValueError: If shards or max_entries is out of range.
+        """
+        if not 1 <= shards <= 256:
+            raise ValueError("shards must be between 1 and 256")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self.cache_dir = Path(cache_dir)
+        self.shards = shards
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._writes: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._legacy_checked = False
+
+    def get(self, content_hash: str) -> EvalResult | None:
+        """Get a cached result.
+
+        Args:
+            content_hash: Hash of the evaluation input.
+
+        Returns:
+            The cached result (with ``cached=True``), or None on a miss.
+        """
+        return self.get_many([content_hash]).get(content_hash)
+
+    def get_many(self, content_hashes: Iterable[str]) -> dict[str, EvalResult]:
+        """Get cached results for several inputs.
+
+        Args:
+            content_hashes: Hashes of the evaluation inputs.
+
+        Returns:
+            Mapping of content hash to cached result for every hit.
+        """
+        by_shard: dict[int, list[str]] = {}
+        for content_hash in set(content_hashes):
+            by_shard.setdefault(self._shard_for(content_hash), []).append(content_hash)
+
+        found: dict[str, EvalResult] = {}
+        with self._lock:
+            rows = []
+            for shard, hashes in by_shard.items():
+                conn = self._connect(shard)
+                for start in range(0, len(hashes), _MAX_QUERY_KEYS):
+                    chunk = hashes[start : start + _MAX_QUERY_KEYS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows += conn.execute(
+                        f"""
+                        SELECT content_hash, intent_correct, relevance_score, explanation,
+                               conversation_id, turn_id
+                        FROM eval_cache
+                        WHERE content_hash IN ({placeholders}) AND created_at >= ?
+                        """,
+                        [*chunk, self._cutoff()],
+                    ).fetchall()
+            for row in rows:
+                found[row[0]] = EvalResult(
+                    intent_correct=bool(row[1]),
+                    relevance_score=row[2],
+                    explanation=row[3],
+                    conversation_id=row[4],
+                    turn_id=row[5],
+                    content_hash=row[0],
+                    cached=True,
+                )
+        return found
+
+    def put(self, result: EvalResult) -> None:
+        """Store a result under its ``content_hash``.
+
+        Args:
+            result: The result to store.
+        """
+        self.put_many([result])
+
+    def put_many(self, results: Iterable[EvalResult]) -> None:
+        """Store several results, one transaction per shard.
+
+        Args:
+            results: Results to store. Results without a content hash are skipped.
+        """
+        with self._lock:
+            for shard, rows in self._rows_by_shard(results).items():
+                self._insert(shard, rows, "REPLACE")
+                self._writes[shard] = self._writes.get(shard, 0) + len(rows)
+                if self._writes[shard] >= _EVICT_EVERY:
+                    self._evict_shard(shard)
+
+    def evict(self) -> int:
+        """Delete expired entries and trim every shard to its size limit.
+
+        Returns:
+            Number of entries deleted.
+        """
+        with self._lock:
+            return sum(self._evict_shard(shard) for shard in range(self.shards))
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock:
+            for shard in range(self.shards):
+                with self._connect(shard) as conn:
+                    conn.execute("DELETE FROM eval_cache")
+
+    def close(self) -> None:
+        """Close all open shard connections."""
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+
+    def __len__(self) -> int:
+        """Number of unexpired entries across all shards."""
+        with self._lock:
+            return sum(
+                self._connect(shard)
+                .execute("SELECT COUNT(*) FROM eval_cache WHERE created_at >= ?", (self._cutoff(),))
+                .fetchone()[0]
+                for shard in range(self.shards)
+            )
+
+    def _shard_for(self, content_hash: str) -> int:
+        """Shard index for a hex content hash."""
+        try:
+            return int(content_hash[:2], 16) % self.shards
+        except ValueError:
+            return sum(content_hash.encode()) % self.shards
+
+    def _rows_by_shard(self, results: Iterable[EvalResult]) -> dict[int, list[tuple]]:
+        """Group results into table rows per shard, skipping unhashed results."""
+        now = time.time()
+        by_shard: dict[int, list[tuple]] = {}
+        for result in results:
+            if result.content_hash is None:
+                continue
+            by_shard.setdefault(self._shard_for(result.content_hash), []).append(
+                (
+                    result.content_hash,
+                    int(result.intent_correct),
+                    result.relevance_score,
+                    result.explanation,
+                    result.conversation_id,
+                    result.turn_id,
+                    now,
+                )
+            )
+        return by_shard
+
+    def _insert(self, shard: int, rows: list[tuple], conflict: str) -> None:
+        """Insert rows into a shard in one transaction. Caller holds the lock."""
+        with self._connect(shard) as conn:
+            conn.executemany(
+                f"INSERT OR {conflict} INTO eval_cache VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def _cutoff(self) -> float:
+        """Oldest creation time that is still valid."""
+        if self.max_age_days is None:
+            return 0.0
+        return time.time() - self.max_age_days * 86400
+
+    def _connect(self, shard: int) -> sqlite3.Connection:
+        """Open a shard on first use. Caller holds the lock."""
+        conn = self._connections.get(shard)
+        if conn is not None:
+            return conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"eval_cache.{shard:02x}.sqlite"
+        conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._connections[shard] = conn
+
+        self._evict_shard(shard)
+        if not self._legacy_checked:
+            self._legacy_checked = True
+            self._import_legacy()
+        return conn
+
+    def _evict_shard(self, shard: int) -> int:
+        """Delete expired and excess entries from one shard. Caller holds the lock."""
+        conn = self._connect(shard)
+        self._writes[shard] = 0
+        limit = max(1, self.max_entries // self.shards)
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM eval_cache WHERE created_at < ?", (self._cutoff(),)
+            ).rowcount
+            deleted += conn.execute(
+                """
+                DELETE FROM eval_cache WHERE content_hash IN (
+                    SELECT content_hash FROM eval_cache
+                    ORDER BY created_at
+                    LIMIT max(0, (SELECT COUNT(*) FROM eval_cache) - ?)
+                )
+                """,
+                (limit,),
+            ).rowcount
+        return deleted
+
+    def _import_legacy(self) -> None:
+        """Import a single-file JSON cache once, then move it aside. Caller holds the lock."""
+        legacy = self.cache_dir / LEGACY_CACHE_FILE
+        if not legacy.exists():
+            return
+        try:
+            with legacy.open() as f:
+                data = json.load(f)
+            results = [
+                EvalResult(
+                    intent_correct=entry["intent_correct"],
+                    relevance_score=entry["relevance_score"],
+                    explanation=entry["explanation"],
+                    conversation_id=entry.get("conversation_id"),
+                    turn_id=entry.get("turn_id"),
+                    content_hash=content_hash,
+                )
+                for content_hash, entry in data.items()
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            logger.warning(f"Ignoring invalid eval cache file {legacy}")
+            return
+
+        # Entries already written by this version win over the legacy file
+        for shard, rows in self._rows_by_shard(results).items():
+            self._insert(shard, rows, "IGNORE")
+        try:
+            legacy.rename(legacy.with_name(LEGACY_CACHE_FILE + ".imported"))
+        except FileNotFoundError:
+            pass  # Another process imported it first
@@ -6,13 +6,14 @@ for LLM abstraction. Uses structured output for reliable JSON responses.
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import asyncio
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+from voiceobs.eval.cache import EvalCache
 from voiceobs.eval.providers import get_provider
+from voiceobs.eval.rate_limit import get_rate_limiter
 from voiceobs.eval.types import EvalConfig, EvalInput, EvalResult
 
 if TYPE_CHECKING:
@@ -87,6 +88,32 @@ def _build_prompt(eval_input: EvalInput) -> str:
     )
 
 
+def _result_from_output(output: EvalOutput, eval_input: EvalInput, content_hash: str) -> EvalResult:
+    """Build an EvalResult from the LLM's structured output."""
+    return EvalResult(
+        intent_correct=output.intent_correct,
+        relevance_score=output.relevance_score,
+        explanation=output.explanation,
+        conversation_id=eval_input.conversation_id,
+        turn_id=eval_input.turn_id,
+        content_hash=content_hash,
+        cached=False,
+    )
+
+
+def _result_for(result: EvalResult, eval_input: EvalInput, cached: bool) -> EvalResult:
+    """Copy a result for another input with the same content, using its IDs."""
+    return EvalResult(
+        intent_correct=result.intent_correct,
+        relevance_score=result.relevance_score,
+        explanation=result.explanation,
+        conversation_id=eval_input.conversation_id,
+        turn_id=eval_input.turn_id,
+        content_hash=result.content_hash,
+        cached=cached,
+    )
+
+
 class SemanticEvaluator:
     """LLM-based semantic evaluator for voice conversations.
 
@@ -116,57 +143,15 @@ class SemanticEvaluator:
         self.config = config or EvalConfig()
         self._llm: BaseChatModel | None = None
         self._structured_llm = None
-        self._cache: dict[str, EvalResult] = {}
 
-        # Initialize cache directory if caching is enabled
+        # The cache opens its files lazily, on the first lookup
+        self._cache: EvalCache | None = None
         if self.config.cache_enabled:
-            self._cache_dir = Path(self.config.cache_dir)
-            self._load_cache()
-
-    def _load_cache(self) -> None:
-        """Load cached results from disk."""
-        if not self._cache_dir.exists():
-            return
-
-        cache_file = self._cache_dir / "eval_cache.json"
-        if cache_file.exists():
-            try:
-                with cache_file.open() as f:
-                    data = json.load(f)
-                    for hash_key, result_data in data.items():
-                        self._cache[hash_key] = EvalResult(
-                            intent_correct=result_data["intent_correct"],
-                            relevance_score=result_data["relevance_score"],
-                            explanation=result_data["explanation"],
-                            conversation_id=result_data.get("conversation_id"),
-                            turn_id=result_data.get("turn_id"),
-                            content_hash=hash_key,
-                            cached=True,
-                        )
-            except (json.JSONDecodeError, KeyError):
-                # Invalid cache file, start fresh
-                self._cache = {}
-
-    def _save_cache(self) -> None:
-        """Save cached results to disk."""
-        if not self.config.cache_enabled:
-            return
-
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = self._cache_dir / "eval_cache.json"
-
-        data = {}
-        for hash_key, result in self._cache.items():
-            data[hash_key] = {
-                "intent_correct": result.intent_correct,
-                "relevance_score": result.relevance_score,
-                "explanation": result.explanation,
-                "conversation_id": result.conversation_id,
-                "turn_id": result.turn_id,
-            }
-
-        with cache_file.open("w") as f:
-            json.dump(data, f, indent=2)
+            self._cache = EvalCache(
+                self.config.cache_dir,
+                max_entries=self.config.cache_max_entries,
+                max_age_days=self.config.cache_max_age_days,
+            )
 
     def _get_structured_llm(self):
         """Get or create the structured LLM instance."""
@@ -193,18 +178,9 @@ class SemanticEvaluator:
         """
         # Check cache first
         content_hash = eval_input.content_hash()
-        if self.config.cache_enabled and content_hash in self._cache:
-            cached_result = self._cache[content_hash]
-            # Update with current input's IDs
-            return EvalResult(
-                intent_correct=cached_result.intent_correct,
-                relevance_score=cached_result.relevance_score,
-                explanation=cached_result.explanation,
-                conversation_id=eval_input.conversation_id,
-                turn_id=eval_input.turn_id,
-                content_hash=content_hash,
-                cached=True,
-            )
+        cached_result = self._cache.get(content_hash) if self._cache is not None else None
+        if cached_result is not None:
+            return _result_for(cached_result, eval_input, cached=True)
 
         # Build prompt and call LLM with structured output
         prompt = _build_prompt(eval_input)
@@ -212,20 +188,11 @@ class SemanticEvaluator:
 
         output: EvalOutput = structured_llm.invoke(prompt)
 
-        result = EvalResult(
-            intent_correct=output.intent_correct,
-            relevance_score=output.relevance_score,
-            explanation=output.explanation,
-            conversation_id=eval_input.conversation_id,
-            turn_id=eval_input.turn_id,
-            content_hash=content_hash,
-            cached=False,
-        )
+        result = _result_from_output(output, eval_input, content_hash)
 
         # Cache the result
-        if self.config.cache_enabled:
-            self._cache[content_hash] = result
-            self._save_cache()
+        if self._cache is not None:
+            self._cache.put(result)
 
         return result
 
@@ -240,10 +207,84 @@ class SemanticEvaluator:
         """
         return [self.evaluate(inp) for inp in inputs]
 
+    async def aevaluate_batch(self, inputs: list[EvalInput]) -> list[EvalResult]:
+        """Evaluate multiple turns concurrently.
+
+        Inputs are deduplicated by ``content_hash`` before any request is
+        sent, so identical turns (and turns already in the cache) cost no
+        extra LLM calls. At most ``config.max_concurrency`` requests are in
+        flight at once, and if ``config.requests_per_second`` is set, requests
+        are paced by a token bucket shared by all evaluators using the same
+        provider.
+
+        Args:
+            inputs: List of evaluation inputs.
+
+        Returns:
+            List of evaluation results in the same order as the inputs.
+
+        Raises:
+            ImportError: If langchain dependencies are not installed.
+            ValueError: If an LLM response cannot be parsed.
+
+        If any request fails, the first error is re-raised after the results
+        of the requests that succeeded have been cached.
+        """
+        hashes = [inp.content_hash() for inp in inputs]
+        cached = self._cache.get_many(hashes) if self._cache is not None and hashes else {}
+
+        # One representative input per hash that is not already cached
+        pending: dict[str, EvalInput] = {}
+        for content_hash, inp in zip(hashes, inputs):
+            if content_hash not in cached:
+                pending.setdefault(content_hash, inp)
+
+        if pending:
+            structured_llm = self._get_structured_llm()
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            limiter = None
+            if self.config.requests_per_second:
+                limiter = get_rate_limiter(
+                    self.config.provider,
+                    self.config.requests_per_second,
+                    self.config.rate_limit_burst,
+                )
+
+            async def evaluate_one(content_hash: str, eval_input: EvalInput) -> EvalResult:
+                async with semaphore:
+                    if limiter is not None:
+                        await limiter.acquire()
+                    output: EvalOutput = await structured_llm.ainvoke(_build_prompt(eval_input))
+                return _result_from_output(output, eval_input, content_hash)
+
+            outcomes = await asyncio.gather(
+                *(evaluate_one(content_hash, inp) for content_hash, inp in pending.items()),
+                return_exceptions=True,
+            )
+            fresh_by_hash = {
+                content_hash: outcome
+                for content_hash, outcome in zip(pending, outcomes)
+                if isinstance(outcome, EvalResult)
+            }
+
+            # Keep the results that did come back even if another request failed
+            if self._cache is not None and fresh_by_hash:
+                self._cache.put_many(list(fresh_by_hash.values()))
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+        else:
+            fresh_by_hash = {}
+
+        results = []
+        for content_hash, inp in zip(hashes, inputs):
+            if content_hash in fresh_by_hash:
+                results.append(_result_for(fresh_by_hash[content_hash], inp, cached=False))
+            else:
+                results.append(_result_for(cached[content_hash], inp, cached=True))
+        return results
+
     def clear_cache(self) -> None:
         """Clear the evaluation cache."""
-        self._cache = {}
-        if self.config.cache_enabled:
-            cache_file = self._cache_dir / "eval_cache.json"
-            if cache_file.exists():
-                cache_file.unlink()
+        if self._cache is not None:
+            self._cache.clear()
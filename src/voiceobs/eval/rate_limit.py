@@ -0,0 +1,101 @@
+"""Token-bucket rate limiting for LLM provider requests.
+
+Limiters are shared per provider so that every evaluator talking to the
+same provider draws from one budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens
+    per second. Each request takes one token. When the bucket is empty,
+    callers reserve a future token and sleep until it is available, so
+    waiting callers are served in arrival order.
+
+    Example:
+        bucket = TokenBucket(rate=5.0, burst=5)
+        await bucket.acquire()
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens the bucket can hold.
+            clock: Monotonic clock, overridable for tests.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long to wait before using it.
+
+        Returns:
+            Seconds until the reserved token is available (0 if available now).
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, rate: float, burst: int = 1) -> TokenBucket:
+    """Get the shared rate limiter for a provider.
+
+    The limiter is created on first use. If a later call asks for a
+    different rate or burst, the limiter is replaced.
+
+    Args:
+        provider: Provider name (e.g., "gemini").
+        rate: Requests per second allowed for the provider.
+        burst: Maximum number of requests allowed at once.
+
+    Returns:
+        The provider's TokenBucket.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None or limiter.rate != rate or limiter.burst != burst:
+            limiter = TokenBucket(rate=rate, burst=burst)
+            _limiters[provider] = limiter
+        return limiter
@@ -104,6 +104,16 @@ class EvalConfig:
         cache_enabled: Whether to cache evaluation results.
         cache_dir: Directory for cache storage. Defaults to .voiceobs_cache.
         api_key: Optional API key (otherwise uses environment variables).
+        cache_max_entries: Maximum number of cached results; the oldest are
+            evicted first.
+        cache_max_age_days: Cached results older than this are ignored and
+            evicted. None keeps results indefinitely.
+        max_concurrency: Maximum number of in-flight LLM requests in
+            ``aevaluate_batch``.
+        requests_per_second: Optional request rate limit, shared by every
+            evaluator using the same provider. None disables rate limiting.
+        rate_limit_burst: Number of requests allowed at once before the rate
+            limit applies.
     """
 
     provider: LLMProvider = "gemini"
@@ -112,6 +122,20 @@ class EvalConfig:
     cache_enabled: bool = True
     cache_dir: str = ".voiceobs_cache"
     api_key: str | None = None
+    cache_max_entries: int = 1_000_000
+    cache_max_age_days: float | None = 90.0
+    max_concurrency: int = 8
+    requests_per_second: float | None = None
+    rate_limit_burst: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the settings that would otherwise fail later.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+        """
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
 
     def get_model(self) -> str:
         """Get the model name, using defaults if not specified."""
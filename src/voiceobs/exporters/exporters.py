@@ -6,13 +6,21 @@ JSONL export for local analysis.
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
 import threading
+import time
 from collections.abc import Sequence
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Literal
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
+Compression = Literal["none", "gzip", "zstd"]
+
 
 class JSONLSpanExporter(SpanExporter):
     """Exports spans to a JSONL file (one JSON object per line).
@@ -21,9 +29,25 @@ class JSONLSpanExporter(SpanExporter):
     to parse and analyze. Each line contains a complete JSON object with
     span information.
 
+    The file is opened once, on the first export, and kept open with a
+    buffered writer. By default the buffer is flushed at the end of every
+    export so the file is always up to date. Set ``flush_interval_ms`` to
+    let several exports share one write; a background thread then flushes
+    at least that often, so spans reach the file even when exports stop.
+    ``force_flush`` and ``shutdown`` always flush.
+
     Args:
         file_path: Path to the output JSONL file. Will be created if it
-            doesn't exist, or appended to if it does.
+            doesn't exist, or truncated if it does.
+        flush_interval_ms: Time between flushes. 0 flushes after every
+            export.
+        buffer_size: Size of the write buffer in bytes.
+        max_bytes: Rotate the file once this many bytes of (uncompressed)
+            JSONL have been written to it. 0 disables rotation.
+        backup_count: Number of rotated files to keep (``spans.1.jsonl``,
+            ``spans.2.jsonl``, ...). The oldest is deleted on rotation.
+        compression: "none", "gzip", or "zstd" (requires the ``zstandard``
+            package).
 
     Example:
         from voiceobs.exporters import JSONLSpanExporter
@@ -35,13 +59,45 @@ class JSONLSpanExporter(SpanExporter):
         provider.add_span_processor(BatchSpanProcessor(exporter))
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(
+        self,
+        file_path: str,
+        flush_interval_ms: int = 0,
+        buffer_size: int = 64 * 1024,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        compression: Compression = "none",
+    ) -> None:
+        if compression not in ("none", "gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd":
+            _import_zstandard()
+
         self._file_path = file_path
+        self._flush_interval_s = flush_interval_ms / 1000
+        self._buffer_size = buffer_size
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._compression = compression
         self._lock = threading.Lock()
+
+        self._file: IO[bytes] | None = None
+        self._bytes_written = 0
+        self._last_flush = time.monotonic()
+        self._shutdown = False
+
         # Create/truncate the file on initialization
         with open(self._file_path, "w"):
             pass  # Just create/truncate the file
 
+        self._stop_flusher = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if self._flush_interval_s > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="voiceobs-jsonl-flush", daemon=True
+            )
+            self._flusher.start()
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Export spans to the JSONL file.
 
@@ -49,32 +105,115 @@ class JSONLSpanExporter(SpanExporter):
             spans: Sequence of spans to export.
 
         Returns:
-            SpanExportResult.SUCCESS if export succeeded.
+            SpanExportResult.SUCCESS if export succeeded, FAILURE if it
+            failed or the exporter has been shut down.
         """
         try:
+            data = "".join(json.dumps(self._span_to_dict(span)) + "\n" for span in spans).encode()
             with self._lock:
-                with open(self._file_path, "a") as f:
-                    for span in spans:
-                        span_data = self._span_to_dict(span)
-                        f.write(json.dumps(span_data) + "\n")
+                if self._shutdown:
+                    return SpanExportResult.FAILURE
+                if self._file is None:
+                    self._file = self._open()
+                self._file.write(data)
+                self._bytes_written += len(data)
+
+                if self._max_bytes and self._bytes_written >= self._max_bytes:
+                    self._rotate()
+                elif time.monotonic() - self._last_flush >= self._flush_interval_s:
+                    self._flush()
             return SpanExportResult.SUCCESS
         except Exception:
             return SpanExportResult.FAILURE
 
     def shutdown(self) -> None:
-        """Shutdown the exporter."""
-        pass  # Nothing to clean up
+        """Shutdown the exporter, flushing and closing the file.
+
+        Later exports fail instead of reopening the file.
+        """
+        self._stop_flusher.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            self._shutdown = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Force flush any pending spans.
+        """Force flush any buffered spans to disk.
 
         Args:
-            timeout_millis: Timeout in milliseconds (unused).
+            timeout_millis: Timeout in milliseconds (unused; flushing a
+                local file does not block on anything else).
 
         Returns:
-            True always, as we flush after each export.
+            True if the flush succeeded, False otherwise.
         """
-        return True
+        try:
+            with self._lock:
+                self._flush()
+            return True
+        except Exception:
+            return False
+
+    def _open(self) -> IO[bytes]:
+        """Open the output file for appending with the configured compression."""
+        if self._compression == "gzip":
+            return _BufferedOwner(
+                gzip.open(self._file_path, "ab", compresslevel=6), self._buffer_size
+            )
+        if self._compression == "zstd":
+            zstandard = _import_zstandard()
+            raw = open(self._file_path, "ab")
+            writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+            return _BufferedOwner(writer, self._buffer_size)
+        return open(self._file_path, "ab", buffering=self._buffer_size)
+
+    def _flush_periodically(self) -> None:
+        """Flush every ``flush_interval_ms`` until shutdown (flusher thread)."""
+        timeout = self._flush_interval_s
+        while not self._stop_flusher.wait(timeout):
+            with self._lock:
+                elapsed = time.monotonic() - self._last_flush
+                if elapsed >= self._flush_interval_s:
+                    elapsed = 0.0
+                    try:
+                        self._flush()
+                    except Exception:
+                        # Keep the thread alive; the next export reports the failure
+                        self._last_flush = time.monotonic()
+            timeout = self._flush_interval_s - elapsed
+
+    def _flush(self) -> None:
+        """Flush buffered data to the operating system. Caller holds the lock."""
+        if self._file is not None:
+            self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def _rotate(self) -> None:
+        """Close the current file and shift it into the backups. Caller holds the lock."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._last_flush = time.monotonic()
+        self._bytes_written = 0
+
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                source = self._backup_path(index)
+                if source.exists():
+                    os.replace(source, self._backup_path(index + 1))
+            os.replace(self._file_path, self._backup_path(1))
+        # Start a fresh (empty) file so readers always find the active path
+        with open(self._file_path, "w"):
+            pass
+
+    def _backup_path(self, index: int) -> Path:
+        """Path of a rotated file, e.g. ``spans.2.jsonl.gz`` for ``spans.jsonl.gz``."""
+        path = Path(self._file_path)
+        base, dot, extensions = path.name.partition(".")
+        return path.with_name(f"{base}.{index}{dot}{extensions}")
 
     def _span_to_dict(self, span: ReadableSpan) -> dict:
         """Convert a span to a dictionary for JSON serialization.
@@ -145,5 +284,61 @@ def get_jsonl_exporter_from_config() -> JSONLSpanExporter | None:
 
     config = get_config()
     if config.exporters.jsonl.enabled:
-        return JSONLSpanExporter(config.exporters.jsonl.path)
+        return JSONLSpanExporter(
+            config.exporters.jsonl.path,
+            flush_interval_ms=config.exporters.jsonl.flush_interval_ms,
+            max_bytes=config.exporters.jsonl.max_bytes,
+            backup_count=config.exporters.jsonl.backup_count,
+            compression=config.exporters.jsonl.compression,
+        )
     return None
+
+
+class _BufferedOwner:
+    """Write buffer in front of a binary stream that it owns.
+
+    Used for the compressed writers, which would otherwise compress (and
+    write) on every small ``write`` call.
+    """
+
+    def __init__(self, stream: IO[bytes], buffer_size: int) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._chunks: list[bytes] = []
+        self._pending = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        self._pending += len(data)
+        if self._pending >= self._buffer_size:
+            self._drain()
+        return len(data)
+
+    def flush(self) -> None:
+        self._drain()
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._drain()
+        self._stream.close()
+
+    def _drain(self) -> None:
+        if self._chunks:
+            self._stream.write(b"".join(self._chunks))
+            self._chunks.clear()
+            self._pending = 0
+
+
+def _import_zstandard() -> ModuleType:
+    """Import the optional zstandard package.
+
+    Raises:
+        ImportError: If zstandard is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires the zstandard package. Install with: pip install zstandard"
+        ) from e
+    return zstandard
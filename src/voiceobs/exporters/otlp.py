@@ -7,7 +7,10 @@ OpenTelemetry-compatible backend (Grafana, Datadog, etc.) via OTLP.
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
+from collections import deque
 from collections.abc import Sequence
 from typing import Any
 
@@ -20,17 +23,28 @@ logger = logging.getLogger(__name__)
 class OTLPSpanExporter(SpanExporter):
     """Exports spans to an OpenTelemetry-compatible backend via OTLP.
 
-    Supports both gRPC and HTTP/protobuf protocols. Includes batch export
-    with configurable batch size and timeout, plus retry logic with
-    exponential backoff.
+    Supports both gRPC and HTTP/protobuf protocols. ``export`` never talks to
+    the network: spans go into a bounded in-memory queue that a background
+    sender thread drains in batches. A batch is sent when it reaches
+    ``batch_size`` spans or when its oldest span has waited
+    ``batch_timeout_ms``. Failed sends are retried with jittered exponential
+    backoff on the sender thread, so a slow or flaky collector never blocks
+    the caller. When the queue is full, new spans are dropped and counted in
+    ``dropped_spans``.
 
     Args:
         endpoint: OTLP endpoint URL (default: http://localhost:4317)
         protocol: Protocol to use, either "grpc" or "http/protobuf"
         headers: Optional headers (e.g., for authentication)
         batch_size: Maximum number of spans per batch
-        batch_timeout_ms: Maximum time to wait before flushing a batch
+        batch_timeout_ms: Maximum time a span waits before its batch is sent
         max_retries: Maximum number of retry attempts on failure
+        max_queue_size: Maximum number of spans waiting to be sent
+        export_timeout_ms: Timeout for a single send to the backend
+        initial_backoff_ms: Upper bound of the first retry delay; the bound
+            doubles on each retry and the actual delay is drawn uniformly
+            below it
+        max_backoff_ms: Cap on the retry delay bound
 
     Example:
         from voiceobs.exporters.otlp import OTLPSpanExporter
@@ -54,6 +68,10 @@ class OTLPSpanExporter(SpanExporter):
         batch_size: int = 512,
         batch_timeout_ms: int = 5000,
         max_retries: int = 3,
+        max_queue_size: int = 2048,
+        export_timeout_ms: int = 10000,
+        initial_backoff_ms: int = 1000,
+        max_backoff_ms: int = 30000,
     ) -> None:
         self._endpoint = endpoint
         self._protocol = protocol
@@ -61,6 +79,10 @@ class OTLPSpanExporter(SpanExporter):
         self._batch_size = batch_size
         self._batch_timeout_ms = batch_timeout_ms
         self._max_retries = max_retries
+        self._max_queue_size = max_queue_size
+        self._export_timeout_ms = export_timeout_ms
+        self._initial_backoff_ms = initial_backoff_ms
+        self._max_backoff_ms = max_backoff_ms
 
         # Lazy import to avoid requiring OTLP dependencies unless used
         # Type: Any because gRPC and HTTP exporters have different types
@@ -74,6 +96,7 @@ class OTLPSpanExporter(SpanExporter):
                 self._otlp_exporter = GrpcOTLPSpanExporter(
                     endpoint=endpoint,
                     headers=self._headers,
+                    timeout=export_timeout_ms / 1000,
                 )
             elif protocol == "http/protobuf":
                 from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
@@ -83,6 +106,7 @@ class OTLPSpanExporter(SpanExporter):
                 self._otlp_exporter = HttpOTLPSpanExporter(
                     endpoint=endpoint,
                     headers=self._headers,
+                    timeout=export_timeout_ms / 1000,
                 )
             else:
                 raise ValueError(f"Unsupported protocol: {protocol}")
@@ -91,89 +115,164 @@ class OTLPSpanExporter(SpanExporter):
                 "OTLP exporter dependencies not installed. Install with: pip install voiceobs[otlp]"
             ) from e
 
-        # Batch state
-        self._batch: list[ReadableSpan] = []
-        self._batch_start_time: float | None = None
+        # Queue state, guarded by _condition
+        self._condition = threading.Condition()
+        # (time.monotonic() when queued, span), oldest first
+        self._queue: deque[tuple[float, ReadableSpan]] = deque()
+        self._flush_requested = False
+        self._shutdown = False
+        self._stop = threading.Event()
+        self._sender: threading.Thread | None = None
+
+        # Span counters, guarded by _condition
+        self._enqueued_spans = 0
+        self._exported_spans = 0
+        self._failed_spans = 0
+        self._dropped_spans = 0
+        # Queued spans discarded at shutdown (also counted as dropped)
+        self._abandoned_spans = 0
+
+    @property
+    def dropped_spans(self) -> int:
+        """Spans dropped because the queue was full or the exporter shut down."""
+        return self._dropped_spans
+
+    @property
+    def failed_spans(self) -> int:
+        """Spans dropped after every send attempt failed."""
+        return self._failed_spans
+
+    @property
+    def exported_spans(self) -> int:
+        """Spans successfully sent to the backend."""
+        return self._exported_spans
+
+    @property
+    def queue_size(self) -> int:
+        """Spans currently waiting to be sent."""
+        return len(self._queue)
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        """Export spans to the OTLP backend.
+        """Queue spans for export to the OTLP backend.
 
-        Spans are batched and exported with retry logic. If the batch
-        is full or the timeout is reached, the batch is flushed.
+        This returns immediately; the spans are sent by the background
+        sender thread.
 
         Args:
             spans: Sequence of spans to export.
 
         Returns:
-            SpanExportResult.SUCCESS if export succeeded, FAILURE otherwise.
+            SpanExportResult.SUCCESS if every span was queued, FAILURE if
+            the queue was full (the overflow is dropped) or the exporter
+            has been shut down.
         """
         if not spans:
             return SpanExportResult.SUCCESS
 
-        # Add spans to batch
-        self._batch.extend(spans)
+        with self._condition:
+            if self._shutdown:
+                self._dropped_spans += len(spans)
+                return SpanExportResult.FAILURE
+
+            accepted = list(spans[: self._max_queue_size - len(self._queue)])
+            dropped = len(spans) - len(accepted)
+            if accepted:
+                enqueued_at = time.monotonic()
+                self._queue.extend((enqueued_at, span) for span in accepted)
+                self._enqueued_spans += len(accepted)
+                self._ensure_sender()
+                self._condition.notify_all()
+
+            if dropped:
+                self._dropped_spans += dropped
+                logger.warning(f"OTLP export queue full, dropped {dropped} spans")
+                return SpanExportResult.FAILURE
 
-        # Check if we should flush the batch
-        should_flush = False
-        current_time = time.time()
+        return SpanExportResult.SUCCESS
 
-        # Flush if batch is full
-        if len(self._batch) >= self._batch_size:
-            should_flush = True
+    def _ensure_sender(self) -> None:
+        """Start the sender thread on first use. Caller holds _condition."""
+        if self._sender is None:
+            self._sender = threading.Thread(
+                target=self._run, name="voiceobs-otlp-sender", daemon=True
+            )
+            self._sender.start()
+
+    def _run(self) -> None:
+        """Sender loop: wait for a full batch, a timeout, a flush or shutdown."""
+        while True:
+            with self._condition:
+                while not self._batch_ready():
+                    if self._shutdown and not self._queue:
+                        return
+                    self._condition.wait(self._time_until_timeout())
+                batch = [
+                    self._queue.popleft()[1] for _ in range(min(self._batch_size, len(self._queue)))
+                ]
+
+            result = self._send_batch(batch)
+
+            with self._condition:
+                if result == SpanExportResult.SUCCESS:
+                    self._exported_spans += len(batch)
+                else:
+                    self._failed_spans += len(batch)
+                if not self._queue:
+                    self._flush_requested = False
+                self._condition.notify_all()
+
+    def _batch_ready(self) -> bool:
+        """Whether a batch should be sent now. Caller holds _condition."""
+        if not self._queue:
+            return False
+        if self._shutdown or self._flush_requested or len(self._queue) >= self._batch_size:
+            return True
+        return self._time_until_timeout() == 0
 
-        # Flush if timeout reached
-        if self._batch_start_time is None:
-            self._batch_start_time = current_time
-        elif (current_time - self._batch_start_time) * 1000 >= self._batch_timeout_ms:
-            should_flush = True
+    def _time_until_timeout(self) -> float | None:
+        """Seconds until the oldest queued span hits the batch timeout."""
+        if not self._queue:
+            return None
+        deadline = self._queue[0][0] + self._batch_timeout_ms / 1000
+        return max(0.0, deadline - time.monotonic())
 
-        if should_flush:
-            return self._flush_batch()
+    def _send_batch(self, batch: list[ReadableSpan]) -> SpanExportResult:
+        """Send one batch to the OTLP backend, retrying with jittered backoff.
 
-        return SpanExportResult.SUCCESS
-
-    def _flush_batch(self) -> SpanExportResult:
-        """Flush the current batch of spans to the OTLP backend.
+        Runs on the sender thread. Backoff waits end early once the
+        exporter is stopped.
 
         Returns:
             SpanExportResult indicating success or failure.
         """
-        if not self._batch:
-            return SpanExportResult.SUCCESS
-
-        # Convert spans to OTLP format and export with retry logic
-        batch_to_export = self._batch.copy()
-        self._batch.clear()
-        self._batch_start_time = None
-
         # Apply resource attributes and semantic conventions
-        spans_to_export = [self._convert_span(span) for span in batch_to_export]
+        spans_to_export = [self._convert_span(span) for span in batch]
 
-        # Retry logic with exponential backoff
         for attempt in range(self._max_retries + 1):
             try:
                 result = self._otlp_exporter.export(spans_to_export)
                 if result == SpanExportResult.SUCCESS:
                     return SpanExportResult.SUCCESS
-                # If not success and not last attempt, retry
-                if attempt < self._max_retries:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(
-                        f"OTLP export failed (attempt {attempt + 1}/{self._max_retries + 1}), "
-                        f"retrying in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
+                error = "backend returned failure"
             except Exception as e:
-                if attempt < self._max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(
-                        f"OTLP export error (attempt {attempt + 1}/{self._max_retries + 1}): {e}, "
-                        f"retrying in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"OTLP export failed after {self._max_retries + 1} attempts: {e}")
-
+                error = str(e)
+
+            if attempt == self._max_retries or self._stop.is_set():
+                break
+
+            # Full jitter: uniform in [0, min(cap, initial * 2**attempt)]
+            bound_ms = min(self._max_backoff_ms, self._initial_backoff_ms * 2**attempt)
+            wait_time = random.uniform(0, bound_ms) / 1000
+            logger.warning(
+                f"OTLP export failed (attempt {attempt + 1}/{self._max_retries + 1}): "
+                f"{error}, retrying in {wait_time:.2f}s..."
+            )
+            if self._stop.wait(wait_time):
+                break
+
+        logger.error(
+            f"OTLP export failed after {attempt + 1} attempts, dropping {len(batch)} spans"
+        )
         return SpanExportResult.FAILURE
 
     def _convert_span(self, span: ReadableSpan) -> ReadableSpan:
@@ -198,30 +297,67 @@ class OTLPSpanExporter(SpanExporter):
 
         return span
 
-    def shutdown(self) -> None:
-        """Shutdown the exporter and flush any pending spans."""
-        # Flush any remaining spans
-        if self._batch:
-            self._flush_batch()
+    def shutdown(self, timeout_millis: int = 30000) -> None:
+        """Shutdown the exporter, sending pending spans within the timeout.
+
+        Spans that cannot be sent before the timeout are dropped and
+        counted in ``dropped_spans``.
+
+        Args:
+            timeout_millis: Maximum time to spend sending pending spans.
+        """
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            self._condition.notify_all()
+
+        if self._sender is not None:
+            self._sender.join(max(0.0, deadline - time.monotonic()))
+            if self._sender.is_alive():
+                # Interrupt any backoff wait and give up on what is left
+                self._stop.set()
+                with self._condition:
+                    self._dropped_spans += len(self._queue)
+                    self._abandoned_spans += len(self._queue)
+                    self._queue.clear()
+                    self._condition.notify_all()
+                self._sender.join(max(0.0, deadline - time.monotonic()))
+        self._stop.set()
 
         # Shutdown the underlying OTLP exporter
         if hasattr(self, "_otlp_exporter"):
             self._otlp_exporter.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Force flush any pending spans.
+        """Send every span queued so far, waiting up to the timeout.
 
         Args:
-            timeout_millis: Timeout in milliseconds (unused, kept for API compatibility).
+            timeout_millis: Maximum time to wait for the queued spans.
 
         Returns:
-            True if flush succeeded, False otherwise.
+            True if all spans queued before the call were sent successfully
+            within the timeout, False otherwise.
         """
-        if not self._batch:
-            return True
-
-        result = self._flush_batch()
-        return result == SpanExportResult.SUCCESS
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            target = self._enqueued_spans
+            failed_before = self._failed_spans
+            if self._processed_spans() < target:
+                self._flush_requested = True
+                self._condition.notify_all()
+
+            while self._processed_spans() < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._sender is None or not self._sender.is_alive():
+                    return False
+                self._condition.wait(remaining)
+            return self._failed_spans == failed_before and self._abandoned_spans == 0
+
+    def _processed_spans(self) -> int:
+        """Queued spans that have left the queue for good. Caller holds _condition."""
+        return self._exported_spans + self._failed_spans + self._abandoned_spans
 
 
 def get_otlp_exporter_from_config() -> OTLPSpanExporter | None:
@@ -259,5 +395,7 @@ def get_otlp_exporter_from_config() -> OTLPSpanExporter | None:
             batch_size=config.exporters.otlp.batch_size,
             batch_timeout_ms=config.exporters.otlp.batch_timeout_ms,
             max_retries=config.exporters.otlp.max_retries,
+            max_queue_size=config.exporters.otlp.max_queue_size,
+            export_timeout_ms=config.exporters.otlp.export_timeout_ms,
         )
     return None
@@ -0,0 +1,323 @@
+"""Single-pass span pipeline feeding the analyzer, classifier and metric plugins.
+
+A report needs both an ``AnalysisResult`` and a ``ClassificationResult``.
+Computing them with ``analyze_file`` and ``classify_file`` parses the trace
+twice and normalizes every span (stage name, stage type, duration) twice.
+``run_pipeline`` instead normalizes each span once into a
+:class:`NormalizedSpan` and hands it to a list of :class:`SpanVisitor`
+objects, so one streaming pass over the spans produces everything.
+
+Custom metrics plug into the same pass by subclassing :class:`MetricPlugin`
+and registering the class:
+
+    from voiceobs.pipeline import MetricPlugin, register_metric_plugin
+
+    @register_metric_plugin
+    class LongTurns(MetricPlugin):
+        name = "long_turns"
+
+        def __init__(self) -> None:
+            self.count = 0
+
+        def visit(self, span: NormalizedSpan) -> None:
+            if span.kind == "turn" and (span.duration_ms or 0) > 10_000:
+                self.count += 1
+
+        def result(self) -> dict[str, Any]:
+            return {"count": self.count}
+
+Registered plugins are instantiated for every run, and their results appear
+in ``PipelineResult.metrics`` and in the "Custom Metrics" report section.
+"""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from voiceobs.analyzer import (
+    AnalysisResult,
+    add_eval,
+    add_stage,
+    add_turn,
+    create_streaming_result,
+    resolve_stage,
+)
+from voiceobs.classifier import ClassificationResult, FailureClassifier
+from voiceobs.failures import FailureThresholds
+
+SpanKind = Literal["stage", "turn", "eval", "other"]
+
+
+@dataclass
+class NormalizedSpan:
+    """A span with the fields shared by every visitor extracted once.
+
+    ``stage_type`` and ``stage_duration_ms`` are only set for stage spans.
+    The stage duration prefers the ``voice.stage.duration_ms`` attribute
+    over the span's own duration, as the analyzer and classifier do.
+    """
+
+    name: str
+    kind: SpanKind
+    attributes: dict
+    duration_ms: float | None = None
+    conversation_id: str | None = None
+    stage_type: str | None = None
+    stage_duration_ms: float | None = None
+
+
+def normalize_span(span: dict) -> NormalizedSpan:
+    """Normalize a span dictionary.
+
+    Args:
+        span: Span dictionary (from iter_jsonl or parse_jsonl).
+
+    Returns:
+        NormalizedSpan for the span.
+    """
+    name = span.get("name", "")
+    attrs = span.get("attributes", {})
+    duration_ms = span.get("duration_ms")
+    conv_id = attrs.get("voice.conversation.id")
+
+    stage = resolve_stage(span)
+    if stage is not None:
+        stage_type, stage_duration_ms = stage
+        return NormalizedSpan(
+            name=name,
+            kind="stage",
+            attributes=attrs,
+            duration_ms=duration_ms,
+            conversation_id=conv_id,
+            stage_type=stage_type,
+            stage_duration_ms=stage_duration_ms,
+        )
+    if name == "voice.turn":
+        kind: SpanKind = "turn"
+    elif name == "voiceobs.eval":
+        kind = "eval"
+    else:
+        kind = "other"
+    return NormalizedSpan(
+        name=name,
+        kind=kind,
+        attributes=attrs,
+        duration_ms=duration_ms,
+        conversation_id=conv_id,
+    )
+
+
+class SpanVisitor(ABC):
+    """Consumer of normalized spans in a pipeline run."""
+
+    @abstractmethod
+    def visit(self, span: NormalizedSpan) -> None:
+        """Process one span."""
+        ...
+
+    def finish(self) -> None:
+        """Called once after the last span has been visited."""
+
+
+class AnalysisVisitor(SpanVisitor):
+    """Computes an AnalysisResult, like analyze_spans or analyze_stream."""
+
+    def __init__(self, streaming: bool = False) -> None:
+        """Initialize the visitor.
+
+        Args:
+            streaming: Record samples in quantile sketches (as analyze_stream
+                does) instead of keeping every sample.
+        """
+        self.result = create_streaming_result() if streaming else AnalysisResult()
+        self._conversation_ids: set[str] = set()
+
+    def visit(self, span: NormalizedSpan) -> None:
+        self.result.total_spans += 1
+        if span.conversation_id:
+            self._conversation_ids.add(span.conversation_id)
+
+        if span.kind == "stage":
+            assert span.stage_type is not None
+            add_stage(self.result, span.stage_type, span.stage_duration_ms)
+        elif span.kind == "turn":
+            add_turn(self.result, span.attributes)
+        elif span.kind == "eval":
+            add_eval(self.result, span.attributes)
+
+    def finish(self) -> None:
+        self.result.conversation_ids = self._conversation_ids
+        self.result.total_conversations = len(self._conversation_ids)
+
+
+class ClassificationVisitor(SpanVisitor):
+    """Detects failures, like FailureClassifier.classify."""
+
+    def __init__(self, classifier: FailureClassifier | None = None) -> None:
+        """Initialize the visitor.
+
+        Args:
+            classifier: Classifier whose thresholds to use. A default
+                FailureClassifier is used if not provided.
+        """
+        self.classifier = classifier or FailureClassifier()
+        self.result = ClassificationResult()
+
+    def visit(self, span: NormalizedSpan) -> None:
+        self.result.total_spans += 1
+        if span.kind == "stage":
+            assert span.stage_type is not None
+            self.classifier.classify_stage(
+                self.result, span.stage_type, span.stage_duration_ms, span.attributes
+            )
+        elif span.kind == "turn":
+            self.classifier.classify_turn(self.result, span.attributes)
+
+
+class MetricPlugin(SpanVisitor):
+    """Base class for custom metrics computed during a pipeline run.
+
+    Subclasses set ``name``, accumulate state in ``visit`` and return
+    JSON-serializable metrics from ``result``. A new instance is created
+    for every run.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def result(self) -> dict[str, Any]:
+        """Metrics computed from the visited spans, keyed by metric name."""
+        ...
+
+
+_metric_plugins: dict[str, type[MetricPlugin]] = {}
+
+_PluginT = TypeVar("_PluginT", bound=type[MetricPlugin])
+
+
+def register_metric_plugin(plugin: _PluginT) -> _PluginT:
+    """Register a metric plugin class so every pipeline run includes it.
+
+    Can be used as a class decorator. Registering a plugin with the name of
+    an existing one replaces it.
+
+    Args:
+        plugin: MetricPlugin subclass with a non-empty ``name``.
+
+    Returns:
+        The plugin class, unchanged.
+
+    Raises:
+        ValueError: If the plugin has no name.
+    """
+    if not plugin.name:
+        raise ValueError(f"Metric plugin {plugin.__name__} must set a name")
+    _metric_plugins[plugin.name] = plugin
+    return plugin
+
+
+def unregister_metric_plugin(name: str) -> None:
+    """Remove a registered metric plugin.
+
+    Args:
+        name: The plugin name.
+
+    Raises:
+        ValueError: If no plugin with that name is registered.
+    """
+    if name not in _metric_plugins:
+        raise ValueError(f"Unknown metric plugin: {name}")
+    del _metric_plugins[name]
+
+
+def load_metric_plugin(spec: str) -> type[MetricPlugin]:
+    """Import a metric plugin class and register it.
+
+    Args:
+        spec: ``"package.module:ClassName"``.
+
+    Returns:
+        The registered plugin class.
+
+    Raises:
+        ValueError: If the spec is malformed or does not name a MetricPlugin
+            subclass.
+        ImportError: If the module cannot be imported.
+    """
+    module_name, _, class_name = spec.partition(":")
+    if not module_name or not class_name:
+        raise ValueError(f"Invalid metric plugin {spec!r}: expected 'module:ClassName'")
+    plugin = getattr(importlib.import_module(module_name), class_name, None)
+    if not isinstance(plugin, type) or not issubclass(plugin, MetricPlugin):
+        raise ValueError(f"{spec} is not a MetricPlugin subclass")
+    return register_metric_plugin(plugin)
+
+
+def list_metric_plugins() -> list[str]:
+    """List the names of registered metric plugins.
+
+    Returns:
+        Sorted list of plugin names.
+    """
+    return sorted(_metric_plugins)
+
+
+@dataclass
+class PipelineResult:
+    """Everything computed by one pipeline run."""
+
+    analysis: AnalysisResult
+    failures: ClassificationResult
+    metrics: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Custom metric plugin results, keyed by plugin name."""
+
+
+def run_pipeline(
+    spans: Iterable[dict],
+    thresholds: FailureThresholds | None = None,
+    plugins: Sequence[MetricPlugin] | None = None,
+    streaming: bool = False,
+) -> PipelineResult:
+    """Analyze and classify spans, and run metric plugins, in one pass.
+
+    Spans are consumed lazily, so ``spans`` can be a generator such as
+    ``iter_jsonl(path)``. The analysis and failures are the same as from
+    ``analyze_spans`` (or ``analyze_stream`` when streaming) and
+    ``FailureClassifier.classify`` over the same spans.
+
+    Args:
+        spans: Iterable of span dictionaries.
+        thresholds: Custom failure thresholds. Uses DEFAULT_THRESHOLDS if
+            not provided.
+        plugins: Metric plugin instances to run. Defaults to a new instance
+            of every registered plugin.
+        streaming: Record analysis samples in quantile sketches so memory
+            stays bounded; percentiles are then approximate.
+
+    Returns:
+        PipelineResult with the analysis, failures and plugin metrics.
+    """
+    if plugins is None:
+        plugins = [plugin() for plugin in _metric_plugins.values()]
+
+    analysis = AnalysisVisitor(streaming=streaming)
+    classification = ClassificationVisitor(FailureClassifier(thresholds))
+    visitors: list[SpanVisitor] = [analysis, classification, *plugins]
+
+    for span in spans:
+        normalized = normalize_span(span)
+        for visitor in visitors:
+            visitor.visit(normalized)
+
+    for visitor in visitors:
+        visitor.finish()
+
+    return PipelineResult(
+        analysis=analysis.result,
+        failures=classification.result,
+        metrics={plugin.name: plugin.result() for plugin in plugins},
+    )
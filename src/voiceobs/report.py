@@ -6,13 +6,16 @@ from JSONL trace analysis results.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from html import escape
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from voiceobs.analyzer import AnalysisResult, analyze_file
-from voiceobs.classifier import ClassificationResult, classify_file
-from voiceobs.failures import FailureType, Severity
+from voiceobs.analyzer import AnalysisResult, iter_jsonl
+from voiceobs.classifier import ClassificationResult
+from voiceobs.failures import FailureThresholds, FailureType, Severity
+from voiceobs.pipeline import MetricPlugin, run_pipeline
 
 
 @dataclass
@@ -22,6 +25,34 @@ class ReportData:
     analysis: AnalysisResult
     failures: ClassificationResult
     title: str = "voiceobs Analysis Report"
+    custom_metrics: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Results of metric plugins (see voiceobs.pipeline), keyed by plugin name."""
+
+
+def build_report_data(
+    spans: Iterable[dict],
+    title: str | None = None,
+    thresholds: FailureThresholds | None = None,
+    plugins: Sequence[MetricPlugin] | None = None,
+) -> ReportData:
+    """Analyze and classify spans for a report in a single pass.
+
+    Args:
+        spans: Iterable of span dictionaries, e.g. ``iter_jsonl(path)``.
+        title: Optional custom title for the report.
+        thresholds: Custom failure thresholds.
+        plugins: Metric plugins to run. Defaults to the registered plugins.
+
+    Returns:
+        ReportData with the analysis, failures and custom metrics.
+    """
+    result = run_pipeline(spans, thresholds=thresholds, plugins=plugins)
+    return ReportData(
+        analysis=result.analysis,
+        failures=result.failures,
+        title=title or "voiceobs Analysis Report",
+        custom_metrics=result.metrics,
+    )
 
 
 def _format_ms(value: float | None) -> str:
@@ -31,6 +62,15 @@ def _format_ms(value: float | None) -> str:
     return f"{value:.1f}"
 
 
+def _format_metric(value: Any) -> str:
+    """Format a custom metric value for display."""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    if value is None:
+        return "-"
+    return str(value)
+
+
 def _generate_recommendations(data: ReportData) -> list[str]:
     """Generate recommendations based on analysis and failures."""
     recommendations: list[str] = []
@@ -156,10 +196,10 @@ def generate_markdown_report(data: ReportData) -> str:
     lines.append("")
 
     # Response latency (silence)
-    if data.analysis.turn_metrics.silence_after_user_ms:
+    if data.analysis.turn_metrics.silence_samples:
         lines.append("### Response Latency")
         lines.append("")
-        lines.append(f"- Samples: {len(data.analysis.turn_metrics.silence_after_user_ms)}")
+        lines.append(f"- Samples: {data.analysis.turn_metrics.silence_samples}")
         lines.append(f"- Mean: {_format_ms(data.analysis.turn_metrics.silence_mean_ms)} ms")
         lines.append(f"- p95: {_format_ms(data.analysis.turn_metrics.silence_p95_ms)} ms")
         lines.append("")
@@ -229,6 +269,17 @@ def generate_markdown_report(data: ReportData) -> str:
         lines.append("```")
     lines.append("")
 
+    # Custom metrics section
+    if data.custom_metrics:
+        lines.append("## Custom Metrics")
+        lines.append("")
+        for plugin_name, metrics in data.custom_metrics.items():
+            lines.append(f"### {plugin_name}")
+            lines.append("")
+            for key, value in metrics.items():
+                lines.append(f"- {key}: {_format_metric(value)}")
+            lines.append("")
+
     # Recommendations section
     lines.append("## Recommendations")
     lines.append("")
@@ -410,6 +461,19 @@ def generate_html_report(data: ReportData) -> str:
             "Run semantic evaluation to generate eval records.</p>"
         )
 
+    # Custom metrics
+    if data.custom_metrics:
+        html_parts.append("<h2>Custom Metrics</h2>")
+        for plugin_name, metrics in data.custom_metrics.items():
+            html_parts.append(f"<h3>{escape(plugin_name)}</h3>")
+            html_parts.append("<table>")
+            html_parts.append("<tr><th>Metric</th><th>Value</th></tr>")
+            for key, value in metrics.items():
+                html_parts.append(
+                    f"<tr><td>{escape(str(key))}</td><td>{escape(_format_metric(value))}</td></tr>"
+                )
+            html_parts.append("</table>")
+
     # Recommendations
     html_parts.append("<h2>Recommendations</h2>")
     recommendations = _generate_recommendations(data)
@@ -457,13 +521,19 @@ def generate_report_from_file(
     file_path: str | Path,
     format: Literal["markdown", "html"] = "markdown",
     title: str | None = None,
+    plugins: Sequence[MetricPlugin] | None = None,
 ) -> str:
     """Generate a report from a JSONL file.
 
+    The file is read once: spans are streamed through the analyzer, the
+    failure classifier and any metric plugins together (see
+    voiceobs.pipeline).
+
     Args:
         file_path: Path to the JSONL file.
         format: Output format - "markdown" or "html".
         title: Optional custom title for the report.
+        plugins: Metric plugins to run. Defaults to the registered plugins.
 
     Returns:
         Formatted report string.
@@ -475,13 +545,5 @@ def generate_report_from_file(
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    analysis = analyze_file(path)
-    failures = classify_file(path)
-
-    data = ReportData(
-        analysis=analysis,
-        failures=failures,
-        title=title or "voiceobs Analysis Report",
-    )
-
+    data = build_report_data(iter_jsonl(path), title=title, plugins=plugins)
     return generate_report(data, format=format)
@@ -0,0 +1,166 @@
+"""TTL/LRU cache for resolved authentication contexts."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from voiceobs.server.auth.context import AuthContext
+
+
+@dataclass(frozen=True)
+class AuthCacheStats:
+    """Counters describing auth cache effectiveness."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 if none yet)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AuthCache:
+    """Bounded TTL/LRU cache of resolved authentication contexts.
+
+    Entries are keyed by (user ID, requested organization ID), where the
+    user ID is the JWT subject and the organization ID is None when the
+    request relied on the user's last active organization. A hit means the
+    user row was upserted, the organization loaded and the membership
+    verified within the last ``ttl_seconds``, so those queries can be
+    skipped. The JWT itself is still verified on every request.
+
+    Only successful lookups are cached. Routes that change membership or
+    organizations must call :meth:`invalidate` or :meth:`invalidate_org`.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching).
+            max_size: Maximum number of entries; the least recently used
+                entry is evicted when full.
+            clock: Monotonic clock, overridable for tests.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[tuple[UUID, UUID | None], tuple[float, AuthContext]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached at all."""
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: UUID, org_id: UUID | None) -> AuthContext | None:
+        """Look up a cached context.
+
+        Args:
+            user_id: The JWT subject.
+            org_id: The requested organization, or None for the last active one.
+
+        Returns:
+            The cached AuthContext, or None on a miss or expired entry.
+        """
+        if not self.enabled:
+            return None
+        key = (user_id, org_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, ctx = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return ctx
+
+    def put(self, user_id: UUID, org_id: UUID | None, ctx: AuthContext) -> None:
+        """Cache a resolved context.
+
+        Args:
+            user_id: The JWT subject.
+            org_id: The requested organization, or None for the last active one.
+            ctx: The resolved context.
+        """
+        if not self.enabled:
+            return
+        key = (user_id, org_id)
+        self._entries[key] = (self._clock() + self.ttl_seconds, ctx)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, user_id: UUID, org_id: UUID | None = None) -> None:
+        """Drop cached contexts for a user.
+
+        Args:
+            user_id: The user whose entries to drop.
+            org_id: Only drop entries resolving to this organization. Drops
+                all of the user's entries if None.
+        """
+        self._drop(lambda key, ctx: key[0] == user_id and (org_id is None or ctx.org.id == org_id))
+
+    def invalidate_org(self, org_id: UUID) -> None:
+        """Drop every cached context resolving to an organization.
+
+        Args:
+            org_id: The organization that was changed or deleted.
+        """
+        self._drop(lambda key, ctx: ctx.org.id == org_id)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> AuthCacheStats:
+        """Get hit, miss and eviction counters.
+
+        Returns:
+            A snapshot of the cache counters.
+        """
+        return AuthCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+    def _drop(self, predicate: Callable[[tuple[UUID, UUID | None], AuthContext], bool]) -> None:
+        """Remove entries matching a predicate."""
+        stale = [key for key, (_, ctx) in self._entries.items() if predicate(key, ctx)]
+        for key in stale:
+            del self._entries[key]
+        self._invalidations += len(stale)
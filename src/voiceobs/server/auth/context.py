@@ -7,9 +7,10 @@ from uuid import UUID
 
 from fastapi import Header, HTTPException, status
 
-from voiceobs.server.auth.dependencies import get_current_user
+from voiceobs.server.auth.dependencies import decode_bearer_token, load_user
 from voiceobs.server.db.models import OrganizationRow, UserRow
 from voiceobs.server.dependencies import (
+    get_auth_cache,
     get_organization_member_repository,
     get_organization_repository,
     get_user_repository,
@@ -24,19 +25,17 @@ class AuthContext:
     org: OrganizationRow
 
 
-async def get_auth_context(
-    x_organization_id: str | None = Header(None, alias="X-Organization-Id"),
-    authorization: str | None = Header(None, alias="Authorization"),
-) -> AuthContext:
-    """Get authentication context with user and active organization.
+async def _resolve_auth_context(payload: dict, requested_org_id: UUID | None) -> AuthContext:
+    """Resolve the user, organization and membership for a verified token.
 
-    Resolves the active organization from:
-    1. X-Organization-Id header (if provided)
-    2. User's last_active_org_id (fallback)
+    Served from the auth cache when the same user and organization were
+    resolved recently; otherwise the user is upserted, the organization
+    loaded and the membership checked, and the result is cached.
 
     Args:
-        x_organization_id: Organization ID from header.
-        authorization: Authorization header for JWT.
+        payload: The verified JWT payload.
+        requested_org_id: Organization to use, or None for the user's
+            last active organization.
 
     Returns:
         AuthContext with user and organization.
@@ -44,23 +43,17 @@ async def get_auth_context(
     Raises:
         HTTPException: If no org selected, org not found, or user not a member.
     """
-    # Get current user
-    user = await get_current_user(authorization)
+    cache = get_auth_cache()
+    user_id = UUID(payload["sub"])
+    cached = cache.get(user_id, requested_org_id)
+    if cached is not None:
+        return cached
 
-    # Determine which org to use
-    org_id: UUID | None = None
+    user = await load_user(payload)
 
-    if x_organization_id:
-        try:
-            org_id = UUID(x_organization_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid organization ID format",
-            )
-    elif user.last_active_org_id:
-        org_id = user.last_active_org_id
-    else:
+    # Determine which org to use
+    org_id = requested_org_id or user.last_active_org_id
+    if org_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No organization selected",
@@ -89,8 +82,47 @@ async def get_auth_context(
         user_repo = get_user_repository()
         if user_repo:
             await user_repo.update(user.id, last_active_org_id=org_id)
+        # Entries resolved through the old last active org are now stale
+        cache.invalidate(user.id)
+
+    ctx = AuthContext(user=user, org=org)
+    cache.put(user_id, requested_org_id, ctx)
+    return ctx
+
+
+async def get_auth_context(
+    x_organization_id: str | None = Header(None, alias="X-Organization-Id"),
+    authorization: str | None = Header(None, alias="Authorization"),
+) -> AuthContext:
+    """Get authentication context with user and active organization.
+
+    Resolves the active organization from:
+    1. X-Organization-Id header (if provided)
+    2. User's last_active_org_id (fallback)
+
+    Args:
+        x_organization_id: Organization ID from header.
+        authorization: Authorization header for JWT.
+
+    Returns:
+        AuthContext with user and organization.
+
+    Raises:
+        HTTPException: If no org selected, org not found, or user not a member.
+    """
+    payload = await decode_bearer_token(authorization)
+
+    org_id: UUID | None = None
+    if x_organization_id:
+        try:
+            org_id = UUID(x_organization_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid organization ID format",
+            )
 
-    return AuthContext(user=user, org=org)
+    return await _resolve_auth_context(payload, org_id)
 
 
 async def require_org_membership(
@@ -112,31 +144,5 @@ async def require_org_membership(
     Raises:
         HTTPException: If user is not authenticated, org not found, or user not a member.
     """
-    # Get current user
-    user = await get_current_user(authorization)
-
-    # Get organization
-    org_repo = get_organization_repository()
-    org = await org_repo.get(org_id)
-    if org is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found",
-        )
-
-    # Verify membership
-    member_repo = get_organization_member_repository()
-    is_member = await member_repo.is_member(org_id=org_id, user_id=user.id)
-    if not is_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this organization",
-        )
-
-    # Update last_active_org_id if different (convenience for user)
-    if user.last_active_org_id != org_id:
-        user_repo = get_user_repository()
-        if user_repo:
-            await user_repo.update(user.id, last_active_org_id=org_id)
-
-    return AuthContext(user=user, org=org)
+    payload = await decode_bearer_token(authorization)
+    return await _resolve_auth_context(payload, org_id)
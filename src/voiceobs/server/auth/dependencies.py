@@ -14,21 +14,17 @@ from voiceobs.server.dependencies import get_organization_service, get_user_repo
 log = logging.getLogger(__name__)
 
 
-async def get_current_user(
-    authorization: str | None = Header(None, alias="Authorization"),
-) -> UserRow:
-    """Get current authenticated user from JWT.
-
-    Validates the JWT, extracts user info, and upserts in local database.
+async def decode_bearer_token(authorization: str | None) -> dict:
+    """Validate the bearer token in an Authorization header.
 
     Args:
         authorization: The Authorization header value (e.g., "Bearer <token>").
 
     Returns:
-        The authenticated user's database row.
+        The verified JWT payload.
 
     Raises:
-        HTTPException: If authentication fails or user is inactive.
+        HTTPException: If the header is missing or malformed, or the token is invalid.
     """
     if not authorization:
         raise HTTPException(
@@ -47,7 +43,7 @@ async def get_current_user(
     token = authorization[7:]  # Remove "Bearer " prefix
     try:
         # Decode JWT using JWKS from Supabase (reads SUPABASE_URL from env)
-        payload = decode_supabase_jwt(token)
+        payload = await decode_supabase_jwt(token)
         log.debug(f"JWT payload decoded: sub={payload.get('sub')}")
     except JWTValidationError as e:
         raise HTTPException(
@@ -62,6 +58,21 @@ async def get_current_user(
             detail=str(e),
         )
 
+    return payload
+
+
+async def load_user(payload: dict) -> UserRow:
+    """Upsert and return the local user for a verified JWT payload.
+
+    Args:
+        payload: The verified JWT payload.
+
+    Returns:
+        The user's database row.
+
+    Raises:
+        HTTPException: If the database is unavailable or the user is inactive.
+    """
     # Extract user info from JWT
     user_id = UUID(payload["sub"])
     email = payload.get("email", "")
@@ -103,6 +114,25 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    authorization: str | None = Header(None, alias="Authorization"),
+) -> UserRow:
+    """Get current authenticated user from JWT.
+
+    Validates the JWT, extracts user info, and upserts in local database.
+
+    Args:
+        authorization: The Authorization header value (e.g., "Bearer <token>").
+
+    Returns:
+        The authenticated user's database row.
+
+    Raises:
+        HTTPException: If authentication fails or user is inactive.
+    """
+    return await load_user(await decode_bearer_token(authorization))
+
+
 async def get_current_user_optional(
     authorization: str | None = Header(None, alias="Authorization"),
 ) -> UserRow | None:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -20,10 +23,161 @@ class JWTValidationError(Exception):
     pass
 
 
-# Cache for JWKS to avoid fetching on every request
-_jwks_cache: dict[str, Any] | None = None
-_jwks_cache_time: float = 0
 _JWKS_CACHE_TTL = 3600  # Cache JWKS for 1 hour
+_JWKS_REFRESH_BEFORE = 300  # Refresh in the background in the last 5 minutes
+_JWKS_MIN_REFRESH_INTERVAL = 30  # Rate limit refreshes triggered by unknown kids
+_VERIFIED_TOKEN_CACHE_SIZE = 10000
+
+
+class JWKSManager:
+    """Async JWKS fetcher and cache for one Supabase project.
+
+    Keys are fetched with an async HTTP client so an expired cache never
+    blocks the event loop. Concurrent callers share a single in-flight
+    fetch. Shortly before the keys expire, a refresh is started in the
+    background while the current keys keep being served. A token signed
+    with an unknown ``kid`` (e.g. after key rotation) triggers a refresh,
+    rate limited to one per ``min_refresh_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = _JWKS_CACHE_TTL,
+        refresh_before: float = _JWKS_REFRESH_BEFORE,
+        min_refresh_interval: float = _JWKS_MIN_REFRESH_INTERVAL,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            jwks_url: URL of the JWKS document.
+            ttl: Seconds fetched keys stay valid.
+            refresh_before: Start a background refresh this many seconds before expiry.
+            min_refresh_interval: Minimum seconds between kid-miss refreshes.
+            timeout: HTTP timeout in seconds.
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.refresh_before = refresh_before
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._jwks: dict[str, Any] | None = None
+        self._fetched_at = 0.0
+        self._refresh_task: asyncio.Task[dict[str, Any]] | None = None
+
+    async def get_jwks(self) -> dict[str, Any]:
+        """Get the current JWKS, fetching it if missing or expired.
+
+        Returns:
+            The JWKS document.
+
+        Raises:
+            JWTValidationError: If no keys are cached and they cannot be fetched.
+        """
+        age = time.monotonic() - self._fetched_at
+        if self._jwks is None or age >= self.ttl:
+            return await self.refresh()
+        if age >= self.ttl - self.refresh_before:
+            self._start_refresh()
+        return self._jwks
+
+    async def get_key(self, kid: str) -> dict[str, Any] | None:
+        """Get the signing key with the given ID, refreshing once on a miss.
+
+        Args:
+            kid: Key ID from the token header.
+
+        Returns:
+            The JWK, or None if the key is not published.
+
+        Raises:
+            JWTValidationError: If no keys are cached and they cannot be fetched.
+        """
+        key = _find_key(await self.get_jwks(), kid)
+        if key is None and time.monotonic() - self._fetched_at >= self.min_refresh_interval:
+            log.info(f"Unknown JWT key ID {kid!r}, refreshing JWKS")
+            key = _find_key(await self.refresh(), kid)
+        return key
+
+    async def refresh(self) -> dict[str, Any]:
+        """Fetch the JWKS, joining a fetch that is already in flight.
+
+        If the fetch fails but keys were fetched before, the old keys are
+        kept and returned.
+
+        Returns:
+            The JWKS document.
+
+        Raises:
+            JWTValidationError: If the fetch fails and no keys are cached.
+        """
+        task = self._start_refresh()
+        try:
+            # Shielded so a cancelled request does not cancel the shared fetch
+            return await asyncio.shield(task)
+        except JWTValidationError:
+            if self._jwks is None:
+                raise
+            log.warning("Using previously fetched JWKS after refresh failure")
+            return self._jwks
+
+    def clear(self) -> None:
+        """Forget the cached keys."""
+        self._jwks = None
+        self._fetched_at = 0.0
+        self._refresh_task = None
+
+    def _start_refresh(self) -> asyncio.Task[dict[str, Any]]:
+        """Start a fetch unless one is already running, and return its task."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._fetch())
+            self._refresh_task.add_done_callback(_log_refresh_failure)
+        return self._refresh_task
+
+    async def _fetch(self) -> dict[str, Any]:
+        """Fetch and cache the JWKS."""
+        log.info(f"Fetching JWKS from {self.jwks_url}")
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.jwks_url)
+                response.raise_for_status()
+                jwks = response.json()
+        except httpx.HTTPError as e:
+            log.error(f"Failed to fetch JWKS: {e}")
+            raise JWTValidationError(f"Failed to fetch JWKS: {e}") from e
+        except ValueError as e:
+            log.error(f"JWKS response is not valid JSON: {e}")
+            raise JWTValidationError(f"Failed to fetch JWKS: invalid JSON: {e}") from e
+        if not isinstance(jwks, dict):
+            log.error("JWKS response is not a JSON object")
+            raise JWTValidationError("Failed to fetch JWKS: response is not a JSON object")
+
+        log.debug(f"Fetched JWKS with {len(jwks.get('keys', []))} keys")
+        self._jwks = jwks
+        self._fetched_at = time.monotonic()
+        return jwks
+
+
+def _find_key(jwks: dict[str, Any], kid: str) -> dict[str, Any] | None:
+    """Find a key by ID in a JWKS document."""
+    for key in jwks.get("keys", []):
+        if key.get("kid") == kid:
+            return key
+    return None
+
+
+def _log_refresh_failure(task: asyncio.Task[dict[str, Any]]) -> None:
+    """Retrieve the exception of a background refresh so it is not reported as unhandled."""
+    if not task.cancelled() and task.exception() is not None:
+        log.debug(f"JWKS refresh failed: {task.exception()}")
+
+
+# One JWKS manager per Supabase project URL
+_jwks_managers: dict[str, JWKSManager] = {}
+
+# Verified claims by SHA-256 of the token, kept until the token's exp
+_verified_tokens: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
 
 def get_supabase_url() -> str:
@@ -41,47 +195,50 @@ def get_supabase_url() -> str:
     return url.rstrip("/")
 
 
-def _fetch_jwks(supabase_url: str) -> dict[str, Any]:
-    """Fetch JWKS from Supabase.
+def get_jwks_manager(supabase_url: str) -> JWKSManager:
+    """Get the shared JWKS manager for a Supabase project.
 
     Args:
         supabase_url: The Supabase project URL.
 
     Returns:
-        The JWKS response.
-
-    Raises:
-        JWTValidationError: If JWKS cannot be fetched.
+        The project's JWKSManager.
     """
-    global _jwks_cache, _jwks_cache_time
-
-    # Return cached JWKS if still valid
-    if _jwks_cache and (time.time() - _jwks_cache_time) < _JWKS_CACHE_TTL:
-        return _jwks_cache
-
-    jwks_url = f"{supabase_url}/auth/v1/.well-known/jwks.json"
-    log.info(f"Fetching JWKS from {jwks_url}")
-
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(jwks_url)
-            response.raise_for_status()
-            jwks = response.json()
-            log.debug(f"Fetched JWKS with {len(jwks.get('keys', []))} keys")
-
-            # Cache the JWKS
-            _jwks_cache = jwks
-            _jwks_cache_time = time.time()
-
-            return jwks
-    except httpx.HTTPError as e:
-        log.error(f"Failed to fetch JWKS: {e}")
-        raise JWTValidationError(f"Failed to fetch JWKS: {e}") from e
-
-
-def decode_supabase_jwt(token: str, supabase_url: str | None = None) -> dict:
+    manager = _jwks_managers.get(supabase_url)
+    if manager is None:
+        manager = JWKSManager(f"{supabase_url}/auth/v1/.well-known/jwks.json")
+        _jwks_managers[supabase_url] = manager
+    return manager
+
+
+def _get_verified(token_hash: str) -> dict[str, Any] | None:
+    """Get cached claims for a token that has not expired yet."""
+    payload = _verified_tokens.get(token_hash)
+    if payload is None:
+        return None
+    if payload["exp"] <= time.time():
+        del _verified_tokens[token_hash]
+        return None
+    _verified_tokens.move_to_end(token_hash)
+    return payload
+
+
+def _put_verified(token_hash: str, payload: dict[str, Any]) -> None:
+    """Cache verified claims until the token's exp."""
+    if not isinstance(payload.get("exp"), (int, float)):
+        return
+    _verified_tokens[token_hash] = payload
+    _verified_tokens.move_to_end(token_hash)
+    while len(_verified_tokens) > _VERIFIED_TOKEN_CACHE_SIZE:
+        _verified_tokens.popitem(last=False)
+
+
+async def decode_supabase_jwt(token: str, supabase_url: str | None = None) -> dict:
     """Decode and validate a Supabase JWT using JWKS.
 
+    Verified claims are cached by token hash until the token expires, so
+    repeated requests with the same token skip signature verification.
+
     Args:
         token: The JWT token string.
         supabase_url: The Supabase project URL. If not provided, reads from SUPABASE_URL env.
@@ -95,25 +252,37 @@ def decode_supabase_jwt(token: str, supabase_url: str | None = None) -> dict:
     if not supabase_url:
         supabase_url = get_supabase_url()
 
+    token_hash = hashlib.sha256(f"{supabase_url}\0{token}".encode()).hexdigest()
+    cached = _get_verified(token_hash)
+    if cached is not None:
+        return cached
+
     try:
-        # Peek at the token header to determine the algorithm
+        # Peek at the token header to determine the algorithm and key
         unverified_header = jwt.get_unverified_header(token)
         alg = unverified_header.get("alg")
-        log.debug(f"JWT header: alg={alg}, typ={unverified_header.get('typ')}")
-
-        # Fetch JWKS from Supabase
-        jwks = _fetch_jwks(supabase_url)
+        kid = unverified_header.get("kid")
+        log.debug(f"JWT header: alg={alg}, kid={kid}, typ={unverified_header.get('typ')}")
+
+        # Get the signing key(s) from Supabase
+        manager = get_jwks_manager(supabase_url)
+        if kid:
+            key = await manager.get_key(kid)
+            if key is None:
+                raise JWTValidationError(f"Unknown signing key: {kid}")
+            keys: dict[str, Any] = {"keys": [key]}
+        else:
+            keys = await manager.get_jwks()
 
         # Decode and verify the token
         # Supabase uses ES256 (Elliptic Curve) for JWKS signing
         payload = jwt.decode(
             token,
-            jwks,
+            keys,
             algorithms=["ES256"],
             audience="authenticated",
         )
         log.debug(f"Decoded JWT payload: sub={payload.get('sub')}")
-        return payload
 
     except JWKError as e:
         log.warning(f"JWK error: {e}")
@@ -129,9 +298,13 @@ def decode_supabase_jwt(token: str, supabase_url: str | None = None) -> dict:
             raise JWTValidationError("Invalid token audience") from e
         raise JWTValidationError(f"Invalid token: {e}") from e
 
+    _put_verified(token_hash, payload)
+    return payload
+
 
 def clear_jwks_cache() -> None:
-    """Clear the JWKS cache. Useful for testing."""
-    global _jwks_cache, _jwks_cache_time
-    _jwks_cache = None
-    _jwks_cache_time = 0
+    """Clear the JWKS and verified-token caches. Useful for testing."""
+    for manager in _jwks_managers.values():
+        manager.clear()
+    _jwks_managers.clear()
+    _verified_tokens.clear()
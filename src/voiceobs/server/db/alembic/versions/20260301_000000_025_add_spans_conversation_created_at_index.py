@@ -0,0 +1,33 @@
+"""Add composite index for conversation-scoped span reads.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-03-01 00:00:00.000000
+
+This migration adds an index on spans (conversation_id, created_at) so that
+conversation detail and analysis reads can fetch one conversation's spans in
+order without scanning or sorting the whole spans table.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "025"
+down_revision: str = "024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_spans_conversation_created_at",
+        "spans",
+        ["conversation_id", "created_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_spans_conversation_created_at", "spans", if_exists=True)
@@ -0,0 +1,78 @@
+"""Add metrics rollup tables.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-03-05 00:00:00.000000
+
+This migration creates the span_rollups, event_rollups and rollup_watermarks
+tables used to answer dashboard metrics queries from per-minute and per-hour
+buckets instead of raw spans, and adds an index on spans.start_time for the
+raw reads that cover partial buckets. Rollups are filled by the server's
+refresh job on its first run.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "026"
+down_revision: str = "025"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create rollup tables and the spans start_time index."""
+    op.create_index("idx_spans_start_time", "spans", ["start_time"], if_not_exists=True)
+
+    op.create_table(
+        "span_rollups",
+        sa.Column("resolution", sa.String(16), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("stage_type", sa.String(255), nullable=False),
+        sa.Column("span_count", sa.BigInteger(), nullable=False),
+        sa.Column("duration_sum", sa.Float(), nullable=False),
+        sa.Column("duration_min", sa.Float(), nullable=False),
+        sa.Column("duration_max", sa.Float(), nullable=False),
+        sa.Column("zero_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "positive_buckets",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "negative_buckets",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("resolution", "bucket_start", "stage_type"),
+    )
+
+    op.create_table(
+        "event_rollups",
+        sa.Column("resolution", sa.String(16), nullable=False),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("event_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("resolution", "kind", "bucket_start"),
+    )
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("refreshed_until", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop rollup tables and the spans start_time index."""
+    op.drop_table("rollup_watermarks")
+    op.drop_table("event_rollups")
+    op.drop_table("span_rollups")
+    op.drop_index("idx_spans_start_time", "spans", if_exists=True)
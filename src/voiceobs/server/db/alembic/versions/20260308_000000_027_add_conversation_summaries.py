@@ -0,0 +1,321 @@
+"""Add conversation summaries for search.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-03-08 00:00:00.000000
+
+This migration creates the conversation_summaries table, which holds
+per-conversation span/turn/failure counts, start time bounds, latency
+aggregates and a transcript tsvector. Statement-level triggers on
+conversations, spans, turns and failures keep it current, so conversation
+search can filter, sort and page through its indexes instead of joining
+spans to itself. Existing conversations are summarized during the upgrade.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "027"
+down_revision: str = "026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION refresh_conversation_summaries(ids UUID[])
+    RETURNS VOID AS $$
+    BEGIN
+        INSERT INTO conversation_summaries AS cs (
+            conversation_id, span_count, turn_count, failure_count,
+            first_start_time, last_start_time, duration_sum, duration_count,
+            max_duration_ms, search_vector
+        )
+        SELECT
+            c.id,
+            s.span_count,
+            t.turn_count,
+            f.failure_count,
+            s.first_start_time,
+            s.last_start_time,
+            COALESCE(s.duration_sum, 0),
+            s.duration_count,
+            s.max_duration_ms,
+            to_tsvector('english', c.conversation_id || ' ' || COALESCE(t.transcripts, ''))
+        FROM conversations c
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS span_count,
+                   MIN(start_time) AS first_start_time,
+                   MAX(start_time) AS last_start_time,
+                   SUM(duration_ms) AS duration_sum,
+                   COUNT(duration_ms) AS duration_count,
+                   MAX(duration_ms) AS max_duration_ms
+            FROM spans WHERE conversation_id = c.id
+        ) s
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS turn_count,
+                   string_agg(transcript, ' ' ORDER BY turn_index NULLS LAST, created_at)
+                       AS transcripts
+            FROM turns WHERE conversation_id = c.id
+        ) t
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS failure_count FROM failures WHERE conversation_id = c.id
+        ) f
+        WHERE c.id = ANY(ids)
+        ORDER BY c.id
+        ON CONFLICT (conversation_id) DO UPDATE SET
+            span_count = EXCLUDED.span_count,
+            turn_count = EXCLUDED.turn_count,
+            failure_count = EXCLUDED.failure_count,
+            first_start_time = EXCLUDED.first_start_time,
+            last_start_time = EXCLUDED.last_start_time,
+            duration_sum = EXCLUDED.duration_sum,
+            duration_count = EXCLUDED.duration_count,
+            max_duration_ms = EXCLUDED.max_duration_ms,
+            search_vector = EXCLUDED.search_vector;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION conversation_summaries_conversation_inserted()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO conversation_summaries (conversation_id, search_vector)
+        SELECT id, to_tsvector('english', conversation_id) FROM new_rows ORDER BY id
+        ON CONFLICT (conversation_id) DO NOTHING;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION conversation_summaries_spans_inserted()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO conversation_summaries AS cs (
+            conversation_id, span_count, first_start_time, last_start_time,
+            duration_sum, duration_count, max_duration_ms
+        )
+        SELECT conversation_id, COUNT(*), MIN(start_time), MAX(start_time),
+               COALESCE(SUM(duration_ms), 0), COUNT(duration_ms), MAX(duration_ms)
+        FROM new_rows
+        WHERE conversation_id IS NOT NULL
+        GROUP BY conversation_id
+        ORDER BY conversation_id
+        ON CONFLICT (conversation_id) DO UPDATE SET
+            span_count = cs.span_count + EXCLUDED.span_count,
+            first_start_time = LEAST(cs.first_start_time, EXCLUDED.first_start_time),
+            last_start_time = GREATEST(cs.last_start_time, EXCLUDED.last_start_time),
+            duration_sum = cs.duration_sum + EXCLUDED.duration_sum,
+            duration_count = cs.duration_count + EXCLUDED.duration_count,
+            max_duration_ms = GREATEST(cs.max_duration_ms, EXCLUDED.max_duration_ms);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION conversation_summaries_turns_inserted()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO conversation_summaries AS cs (conversation_id, turn_count, search_vector)
+        SELECT conversation_id, COUNT(*),
+               to_tsvector('english', COALESCE(
+                   string_agg(transcript, ' ' ORDER BY turn_index NULLS LAST), ''))
+        FROM new_rows
+        GROUP BY conversation_id
+        ORDER BY conversation_id
+        ON CONFLICT (conversation_id) DO UPDATE SET
+            turn_count = cs.turn_count + EXCLUDED.turn_count,
+            search_vector = cs.search_vector || EXCLUDED.search_vector;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION conversation_summaries_failures_inserted()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO conversation_summaries AS cs (conversation_id, failure_count)
+        SELECT conversation_id, COUNT(*)
+        FROM new_rows
+        WHERE conversation_id IS NOT NULL
+        GROUP BY conversation_id
+        ORDER BY conversation_id
+        ON CONFLICT (conversation_id) DO UPDATE SET
+            failure_count = cs.failure_count + EXCLUDED.failure_count;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION conversation_summaries_rows_changed()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            PERFORM refresh_conversation_summaries(ARRAY(SELECT id FROM conversations));
+        ELSIF TG_OP = 'UPDATE' THEN
+            PERFORM refresh_conversation_summaries(ARRAY(
+                SELECT conversation_id FROM old_rows WHERE conversation_id IS NOT NULL
+                UNION
+                SELECT conversation_id FROM new_rows WHERE conversation_id IS NOT NULL
+            ));
+        ELSE
+            PERFORM refresh_conversation_summaries(ARRAY(
+                SELECT DISTINCT conversation_id FROM old_rows WHERE conversation_id IS NOT NULL
+            ));
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+]
+
+# (trigger name, table, event, transition tables, function)
+TRIGGERS = [
+    (
+        "conversation_summaries_insert",
+        "conversations",
+        "INSERT",
+        "NEW TABLE AS new_rows",
+        "conversation_summaries_conversation_inserted",
+    ),
+    (
+        "conversation_summaries_insert",
+        "spans",
+        "INSERT",
+        "NEW TABLE AS new_rows",
+        "conversation_summaries_spans_inserted",
+    ),
+    (
+        "conversation_summaries_insert",
+        "turns",
+        "INSERT",
+        "NEW TABLE AS new_rows",
+        "conversation_summaries_turns_inserted",
+    ),
+    (
+        "conversation_summaries_insert",
+        "failures",
+        "INSERT",
+        "NEW TABLE AS new_rows",
+        "conversation_summaries_failures_inserted",
+    ),
+    *[
+        (
+            "conversation_summaries_update",
+            table,
+            "UPDATE",
+            "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+            "conversation_summaries_rows_changed",
+        )
+        for table in ("spans", "turns", "failures")
+    ],
+    *[
+        (
+            "conversation_summaries_delete",
+            table,
+            "DELETE",
+            "OLD TABLE AS old_rows",
+            "conversation_summaries_rows_changed",
+        )
+        for table in ("spans", "turns", "failures")
+    ],
+    *[
+        (
+            "conversation_summaries_truncate",
+            table,
+            "TRUNCATE",
+            None,
+            "conversation_summaries_rows_changed",
+        )
+        for table in ("spans", "turns", "failures")
+    ],
+]
+
+FUNCTION_NAMES = [
+    "conversation_summaries_rows_changed()",
+    "conversation_summaries_failures_inserted()",
+    "conversation_summaries_turns_inserted()",
+    "conversation_summaries_spans_inserted()",
+    "conversation_summaries_conversation_inserted()",
+    "refresh_conversation_summaries(UUID[])",
+]
+
+
+def upgrade() -> None:
+    """Create conversation_summaries, its triggers, and backfill it."""
+    op.create_table(
+        "conversation_summaries",
+        sa.Column("conversation_id", sa.UUID(), nullable=False),
+        sa.Column("span_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("turn_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("failure_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("first_start_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_start_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("duration_sum", sa.Float(), server_default=sa.text("0"), nullable=False),
+        sa.Column("duration_count", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "avg_duration_ms",
+            sa.Float(),
+            sa.Computed("duration_sum / NULLIF(duration_count, 0)", persisted=True),
+            nullable=True,
+        ),
+        sa.Column("max_duration_ms", sa.Float(), nullable=True),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            server_default=sa.text("''::tsvector"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["conversation_id"], ["conversations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("conversation_id"),
+    )
+    op.create_index(
+        "idx_conversation_summaries_first_start_time",
+        "conversation_summaries",
+        ["first_start_time", "conversation_id"],
+    )
+    op.create_index(
+        "idx_conversation_summaries_last_start_time",
+        "conversation_summaries",
+        ["last_start_time"],
+    )
+    op.create_index(
+        "idx_conversation_summaries_avg_duration",
+        "conversation_summaries",
+        ["avg_duration_ms", "conversation_id"],
+    )
+    op.create_index(
+        "idx_conversation_summaries_max_duration",
+        "conversation_summaries",
+        ["max_duration_ms"],
+    )
+    op.create_index(
+        "idx_conversation_summaries_search_vector",
+        "conversation_summaries",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+    for function in FUNCTIONS:
+        op.execute(function)
+
+    for name, table, event, referencing, function in TRIGGERS:
+        referencing_clause = f" REFERENCING {referencing}" if referencing else ""
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON {table}{referencing_clause} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+    op.execute("SELECT refresh_conversation_summaries(ARRAY(SELECT id FROM conversations))")
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and conversation_summaries table."""
+    for name, table, _event, _referencing, _function in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    for function in FUNCTION_NAMES:
+        op.execute(f"DROP FUNCTION IF EXISTS {function}")
+    op.drop_table("conversation_summaries")
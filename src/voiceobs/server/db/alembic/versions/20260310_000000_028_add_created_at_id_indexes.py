@@ -0,0 +1,38 @@
+"""Index spans and failures on (created_at, id) for keyset pagination.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-03-10 00:00:00.000000
+
+Span and failure listings page with a (created_at, id) cursor. A composite
+index lets each page start right after the cursor, and it also serves the
+created_at range scans the single-column indexes it replaces were used for.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "028"
+down_revision: str = "027"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ["spans", "failures"]
+
+
+def upgrade() -> None:
+    """Replace the created_at indexes with (created_at, id) indexes."""
+    for table in TABLES:
+        op.create_index(
+            f"idx_{table}_created_at_id", table, ["created_at", "id"], if_not_exists=True
+        )
+        op.drop_index(f"idx_{table}_created_at", table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column created_at indexes."""
+    for table in TABLES:
+        op.create_index(f"idx_{table}_created_at", table, ["created_at"], if_not_exists=True)
+        op.drop_index(f"idx_{table}_created_at_id", table, if_exists=True)
@@ -0,0 +1,107 @@
+"""Turn test_executions into a job queue for the test execution workers.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-03-15 00:00:00.000000
+
+This migration:
+1. Adds run_id so the executions started by one run can be tracked together
+2. Adds agent_id and max_parallel, which cap how many executions run at once
+   per agent and per run
+3. Adds queued_at, attempts, locked_by and locked_at for claiming executions
+   with FOR UPDATE SKIP LOCKED and requeueing them if a worker disappears
+4. Adds indexes for claiming queued executions, counting running ones per
+   agent and reading a run's progress
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "029"
+down_revision: str = "028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add queue columns and indexes to test_executions."""
+    op.add_column(
+        "test_executions",
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column("agent_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column("max_parallel", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column(
+            "queued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column("locked_by", sa.String(255), nullable=True),
+    )
+    op.add_column(
+        "test_executions",
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.create_foreign_key(
+        "fk_test_executions_agent_id",
+        "test_executions",
+        "agents",
+        ["agent_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    op.create_index("idx_test_executions_run_id", "test_executions", ["run_id"])
+    op.create_index(
+        "idx_test_executions_queued",
+        "test_executions",
+        ["queued_at", "id"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "idx_test_executions_running_agent_id",
+        "test_executions",
+        ["agent_id"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    """Remove queue columns and indexes from test_executions."""
+    op.drop_index("idx_test_executions_running_agent_id", "test_executions")
+    op.drop_index("idx_test_executions_queued", "test_executions")
+    op.drop_index("idx_test_executions_run_id", "test_executions")
+
+    op.drop_constraint("fk_test_executions_agent_id", "test_executions", type_="foreignkey")
+
+    for column in (
+        "locked_at",
+        "locked_by",
+        "attempts",
+        "queued_at",
+        "max_parallel",
+        "agent_id",
+        "run_id",
+    ):
+        op.drop_column("test_executions", column)
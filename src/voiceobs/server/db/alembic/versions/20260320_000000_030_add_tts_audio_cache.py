@@ -0,0 +1,64 @@
+"""Add the content-addressed TTS audio cache.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-03-20 00:00:00.000000
+
+This migration creates the tts_audio_cache table. Each row is one
+synthesized audio file in audio storage, keyed by a SHA-256 hash of the
+TTS provider, the normalized TTS config and the text, so identical
+synthesis requests (e.g. the same system persona's preview in every
+organization) share one file. ref_count tracks how many records point at
+the file; unreferenced entries are evicted by idle time and total size.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "030"
+down_revision: str = "029"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the tts_audio_cache table."""
+    op.create_table(
+        "tts_audio_cache",
+        sa.Column("cache_key", sa.String(64), nullable=False),
+        sa.Column("tts_provider", sa.String(50), nullable=False),
+        sa.Column("audio_url", sa.Text(), nullable=False),
+        sa.Column("mime_type", sa.String(100), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+        sa.UniqueConstraint("audio_url", name="uq_tts_audio_cache_audio_url"),
+    )
+    op.create_index(
+        "idx_tts_audio_cache_unreferenced",
+        "tts_audio_cache",
+        ["last_used_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the tts_audio_cache table."""
+    op.drop_index("idx_tts_audio_cache_unreferenced", "tts_audio_cache")
+    op.drop_table("tts_audio_cache")
@@ -0,0 +1,86 @@
+"""Add the span derivation backlog.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-03-25 00:00:00.000000
+
+This migration creates the span_derivation_backlog table, which records
+conversation spans whose turns and failures have not been derived yet. A
+statement-level trigger on spans adds every derivable span in the same
+transaction that stores it, whether it arrives through ingest or the CLI
+import, and derivation removes it in the transaction that writes the derived
+rows. Spans that predate the table are added for conversations that have no
+turns or failures yet, so the server's catch-up pass backfills them.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: str = "030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match DERIVED_SPAN_NAMES in voiceobs.server.services.span_derivation
+DERIVED_SPAN_NAMES_SQL = (
+    "'voice.turn', 'voice.asr', 'voice.llm', 'voice.tts', "
+    "'voice.stage.asr', 'voice.stage.llm', 'voice.stage.tts'"
+)
+
+FUNCTION = f"""
+    CREATE OR REPLACE FUNCTION span_derivation_backlog_spans_inserted()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO span_derivation_backlog (span_id)
+        SELECT id FROM new_rows
+        WHERE conversation_id IS NOT NULL
+          AND name IN ({DERIVED_SPAN_NAMES_SQL});
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+TRIGGER = """
+    CREATE TRIGGER span_derivation_backlog_insert
+        AFTER INSERT ON spans REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION span_derivation_backlog_spans_inserted()
+"""
+
+BACKFILL = f"""
+    INSERT INTO span_derivation_backlog (span_id)
+    SELECT s.id FROM spans s
+    WHERE s.conversation_id IS NOT NULL
+      AND s.name IN ({DERIVED_SPAN_NAMES_SQL})
+      AND NOT EXISTS (SELECT 1 FROM turns t WHERE t.conversation_id = s.conversation_id)
+      AND NOT EXISTS (SELECT 1 FROM failures f WHERE f.conversation_id = s.conversation_id)
+"""
+
+
+def upgrade() -> None:
+    """Create the backlog table and its trigger, and queue underived spans."""
+    op.create_table(
+        "span_derivation_backlog",
+        sa.Column("span_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "enqueued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["span_id"], ["spans.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("span_id"),
+    )
+    op.execute(FUNCTION)
+    op.execute(TRIGGER)
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Drop the trigger, its function and the backlog table."""
+    op.execute("DROP TRIGGER IF EXISTS span_derivation_backlog_insert ON spans")
+    op.execute("DROP FUNCTION IF EXISTS span_derivation_backlog_spans_inserted()")
+    op.drop_table("span_derivation_backlog")
@@ -158,6 +158,30 @@ class Database:
             async with conn.transaction():
                 yield conn
 
+    async def iterate(
+        self, query: str, *args: Any, prefetch: int = 1000
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Iterate over query results through a server-side cursor.
+
+        Rows are fetched ``prefetch`` at a time, so memory use does not grow
+        with the size of the result. The cursor holds a pooled connection
+        and a read transaction until iteration finishes or is abandoned.
+
+        Args:
+            query: SQL query to execute.
+            *args: Query parameters.
+            prefetch: Number of rows fetched per round trip.
+
+        Yields:
+            Result rows.
+
+        Raises:
+            RuntimeError: If not connected to the database.
+        """
+        async with self.transaction() as conn:
+            async for row in conn.cursor(query, *args, prefetch=prefetch):
+                yield row
+
     async def init_schema(self) -> None:
         """Initialize the database schema.
 
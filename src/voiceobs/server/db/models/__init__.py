@@ -14,6 +14,7 @@ from voiceobs.server.db.models.span import SpanRow
 from voiceobs.server.db.models.test_execution import TestExecutionRow
 from voiceobs.server.db.models.test_scenario import TestScenarioRow
 from voiceobs.server.db.models.test_suite import TestSuiteRow
+from voiceobs.server.db.models.tts_audio_cache import TTSAudioCacheRow
 from voiceobs.server.db.models.turn import TurnRow
 from voiceobs.server.db.models.user import UserRow
 
@@ -29,6 +30,7 @@ __all__ = [
     "TestExecutionRow",
     "TestScenarioRow",
     "TestSuiteRow",
+    "TTSAudioCacheRow",
     "TurnRow",
     "UserRow",
 ]
@@ -15,7 +15,10 @@ class TestExecutionRow:
     id: UUID
     scenario_id: UUID
     conversation_id: UUID | None = None
-    status: str = "pending"  # pending, running, completed, failed
+    status: str = "pending"  # pending, queued, running, completed, failed
     started_at: datetime | None = None
     completed_at: datetime | None = None
     result_json: dict[str, Any] = field(default_factory=dict)
+    run_id: UUID | None = None  # Run that queued this execution
+    agent_id: UUID | None = None  # Agent under test, resolved from the scenario's suite
+    attempts: int = 0  # Times a worker has claimed this execution
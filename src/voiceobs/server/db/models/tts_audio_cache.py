@@ -0,0 +1,21 @@
+"""TTS audio cache model for database operations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class TTSAudioCacheRow:
+    """Represents a tts_audio_cache row in the database."""
+
+    cache_key: str  # SHA-256 of provider, normalized TTS config and text
+    tts_provider: str
+    audio_url: str
+    mime_type: str
+    duration_ms: float
+    size_bytes: int
+    ref_count: int = 0  # Records currently pointing at audio_url
+    created_at: datetime | None = None
+    last_used_at: datetime | None = None
@@ -0,0 +1,166 @@
+"""Keyset pagination helpers for listing queries.
+
+Listing endpoints hand out an opaque cursor that holds the sort key and
+UUID of the last row on a page. The next page starts strictly after that
+row, so fetching it costs the same however deep the client has paged, and
+rows inserted in the meantime do not shift later pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from voiceobs.server.db.connection import Database
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of the last row returned on a page.
+
+    Attributes:
+        sort: Sort key the cursor belongs to (e.g. "created_at", "latency").
+            Backends without keyset support use "offset".
+        value: Sort key value of the last row (datetime, number or None), or
+            the number of rows already returned for "offset" cursors.
+        id: UUID of the last row, which orders rows with equal sort values.
+    """
+
+    sort: str
+    value: Any
+    id: UUID | None = None
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        value = {"ts": self.value.isoformat()} if isinstance(self.value, datetime) else self.value
+        payload = json.dumps(
+            [self.sort, value, str(self.id) if self.id else None], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: str) -> Cursor:
+        """Decode a token produced by `encode`.
+
+        Args:
+            token: Cursor token from a previous page.
+            sort: Sort key of the current request.
+
+        Returns:
+            The decoded cursor.
+
+        Raises:
+            ValueError: If the token is malformed or was produced for another sort key.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            cursor_sort, value, row_id = json.loads(raw)
+            if isinstance(value, dict):
+                value = datetime.fromisoformat(value["ts"])
+            cursor = cls(cursor_sort, value, UUID(row_id) if row_id else None)
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as e:
+            raise ValueError("Invalid cursor") from e
+
+        if cursor.sort != sort:
+            raise ValueError(f"Cursor was created for sort '{cursor.sort}', not '{sort}'")
+        if sort == "offset" and not (isinstance(cursor.value, int) and cursor.value >= 0):
+            raise ValueError("Invalid cursor")
+        if sort != "offset" and cursor.id is None:
+            raise ValueError("Invalid cursor")
+        return cursor
+
+
+def keyset_condition(
+    key: str,
+    id_column: str,
+    cursor: Cursor,
+    descending: bool,
+    param_idx: int,
+    nullable: bool = False,
+) -> tuple[str, list[Any]]:
+    """Build the condition that selects the rows after a cursor.
+
+    The condition matches ``ORDER BY key <dir>, id_column <dir>`` with
+    PostgreSQL's default null placement (first when descending, last when
+    ascending). For non-null cursors it is a row comparison, which a btree
+    index on ``(key, id_column)`` can serve directly.
+
+    Args:
+        key: Sort key expression.
+        id_column: Unique column that breaks ties.
+        cursor: Position of the last row already returned.
+        descending: Whether the listing is sorted in descending order.
+        param_idx: Index of the first query parameter to use.
+        nullable: Whether the sort key can be NULL.
+
+    Returns:
+        Tuple of (SQL condition, parameters).
+    """
+    op = "<" if descending else ">"
+    if cursor.value is None:
+        condition = f"({key} IS NULL AND {id_column} {op} ${param_idx})"
+        if descending:
+            condition = f"({condition} OR {key} IS NOT NULL)"
+        return condition, [cursor.id]
+
+    condition = f"({key}, {id_column}) {op} (${param_idx}, ${param_idx + 1})"
+    if nullable and not descending:
+        condition = f"({condition} OR {key} IS NULL)"
+    return condition, [cursor.value, cursor.id]
+
+
+async def estimate_count(db: Database, query: str, *args: Any) -> int:
+    """Return the planner's row estimate for a query without running it.
+
+    Args:
+        db: Database connection.
+        query: SELECT statement whose result size to estimate.
+        *args: Query parameters.
+
+    Returns:
+        Estimated number of rows.
+    """
+    plan = await db.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def offset_page(
+    items: list[T], limit: int | None, cursor: str | None = None, offset: int = 0
+) -> tuple[list[T], str | None]:
+    """Slice one page out of an already sorted list.
+
+    For listings computed in memory, where there is no index to seek, the
+    cursor simply records how many items were returned so far.
+
+    Args:
+        items: All items, in listing order.
+        limit: Maximum number of items per page, or None for all remaining items.
+        cursor: Cursor from the previous page.
+        offset: Number of items to skip when no cursor is given.
+
+    Returns:
+        Tuple of (page items, cursor for the next page or None on the last page).
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    start = Cursor.decode(cursor, "offset").value if cursor is not None else offset
+    end = len(items) if limit is None else start + limit
+    next_cursor = Cursor("offset", end).encode() if end < len(items) else None
+    return items[start:end], next_cursor
@@ -8,6 +8,7 @@ from voiceobs.server.db.repositories.agent import AgentRepository
 from voiceobs.server.db.repositories.conversation import ConversationRepository
 from voiceobs.server.db.repositories.failure import FailureRepository
 from voiceobs.server.db.repositories.metrics import MetricsRepository
+from voiceobs.server.db.repositories.metrics_rollup import MetricsRollupRepository
 from voiceobs.server.db.repositories.organization import OrganizationRepository
 from voiceobs.server.db.repositories.organization_invite import (
     OrganizationInviteRepository,
@@ -20,6 +21,7 @@ from voiceobs.server.db.repositories.span import SpanRepository
 from voiceobs.server.db.repositories.test_execution import TestExecutionRepository
 from voiceobs.server.db.repositories.test_scenario import TestScenarioRepository
 from voiceobs.server.db.repositories.test_suite import TestSuiteRepository
+from voiceobs.server.db.repositories.tts_audio_cache import TTSAudioCacheRepository
 from voiceobs.server.db.repositories.turn import TurnRepository
 from voiceobs.server.db.repositories.user import UserRepository
 
@@ -28,6 +30,7 @@ __all__ = [
     "ConversationRepository",
     "FailureRepository",
     "MetricsRepository",
+    "MetricsRollupRepository",
     "OrganizationInviteRepository",
     "OrganizationMemberRepository",
     "OrganizationRepository",
@@ -36,6 +39,7 @@ __all__ = [
     "TestExecutionRepository",
     "TestScenarioRepository",
     "TestSuiteRepository",
+    "TTSAudioCacheRepository",
     "TurnRepository",
     "UserRepository",
 ]
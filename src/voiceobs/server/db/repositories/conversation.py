@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.models import ConversationRow
+from voiceobs.server.db.pagination import Cursor, estimate_count, keyset_condition
 
 
 class ConversationRepository:
@@ -63,6 +65,37 @@ class ConversationRepository:
             conversation_id=conversation_id,
         )
 
+    async def get_or_create_many(self, conversation_ids: Iterable[str]) -> dict[str, UUID]:
+        """Resolve many external conversation IDs in a single round trip.
+
+        Missing conversations are inserted and existing ones are returned via
+        one ``INSERT ... ON CONFLICT ... RETURNING`` statement.
+
+        Args:
+            conversation_ids: External conversation IDs (duplicates allowed).
+
+        Returns:
+            Mapping of external conversation ID to conversation UUID.
+        """
+        unique_ids = sorted(set(conversation_ids))
+        if not unique_ids:
+            return {}
+
+        # DO UPDATE (rather than DO NOTHING) so RETURNING also yields existing rows.
+        # Sorting the IDs keeps lock acquisition order stable across concurrent batches.
+        rows = await self._db.fetch(
+            """
+            INSERT INTO conversations (conversation_id)
+            SELECT unnest($1::varchar[])
+            ON CONFLICT (conversation_id)
+            DO UPDATE SET conversation_id = EXCLUDED.conversation_id
+            RETURNING id, conversation_id
+            """,
+            unique_ids,
+        )
+
+        return {row["conversation_id"]: row["id"] for row in rows}
+
     async def get(self, id: UUID) -> ConversationRow | None:
         """Get a conversation by UUID.
 
@@ -151,13 +184,11 @@ class ConversationRepository:
             SELECT
                 c.id,
                 c.conversation_id,
-                COUNT(DISTINCT s.id) as span_count,
-                COUNT(DISTINCT t.id) as turn_count,
-                EXISTS(SELECT 1 FROM failures f WHERE f.conversation_id = c.id) as has_failures
+                cs.span_count,
+                cs.turn_count,
+                cs.failure_count > 0 as has_failures
             FROM conversations c
-            LEFT JOIN spans s ON s.conversation_id = c.id
-            LEFT JOIN turns t ON t.conversation_id = c.id
-            GROUP BY c.id, c.conversation_id
+            JOIN conversation_summaries cs ON cs.conversation_id = c.id
             ORDER BY c.created_at DESC
             """
         )
@@ -208,12 +239,7 @@ class ConversationRepository:
         conditions.append(
             f"""
             (c.conversation_id ILIKE ${param_idx}
-            OR EXISTS (
-                SELECT 1 FROM turns t
-                WHERE t.conversation_id = c.id
-                AND to_tsvector('english', COALESCE(t.transcript, ''))
-                    @@ plainto_tsquery('english', ${next_param})
-            ))
+            OR cs.search_vector @@ plainto_tsquery('english', ${next_param}))
             """
         )
         params.append(f"%{query}%")
@@ -234,15 +260,8 @@ class ConversationRepository:
         Returns:
             Next parameter index.
         """
-        conditions.append(
-            f"""
-            EXISTS (
-                SELECT 1 FROM spans s
-                WHERE s.conversation_id = c.id
-                AND s.start_time >= ${param_idx}
-            )
-            """
-        )
+        # Some span started at or after start_time
+        conditions.append(f"cs.last_start_time >= ${param_idx}")
         params.append(start_time)
         return param_idx + 1
 
@@ -260,15 +279,8 @@ class ConversationRepository:
         Returns:
             Next parameter index.
         """
-        conditions.append(
-            f"""
-            EXISTS (
-                SELECT 1 FROM spans s
-                WHERE s.conversation_id = c.id
-                AND s.start_time <= ${param_idx}
-            )
-            """
-        )
+        # Some span started at or before end_time
+        conditions.append(f"cs.first_start_time <= ${param_idx}")
         params.append(end_time)
         return param_idx + 1
 
@@ -306,11 +318,9 @@ class ConversationRepository:
             conditions: List of SQL conditions to append to.
         """
         if has_failures:
-            conditions.append("EXISTS (SELECT 1 FROM failures f WHERE f.conversation_id = c.id)")
+            conditions.append("cs.failure_count > 0")
         else:
-            conditions.append(
-                "NOT EXISTS (SELECT 1 FROM failures f WHERE f.conversation_id = c.id)"
-            )
+            conditions.append("cs.failure_count = 0")
 
     def _add_failure_type_condition(
         self, failure_type: str, conditions: list[str], params: list[Any], param_idx: int
@@ -352,15 +362,8 @@ class ConversationRepository:
         Returns:
             Next parameter index.
         """
-        conditions.append(
-            f"""
-            EXISTS (
-                SELECT 1 FROM spans s
-                WHERE s.conversation_id = c.id
-                AND s.duration_ms >= ${param_idx}
-            )
-            """
-        )
+        # Some span took at least min_latency_ms
+        conditions.append(f"cs.max_duration_ms >= ${param_idx}")
         params.append(min_latency_ms)
         return param_idx + 1
 
@@ -419,6 +422,30 @@ class ConversationRepository:
 
         return conditions, params, param_idx
 
+    def _sort_key(
+        self, sort: str, query: str | None, query_param_idx: int | None
+    ) -> tuple[str, str]:
+        """Resolve the sort field to a cursor sort name and SQL expression.
+
+        Args:
+            sort: Sort field (start_time, latency, relevance).
+            query: Search query for relevance sorting.
+            query_param_idx: Parameter index for query in relevance sorting.
+
+        Returns:
+            Tuple of (sort name, sort key expression).
+        """
+        if sort == "start_time":
+            return "start_time", "cs.first_start_time"
+        if sort == "latency":
+            return "latency", "cs.avg_duration_ms"
+        if sort == "relevance" and query and query_param_idx:
+            return (
+                "relevance",
+                f"ts_rank(cs.search_vector, plainto_tsquery('english', ${query_param_idx}))",
+            )
+        return "created_at", "c.created_at"
+
     def _build_order_by(
         self, sort: str, sort_order: str, query: str | None, query_param_idx: int | None
     ) -> str:
@@ -433,27 +460,11 @@ class ConversationRepository:
         Returns:
             ORDER BY clause string.
         """
-        if sort == "start_time":
-            order_by = "MIN(span_times.start_time)"
-        elif sort == "latency":
-            order_by = "AVG(span_times.duration_ms)"
-        elif sort == "relevance" and query and query_param_idx:
-            order_by = f"""
-            ts_rank(
-                to_tsvector('english', c.conversation_id || ' ' ||
-                COALESCE((
-                    SELECT string_agg(t.transcript, ' ')
-                    FROM turns t
-                    WHERE t.conversation_id = c.id
-                ), '')),
-                plainto_tsquery('english', ${query_param_idx})
-            )
-            """
-        else:
-            order_by = "c.created_at"
+        _, order_by = self._sort_key(sort, query, query_param_idx)
 
+        # The conversation UUID breaks ties so pages do not overlap
         order_direction = "ASC" if sort_order.lower() == "asc" else "DESC"
-        return f"{order_by} {order_direction}"
+        return f"{order_by} {order_direction}, cs.conversation_id {order_direction}"
 
     async def search(
         self,
@@ -468,9 +479,21 @@ class ConversationRepository:
         sort_order: str = "desc",
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
+        approximate_total: bool = False,
     ) -> tuple[list[dict[str, Any]], int]:
         """Search and filter conversations.
 
+        Filters and sort keys come from ``conversation_summaries``, which the
+        database keeps up to date as spans, turns and failures are written,
+        so a page is read through its indexes instead of aggregating every
+        conversation's spans.
+
+        Every result carries a ``cursor``. Passing the last one back returns
+        the page after it with a keyset condition, which stays as fast as the
+        first page however deep the client pages; ``offset`` still works but
+        gets slower the more rows it skips.
+
         Args:
             query: Full-text search query for transcripts and conversation IDs.
             start_time: Filter conversations starting after this time.
@@ -483,9 +506,15 @@ class ConversationRepository:
             sort_order: Sort order (asc, desc).
             limit: Maximum number of results.
             offset: Number of results to skip.
+            cursor: Cursor of the last result on the previous page.
+            approximate_total: Use the planner's row estimate for the total
+                instead of counting every match.
 
         Returns:
             Tuple of (list of conversation summaries, total count).
+
+        Raises:
+            ValueError: If the cursor is invalid or was created for another sort.
         """
         # Build WHERE conditions
         conditions, params, param_idx = self._build_search_conditions(
@@ -501,29 +530,45 @@ class ConversationRepository:
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
+        count_params = list(params)
 
         # Find query parameter index for relevance sorting
         query_param_idx = 2 if query else None
 
         # Build ORDER BY clause
+        sort_name, sort_key = self._sort_key(sort, query, query_param_idx)
         order_by = self._build_order_by(sort, sort_order, query, query_param_idx)
 
+        page_conditions = list(conditions)
+        if cursor is not None:
+            condition, cursor_params = keyset_condition(
+                sort_key,
+                "cs.conversation_id",
+                Cursor.decode(cursor, sort_name),
+                descending=sort_order.lower() != "asc",
+                param_idx=param_idx,
+                nullable=True,
+            )
+            page_conditions.append(condition)
+            params.extend(cursor_params)
+            param_idx += len(cursor_params)
+
+        page_where_clause = ""
+        if page_conditions:
+            page_where_clause = "WHERE " + " AND ".join(page_conditions)
+
         # Build and execute main query
         base_query = f"""
         SELECT
             c.id,
             c.conversation_id,
-            COUNT(DISTINCT s.id) as span_count,
-            COUNT(DISTINCT t.id) as turn_count,
-            EXISTS(SELECT 1 FROM failures f WHERE f.conversation_id = c.id) as has_failures,
-            MIN(span_times.start_time) as min_start_time,
-            AVG(span_times.duration_ms) as avg_latency
-        FROM conversations c
-        LEFT JOIN spans s ON s.conversation_id = c.id
-        LEFT JOIN spans span_times ON span_times.conversation_id = c.id
-        LEFT JOIN turns t ON t.conversation_id = c.id
-        {where_clause}
-        GROUP BY c.id, c.conversation_id
+            cs.span_count,
+            cs.turn_count,
+            cs.failure_count > 0 as has_failures,
+            {sort_key} as sort_value
+        FROM conversation_summaries cs
+        JOIN conversations c ON c.id = cs.conversation_id
+        {page_where_clause}
         ORDER BY {order_by}
         LIMIT ${param_idx} OFFSET ${param_idx + 1}
         """
@@ -537,17 +582,20 @@ class ConversationRepository:
                 "span_count": row["span_count"],
                 "turn_count": row["turn_count"],
                 "has_failures": row["has_failures"],
+                "cursor": Cursor(sort_name, row["sort_value"], row["id"]).encode(),
             }
             for row in rows
         ]
 
         # Get total count
-        count_query = f"""
-        SELECT COUNT(DISTINCT c.id)
-        FROM conversations c
+        match_query = f"""
+        FROM conversation_summaries cs
+        JOIN conversations c ON c.id = cs.conversation_id
         {where_clause}
         """
-        count_params = params[:-2]
-        total = await self._db.fetchval(count_query, *count_params) or 0
+        if approximate_total:
+            total = await estimate_count(self._db, f"SELECT 1 {match_query}", *count_params)
+        else:
+            total = await self._db.fetchval(f"SELECT COUNT(*) {match_query}", *count_params) or 0
 
         return results, total
@@ -2,11 +2,29 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from contextlib import nullcontext
 from typing import Any
 from uuid import UUID, uuid4
 
+import asyncpg
+
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.models import FailureRow
+from voiceobs.server.db.pagination import Cursor, keyset_condition
+
+_FAILURE_COPY_COLUMNS = [
+    "id",
+    "failure_type",
+    "severity",
+    "message",
+    "conversation_id",
+    "turn_id",
+    "turn_index",
+    "signal_name",
+    "signal_value",
+    "threshold",
+]
 
 
 class FailureRepository:
@@ -72,6 +90,52 @@ class FailureRepository:
 
         return failure_uuid
 
+    async def add_many(
+        self, failures: Sequence[dict[str, Any]], conn: asyncpg.Connection | None = None
+    ) -> list[UUID]:
+        """Add many failures in a single transaction using binary COPY.
+
+        Each failure dictionary accepts the same keys as the keyword
+        arguments of :meth:`add`. ``failure_type``, ``severity`` and
+        ``message`` are required; other keys default to None.
+
+        Args:
+            failures: Failure dictionaries to store.
+            conn: Connection of an open transaction to write in. A new
+                transaction is used if not provided.
+
+        Returns:
+            The UUIDs of the stored failures, in input order.
+        """
+        failure_uuids = [uuid4() for _ in failures]
+        if not failures:
+            return failure_uuids
+
+        records = [
+            (
+                failure_uuid,
+                failure["failure_type"],
+                failure["severity"],
+                failure["message"],
+                failure.get("conversation_id"),
+                failure.get("turn_id"),
+                failure.get("turn_index"),
+                failure.get("signal_name"),
+                failure.get("signal_value"),
+                failure.get("threshold"),
+            )
+            for failure_uuid, failure in zip(failure_uuids, failures)
+        ]
+
+        async with self._db.transaction() if conn is None else nullcontext(conn) as conn:
+            await conn.copy_records_to_table(
+                "failures",
+                records=records,
+                columns=_FAILURE_COPY_COLUMNS,
+            )
+
+        return failure_uuids
+
     async def get(self, failure_id: UUID) -> FailureRow | None:
         """Get a failure by UUID.
 
@@ -122,17 +186,7 @@ class FailureRepository:
         Returns:
             List of failures.
         """
-        conditions = []
-        params: list[Any] = []
-
-        if severity is not None:
-            params.append(severity)
-            conditions.append(f"severity = ${len(params)}")
-
-        if failure_type is not None:
-            params.append(failure_type)
-            conditions.append(f"failure_type = ${len(params)}")
-
+        conditions, params = self._build_filter_conditions(severity, failure_type)
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
@@ -165,6 +219,143 @@ class FailureRepository:
             for row in rows
         ]
 
+    def _build_filter_conditions(
+        self, severity: str | None, failure_type: str | None, alias: str = ""
+    ) -> tuple[list[str], list[Any]]:
+        """Build WHERE conditions for the severity and type filters.
+
+        Args:
+            severity: Filter by severity.
+            failure_type: Filter by type.
+            alias: Table alias prefix for the columns (e.g. "f.").
+
+        Returns:
+            Tuple of (conditions list, params list).
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if severity is not None:
+            params.append(severity)
+            conditions.append(f"{alias}severity = ${len(params)}")
+
+        if failure_type is not None:
+            params.append(failure_type)
+            conditions.append(f"{alias}failure_type = ${len(params)}")
+
+        return conditions, params
+
+    async def search(
+        self,
+        severity: str | None = None,
+        failure_type: str | None = None,
+        limit: int | None = 100,
+        cursor: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get one page of failures, newest first.
+
+        Failures are returned with their conversation's and turn's external
+        IDs. Every result carries a ``cursor``; passing the last one back
+        returns the next page through the (created_at, id) index.
+
+        Args:
+            severity: Filter by severity.
+            failure_type: Filter by type.
+            limit: Maximum number of results. Returns all failures if None.
+            cursor: Cursor of the last result on the previous page.
+
+        Returns:
+            List of failure dictionaries.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        conditions, params = self._build_filter_conditions(severity, failure_type, "f.")
+        if cursor is not None:
+            condition, cursor_params = keyset_condition(
+                "f.created_at",
+                "f.id",
+                Cursor.decode(cursor, "created_at"),
+                descending=True,
+                param_idx=len(params) + 1,
+                nullable=True,
+            )
+            conditions.append(condition)
+            params.extend(cursor_params)
+
+        where_clause = ""
+        if conditions:
+            where_clause = "WHERE " + " AND ".join(conditions)
+        limit_clause = ""
+        if limit is not None:
+            params.append(limit)
+            limit_clause = f"LIMIT ${len(params)}"
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT f.id, f.failure_type, f.severity, f.message,
+                   c.conversation_id, t.turn_id, f.turn_index,
+                   f.signal_name, f.signal_value, f.threshold, f.created_at
+            FROM failures f
+            LEFT JOIN conversations c ON c.id = f.conversation_id
+            LEFT JOIN turns t ON t.id = f.turn_id
+            {where_clause}
+            ORDER BY f.created_at DESC, f.id DESC
+            {limit_clause}
+            """,
+            *params,
+        )
+
+        return [
+            {
+                "id": str(row["id"]),
+                "type": row["failure_type"],
+                "severity": row["severity"],
+                "message": row["message"],
+                "conversation_id": row["conversation_id"],
+                "turn_id": row["turn_id"],
+                "turn_index": row["turn_index"],
+                "signal_name": row["signal_name"],
+                "signal_value": row["signal_value"],
+                "threshold": row["threshold"],
+                "cursor": Cursor("created_at", row["created_at"], row["id"]).encode(),
+            }
+            for row in rows
+        ]
+
+    async def get_counts(
+        self, severity: str | None = None, failure_type: str | None = None
+    ) -> tuple[dict[str, int], dict[str, int]]:
+        """Get failure counts by severity and by type for the filtered failures.
+
+        Args:
+            severity: Filter by severity.
+            failure_type: Filter by type.
+
+        Returns:
+            Tuple of (counts by severity, counts by type).
+        """
+        conditions, params = self._build_filter_conditions(severity, failure_type)
+        where_clause = ""
+        if conditions:
+            where_clause = "WHERE " + " AND ".join(conditions)
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT severity, failure_type, COUNT(*) as count
+            FROM failures {where_clause}
+            GROUP BY severity, failure_type
+            """,
+            *params,
+        )
+
+        by_severity: dict[str, int] = {}
+        by_type: dict[str, int] = {}
+        for row in rows:
+            by_severity[row["severity"]] = by_severity.get(row["severity"], 0) + row["count"]
+            by_type[row["failure_type"]] = by_type.get(row["failure_type"], 0) + row["count"]
+        return by_severity, by_type
+
     async def get_by_conversation(self, conversation_id: UUID) -> list[FailureRow]:
         """Get all failures for a conversation.
 
@@ -6,19 +6,27 @@ from datetime import datetime
 from typing import Any
 
 from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories.metrics_rollup import MetricsRollupRepository
 from voiceobs.server.db.repositories.metrics_utils import MetricsUtils
 
 
 class MetricsRepository:
-    """Repository for metrics aggregation operations."""
+    """Repository for metrics aggregation operations.
 
-    def __init__(self, db: Database) -> None:
+    When a rollup repository is given, latency breakdowns by stage, trends
+    and conversation volume that are not filtered by conversation are
+    answered from rollups instead of raw rows.
+    """
+
+    def __init__(self, db: Database, rollups: MetricsRollupRepository | None = None) -> None:
         """Initialize the metrics repository.
 
         Args:
             db: Database connection manager.
+            rollups: Optional metrics rollup repository.
         """
         self._db = db
+        self._rollups = rollups
 
     def _build_time_filter(
         self,
@@ -87,52 +95,91 @@ class MetricsRepository:
     ) -> dict[str, Any]:
         """Get overall metrics summary.
 
+        Spans, turns and failures are each aggregated on their own over the
+        matching conversations and the single-row results are combined, so
+        no table multiplies the rows of another. Latency percentiles are
+        taken over span durations only.
+
         Args:
-            start_time: Filter by start time.
+            start_time: Filter by start time. Only spans in the range are
+                aggregated, and only conversations with such spans are counted.
             end_time: Filter by end time.
             conversation_id: Filter by conversation ID.
 
         Returns:
             Dictionary with summary metrics.
         """
-        conditions: list[str] = []
+        conversation_conditions: list[str] = []
+        span_conditions: list[str] = []
         params: list[Any] = []
         param_idx = 1
 
         # Build filters
         if conversation_id:
             param_idx = self._build_conversation_filter(
-                conversation_id, conditions, params, param_idx
+                conversation_id, conversation_conditions, params, param_idx
             )
 
         if start_time or end_time:
             param_idx = self._build_time_filter(
-                start_time, end_time, conditions, params, param_idx, "s.start_time"
+                start_time, end_time, span_conditions, params, param_idx, "s.start_time"
+            )
+            conversation_conditions.append(
+                "EXISTS (SELECT 1 FROM spans s WHERE s.conversation_id = c.id AND "
+                + " AND ".join(span_conditions)
+                + ")"
             )
 
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+        conversation_where = ""
+        if conversation_conditions:
+            conversation_where = "WHERE " + " AND ".join(conversation_conditions)
+
+        span_where = ""
+        if span_conditions:
+            span_where = "WHERE " + " AND ".join(span_conditions)
 
         query = f"""
+        WITH matched AS (
+            SELECT c.id FROM conversations c
+            {conversation_where}
+        ),
+        span_stats AS (
+            SELECT
+                SUM(COALESCE(s.duration_ms, 0)) as total_duration_ms,
+                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY s.duration_ms) as p50_latency,
+                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY s.duration_ms) as p95_latency,
+                PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY s.duration_ms) as p99_latency,
+                AVG(CASE WHEN s.attributes->>'voice.silence.duration_ms' IS NOT NULL
+                    THEN (s.attributes->>'voice.silence.duration_ms')::float END)
+                    as silence_mean_ms,
+                COUNT(
+                    CASE WHEN s.attributes->>'voice.overlap.detected' = 'true' THEN 1 END
+                ) as overlap_count
+            FROM spans s
+            JOIN matched m ON m.id = s.conversation_id
+            {span_where}
+        ),
+        turn_stats AS (
+            SELECT COUNT(*) as total_turns
+            FROM turns t
+            JOIN matched m ON m.id = t.conversation_id
+        ),
+        failure_stats AS (
+            SELECT COUNT(*) as total_failures
+            FROM failures f
+            JOIN matched m ON m.id = f.conversation_id
+        )
         SELECT
-            COUNT(DISTINCT c.id) as total_conversations,
-            COUNT(DISTINCT t.id) as total_turns,
-            SUM(COALESCE(s.duration_ms, 0)) as total_duration_ms,
-            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY s.duration_ms) as p50_latency,
-            PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY s.duration_ms) as p95_latency,
-            PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY s.duration_ms) as p99_latency,
-            COUNT(DISTINCT f.id) as total_failures,
-            AVG(CASE WHEN s.attributes->>'voice.silence.duration_ms' IS NOT NULL
-                THEN (s.attributes->>'voice.silence.duration_ms')::float END) as silence_mean_ms,
-            COUNT(
-                CASE WHEN s.attributes->>'voice.overlap.detected' = 'true' THEN 1 END
-            ) as overlap_count
-        FROM conversations c
-        LEFT JOIN spans s ON s.conversation_id = c.id
-        LEFT JOIN turns t ON t.conversation_id = c.id
-        LEFT JOIN failures f ON f.conversation_id = c.id
-        {where_clause}
+            (SELECT COUNT(*) FROM matched) as total_conversations,
+            turn_stats.total_turns,
+            span_stats.total_duration_ms,
+            span_stats.p50_latency,
+            span_stats.p95_latency,
+            span_stats.p99_latency,
+            failure_stats.total_failures,
+            span_stats.silence_mean_ms,
+            span_stats.overlap_count
+        FROM span_stats, turn_stats, failure_stats
         """
 
         row = await self._db.fetchrow(query, *params)
@@ -190,6 +237,11 @@ class MetricsRepository:
         Returns:
             List of breakdown items.
         """
+        if self._rollups is not None and group_by == "stage" and not conversation_id:
+            breakdown = await self._rollups.get_latency_breakdown(start_time, end_time)
+            if breakdown is not None:
+                return breakdown
+
         conditions: list[str] = []
         params: list[Any] = []
         param_idx = 1
@@ -337,6 +389,11 @@ class MetricsRepository:
         Returns:
             List of volume items.
         """
+        if self._rollups is not None and not conversation_id:
+            volume = await self._rollups.get_conversation_volume(group_by, start_time, end_time)
+            if volume is not None:
+                return volume
+
         conditions: list[str] = []
         params: list[Any] = []
         param_idx = 1
@@ -570,6 +627,11 @@ class MetricsRepository:
         Returns:
             List of trend data points.
         """
+        if self._rollups is not None and not conversation_id:
+            trends = await self._rollups.get_trends(metric, window, start_time, end_time)
+            if trends is not None:
+                return trends
+
         conditions: list[str] = []
         params: list[Any] = []
         param_idx = 1
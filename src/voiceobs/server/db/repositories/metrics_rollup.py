@@ -0,0 +1,599 @@
+"""Metrics rollup repository for pre-aggregated dashboard metrics.
+
+Spans are rolled up into per-minute and per-hour buckets by stage type,
+keeping the span count, duration sum, min, max and the bucket counts of a
+:class:`~voiceobs.sketch.QuantileSketch`. Conversations and failures are
+rolled up into per-minute and per-hour counts.
+
+Rollups are refreshed incrementally: every bucket that received a row since
+the previous refresh is recomputed from the raw tables. Queries read whole
+buckets that are older than the last refresh from the rollups and the rest
+of the requested range (partial buckets at either end and anything newer
+than the last refresh) from the raw tables, so results include data that
+has not been rolled up yet.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import asyncpg
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories.metrics_utils import MetricsUtils
+from voiceobs.sketch import DEFAULT_RELATIVE_ACCURACY, QuantileSketch
+
+ROLLUP_RELATIVE_ACCURACY = DEFAULT_RELATIVE_ACCURACY
+"""Relative accuracy of the latency sketches stored in span rollups."""
+
+ROLLUP_RESOLUTIONS: dict[str, timedelta] = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+}
+"""Rollup bucket sizes. Buckets are aligned to the Unix epoch (UTC)."""
+
+EVENT_KINDS: dict[str, str] = {
+    "conversation": "conversations",
+    "failure": "failures",
+}
+"""Event rollup kinds and the table whose rows they count by created_at."""
+
+_WATERMARK_NAME = "metrics"
+_REFRESH_LOCK_ID = 0x766F_6D65_7472_6963
+"""Advisory lock key held while refreshing, so only one server refreshes at a time."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_STAGE_EXPR = "COALESCE(s.attributes->>'voice.stage.type', 'unknown')"
+_LOG_GAMMA = math.log((1 + ROLLUP_RELATIVE_ACCURACY) / (1 - ROLLUP_RELATIVE_ACCURACY))
+
+
+def _bucket_expr(column: str, resolution: str) -> str:
+    """SQL expression truncating a timestamp column to an epoch-aligned bucket."""
+    seconds = int(ROLLUP_RESOLUTIONS[resolution].total_seconds())
+    return f"to_timestamp(floor(extract(epoch FROM {column}) / {seconds}) * {seconds})"
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, like asyncpg does for timestamptz."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _floor(value: datetime, step: timedelta) -> datetime:
+    """Round a datetime down to a multiple of step since the epoch."""
+    return value - (value - _EPOCH) % step
+
+
+def _ceil(value: datetime, step: timedelta) -> datetime:
+    """Round a datetime up to a multiple of step since the epoch."""
+    floored = _floor(value, step)
+    return floored if floored == value else floored + step
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """Part of a query range, read from one rollup resolution or raw rows.
+
+    ``source`` is a rollup resolution, "raw", or "untimed" for raw rows
+    without a timestamp, which only unbounded queries include. ``start`` is
+    inclusive and ``end`` exclusive unless ``end_inclusive`` is set; None
+    means unbounded.
+    """
+
+    source: str
+    start: datetime | None
+    end: datetime | None
+    end_inclusive: bool = False
+
+
+class MetricsRollupRepository:
+    """Repository for metrics rollups.
+
+    Deleting spans, conversations or failures does not update rollups
+    already computed for them; call ``refresh(full=True)`` to rebuild.
+    """
+
+    def __init__(self, db: Database, overlap: timedelta = timedelta(minutes=5)) -> None:
+        """Initialize the metrics rollup repository.
+
+        Args:
+            db: Database connection manager.
+            overlap: How far before the previous refresh to look for new
+                rows, to catch rows committed after that refresh by
+                transactions that started before it.
+        """
+        self._db = db
+        self._overlap = overlap
+
+    async def refresh(self, full: bool = False) -> datetime | None:
+        """Bring the rollups up to date.
+
+        Args:
+            full: Rebuild every bucket instead of only the ones that
+                received rows since the previous refresh.
+
+        Returns:
+            The new watermark, or None if another refresh was already
+            running and this one was skipped.
+        """
+        async with self._db.transaction() as conn:
+            if not await conn.fetchval("SELECT pg_try_advisory_xact_lock($1)", _REFRESH_LOCK_ID):
+                return None
+
+            now = await conn.fetchval("SELECT now()")
+            previous = await conn.fetchval(
+                "SELECT refreshed_until FROM rollup_watermarks WHERE name = $1", _WATERMARK_NAME
+            )
+            since = None if full or previous is None else previous - self._overlap
+
+            for resolution in ROLLUP_RESOLUTIONS:
+                await self._refresh_spans(conn, resolution, since)
+                for kind, table in EVENT_KINDS.items():
+                    await self._refresh_events(conn, resolution, kind, table, since)
+
+            await conn.execute(
+                """
+                INSERT INTO rollup_watermarks (name, refreshed_until) VALUES ($1, $2)
+                ON CONFLICT (name) DO UPDATE SET refreshed_until = EXCLUDED.refreshed_until
+                """,
+                _WATERMARK_NAME,
+                now,
+            )
+            return now
+
+    async def get_watermark(self) -> datetime | None:
+        """Get the time up to which rollups are complete.
+
+        Returns:
+            Start time of the last refresh, or None if never refreshed.
+        """
+        return await self._db.fetchval(
+            "SELECT refreshed_until FROM rollup_watermarks WHERE name = $1", _WATERMARK_NAME
+        )
+
+    async def clear(self) -> None:
+        """Delete all rollups and the watermark."""
+        await self._db.execute("TRUNCATE span_rollups, event_rollups, rollup_watermarks")
+
+    async def _refresh_spans(
+        self, conn: asyncpg.Connection, resolution: str, since: datetime | None
+    ) -> None:
+        """Recompute span rollups for buckets that received spans since a time."""
+        seconds = int(ROLLUP_RESOLUTIONS[resolution].total_seconds())
+        if since is None:
+            await conn.execute("DELETE FROM span_rollups WHERE resolution = $1", resolution)
+            source = "spans s"
+            bucket = _bucket_expr("s.start_time", resolution)
+            params: list[Any] = []
+        else:
+            buckets = [
+                row["bucket_start"]
+                for row in await conn.fetch(
+                    f"""
+                    SELECT DISTINCT {_bucket_expr("s.start_time", resolution)} as bucket_start
+                    FROM spans s
+                    WHERE s.created_at >= $1
+                      AND s.start_time IS NOT NULL
+                      AND s.duration_ms IS NOT NULL
+                    """,
+                    since,
+                )
+            ]
+            if not buckets:
+                return
+            await conn.execute(
+                "DELETE FROM span_rollups WHERE resolution = $1 AND bucket_start = ANY($2)",
+                resolution,
+                buckets,
+            )
+            source = (
+                "unnest($3::timestamptz[]) AS d(bucket_start) "
+                "JOIN spans s ON s.start_time >= d.bucket_start "
+                f"AND s.start_time < d.bucket_start + make_interval(secs => {seconds})"
+            )
+            bucket = "d.bucket_start"
+            params = [buckets]
+
+        await conn.execute(
+            f"""
+            INSERT INTO span_rollups (
+                resolution, bucket_start, stage_type, span_count, duration_sum,
+                duration_min, duration_max, zero_count, positive_buckets, negative_buckets
+            )
+            SELECT
+                $1, bucket_start, stage_type,
+                SUM(n), SUM(total), MIN(lo), MAX(hi),
+                COALESCE(SUM(n) FILTER (WHERE sign = 0), 0),
+                COALESCE(jsonb_object_agg(idx, n) FILTER (WHERE sign > 0), '{{}}'::jsonb),
+                COALESCE(jsonb_object_agg(idx, n) FILTER (WHERE sign < 0), '{{}}'::jsonb)
+            FROM (
+                SELECT
+                    bucket_start, stage_type, sign, idx,
+                    COUNT(*) as n, SUM(d) as total, MIN(d) as lo, MAX(d) as hi
+                FROM (
+                    SELECT
+                        {bucket} as bucket_start,
+                        {_STAGE_EXPR} as stage_type,
+                        s.duration_ms as d,
+                        sign(s.duration_ms)::int as sign,
+                        CASE WHEN s.duration_ms <> 0
+                            THEN ceil(ln(abs(s.duration_ms)) / $2)::int ELSE 0 END as idx
+                    FROM {source}
+                    WHERE s.start_time IS NOT NULL AND s.duration_ms IS NOT NULL
+                ) points
+                GROUP BY bucket_start, stage_type, sign, idx
+            ) cells
+            GROUP BY bucket_start, stage_type
+            """,
+            resolution,
+            _LOG_GAMMA,
+            *params,
+        )
+
+    async def _refresh_events(
+        self,
+        conn: asyncpg.Connection,
+        resolution: str,
+        kind: str,
+        table: str,
+        since: datetime | None,
+    ) -> None:
+        """Recompute event counts for buckets from a time onwards."""
+        bucket = _bucket_expr("created_at", resolution)
+        if since is None:
+            await conn.execute(
+                "DELETE FROM event_rollups WHERE resolution = $1 AND kind = $2", resolution, kind
+            )
+            where = "created_at IS NOT NULL"
+            params: list[Any] = []
+        else:
+            since = _floor(since, ROLLUP_RESOLUTIONS[resolution])
+            await conn.execute(
+                """
+                DELETE FROM event_rollups
+                WHERE resolution = $1 AND kind = $2 AND bucket_start >= $3
+                """,
+                resolution,
+                kind,
+                since,
+            )
+            where = "created_at >= $3"
+            params = [since]
+
+        await conn.execute(
+            f"""
+            INSERT INTO event_rollups (resolution, bucket_start, kind, event_count)
+            SELECT $1, {bucket}, $2, COUNT(*)
+            FROM {table}
+            WHERE {where}
+            GROUP BY {bucket}
+            """,
+            resolution,
+            kind,
+            *params,
+        )
+
+    async def _plan(self, start: datetime | None, end: datetime | None) -> list[_Segment] | None:
+        """Split a query range into rollup and raw segments.
+
+        Whole minutes and hours older than the watermark come from rollups,
+        using hour rollups wherever a whole hour is covered. Everything else
+        in the range comes from raw rows.
+
+        Args:
+            start: Inclusive start of the range, or None for unbounded.
+            end: Inclusive end of the range, or None for unbounded.
+
+        Returns:
+            Segments covering the range, or None if rollups were never refreshed.
+        """
+        watermark = await self.get_watermark()
+        if watermark is None:
+            return None
+
+        minute, hour = ROLLUP_RESOLUTIONS["minute"], ROLLUP_RESOLUTIONS["hour"]
+        start = _as_utc(start) if start is not None else None
+        end = _as_utc(end) if end is not None else None
+
+        upper = _floor(watermark, minute)
+        if end is not None:
+            upper = min(upper, _floor(end, minute))
+        lower = _ceil(start, minute) if start is not None else None
+
+        if lower is not None and lower >= upper:
+            return [_Segment("raw", start, end, end_inclusive=True)]
+
+        segments = []
+        if start is not None and lower is not None and start < lower:
+            segments.append(_Segment("raw", start, lower))
+
+        hour_lower = _ceil(lower, hour) if lower is not None else None
+        hour_upper = _floor(upper, hour)
+        if hour_lower is None or hour_lower < hour_upper:
+            if lower is not None and hour_lower is not None and lower < hour_lower:
+                segments.append(_Segment("minute", lower, hour_lower))
+            segments.append(_Segment("hour", hour_lower, hour_upper))
+            if hour_upper < upper:
+                segments.append(_Segment("minute", hour_upper, upper))
+        else:
+            segments.append(_Segment("minute", lower, upper))
+
+        segments.append(_Segment("raw", upper, end, end_inclusive=True))
+        if start is None and end is None:
+            segments.append(_Segment("untimed", None, None))
+        return segments
+
+    def _segment_filters(
+        self, segments: list[_Segment], time_column: str, params: list[Any]
+    ) -> tuple[str, str]:
+        """Build WHERE conditions selecting the rollup rows and raw rows of a plan.
+
+        Args:
+            segments: Planned segments.
+            time_column: Timestamp column of the raw rows.
+            params: List of SQL parameters to append to.
+
+        Returns:
+            Tuple of (rollup condition, raw condition).
+        """
+        rollup_conditions: list[str] = []
+        raw_conditions: list[str] = []
+
+        for segment in segments:
+            if segment.source == "untimed":
+                raw_conditions.append(f"{time_column} IS NULL")
+                continue
+
+            column = time_column if segment.source == "raw" else "r.bucket_start"
+            conditions = []
+            if segment.source != "raw":
+                params.append(segment.source)
+                conditions.append(f"r.resolution = ${len(params)}")
+            if segment.start is not None:
+                params.append(segment.start)
+                conditions.append(f"{column} >= ${len(params)}")
+            if segment.end is not None:
+                params.append(segment.end)
+                operator = "<=" if segment.end_inclusive else "<"
+                conditions.append(f"{column} {operator} ${len(params)}")
+
+            target = raw_conditions if segment.source == "raw" else rollup_conditions
+            target.append("(" + " AND ".join(conditions or ["TRUE"]) + ")")
+
+        rollup_where = " OR ".join(rollup_conditions) if rollup_conditions else "FALSE"
+        raw_where = " OR ".join(raw_conditions) if raw_conditions else "FALSE"
+        return f"({rollup_where})", f"({raw_where})"
+
+    async def get_latency_breakdown(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Get latency by stage type from rollups.
+
+        Count and mean are exact. Percentiles are estimated from the merged
+        sketches and are within 1% relative error of the exact values.
+
+        Args:
+            start_time: Filter by span start time (inclusive).
+            end_time: Filter by span start time (inclusive).
+
+        Returns:
+            Breakdown items in the same shape as
+            ``MetricsRepository.get_latency_breakdown``, or None if rollups
+            were never refreshed.
+        """
+        segments = await self._plan(start_time, end_time)
+        if segments is None:
+            return None
+
+        params: list[Any] = []
+        rollup_where, raw_where = self._segment_filters(segments, "s.start_time", params)
+        stats = await self._db.fetch(
+            f"""
+            SELECT
+                stage_type,
+                SUM(n) as count,
+                SUM(total) as total,
+                MIN(lo) as min_ms,
+                MAX(hi) as max_ms,
+                SUM(zero) as zero_count
+            FROM (
+                SELECT r.stage_type, r.span_count as n, r.duration_sum as total,
+                       r.duration_min as lo, r.duration_max as hi, r.zero_count as zero
+                FROM span_rollups r
+                WHERE {rollup_where}
+                UNION ALL
+                SELECT {_STAGE_EXPR}, 1, s.duration_ms, s.duration_ms, s.duration_ms,
+                       CASE WHEN s.duration_ms = 0 THEN 1 ELSE 0 END
+                FROM spans s
+                WHERE s.duration_ms IS NOT NULL AND {raw_where}
+            ) parts
+            GROUP BY stage_type
+            """,
+            *params,
+        )
+        if not stats:
+            return []
+
+        params.append(_LOG_GAMMA)
+        buckets = await self._db.fetch(
+            f"""
+            SELECT stage_type, sign, idx, SUM(n) as count
+            FROM (
+                SELECT r.stage_type, 1 as sign, b.key::int as idx, b.value::bigint as n
+                FROM span_rollups r CROSS JOIN LATERAL jsonb_each_text(r.positive_buckets) b
+                WHERE {rollup_where}
+                UNION ALL
+                SELECT r.stage_type, -1, b.key::int, b.value::bigint
+                FROM span_rollups r CROSS JOIN LATERAL jsonb_each_text(r.negative_buckets) b
+                WHERE {rollup_where}
+                UNION ALL
+                SELECT {_STAGE_EXPR}, sign(s.duration_ms)::int,
+                       ceil(ln(abs(s.duration_ms)) / ${len(params)})::int, 1
+                FROM spans s
+                WHERE s.duration_ms IS NOT NULL AND s.duration_ms <> 0 AND {raw_where}
+            ) parts
+            GROUP BY stage_type, sign, idx
+            """,
+            *params,
+        )
+
+        sketches: dict[str, dict[str, Any]] = {
+            row["stage_type"]: {
+                "relative_accuracy": ROLLUP_RELATIVE_ACCURACY,
+                "count": int(row["count"]),
+                "sum": float(row["total"]),
+                "min": float(row["min_ms"]),
+                "max": float(row["max_ms"]),
+                "zero_count": int(row["zero_count"]),
+                "positive": {},
+                "negative": {},
+            }
+            for row in stats
+        }
+        for row in buckets:
+            side = "positive" if row["sign"] > 0 else "negative"
+            sketches[row["stage_type"]][side][row["idx"]] = int(row["count"])
+
+        breakdown = []
+        for stage_type, data in sketches.items():
+            sketch = QuantileSketch.from_dict(data)
+            breakdown.append(
+                {
+                    "group": stage_type,
+                    "count": sketch.count,
+                    "mean_ms": sketch.mean or None,
+                    "p50_ms": sketch.quantile(0.5) or None,
+                    "p95_ms": sketch.quantile(0.95) or None,
+                    "p99_ms": sketch.quantile(0.99) or None,
+                }
+            )
+        breakdown.sort(key=lambda item: item["count"], reverse=True)
+        return breakdown
+
+    async def get_trends(
+        self,
+        metric: str,
+        window: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Get time-series trends for a metric from rollups.
+
+        Args:
+            metric: Metric name ('latency', 'failures', 'conversations').
+            window: Time window ('1h', '1d', '1w').
+            start_time: Filter by start time.
+            end_time: Filter by end time.
+
+        Returns:
+            Trend data points in the same shape as
+            ``MetricsRepository.get_trends``, or None if rollups were never
+            refreshed.
+        """
+        segments = await self._plan(start_time, end_time)
+        if segments is None:
+            return None
+
+        window_value, window_unit = MetricsUtils.parse_window(window)
+        time_trunc, time_format = MetricsUtils.get_time_truncation(window_unit)
+        time_trunc = time_trunc.replace("time_col", "parts.t")
+
+        params: list[Any] = []
+        if metric == "latency":
+            rollup_where, raw_where = self._segment_filters(segments, "s.start_time", params)
+            parts = f"""
+                SELECT r.bucket_start as t, r.duration_sum as total, r.span_count as n
+                FROM span_rollups r
+                WHERE {rollup_where}
+                UNION ALL
+                SELECT s.start_time, s.duration_ms, 1
+                FROM spans s
+                WHERE s.duration_ms IS NOT NULL AND {raw_where}
+            """
+            value = "SUM(parts.total) / SUM(parts.n)"
+        else:
+            kind = "failure" if metric == "failures" else "conversation"
+            parts = self._event_parts(kind, segments, params)
+            value = "SUM(parts.n)::float"
+
+        query = f"""
+        SELECT
+            to_char({time_trunc}, '{time_format}') as timestamp,
+            {value} as value,
+            AVG({value}) OVER (
+                ORDER BY {time_trunc}
+                ROWS BETWEEN {window_value} PRECEDING AND CURRENT ROW
+            ) as rolling_avg
+        FROM ({parts}) parts
+        GROUP BY {time_trunc}
+        ORDER BY {time_trunc}
+        """
+        rows = await self._db.fetch(query, *params)
+
+        return [
+            {
+                "timestamp": row["timestamp"],
+                "value": float(row["value"]) if row["value"] else None,
+                "rolling_avg": float(row["rolling_avg"]) if row["rolling_avg"] else None,
+            }
+            for row in rows
+        ]
+
+    async def get_conversation_volume(
+        self,
+        group_by: str = "hour",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Get conversation volume over time from rollups.
+
+        Args:
+            group_by: Time grouping ('hour', 'day', 'week').
+            start_time: Filter by creation time.
+            end_time: Filter by creation time.
+
+        Returns:
+            Volume items in the same shape as
+            ``MetricsRepository.get_conversation_volume``, or None if rollups
+            were never refreshed.
+        """
+        segments = await self._plan(start_time, end_time)
+        if segments is None:
+            return None
+
+        params: list[Any] = []
+        parts = self._event_parts("conversation", segments, params)
+        time_trunc, time_format = MetricsUtils.get_conversation_volume_truncation(group_by)
+        time_trunc = time_trunc.replace("c.created_at", "parts.t")
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT
+                to_char({time_trunc}, '{time_format}') as time_bucket,
+                SUM(parts.n) as count
+            FROM ({parts}) parts
+            GROUP BY {time_trunc}
+            ORDER BY {time_trunc}
+            """,
+            *params,
+        )
+
+        return [{"time_bucket": row["time_bucket"], "count": int(row["count"])} for row in rows]
+
+    def _event_parts(self, kind: str, segments: list[_Segment], params: list[Any]) -> str:
+        """Build a subquery of (t, n) event counts from rollups and raw rows."""
+        rollup_where, raw_where = self._segment_filters(segments, "e.created_at", params)
+        params.append(kind)
+        return f"""
+            SELECT r.bucket_start as t, r.event_count as n
+            FROM event_rollups r
+            WHERE r.kind = ${len(params)} AND {rollup_where}
+            UNION ALL
+            SELECT e.created_at, 1
+            FROM {EVENT_KINDS[kind]} e
+            WHERE {raw_where}
+        """
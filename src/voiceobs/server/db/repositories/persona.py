@@ -410,6 +410,24 @@ class PersonaRepository:
         )
         return result == "DELETE 1"
 
+    async def list_preview_audio_urls(self, org_id: UUID) -> list[str]:
+        """List the preview audio URLs of an organization's personas.
+
+        Args:
+            org_id: Organization UUID for scoping (required).
+
+        Returns:
+            Preview audio URLs of all personas, active or not, that have one.
+        """
+        rows = await self._db.fetch(
+            """
+            SELECT preview_audio_url FROM personas
+            WHERE org_id = $1 AND preview_audio_url IS NOT NULL
+            """,
+            org_id,
+        )
+        return [row["preview_audio_url"] for row in rows]
+
     async def count(self, org_id: UUID, is_active: bool | None = True) -> int:
         """Count personas.
 
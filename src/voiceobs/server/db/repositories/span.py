@@ -3,12 +3,30 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import asyncpg
+
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.models import SpanRow
+from voiceobs.server.db.pagination import Cursor, estimate_count, keyset_condition
+
+# Column order used by add_many's COPY; must match the record tuples it builds.
+_SPAN_COPY_COLUMNS = [
+    "id",
+    "name",
+    "start_time",
+    "end_time",
+    "duration_ms",
+    "attributes",
+    "trace_id",
+    "span_id",
+    "parent_span_id",
+    "conversation_id",
+]
 
 
 def _parse_datetime(value: str | datetime | None) -> datetime | None:
@@ -94,6 +112,47 @@ class SpanRepository:
 
         return span_uuid
 
+    async def add_many(self, spans: Sequence[dict[str, Any]]) -> list[UUID]:
+        """Add many spans in a single transaction using binary COPY.
+
+        Each span dictionary accepts the same keys as the keyword arguments
+        of :meth:`add`. Missing keys default to None.
+
+        Args:
+            spans: Span dictionaries to store.
+
+        Returns:
+            The UUIDs of the stored spans, in input order.
+        """
+        span_uuids = [uuid4() for _ in spans]
+        if not spans:
+            return span_uuids
+
+        records = [
+            (
+                span_uuid,
+                span["name"],
+                _parse_datetime(span.get("start_time")),
+                _parse_datetime(span.get("end_time")),
+                span.get("duration_ms"),
+                json.dumps(span.get("attributes") or {}),
+                span.get("trace_id"),
+                span.get("span_id"),
+                span.get("parent_span_id"),
+                span.get("conversation_id"),
+            )
+            for span_uuid, span in zip(span_uuids, spans)
+        ]
+
+        async with self._db.transaction() as conn:
+            await conn.copy_records_to_table(
+                "spans",
+                records=records,
+                columns=_SPAN_COPY_COLUMNS,
+            )
+
+        return span_uuids
+
     async def get(self, span_id: UUID) -> SpanRow | None:
         """Get a span by ID.
 
@@ -137,19 +196,43 @@ class SpanRepository:
             created_at=row["created_at"],
         )
 
-    async def get_all(self) -> list[SpanRow]:
-        """Get all spans.
+    async def get_all(self, limit: int | None = None, cursor: str | None = None) -> list[SpanRow]:
+        """Get spans, newest first.
+
+        Args:
+            limit: Maximum number of spans to return. Returns all spans if None.
+            cursor: Cursor of the last span on the previous page; the page
+                continues after it through the (created_at, id) index.
 
         Returns:
-            List of all spans.
+            List of spans.
+
+        Raises:
+            ValueError: If the cursor is invalid.
         """
+        conditions = []
+        params: list[Any] = []
+        if cursor is not None:
+            condition, params = keyset_condition(
+                "created_at", "id", Cursor.decode(cursor, "created_at"), True, 1, nullable=True
+            )
+            conditions.append(condition)
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+        limit_clause = ""
+        if limit is not None:
+            params.append(limit)
+            limit_clause = f"LIMIT ${len(params)}"
+
         rows = await self._db.fetch(
-            """
+            f"""
             SELECT id, name, start_time, end_time, duration_ms,
                    attributes, trace_id, span_id, parent_span_id,
                    conversation_id, created_at
-            FROM spans ORDER BY created_at DESC
-            """
+            FROM spans {where_clause}
+            ORDER BY created_at DESC, id DESC
+            {limit_clause}
+            """,
+            *params,
         )
 
         result = []
@@ -211,6 +294,49 @@ class SpanRepository:
 
         return result
 
+    async def get_as_dicts_by_conversation(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Get spans for one conversation as dictionaries (for analysis).
+
+        Resolves the external conversation ID through the conversations table and
+        reads only that conversation's spans via the ``conversation_id`` foreign key.
+
+        Args:
+            conversation_id: External conversation ID (``voice.conversation.id``).
+
+        Returns:
+            List of span dictionaries compatible with analyzer, in the same
+            order as :meth:`get_as_dicts`.
+        """
+        rows = await self._db.fetch(
+            """
+            SELECT s.name, s.duration_ms, s.attributes
+            FROM spans s
+            JOIN conversations c ON c.id = s.conversation_id
+            WHERE c.conversation_id = $1
+            ORDER BY s.created_at DESC
+            """,
+            conversation_id,
+        )
+
+        result = []
+        for row in rows:
+            attrs = row["attributes"]
+            # Parse JSONB if it's a string (asyncpg might return it as string)
+            if isinstance(attrs, str):
+                attrs = json.loads(attrs) if attrs else {}
+            elif attrs is None:
+                attrs = {}
+
+            result.append(
+                {
+                    "name": row["name"],
+                    "duration_ms": row["duration_ms"],
+                    "attributes": attrs,
+                }
+            )
+
+        return result
+
     async def get_by_conversation(self, conversation_id: UUID) -> list[SpanRow]:
         """Get all spans for a conversation.
 
@@ -248,6 +374,66 @@ class SpanRepository:
             for row in rows
         ]
 
+    async def iter_export(
+        self,
+        conversation_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream spans as export dictionaries, oldest first.
+
+        Rows are read through a server-side cursor, so memory use stays flat
+        however many spans match. The dictionaries have the same fields as
+        the ingest payload, with times as ISO 8601 strings.
+
+        Args:
+            conversation_id: External conversation ID (``voice.conversation.id``) to filter by.
+            since: Only include spans starting at or after this time.
+            until: Only include spans starting before this time.
+            batch_size: Number of rows fetched per round trip.
+
+        Yields:
+            Span dictionaries.
+        """
+        conditions = []
+        params: list[Any] = []
+        if conversation_id is not None:
+            params.append(conversation_id)
+            conditions.append(
+                f"s.conversation_id = "
+                f"(SELECT id FROM conversations WHERE conversation_id = ${len(params)})"
+            )
+        if since is not None:
+            params.append(since)
+            conditions.append(f"s.start_time >= ${len(params)}")
+        if until is not None:
+            params.append(until)
+            conditions.append(f"s.start_time < ${len(params)}")
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT s.name, s.start_time, s.end_time, s.duration_ms, s.attributes,
+                   s.trace_id, s.span_id, s.parent_span_id
+            FROM spans s
+            {where_clause}
+            ORDER BY s.created_at, s.id
+        """
+        async for row in self._db.iterate(query, *params, prefetch=batch_size):
+            attrs = row["attributes"]
+            if isinstance(attrs, str):
+                attrs = json.loads(attrs) if attrs else {}
+            yield {
+                "name": row["name"],
+                "start_time": row["start_time"].isoformat() if row["start_time"] else None,
+                "end_time": row["end_time"].isoformat() if row["end_time"] else None,
+                "duration_ms": row["duration_ms"],
+                "attributes": attrs or {},
+                "trace_id": row["trace_id"],
+                "span_id": row["span_id"],
+                "parent_span_id": row["parent_span_id"],
+            }
+
     async def clear(self) -> int:
         """Delete all spans.
 
@@ -265,3 +451,74 @@ class SpanRepository:
             Number of spans.
         """
         return await self._db.fetchval("SELECT COUNT(*) FROM spans")
+
+    async def estimate_count(self) -> int:
+        """Estimate the number of spans from planner statistics.
+
+        Returns:
+            Approximate number of spans.
+        """
+        return await estimate_count(self._db, "SELECT 1 FROM spans")
+
+    async def get_pending_derivations(
+        self, limit: int, after: UUID | None = None, min_age_seconds: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """Get spans in the derivation backlog.
+
+        Args:
+            limit: Maximum number of spans to return.
+            after: Only return spans whose UUID is greater than this, for paging.
+            min_age_seconds: Skip spans added to the backlog more recently than
+                this, which the in-memory derivation queue still holds.
+
+        Returns:
+            Span dictionaries with ``id``, ``conversation_id``, ``name``,
+            ``duration_ms`` and ``attributes``, ordered by UUID.
+        """
+        rows = await self._db.fetch(
+            """
+            SELECT s.id, s.conversation_id, s.name, s.duration_ms, s.attributes
+            FROM span_derivation_backlog b
+            JOIN spans s ON s.id = b.span_id
+            WHERE ($1::uuid IS NULL OR b.span_id > $1)
+              AND b.enqueued_at <= NOW() - make_interval(secs => $2)
+            ORDER BY b.span_id
+            LIMIT $3
+            """,
+            after,
+            min_age_seconds,
+            limit,
+        )
+
+        result = []
+        for row in rows:
+            attrs = row["attributes"]
+            if isinstance(attrs, str):
+                attrs = json.loads(attrs) if attrs else {}
+            elif attrs is None:
+                attrs = {}
+            result.append({**dict(row), "attributes": attrs})
+        return result
+
+    async def claim_derivations(
+        self, span_ids: Sequence[UUID], conn: asyncpg.Connection
+    ) -> set[UUID]:
+        """Remove spans from the derivation backlog.
+
+        Call this in the transaction that writes the spans' turns and
+        failures, so spans leave the backlog only if those rows commit. A
+        span another transaction is deriving is waited for and then left
+        out, so each span is derived once.
+
+        Args:
+            span_ids: UUIDs of the spans about to be derived.
+            conn: Connection of the open derivation transaction.
+
+        Returns:
+            UUIDs of the spans that were in the backlog and must be derived.
+        """
+        rows = await conn.fetch(
+            "DELETE FROM span_derivation_backlog WHERE span_id = ANY($1::uuid[]) RETURNING span_id",
+            list(span_ids),
+        )
+        return {row["span_id"] for row in rows}
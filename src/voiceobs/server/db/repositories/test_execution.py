@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -9,6 +10,17 @@ from uuid import UUID, uuid4
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.models import TestExecutionRow
 
+_CLAIM_LOCK_KEY = 0x766F_7465_7374_0001
+"""Advisory lock key serializing test execution claims."""
+
+_EXECUTION_COLUMNS = (
+    "id, scenario_id, conversation_id, status, started_at, completed_at, result_json, "
+    "run_id, agent_id, attempts"
+)
+
+# Statuses after which an execution is never picked up again
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
 
 class TestExecutionRepository:
     """Repository for test execution operations."""
@@ -53,8 +65,8 @@ class TestExecutionRepository:
         )
 
         row = await self._db.fetchrow(
-            """
-            SELECT id, scenario_id, conversation_id, status, started_at, completed_at, result_json
+            f"""
+            SELECT {_EXECUTION_COLUMNS}
             FROM test_executions WHERE id = $1
             """,
             execution_id,
@@ -63,15 +75,7 @@ class TestExecutionRepository:
         if row is None:
             raise RuntimeError("Failed to create test execution")
 
-        return TestExecutionRow(
-            id=row["id"],
-            scenario_id=row["scenario_id"],
-            conversation_id=row["conversation_id"],
-            status=row["status"],
-            started_at=row["started_at"],
-            completed_at=row["completed_at"],
-            result_json=row["result_json"] or {},
-        )
+        return _row_to_execution(row)
 
     async def get(self, execution_id: UUID) -> TestExecutionRow | None:
         """Get a test execution by UUID.
@@ -83,8 +87,8 @@ class TestExecutionRepository:
             The test execution row, or None if not found.
         """
         row = await self._db.fetchrow(
-            """
-            SELECT id, scenario_id, conversation_id, status, started_at, completed_at, result_json
+            f"""
+            SELECT {_EXECUTION_COLUMNS}
             FROM test_executions WHERE id = $1
             """,
             execution_id,
@@ -93,16 +97,297 @@ class TestExecutionRepository:
         if row is None:
             return None
 
-        return TestExecutionRow(
-            id=row["id"],
-            scenario_id=row["scenario_id"],
-            conversation_id=row["conversation_id"],
-            status=row["status"],
-            started_at=row["started_at"],
-            completed_at=row["completed_at"],
-            result_json=row["result_json"] or {},
+        return _row_to_execution(row)
+
+    async def enqueue_run(
+        self,
+        scenario_ids: list[UUID],
+        max_parallel: int | None = None,
+    ) -> tuple[UUID, list[TestExecutionRow]]:
+        """Queue one execution per scenario under a new run.
+
+        The agent under test is taken from each scenario's suite so that
+        workers can cap how many executions run against one agent at once.
+
+        Args:
+            scenario_ids: Scenarios to execute.
+            max_parallel: Maximum executions of this run running at once (None for no cap).
+
+        Returns:
+            Tuple of (run UUID, queued test execution rows).
+        """
+        run_id = uuid4()
+        execution_ids = [uuid4() for _ in scenario_ids]
+
+        rows = await self._db.fetch(
+            f"""
+            INSERT INTO test_executions (
+                id, run_id, scenario_id, agent_id, status, max_parallel, queued_at
+            )
+            SELECT q.id, $1, ts.id, tsu.agent_id, 'queued', $4, NOW()
+            FROM unnest($2::uuid[], $3::uuid[]) AS q(id, scenario_id)
+            JOIN test_scenarios ts ON ts.id = q.scenario_id
+            JOIN test_suites tsu ON tsu.id = ts.suite_id
+            RETURNING {_EXECUTION_COLUMNS}
+            """,
+            run_id,
+            execution_ids,
+            scenario_ids,
+            max_parallel,
+        )
+
+        return run_id, [_row_to_execution(row) for row in rows]
+
+    async def claim(
+        self,
+        worker_id: str,
+        limit: int,
+        per_agent_limit: int,
+        scan_limit: int = 500,
+    ) -> list[TestExecutionRow]:
+        """Claim queued executions for a worker and mark them running.
+
+        The oldest queued executions are locked with FOR UPDATE SKIP LOCKED,
+        so concurrent workers, in this process or another, never claim the
+        same row. Executions are skipped while their agent already has
+        ``per_agent_limit`` executions running or their run has
+        ``max_parallel`` running; they stay queued for a later claim.
+
+        Claims are serialized by a transaction-level advisory lock. Each
+        claim therefore counts the executions started by every claim before
+        it, so the limits hold across all workers sharing the database.
+
+        Args:
+            worker_id: Identifier of the claiming worker, stored in locked_by.
+            limit: Maximum number of executions to claim.
+            per_agent_limit: Maximum executions running at once per agent.
+            scan_limit: Maximum number of queued executions considered.
+
+        Returns:
+            The claimed test execution rows, now running.
+        """
+        query = f"""
+            WITH candidates AS (
+                SELECT id, run_id, agent_id, max_parallel, queued_at
+                FROM test_executions
+                WHERE status = 'queued'
+                ORDER BY queued_at, id
+                LIMIT $4
+                FOR UPDATE SKIP LOCKED
+            ),
+            ranked AS (
+                SELECT
+                    c.*,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY c.agent_id ORDER BY c.queued_at, c.id
+                    ) AS agent_rank,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY c.run_id ORDER BY c.queued_at, c.id
+                    ) AS run_rank
+                FROM candidates c
+            ),
+            eligible AS (
+                SELECT r.id AS execution_id
+                FROM ranked r
+                WHERE (
+                    r.agent_id IS NULL
+                    OR r.agent_rank + (
+                        SELECT COUNT(*) FROM test_executions x
+                        WHERE x.agent_id = r.agent_id AND x.status = 'running'
+                    ) <= $3
+                )
+                AND (
+                    r.max_parallel IS NULL
+                    OR r.run_rank + (
+                        SELECT COUNT(*) FROM test_executions x
+                        WHERE x.run_id = r.run_id AND x.status = 'running'
+                    ) <= r.max_parallel
+                )
+                ORDER BY r.queued_at, r.id
+                LIMIT $2
+            )
+            UPDATE test_executions
+            SET status = 'running',
+                started_at = NOW(),
+                completed_at = NULL,
+                locked_by = $1,
+                locked_at = NOW(),
+                attempts = attempts + 1
+            FROM eligible
+            WHERE test_executions.id = eligible.execution_id
+            RETURNING {_EXECUTION_COLUMNS}
+            """
+        async with self._db.transaction() as conn:
+            # The claim runs as its own statement after the lock is held, so
+            # under READ COMMITTED it sees the previous claim's running rows
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _CLAIM_LOCK_KEY)
+            rows = await conn.fetch(query, worker_id, limit, per_agent_limit, scan_limit)
+
+        return [_row_to_execution(row) for row in rows]
+
+    async def heartbeat(self, worker_id: str) -> None:
+        """Refresh the lock of every execution a worker is running.
+
+        Args:
+            worker_id: Identifier of the worker.
+        """
+        await self._db.execute(
+            """
+            UPDATE test_executions SET locked_at = NOW()
+            WHERE locked_by = $1 AND status = 'running'
+            """,
+            worker_id,
+        )
+
+    async def release(self, worker_id: str) -> None:
+        """Put every execution a worker is running back in the queue.
+
+        Used when a worker shuts down before its executions finish.
+
+        Args:
+            worker_id: Identifier of the worker.
+        """
+        await self._db.execute(
+            """
+            UPDATE test_executions
+            SET status = 'queued', locked_by = NULL, locked_at = NULL
+            WHERE locked_by = $1 AND status = 'running'
+            """,
+            worker_id,
+        )
+
+    async def requeue_stale(self, lease_seconds: float, max_attempts: int) -> int:
+        """Requeue running executions whose worker stopped sending heartbeats.
+
+        Executions that have already been claimed ``max_attempts`` times are
+        marked failed instead.
+
+        Args:
+            lease_seconds: Seconds without a heartbeat after which a lock is stale.
+            max_attempts: Maximum number of claims per execution.
+
+        Returns:
+            Number of executions requeued or failed.
+        """
+        rows = await self._db.fetch(
+            """
+            UPDATE test_executions
+            SET status = CASE WHEN attempts >= $2 THEN 'failed' ELSE 'queued' END,
+                completed_at = CASE WHEN attempts >= $2 THEN NOW() END,
+                result_json = CASE
+                    WHEN attempts >= $2
+                    THEN jsonb_build_object('error', 'Worker stopped responding')
+                    ELSE result_json
+                END,
+                locked_by = NULL,
+                locked_at = NULL
+            WHERE status = 'running'
+              AND locked_at < NOW() - make_interval(secs => $1)
+            RETURNING id
+            """,
+            lease_seconds,
+            max_attempts,
+        )
+        return len(rows)
+
+    async def complete(
+        self,
+        execution_id: UUID,
+        worker_id: str,
+        result_json: dict[str, Any],
+        conversation_id: UUID | None = None,
+    ) -> bool:
+        """Mark a running execution as completed with its results.
+
+        Args:
+            execution_id: The test execution UUID.
+            worker_id: Worker that claimed the execution.
+            result_json: Execution results, including ``passed``.
+            conversation_id: Conversation recorded for the execution, if any.
+
+        Returns:
+            True if updated, False if the execution is no longer held by the worker.
+        """
+        return await self._finish(
+            execution_id, worker_id, "completed", result_json, conversation_id
         )
 
+    async def fail(self, execution_id: UUID, worker_id: str, error: str) -> bool:
+        """Mark a running execution as failed because it could not be run.
+
+        Args:
+            execution_id: The test execution UUID.
+            worker_id: Worker that claimed the execution.
+            error: Error message.
+
+        Returns:
+            True if updated, False if the execution is no longer held by the worker.
+        """
+        return await self._finish(execution_id, worker_id, "failed", {"error": error}, None)
+
+    async def _finish(
+        self,
+        execution_id: UUID,
+        worker_id: str,
+        status: str,
+        result_json: dict[str, Any],
+        conversation_id: UUID | None,
+    ) -> bool:
+        """Move a running execution held by a worker to a terminal status."""
+        result = await self._db.execute(
+            """
+            UPDATE test_executions
+            SET status = $3,
+                result_json = $4::jsonb,
+                conversation_id = COALESCE($5, conversation_id),
+                completed_at = NOW(),
+                locked_by = NULL,
+                locked_at = NULL
+            WHERE id = $1 AND locked_by = $2 AND status = 'running'
+            """,
+            execution_id,
+            worker_id,
+            status,
+            json.dumps(result_json),
+            conversation_id,
+        )
+        return result == "UPDATE 1"
+
+    async def get_run_progress(self, run_id: UUID) -> dict[str, Any] | None:
+        """Get execution counts by status for a run.
+
+        Args:
+            run_id: The run UUID.
+
+        Returns:
+            Dictionary with total, queued, running, completed, failed and
+            passed counts, or None if the run has no executions.
+        """
+        row = await self._db.fetchrow(
+            """
+            SELECT
+                COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE status = 'queued') AS queued,
+                COUNT(*) FILTER (WHERE status = 'running') AS running,
+                COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+                COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+                COUNT(*) FILTER (
+                    WHERE status = 'completed' AND (result_json->>'passed')::boolean = true
+                ) AS passed
+            FROM test_executions
+            WHERE run_id = $1
+            """,
+            run_id,
+        )
+
+        if row is None or not row["total"]:
+            return None
+
+        return {
+            key: row[key] or 0
+            for key in ("total", "queued", "running", "completed", "failed", "passed")
+        }
+
     async def get_summary(
         self,
         suite_id: UUID | None = None,
@@ -192,3 +477,23 @@ class TestExecutionRepository:
             "avg_duration_ms": avg_duration,
             "avg_latency_ms": avg_latency,
         }
+
+
+def _row_to_execution(row: Any) -> TestExecutionRow:
+    """Convert a database row to a TestExecutionRow."""
+    result_json = row["result_json"]
+    if isinstance(result_json, str):
+        result_json = json.loads(result_json) if result_json else {}
+
+    return TestExecutionRow(
+        id=row["id"],
+        scenario_id=row["scenario_id"],
+        conversation_id=row["conversation_id"],
+        status=row["status"],
+        started_at=row["started_at"],
+        completed_at=row["completed_at"],
+        result_json=result_json or {},
+        run_id=row.get("run_id"),
+        agent_id=row.get("agent_id"),
+        attempts=row.get("attempts") or 0,
+    )
@@ -0,0 +1,199 @@
+"""TTS audio cache repository for database operations."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.models import TTSAudioCacheRow
+
+_CACHE_COLUMNS = (
+    "cache_key, tts_provider, audio_url, mime_type, duration_ms, size_bytes, ref_count, "
+    "created_at, last_used_at"
+)
+
+
+class TTSAudioCacheRepository:
+    """Repository for the content-addressed TTS audio cache.
+
+    Entries are reference counted: :meth:`acquire` and :meth:`add` take a
+    reference and :meth:`release` drops one. Only entries without references
+    are ever evicted.
+    """
+
+    def __init__(self, db: Database) -> None:
+        """Initialize the TTS audio cache repository.
+
+        Args:
+            db: Database connection manager.
+        """
+        self._db = db
+
+    async def get(self, cache_key: str) -> TTSAudioCacheRow | None:
+        """Get a cache entry without taking a reference.
+
+        Args:
+            cache_key: Cache key.
+
+        Returns:
+            The cache entry, or None if not cached.
+        """
+        row = await self._db.fetchrow(
+            f"SELECT {_CACHE_COLUMNS} FROM tts_audio_cache WHERE cache_key = $1",
+            cache_key,
+        )
+        return _row_to_entry(row) if row else None
+
+    async def acquire(self, cache_key: str) -> TTSAudioCacheRow | None:
+        """Take a reference to a cache entry, if it exists.
+
+        Args:
+            cache_key: Cache key.
+
+        Returns:
+            The cache entry, or None if not cached.
+        """
+        row = await self._db.fetchrow(
+            f"""
+            UPDATE tts_audio_cache
+            SET ref_count = ref_count + 1, last_used_at = NOW()
+            WHERE cache_key = $1
+            RETURNING {_CACHE_COLUMNS}
+            """,
+            cache_key,
+        )
+        return _row_to_entry(row) if row else None
+
+    async def add(
+        self,
+        cache_key: str,
+        tts_provider: str,
+        audio_url: str,
+        mime_type: str,
+        duration_ms: float,
+        size_bytes: int,
+    ) -> TTSAudioCacheRow:
+        """Add a cache entry holding one reference.
+
+        If another writer cached the same key first, a reference to that
+        entry is taken instead; its audio_url then differs from ``audio_url``.
+
+        Args:
+            cache_key: Cache key.
+            tts_provider: TTS provider that synthesized the audio.
+            audio_url: URL of the stored audio.
+            mime_type: MIME type of the audio.
+            duration_ms: Duration of the audio in milliseconds.
+            size_bytes: Size of the audio in bytes.
+
+        Returns:
+            The cache entry.
+        """
+        row = await self._db.fetchrow(
+            f"""
+            INSERT INTO tts_audio_cache (
+                cache_key, tts_provider, audio_url, mime_type, duration_ms, size_bytes, ref_count
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, 1)
+            ON CONFLICT (cache_key) DO UPDATE SET
+                ref_count = tts_audio_cache.ref_count + 1,
+                last_used_at = NOW()
+            RETURNING {_CACHE_COLUMNS}
+            """,
+            cache_key,
+            tts_provider,
+            audio_url,
+            mime_type,
+            duration_ms,
+            size_bytes,
+        )
+        if row is None:
+            raise RuntimeError("Failed to add TTS audio cache entry")
+        return _row_to_entry(row)
+
+    async def release(self, audio_url: str) -> bool:
+        """Drop a reference to the cache entry stored at a URL.
+
+        Args:
+            audio_url: URL of the cached audio.
+
+        Returns:
+            True if the URL belongs to a cache entry, False otherwise.
+        """
+        result = await self._db.execute(
+            """
+            UPDATE tts_audio_cache
+            SET ref_count = GREATEST(ref_count - 1, 0), last_used_at = NOW()
+            WHERE audio_url = $1
+            """,
+            audio_url,
+        )
+        return result == "UPDATE 1"
+
+    async def evict(
+        self, max_idle_seconds: float | None = None, max_bytes: int | None = None
+    ) -> list[str]:
+        """Delete unreferenced entries that are idle too long or over the size limit.
+
+        Unreferenced entries unused for more than ``max_idle_seconds`` are
+        deleted. Then, while the whole cache is larger than ``max_bytes``,
+        unreferenced entries are deleted least recently used first.
+        Referenced entries are never deleted.
+
+        Args:
+            max_idle_seconds: Maximum seconds an unreferenced entry is kept, or None.
+            max_bytes: Maximum total size of the cache in bytes, or None.
+
+        Returns:
+            The audio URLs of the deleted entries, for removal from audio storage.
+        """
+        if max_idle_seconds is None and max_bytes is None:
+            return []
+
+        rows = await self._db.fetch(
+            """
+            WITH referenced AS (
+                SELECT COALESCE(SUM(size_bytes), 0) AS bytes
+                FROM tts_audio_cache
+                WHERE ref_count > 0
+            ),
+            unreferenced AS (
+                SELECT
+                    cache_key,
+                    last_used_at,
+                    SUM(size_bytes) OVER (
+                        ORDER BY last_used_at DESC, cache_key
+                    ) AS newer_bytes
+                FROM tts_audio_cache
+                WHERE ref_count = 0
+            )
+            DELETE FROM tts_audio_cache c
+            USING unreferenced u, referenced r
+            WHERE c.cache_key = u.cache_key
+              AND c.ref_count = 0
+              AND (
+                  ($1::float8 IS NOT NULL
+                   AND u.last_used_at < NOW() - make_interval(secs => $1::float8))
+                  OR ($2::bigint IS NOT NULL AND r.bytes + u.newer_bytes > $2::bigint)
+              )
+            RETURNING c.audio_url
+            """,
+            max_idle_seconds,
+            max_bytes,
+        )
+        return [row["audio_url"] for row in rows]
+
+
+def _row_to_entry(row: Any) -> TTSAudioCacheRow:
+    """Convert a database row to a TTSAudioCacheRow."""
+    return TTSAudioCacheRow(
+        cache_key=row["cache_key"],
+        tts_provider=row["tts_provider"],
+        audio_url=row["audio_url"],
+        mime_type=row["mime_type"],
+        duration_ms=row["duration_ms"],
+        size_bytes=row["size_bytes"],
+        ref_count=row["ref_count"],
+        created_at=row["created_at"],
+        last_used_at=row["last_used_at"],
+    )
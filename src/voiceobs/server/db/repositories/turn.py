@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from contextlib import nullcontext
 from typing import Any
 from uuid import UUID, uuid4
 
+import asyncpg
+
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.models import TurnRow
 
+_TURN_COPY_COLUMNS = [
+    "id",
+    "turn_id",
+    "conversation_id",
+    "span_id",
+    "actor",
+    "turn_index",
+    "duration_ms",
+    "transcript",
+    "attributes",
+]
+
 
 class TurnRepository:
     """Repository for turn operations."""
@@ -70,6 +86,83 @@ class TurnRepository:
 
         return turn_uuid
 
+    async def add_many(
+        self, turns: Sequence[dict[str, Any]], conn: asyncpg.Connection | None = None
+    ) -> list[UUID]:
+        """Add many turns in a single transaction using binary COPY.
+
+        Each turn dictionary accepts the same keys as the keyword arguments
+        of :meth:`add`. ``conversation_id``, ``span_id`` and ``actor`` are
+        required; other keys default to None.
+
+        Args:
+            turns: Turn dictionaries to store.
+            conn: Connection of an open transaction to write in. A new
+                transaction is used if not provided.
+
+        Returns:
+            The UUIDs of the stored turns, in input order.
+        """
+        turn_uuids = [uuid4() for _ in turns]
+        if not turns:
+            return turn_uuids
+
+        records = [
+            (
+                turn_uuid,
+                turn.get("turn_id"),
+                turn["conversation_id"],
+                turn["span_id"],
+                turn["actor"],
+                turn.get("turn_index"),
+                turn.get("duration_ms"),
+                turn.get("transcript"),
+                json.dumps(turn.get("attributes") or {}),
+            )
+            for turn_uuid, turn in zip(turn_uuids, turns)
+        ]
+
+        async with self._db.transaction() if conn is None else nullcontext(conn) as conn:
+            await conn.copy_records_to_table(
+                "turns",
+                records=records,
+                columns=_TURN_COPY_COLUMNS,
+            )
+
+        return turn_uuids
+
+    async def get_ids_by_turn_id(
+        self, keys: Sequence[tuple[UUID, str]], conn: asyncpg.Connection | None = None
+    ) -> dict[tuple[UUID, str], UUID]:
+        """Look up turn UUIDs by conversation and external turn ID.
+
+        Args:
+            keys: (conversation UUID, external turn ID) pairs.
+            conn: Connection of an open transaction to read in, so turns it
+                has written are visible. Uses the pool if not provided.
+
+        Returns:
+            Mapping from each pair that has a stored turn to that turn's UUID.
+            If several turns share a pair, the most recent one is returned.
+        """
+        if not keys:
+            return {}
+
+        rows = await (conn or self._db).fetch(
+            """
+            SELECT DISTINCT ON (t.conversation_id, t.turn_id)
+                   t.conversation_id, t.turn_id, t.id
+            FROM turns t
+            JOIN unnest($1::uuid[], $2::text[]) AS k(conversation_id, turn_id)
+              ON t.conversation_id = k.conversation_id AND t.turn_id = k.turn_id
+            ORDER BY t.conversation_id, t.turn_id, t.created_at DESC
+            """,
+            [conversation_id for conversation_id, _ in keys],
+            [turn_id for _, turn_id in keys],
+        )
+
+        return {(row["conversation_id"], row["turn_id"]): row["id"] for row in rows}
+
     async def get(self, turn_id: UUID) -> TurnRow | None:
         """Get a turn by UUID.
 
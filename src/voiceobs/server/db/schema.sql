@@ -30,7 +30,10 @@ CREATE TABLE IF NOT EXISTS spans (
 CREATE INDEX IF NOT EXISTS idx_spans_name ON spans(name);
 CREATE INDEX IF NOT EXISTS idx_spans_trace_id ON spans(trace_id);
 CREATE INDEX IF NOT EXISTS idx_spans_conversation_id ON spans(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_spans_created_at ON spans(created_at);
+CREATE INDEX IF NOT EXISTS idx_spans_conversation_created_at ON spans(conversation_id, created_at);
+-- (created_at, id) serves time-range scans and keyset pagination of listings
+DROP INDEX IF EXISTS idx_spans_created_at;
+CREATE INDEX IF NOT EXISTS idx_spans_created_at_id ON spans(created_at, id);
 CREATE INDEX IF NOT EXISTS idx_spans_attributes ON spans USING GIN(attributes);
 
 -- Turns table: voice conversation turns extracted from spans
@@ -70,7 +73,81 @@ CREATE TABLE IF NOT EXISTS failures (
 CREATE INDEX IF NOT EXISTS idx_failures_failure_type ON failures(failure_type);
 CREATE INDEX IF NOT EXISTS idx_failures_severity ON failures(severity);
 CREATE INDEX IF NOT EXISTS idx_failures_conversation_id ON failures(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_failures_created_at ON failures(created_at);
+DROP INDEX IF EXISTS idx_failures_created_at;
+CREATE INDEX IF NOT EXISTS idx_failures_created_at_id ON failures(created_at, id);
+
+-- Derivation backlog: conversation spans whose turns and failures have not been
+-- derived yet. The trigger below records every such span in the transaction
+-- that stores it, and a span leaves the backlog in the transaction that writes
+-- its derived rows, so spans lost from the in-memory queue are picked up later.
+DO $$
+BEGIN
+    IF to_regclass('span_derivation_backlog') IS NULL THEN
+        CREATE TABLE span_derivation_backlog (
+            span_id UUID PRIMARY KEY REFERENCES spans(id) ON DELETE CASCADE,
+            enqueued_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+        );
+        -- Spans stored before the backlog existed, in conversations nothing was derived for
+        INSERT INTO span_derivation_backlog (span_id)
+        SELECT s.id FROM spans s
+        WHERE s.conversation_id IS NOT NULL
+          AND s.name IN ('voice.turn', 'voice.asr', 'voice.llm', 'voice.tts',
+                         'voice.stage.asr', 'voice.stage.llm', 'voice.stage.tts')
+          AND NOT EXISTS (SELECT 1 FROM turns t WHERE t.conversation_id = s.conversation_id)
+          AND NOT EXISTS (SELECT 1 FROM failures f WHERE f.conversation_id = s.conversation_id);
+    END IF;
+END $$;
+
+-- Span names must match DERIVED_SPAN_NAMES in services/span_derivation.py
+CREATE OR REPLACE FUNCTION span_derivation_backlog_spans_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO span_derivation_backlog (span_id)
+    SELECT id FROM new_rows
+    WHERE conversation_id IS NOT NULL
+      AND name IN ('voice.turn', 'voice.asr', 'voice.llm', 'voice.tts',
+                   'voice.stage.asr', 'voice.stage.llm', 'voice.stage.tts');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS span_derivation_backlog_insert ON spans;
+CREATE TRIGGER span_derivation_backlog_insert
+    AFTER INSERT ON spans REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION span_derivation_backlog_spans_inserted();
+
+-- Span start time index for time-range metrics queries
+CREATE INDEX IF NOT EXISTS idx_spans_start_time ON spans(start_time);
+
+-- Span rollups: per-minute and per-hour latency aggregates by stage type
+CREATE TABLE IF NOT EXISTS span_rollups (
+    resolution VARCHAR(16) NOT NULL,  -- 'minute' or 'hour'
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    stage_type VARCHAR(255) NOT NULL,
+    span_count BIGINT NOT NULL,
+    duration_sum DOUBLE PRECISION NOT NULL,
+    duration_min DOUBLE PRECISION NOT NULL,
+    duration_max DOUBLE PRECISION NOT NULL,
+    zero_count BIGINT NOT NULL DEFAULT 0,
+    positive_buckets JSONB NOT NULL DEFAULT '{}',  -- sketch bucket index -> count
+    negative_buckets JSONB NOT NULL DEFAULT '{}',
+    PRIMARY KEY (resolution, bucket_start, stage_type)
+);
+
+-- Event rollups: per-minute and per-hour conversation and failure counts
+CREATE TABLE IF NOT EXISTS event_rollups (
+    resolution VARCHAR(16) NOT NULL,
+    kind VARCHAR(32) NOT NULL,  -- 'conversation' or 'failure'
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    event_count BIGINT NOT NULL,
+    PRIMARY KEY (resolution, kind, bucket_start)
+);
+
+-- Rollup watermarks: time up to which rollups are complete
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+    name VARCHAR(64) PRIMARY KEY,
+    refreshed_until TIMESTAMP WITH TIME ZONE NOT NULL
+);
 
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -87,3 +164,246 @@ CREATE TRIGGER update_conversations_updated_at
     BEFORE UPDATE ON conversations
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
+
+-- Conversation summaries: per-conversation aggregates that conversation search
+-- filters, sorts and pages on. Kept up to date by the statement-level triggers
+-- below, so a COPY of many spans costs one upsert per conversation.
+CREATE TABLE IF NOT EXISTS conversation_summaries (
+    conversation_id UUID PRIMARY KEY REFERENCES conversations(id) ON DELETE CASCADE,
+    span_count BIGINT NOT NULL DEFAULT 0,
+    turn_count BIGINT NOT NULL DEFAULT 0,
+    failure_count BIGINT NOT NULL DEFAULT 0,
+    first_start_time TIMESTAMP WITH TIME ZONE,
+    last_start_time TIMESTAMP WITH TIME ZONE,
+    duration_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    duration_count BIGINT NOT NULL DEFAULT 0,
+    avg_duration_ms DOUBLE PRECISION
+        GENERATED ALWAYS AS (duration_sum / NULLIF(duration_count, 0)) STORED,
+    max_duration_ms DOUBLE PRECISION,
+    search_vector TSVECTOR NOT NULL DEFAULT ''::tsvector
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_first_start_time
+    ON conversation_summaries(first_start_time, conversation_id);
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_last_start_time
+    ON conversation_summaries(last_start_time);
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_avg_duration
+    ON conversation_summaries(avg_duration_ms, conversation_id);
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_max_duration
+    ON conversation_summaries(max_duration_ms);
+CREATE INDEX IF NOT EXISTS idx_conversation_summaries_search_vector
+    ON conversation_summaries USING GIN(search_vector);
+
+-- Recompute summaries from the raw tables (used after updates and deletes)
+CREATE OR REPLACE FUNCTION refresh_conversation_summaries(ids UUID[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO conversation_summaries AS cs (
+        conversation_id, span_count, turn_count, failure_count,
+        first_start_time, last_start_time, duration_sum, duration_count,
+        max_duration_ms, search_vector
+    )
+    SELECT
+        c.id,
+        s.span_count,
+        t.turn_count,
+        f.failure_count,
+        s.first_start_time,
+        s.last_start_time,
+        COALESCE(s.duration_sum, 0),
+        s.duration_count,
+        s.max_duration_ms,
+        to_tsvector('english', c.conversation_id || ' ' || COALESCE(t.transcripts, ''))
+    FROM conversations c
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS span_count,
+               MIN(start_time) AS first_start_time,
+               MAX(start_time) AS last_start_time,
+               SUM(duration_ms) AS duration_sum,
+               COUNT(duration_ms) AS duration_count,
+               MAX(duration_ms) AS max_duration_ms
+        FROM spans WHERE conversation_id = c.id
+    ) s
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS turn_count,
+               string_agg(transcript, ' ' ORDER BY turn_index NULLS LAST, created_at)
+                   AS transcripts
+        FROM turns WHERE conversation_id = c.id
+    ) t
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS failure_count FROM failures WHERE conversation_id = c.id
+    ) f
+    WHERE c.id = ANY(ids)
+    ORDER BY c.id
+    ON CONFLICT (conversation_id) DO UPDATE SET
+        span_count = EXCLUDED.span_count,
+        turn_count = EXCLUDED.turn_count,
+        failure_count = EXCLUDED.failure_count,
+        first_start_time = EXCLUDED.first_start_time,
+        last_start_time = EXCLUDED.last_start_time,
+        duration_sum = EXCLUDED.duration_sum,
+        duration_count = EXCLUDED.duration_count,
+        max_duration_ms = EXCLUDED.max_duration_ms,
+        search_vector = EXCLUDED.search_vector;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION conversation_summaries_conversation_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO conversation_summaries (conversation_id, search_vector)
+    SELECT id, to_tsvector('english', conversation_id) FROM new_rows ORDER BY id
+    ON CONFLICT (conversation_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION conversation_summaries_spans_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO conversation_summaries AS cs (
+        conversation_id, span_count, first_start_time, last_start_time,
+        duration_sum, duration_count, max_duration_ms
+    )
+    SELECT conversation_id, COUNT(*), MIN(start_time), MAX(start_time),
+           COALESCE(SUM(duration_ms), 0), COUNT(duration_ms), MAX(duration_ms)
+    FROM new_rows
+    WHERE conversation_id IS NOT NULL
+    GROUP BY conversation_id
+    ORDER BY conversation_id
+    ON CONFLICT (conversation_id) DO UPDATE SET
+        span_count = cs.span_count + EXCLUDED.span_count,
+        first_start_time = LEAST(cs.first_start_time, EXCLUDED.first_start_time),
+        last_start_time = GREATEST(cs.last_start_time, EXCLUDED.last_start_time),
+        duration_sum = cs.duration_sum + EXCLUDED.duration_sum,
+        duration_count = cs.duration_count + EXCLUDED.duration_count,
+        max_duration_ms = GREATEST(cs.max_duration_ms, EXCLUDED.max_duration_ms);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION conversation_summaries_turns_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO conversation_summaries AS cs (conversation_id, turn_count, search_vector)
+    SELECT conversation_id, COUNT(*),
+           to_tsvector('english', COALESCE(
+               string_agg(transcript, ' ' ORDER BY turn_index NULLS LAST), ''))
+    FROM new_rows
+    GROUP BY conversation_id
+    ORDER BY conversation_id
+    ON CONFLICT (conversation_id) DO UPDATE SET
+        turn_count = cs.turn_count + EXCLUDED.turn_count,
+        search_vector = cs.search_vector || EXCLUDED.search_vector;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION conversation_summaries_failures_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO conversation_summaries AS cs (conversation_id, failure_count)
+    SELECT conversation_id, COUNT(*)
+    FROM new_rows
+    WHERE conversation_id IS NOT NULL
+    GROUP BY conversation_id
+    ORDER BY conversation_id
+    ON CONFLICT (conversation_id) DO UPDATE SET
+        failure_count = cs.failure_count + EXCLUDED.failure_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Shared by spans, turns and failures: recompute conversations whose rows changed
+CREATE OR REPLACE FUNCTION conversation_summaries_rows_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM refresh_conversation_summaries(ARRAY(SELECT id FROM conversations));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_conversation_summaries(ARRAY(
+            SELECT conversation_id FROM old_rows WHERE conversation_id IS NOT NULL
+            UNION
+            SELECT conversation_id FROM new_rows WHERE conversation_id IS NOT NULL
+        ));
+    ELSE
+        PERFORM refresh_conversation_summaries(ARRAY(
+            SELECT DISTINCT conversation_id FROM old_rows WHERE conversation_id IS NOT NULL
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS conversation_summaries_insert ON conversations;
+CREATE TRIGGER conversation_summaries_insert
+    AFTER INSERT ON conversations REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_conversation_inserted();
+
+DROP TRIGGER IF EXISTS conversation_summaries_insert ON spans;
+CREATE TRIGGER conversation_summaries_insert
+    AFTER INSERT ON spans REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_spans_inserted();
+
+DROP TRIGGER IF EXISTS conversation_summaries_insert ON turns;
+CREATE TRIGGER conversation_summaries_insert
+    AFTER INSERT ON turns REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_turns_inserted();
+
+DROP TRIGGER IF EXISTS conversation_summaries_insert ON failures;
+CREATE TRIGGER conversation_summaries_insert
+    AFTER INSERT ON failures REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_failures_inserted();
+
+DROP TRIGGER IF EXISTS conversation_summaries_update ON spans;
+CREATE TRIGGER conversation_summaries_update
+    AFTER UPDATE ON spans REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_update ON turns;
+CREATE TRIGGER conversation_summaries_update
+    AFTER UPDATE ON turns REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_update ON failures;
+CREATE TRIGGER conversation_summaries_update
+    AFTER UPDATE ON failures REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_delete ON spans;
+CREATE TRIGGER conversation_summaries_delete
+    AFTER DELETE ON spans REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_delete ON turns;
+CREATE TRIGGER conversation_summaries_delete
+    AFTER DELETE ON turns REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_delete ON failures;
+CREATE TRIGGER conversation_summaries_delete
+    AFTER DELETE ON failures REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_truncate ON spans;
+CREATE TRIGGER conversation_summaries_truncate
+    AFTER TRUNCATE ON spans
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_truncate ON turns;
+CREATE TRIGGER conversation_summaries_truncate
+    AFTER TRUNCATE ON turns
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+DROP TRIGGER IF EXISTS conversation_summaries_truncate ON failures;
+CREATE TRIGGER conversation_summaries_truncate
+    AFTER TRUNCATE ON failures
+    FOR EACH STATEMENT EXECUTE FUNCTION conversation_summaries_rows_changed();
+
+-- Fill summaries for conversations that predate the table
+SELECT refresh_conversation_summaries(ARRAY(
+    SELECT c.id FROM conversations c
+    WHERE NOT EXISTS (
+        SELECT 1 FROM conversation_summaries cs WHERE cs.conversation_id = c.id
+    )
+));
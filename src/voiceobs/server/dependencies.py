@@ -17,8 +17,8 @@ The API routes use an async interface for storage operations. The PostgresSpanSt
 wraps the async SpanRepository and adds conversation linking logic.
 
 Spans are the primary ingestion point for the API. All routes that ingest or query data
-work with spans. Conversations, turns, and failures are stored separately but populated
-from span data.
+work with spans. Conversations are linked at ingest time; turns and failures are derived
+from the stored spans in the background by SpanDerivationQueue.
 
 Repositories
 ------------
@@ -31,7 +31,9 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Protocol
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
 
 from voiceobs.server.db.connection import Database
 from voiceobs.server.db.repositories import (
@@ -39,6 +41,7 @@ from voiceobs.server.db.repositories import (
     ConversationRepository,
     FailureRepository,
     MetricsRepository,
+    MetricsRollupRepository,
     OrganizationInviteRepository,
     OrganizationMemberRepository,
     OrganizationRepository,
@@ -47,13 +50,26 @@ from voiceobs.server.db.repositories import (
     TestExecutionRepository,
     TestScenarioRepository,
     TestSuiteRepository,
+    TTSAudioCacheRepository,
     TurnRepository,
     UserRepository,
 )
 from voiceobs.server.services.agent_verification.service import AgentVerificationService
+from voiceobs.server.services.metrics_rollup_scheduler import MetricsRollupScheduler
 from voiceobs.server.services.organization_service import OrganizationService
 from voiceobs.server.services.persona_service import PersonaService
 from voiceobs.server.services.scenario_generation.service import ScenarioGenerationService
+from voiceobs.server.services.span_derivation import IngestedSpan, SpanDerivationQueue
+from voiceobs.server.services.test_execution import (
+    ScenarioRunner,
+    SimulatedScenarioRunner,
+    TestExecutionPool,
+)
+from voiceobs.server.services.tts_cache import TTSAudioCache
+from voiceobs.server.services.tts_streaming import TTSStreamMetrics
+
+if TYPE_CHECKING:
+    from voiceobs.server.auth.cache import AuthCache
 
 logger = logging.getLogger(__name__)
 
@@ -79,18 +95,35 @@ class SpanStorageProtocol(Protocol):
         """Add a span to storage."""
         ...
 
+    async def add_spans(self, spans: list[dict[str, Any]]) -> list[Any]:
+        """Add a batch of spans to storage."""
+        ...
+
     async def get_span(self, span_id: Any) -> Any:
         """Get a span by ID."""
         ...
 
-    async def get_all_spans(self) -> list[Any]:
-        """Get all spans."""
+    async def get_all_spans(self, limit: int | None = None, cursor: str | None = None) -> list[Any]:
+        """Get spans newest first, optionally one page after a cursor."""
         ...
 
     async def get_spans_as_dicts(self) -> list[dict[str, Any]]:
         """Get spans as dictionaries for analysis."""
         ...
 
+    async def get_conversation_spans_as_dicts(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Get one conversation's spans as dictionaries for analysis."""
+        ...
+
+    def iter_spans(
+        self,
+        conversation_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream spans as export dictionaries, oldest first."""
+        ...
+
     async def clear(self) -> int:
         """Clear all spans."""
         ...
@@ -99,28 +132,36 @@ class SpanStorageProtocol(Protocol):
         """Count all spans."""
         ...
 
+    async def estimate_count(self) -> int:
+        """Estimate the number of spans."""
+        ...
+
 
 class PostgresSpanStoreAdapter:
     """Adapter that wraps PostgreSQL repositories with conversation linking.
 
     This adapter implements the SpanStorageProtocol using PostgreSQL repositories.
     It handles automatic conversation creation when spans contain a
-    `voice.conversation.id` attribute.
+    `voice.conversation.id` attribute, and hands stored conversation spans to
+    the derivation queue (if any) so turns and failures are filled in later.
     """
 
     def __init__(
         self,
         span_repo: SpanRepository,
         conversation_repo: ConversationRepository,
+        derivation: SpanDerivationQueue | None = None,
     ) -> None:
         """Initialize the adapter.
 
         Args:
             span_repo: Repository for span operations.
             conversation_repo: Repository for conversation operations.
+            derivation: Queue that derives turns and failures from stored spans.
         """
         self._span_repo = span_repo
         self._conversation_repo = conversation_repo
+        self._derivation = derivation
 
     async def add_span(
         self,
@@ -147,7 +188,7 @@ class PostgresSpanStoreAdapter:
             conversation = await self._conversation_repo.get_or_create(conv_external_id)
             conversation_id = conversation.id
 
-        return await self._span_repo.add(
+        span_uuid = await self._span_repo.add(
             name=name,
             start_time=start_time,
             end_time=end_time,
@@ -159,18 +200,81 @@ class PostgresSpanStoreAdapter:
             conversation_id=conversation_id,
         )
 
+        if self._derivation is not None and conversation_id is not None:
+            span = {"name": name, "duration_ms": duration_ms, "attributes": attrs}
+            await self._derivation.submit([IngestedSpan(span_uuid, conversation_id, span)])
+
+        return span_uuid
+
+    async def add_spans(self, spans: list[dict[str, Any]]) -> list[Any]:
+        """Add a batch of spans to storage.
+
+        Resolves every distinct `voice.conversation.id` with one upsert and then
+        writes all spans in a single COPY, instead of two round trips per span.
+
+        Args:
+            spans: Span dictionaries using the same keys as `add_span` arguments.
+
+        Returns:
+            The UUIDs of the stored spans, in input order.
+        """
+        external_ids = [
+            conv_id
+            for span in spans
+            if (conv_id := (span.get("attributes") or {}).get("voice.conversation.id"))
+        ]
+        conversation_ids = await self._conversation_repo.get_or_create_many(external_ids)
+
+        rows = []
+        for span in spans:
+            attrs = span.get("attributes") or {}
+            conv_external_id = attrs.get("voice.conversation.id")
+            rows.append(
+                {
+                    **span,
+                    "attributes": attrs,
+                    "conversation_id": (
+                        conversation_ids[conv_external_id] if conv_external_id else None
+                    ),
+                }
+            )
+
+        span_uuids = await self._span_repo.add_many(rows)
+
+        if self._derivation is not None:
+            await self._derivation.submit(
+                IngestedSpan(span_uuid, row["conversation_id"], row)
+                for span_uuid, row in zip(span_uuids, rows)
+                if row["conversation_id"] is not None
+            )
+
+        return span_uuids
+
     async def get_span(self, span_id: Any) -> Any:
         """Get a span by ID."""
         return await self._span_repo.get(span_id)
 
-    async def get_all_spans(self) -> list[Any]:
-        """Get all spans."""
-        return await self._span_repo.get_all()
+    async def get_all_spans(self, limit: int | None = None, cursor: str | None = None) -> list[Any]:
+        """Get spans newest first, optionally one page after a cursor."""
+        return await self._span_repo.get_all(limit=limit, cursor=cursor)
 
     async def get_spans_as_dicts(self) -> list[dict[str, Any]]:
         """Get spans as dictionaries for analysis."""
         return await self._span_repo.get_as_dicts()
 
+    async def get_conversation_spans_as_dicts(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Get one conversation's spans as dictionaries for analysis."""
+        return await self._span_repo.get_as_dicts_by_conversation(conversation_id)
+
+    def iter_spans(
+        self,
+        conversation_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream spans as export dictionaries through a server-side cursor."""
+        return self._span_repo.iter_export(conversation_id, since=since, until=until)
+
     async def clear(self) -> int:
         """Clear all spans."""
         return await self._span_repo.clear()
@@ -179,6 +283,10 @@ class PostgresSpanStoreAdapter:
         """Count all spans."""
         return await self._span_repo.count()
 
+    async def estimate_count(self) -> int:
+        """Estimate the number of spans from planner statistics."""
+        return await self._span_repo.estimate_count()
+
 
 # ---------------------------------------------------------------------------
 # Global state for dependencies
@@ -190,6 +298,9 @@ _conversation_repo: ConversationRepository | None = None
 _turn_repo: TurnRepository | None = None
 _failure_repo: FailureRepository | None = None
 _metrics_repo: MetricsRepository | None = None
+_metrics_rollup_scheduler: MetricsRollupScheduler | None = None
+_span_derivation: SpanDerivationQueue | None = None
+_test_execution_pool: TestExecutionPool | None = None
 _test_suite_repo: TestSuiteRepository | None = None
 _test_scenario_repo: TestScenarioRepository | None = None
 _test_execution_repo: TestExecutionRepository | None = None
@@ -205,6 +316,9 @@ _persona_service: PersonaService | None = None
 _scenario_generation_service: ScenarioGenerationService | None = None
 _use_postgres: bool = False
 _audio_storage: Any | None = None
+_tts_audio_cache: TTSAudioCache | None = None
+_auth_cache: AuthCache | None = None
+_tts_stream_metrics: TTSStreamMetrics | None = None
 
 
 def _get_database_url() -> str | None:
@@ -241,20 +355,131 @@ def _get_database_url() -> str | None:
     return None
 
 
+def _get_metrics_rollup_interval() -> float:
+    """Get the metrics rollup refresh interval from the config file.
+
+    Returns:
+        Seconds between refreshes, or 0 if rollups are disabled.
+    """
+    try:
+        from voiceobs.config import get_config
+
+        return get_config().server.metrics_rollup_interval_seconds
+    except Exception as e:
+        logger.warning(f"Failed to load metrics rollup interval from config file: {e}")
+        return 0.0
+
+
+def _get_auth_cache_settings() -> tuple[float, int]:
+    """Get the auth cache TTL and size from the config file.
+
+    Returns:
+        (ttl_seconds, max_size); ttl_seconds is 0 if the cache is disabled.
+    """
+    try:
+        from voiceobs.config import get_config
+
+        server = get_config().server
+        return server.auth_cache_ttl_seconds, server.auth_cache_max_size
+    except Exception as e:
+        logger.warning(f"Failed to load auth cache settings from config file: {e}")
+        return 0.0, 1
+
+
+def _get_span_derivation_settings() -> tuple[int, int]:
+    """Get the span derivation worker count and queue size from the config file.
+
+    Returns:
+        (workers, max_queue_size); workers is 0 if derivation is disabled.
+    """
+    try:
+        from voiceobs.config import get_config
+
+        server = get_config().server
+        return server.derivation_workers, server.derivation_queue_size
+    except Exception as e:
+        logger.warning(f"Failed to load span derivation settings from config file: {e}")
+        return 0, 0
+
+
+def _get_test_execution_settings() -> tuple[int, str, int, float]:
+    """Get the test execution pool settings from the config file.
+
+    Returns:
+        (workers, runner, concurrency_per_agent, lease_seconds); workers is 0
+        and runner is "none" if this server does not run tests.
+    """
+    try:
+        from voiceobs.config import get_config
+
+        server = get_config().server
+        return (
+            server.test_execution_workers,
+            server.test_execution_runner,
+            server.test_execution_concurrency_per_agent,
+            server.test_execution_lease_seconds,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load test execution settings from config file: {e}")
+        return 0, "none", 1, 300.0
+
+
+def _create_scenario_runner(name: str) -> ScenarioRunner | None:
+    """Create the scenario runner selected by test_execution_runner.
+
+    Args:
+        name: Runner name from the config file.
+
+    Returns:
+        The runner, or None if no runner is configured.
+    """
+    if name == "simulated":
+        logger.warning(
+            "Test executions run with the simulated scenario runner; "
+            "their transcripts, latencies and results are made up"
+        )
+        return SimulatedScenarioRunner()
+    return None
+
+
+def _get_tts_cache_settings() -> tuple[bool, int | None, float | None]:
+    """Get the TTS audio cache settings from the config file.
+
+    Returns:
+        (enabled, max_bytes, max_idle_seconds); a limit is None if it is
+        disabled.
+    """
+    try:
+        from voiceobs.config import get_config
+
+        server = get_config().server
+        return (
+            server.tts_cache_enabled,
+            server.tts_cache_max_bytes or None,
+            server.tts_cache_max_idle_seconds or None,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load TTS cache settings from config file: {e}")
+        return False, None, None
+
+
 async def init_database() -> None:
     """Initialize database connection.
 
-    Call this on application startup. Connects to PostgreSQL and initializes
-    the schema. Raises RuntimeError if database URL is not configured.
+    Call this on application startup. Connects to PostgreSQL, initializes
+    the schema and starts the metrics rollup refresh job, the span
+    derivation workers and the test execution pool. Raises RuntimeError if
+    database URL is not configured.
 
     Raises:
         RuntimeError: If database URL is not configured.
     """
-    global _database, _span_storage
-    global _conversation_repo, _turn_repo, _failure_repo, _metrics_repo
+    global _database, _span_storage, _span_derivation, _test_execution_pool
+    global _conversation_repo, _turn_repo, _failure_repo, _metrics_repo, _metrics_rollup_scheduler
     global _test_suite_repo, _test_scenario_repo, _test_execution_repo, _persona_repo, _agent_repo
     global _user_repo, _organization_repo, _organization_member_repo, _organization_invite_repo
     global _agent_verification_service, _organization_service, _persona_service, _use_postgres
+    global _tts_audio_cache
 
     database_url = _get_database_url()
     logger.info(f"Database URL retrieved: {'configured' if database_url else 'not configured'}")
@@ -279,7 +504,14 @@ async def init_database() -> None:
     _conversation_repo = ConversationRepository(_database)
     _turn_repo = TurnRepository(_database)
     _failure_repo = FailureRepository(_database)
-    _metrics_repo = MetricsRepository(_database)
+    rollup_interval = _get_metrics_rollup_interval()
+    if rollup_interval > 0:
+        rollup_repo = MetricsRollupRepository(_database)
+        _metrics_repo = MetricsRepository(_database, rollups=rollup_repo)
+        _metrics_rollup_scheduler = MetricsRollupScheduler(rollup_repo, rollup_interval)
+        _metrics_rollup_scheduler.start()
+    else:
+        _metrics_repo = MetricsRepository(_database)
     _persona_repo = PersonaRepository(_database)
     _agent_repo = AgentRepository(_database)
     _user_repo = UserRepository(_database)
@@ -287,7 +519,15 @@ async def init_database() -> None:
     _organization_member_repo = OrganizationMemberRepository(_database)
     _organization_invite_repo = OrganizationInviteRepository(_database)
     _agent_verification_service = AgentVerificationService(_agent_repo)
-    _persona_service = PersonaService(persona_repo=_persona_repo)
+    tts_cache_enabled, tts_cache_max_bytes, tts_cache_max_idle_seconds = _get_tts_cache_settings()
+    if tts_cache_enabled:
+        _tts_audio_cache = TTSAudioCache(
+            repo=TTSAudioCacheRepository(_database),
+            audio_storage=get_audio_storage(),
+            max_bytes=tts_cache_max_bytes,
+            max_idle_seconds=tts_cache_max_idle_seconds,
+        )
+    _persona_service = PersonaService(persona_repo=_persona_repo, tts_cache=_tts_audio_cache)
     _organization_service = OrganizationService(
         org_repo=_organization_repo,
         member_repo=_organization_member_repo,
@@ -298,10 +538,44 @@ async def init_database() -> None:
     _test_scenario_repo = TestScenarioRepository(_database, _persona_repo)
     _test_execution_repo = TestExecutionRepository(_database)
 
+    span_repo = SpanRepository(_database)
+    derivation_workers, derivation_queue_size = _get_span_derivation_settings()
+    if derivation_workers > 0:
+        _span_derivation = SpanDerivationQueue(
+            db=_database,
+            span_repo=span_repo,
+            turn_repo=_turn_repo,
+            failure_repo=_failure_repo,
+            workers=derivation_workers,
+            max_queue_size=derivation_queue_size,
+        )
+        _span_derivation.start()
+
+    test_workers, runner_name, concurrency_per_agent, lease_seconds = _get_test_execution_settings()
+    runner = _create_scenario_runner(runner_name) if test_workers > 0 else None
+    if test_workers > 0 and runner is None:
+        logger.warning(
+            "test_execution_workers is set but no test_execution_runner is configured; "
+            "test executions stay queued"
+        )
+    if runner is not None:
+        _test_execution_pool = TestExecutionPool(
+            execution_repo=_test_execution_repo,
+            scenario_repo=_test_scenario_repo,
+            runner=runner,
+            suite_repo=_test_suite_repo,
+            agent_repo=_agent_repo,
+            workers=test_workers,
+            concurrency_per_agent=concurrency_per_agent,
+            lease_seconds=lease_seconds,
+        )
+        _test_execution_pool.start()
+
     # Create span storage adapter
     _span_storage = PostgresSpanStoreAdapter(
-        span_repo=SpanRepository(_database),
+        span_repo=span_repo,
         conversation_repo=_conversation_repo,
+        derivation=_span_derivation,
     )
 
 
@@ -315,13 +589,29 @@ async def shutdown_database() -> None:
     global _test_suite_repo, _test_scenario_repo, _test_execution_repo, _persona_repo, _agent_repo
     global _user_repo, _organization_repo, _organization_member_repo, _organization_invite_repo
     global _agent_verification_service, _organization_service, _persona_service
-    global _scenario_generation_service
-    global _use_postgres
+    global _scenario_generation_service, _metrics_rollup_scheduler, _span_derivation
+    global _test_execution_pool, _tts_audio_cache, _use_postgres, _audio_storage
+
+    if _metrics_rollup_scheduler is not None:
+        await _metrics_rollup_scheduler.stop()
+        _metrics_rollup_scheduler = None
+
+    if _test_execution_pool is not None:
+        await _test_execution_pool.stop()
+        _test_execution_pool = None
+
+    if _span_derivation is not None:
+        await _span_derivation.stop()
+        _span_derivation = None
 
     if _database is not None:
         await _database.disconnect()
         _database = None
 
+    if _audio_storage is not None:
+        _audio_storage.close()
+        _audio_storage = None
+
     _span_storage = None
     _conversation_repo = None
     _turn_repo = None
@@ -340,6 +630,7 @@ async def shutdown_database() -> None:
     _organization_service = None
     _persona_service = None
     _scenario_generation_service = None
+    _tts_audio_cache = None
     _use_postgres = False
 
 
@@ -448,6 +739,16 @@ def get_test_scenario_repository() -> TestScenarioRepository:
     return _ensure_initialized(_test_scenario_repo, "Test scenario repository")
 
 
+def get_test_execution_pool() -> TestExecutionPool | None:
+    """Get the test execution pool.
+
+    Returns:
+        The pool running queued test executions, or None if this server
+        does not run tests.
+    """
+    return _test_execution_pool
+
+
 def get_test_execution_repository() -> TestExecutionRepository:
     """Get the test execution repository.
 
@@ -568,6 +869,16 @@ def get_persona_service() -> PersonaService:
     return _ensure_initialized(_persona_service, "Persona service")
 
 
+def get_tts_audio_cache() -> TTSAudioCache | None:
+    """Get the TTS audio cache.
+
+    Returns:
+        The cache shared by persona preview audio, or None if the cache is
+        disabled or the database is not initialized.
+    """
+    return _tts_audio_cache
+
+
 def get_scenario_generation_service() -> ScenarioGenerationService | None:
     """Get the scenario generation service.
 
@@ -616,6 +927,16 @@ def is_using_postgres() -> bool:
     return _use_postgres
 
 
+def is_deriving_spans() -> bool:
+    """Check if turns and failures are being derived from stored spans.
+
+    Returns:
+        True if the span derivation queue is running, False if derivation is
+        disabled or PostgreSQL is not in use.
+    """
+    return _span_derivation is not None
+
+
 def get_audio_storage() -> Any:
     """Get the audio storage instance.
 
@@ -634,10 +955,14 @@ def get_audio_storage() -> Any:
         if provider == "s3":
             bucket_name = os.environ.get("VOICEOBS_AUDIO_S3_BUCKET", base_path)
             aws_region = os.environ.get("VOICEOBS_AUDIO_S3_REGION", "us-east-1")
+            endpoint_url = os.environ.get("VOICEOBS_AUDIO_S3_ENDPOINT_URL") or None
+            max_concurrency = int(os.environ.get("VOICEOBS_AUDIO_S3_MAX_CONCURRENCY", "16"))
             _audio_storage = AudioStorage(
                 provider="s3",
                 base_path=bucket_name,
                 aws_region=aws_region,
+                endpoint_url=endpoint_url,
+                max_concurrency=max_concurrency,
             )
         else:
             _audio_storage = AudioStorage(
@@ -648,6 +973,37 @@ def get_audio_storage() -> Any:
     return _audio_storage
 
 
+def get_auth_cache() -> AuthCache:
+    """Get the auth cache shared by get_auth_context and require_org_membership.
+
+    Returns:
+        AuthCache configured from the config file.
+    """
+    global _auth_cache
+
+    if _auth_cache is None:
+        from voiceobs.server.auth.cache import AuthCache
+
+        ttl_seconds, max_size = _get_auth_cache_settings()
+        _auth_cache = AuthCache(ttl_seconds=ttl_seconds, max_size=max_size)
+
+    return _auth_cache
+
+
+def get_tts_stream_metrics() -> TTSStreamMetrics:
+    """Get the streaming TTS latency metrics of this server process.
+
+    Returns:
+        TTSStreamMetrics shared by all streaming TTS endpoints.
+    """
+    global _tts_stream_metrics
+
+    if _tts_stream_metrics is None:
+        _tts_stream_metrics = TTSStreamMetrics()
+
+    return _tts_stream_metrics
+
+
 def reset_dependencies() -> None:
     """Reset all dependencies (for testing)."""
     global _database, _span_storage
@@ -655,8 +1011,18 @@ def reset_dependencies() -> None:
     global _test_suite_repo, _test_scenario_repo, _test_execution_repo, _persona_repo, _agent_repo
     global _user_repo, _organization_repo, _organization_member_repo, _organization_invite_repo
     global _agent_verification_service, _organization_service, _persona_service
-    global _scenario_generation_service
-    global _use_postgres, _audio_storage
+    global _scenario_generation_service, _metrics_rollup_scheduler, _span_derivation
+    global _use_postgres, _audio_storage, _auth_cache, _test_execution_pool, _tts_audio_cache
+    global _tts_stream_metrics
+    if _metrics_rollup_scheduler is not None:
+        _metrics_rollup_scheduler.cancel()
+        _metrics_rollup_scheduler = None
+    if _test_execution_pool is not None:
+        _test_execution_pool.cancel()
+        _test_execution_pool = None
+    if _span_derivation is not None:
+        _span_derivation.cancel()
+        _span_derivation = None
     _database = None
     _span_storage = None
     _conversation_repo = None
@@ -678,3 +1044,6 @@ def reset_dependencies() -> None:
     _scenario_generation_service = None
     _use_postgres = False
     _audio_storage = None
+    _auth_cache = None
+    _tts_audio_cache = None
+    _tts_stream_metrics = None
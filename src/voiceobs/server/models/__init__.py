@@ -61,6 +61,7 @@ from voiceobs.server.models.response import (
     StageMetricsResponse,
     StagesResponse,
     TestExecutionResponse,
+    TestRunProgressResponse,
     TestRunResponse,
     TestScenarioResponse,
     TestScenariosListResponse,
@@ -69,6 +70,8 @@ from voiceobs.server.models.response import (
     TestSummaryResponse,
     TrendDataPoint,
     TrendResponse,
+    TTSProviderStreamMetrics,
+    TTSStreamMetricsResponse,
     TurnMetricsResponse,
     TurnResponse,
 )
@@ -132,6 +135,7 @@ __all__ = [
     "TestSuitesListResponse",
     "TestScenarioResponse",
     "TestScenariosListResponse",
+    "TestRunProgressResponse",
     "TestRunResponse",
     "TestExecutionResponse",
     "TestSummaryResponse",
@@ -145,4 +149,7 @@ __all__ = [
     "AgentResponse",
     "AgentListItem",
     "AgentsListResponse",
+    # Responses - TTS
+    "TTSProviderStreamMetrics",
+    "TTSStreamMetricsResponse",
 ]
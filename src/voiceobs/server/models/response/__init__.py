@@ -15,6 +15,7 @@ from voiceobs.server.models.response.analysis import (
 )
 from voiceobs.server.models.response.auth import (
     ActiveOrgResponse,
+    AuthCacheStatsResponse,
     AuthMeResponse,
     OrgSummary,
     UserResponse,
@@ -66,6 +67,7 @@ from voiceobs.server.models.response.span import (
 )
 from voiceobs.server.models.response.test import (
     TestExecutionResponse,
+    TestRunProgressResponse,
     TestRunResponse,
     TestScenarioResponse,
     TestScenariosListResponse,
@@ -74,6 +76,10 @@ from voiceobs.server.models.response.test import (
     TestSummaryResponse,
 )
 from voiceobs.server.models.response.traits import TraitVocabularyResponse
+from voiceobs.server.models.response.tts import (
+    TTSProviderStreamMetrics,
+    TTSStreamMetricsResponse,
+)
 
 __all__ = [
     # Common responses
@@ -84,6 +90,7 @@ __all__ = [
     "OrgSummary",
     "ActiveOrgResponse",
     "AuthMeResponse",
+    "AuthCacheStatsResponse",
     # Generation status response
     "GenerationStatusResponse",
     # Span responses
@@ -123,6 +130,7 @@ __all__ = [
     "TestSuitesListResponse",
     "TestScenarioResponse",
     "TestScenariosListResponse",
+    "TestRunProgressResponse",
     "TestRunResponse",
     "TestExecutionResponse",
     "TestSummaryResponse",
@@ -144,4 +152,7 @@ __all__ = [
     "MemberResponse",
     # Traits responses
     "TraitVocabularyResponse",
+    # TTS responses
+    "TTSProviderStreamMetrics",
+    "TTSStreamMetricsResponse",
 ]
@@ -1,6 +1,6 @@
 """Auth response models."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from voiceobs.server.db.models import UserRow
 
@@ -60,3 +60,16 @@ class AuthMeResponse(BaseModel):
     user: UserResponse
     active_org: ActiveOrgResponse | None = None
     orgs: list[OrgSummary] = []
+
+
+class AuthCacheStatsResponse(BaseModel):
+    """Response for /auth/cache endpoint."""
+
+    ttl_seconds: float = Field(..., description="Seconds an entry stays valid (0 = disabled)")
+    hits: int = Field(..., description="Requests served from the cache")
+    misses: int = Field(..., description="Requests that looked up the database")
+    hit_rate: float = Field(..., description="Fraction of requests served from the cache")
+    evictions: int = Field(..., description="Entries dropped because the cache was full")
+    invalidations: int = Field(..., description="Entries dropped by membership or org changes")
+    size: int = Field(..., description="Entries currently cached")
+    max_size: int = Field(..., description="Maximum number of entries")
@@ -77,6 +77,12 @@ class ConversationsListResponse(BaseModel):
     conversations: list[ConversationSummary] = Field(..., description="List of conversations")
     limit: int = Field(default=50, description="Maximum number of results per page")
     offset: int = Field(default=0, description="Number of results skipped")
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to get the next page; null on the last page"
+    )
+    total_is_approximate: bool = Field(
+        False, description="Whether total is a planner estimate rather than an exact count"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -85,6 +91,8 @@ class ConversationsListResponse(BaseModel):
                 "total": 2,
                 "limit": 50,
                 "offset": 0,
+                "next_cursor": None,
+                "total_is_approximate": False,
                 "conversations": [
                     {
                         "id": "conv-123",
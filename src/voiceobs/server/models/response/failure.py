@@ -44,17 +44,25 @@ class FailuresListResponse(BaseModel):
     Includes failure counts grouped by severity and type.
     """
 
-    count: int = Field(..., description="Number of failures")
+    count: int = Field(..., description="Total number of failures matching filters (same as total)")
+    total: int = Field(..., description="Total number of failures matching filters")
+    page_count: int = Field(..., description="Number of failures in this page")
     failures: list[FailureResponse] = Field(..., description="List of failures")
     by_severity: dict[str, int] = Field(
         default_factory=dict, description="Count of failures by severity"
     )
     by_type: dict[str, int] = Field(default_factory=dict, description="Count of failures by type")
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to get the next page; null on the last page"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "count": 2,
+                "total": 2,
+                "page_count": 2,
+                "next_cursor": None,
                 "failures": [
                     {
                         "id": "0",
@@ -70,15 +70,27 @@ class SpanListItem(BaseModel):
 
 
 class SpansListResponse(BaseModel):
-    """Response model for listing all spans."""
+    """Response model for listing spans, newest first."""
 
-    count: int = Field(..., description="Total number of spans")
+    count: int = Field(..., description="Total number of spans (same as total)")
+    total: int = Field(..., description="Total number of spans")
+    page_count: int = Field(..., description="Number of spans in this page")
     spans: list[SpanListItem] = Field(..., description="List of spans")
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to get the next page; null on the last page"
+    )
+    total_is_approximate: bool = Field(
+        False, description="Whether total is a planner estimate rather than an exact count"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "count": 2,
+                "total": 2,
+                "page_count": 2,
+                "next_cursor": None,
+                "total_is_approximate": False,
                 "spans": [
                     {
                         "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -174,7 +174,8 @@ class TestScenariosListResponse(BaseModel):
 class TestRunResponse(BaseModel):
     """Response model for test run initiation."""
 
-    execution_id: str = Field(..., description="Test execution UUID")
+    run_id: str | None = Field(None, description="Test run UUID grouping the run's executions")
+    execution_id: str = Field(..., description="UUID of the run's first test execution")
     status: str = Field(..., description="Execution status (queued, running, completed, failed)")
     scenarios_count: int = Field(..., description="Number of scenarios in execution")
     estimated_duration: int | None = Field(None, description="Estimated duration in seconds")
@@ -182,6 +183,7 @@ class TestRunResponse(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
+                "run_id": "550e8400-e29b-41d4-a716-446655440010",
                 "execution_id": "550e8400-e29b-41d4-a716-446655440000",
                 "status": "queued",
                 "scenarios_count": 2,
@@ -191,6 +193,34 @@ class TestRunResponse(BaseModel):
     )
 
 
+class TestRunProgressResponse(BaseModel):
+    """Response model for the progress of a test run."""
+
+    run_id: str = Field(..., description="Test run UUID")
+    total: int = Field(..., description="Number of executions in the run")
+    queued: int = Field(..., description="Executions waiting for a worker")
+    running: int = Field(..., description="Executions currently running")
+    completed: int = Field(..., description="Executions that ran to completion")
+    failed: int = Field(..., description="Executions that could not be run")
+    passed: int = Field(..., description="Completed executions that passed")
+    done: bool = Field(..., description="True once every execution has completed or failed")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "run_id": "550e8400-e29b-41d4-a716-446655440010",
+                "total": 200,
+                "queued": 150,
+                "running": 8,
+                "completed": 41,
+                "failed": 1,
+                "passed": 39,
+                "done": False,
+            }
+        }
+    )
+
+
 class TestExecutionResponse(BaseModel):
     """Response model for a test execution."""
 
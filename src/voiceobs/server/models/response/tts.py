@@ -0,0 +1,51 @@
+"""TTS response models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TTSProviderStreamMetrics(BaseModel):
+    """Streaming latency of one TTS provider."""
+
+    provider: str = Field(..., description="TTS provider identifier")
+    streams: int = Field(..., description="Streams that completed")
+    failures: int = Field(..., description="Streams that failed before completing")
+    time_to_first_byte_ms_p50: float | None = Field(
+        None, description="Median milliseconds until the first audio chunk"
+    )
+    time_to_first_byte_ms_p95: float | None = Field(
+        None, description="95th percentile milliseconds until the first audio chunk"
+    )
+    total_ms_p50: float | None = Field(
+        None, description="Median milliseconds until synthesis completed"
+    )
+    total_ms_p95: float | None = Field(
+        None, description="95th percentile milliseconds until synthesis completed"
+    )
+
+
+class TTSStreamMetricsResponse(BaseModel):
+    """Response model for streaming TTS latency metrics."""
+
+    window: int = Field(..., description="Recent streams per provider the percentiles cover")
+    providers: list[TTSProviderStreamMetrics] = Field(
+        ..., description="Latency per provider, by provider name"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "window": 500,
+                "providers": [
+                    {
+                        "provider": "openai",
+                        "streams": 42,
+                        "failures": 1,
+                        "time_to_first_byte_ms_p50": 310.0,
+                        "time_to_first_byte_ms_p95": 540.0,
+                        "total_ms_p50": 4200.0,
+                        "total_ms_p95": 6100.0,
+                    }
+                ],
+            }
+        }
+    )
@@ -36,14 +36,7 @@ async def analyze_all() -> AnalysisResponse:
 async def analyze_conversation(conversation_id: str) -> AnalysisResponse:
     """Analyze spans for a specific conversation."""
     storage = get_storage()
-    all_spans = await storage.get_spans_as_dicts()
-
-    # Filter spans by conversation ID
-    conv_spans = [
-        span
-        for span in all_spans
-        if span.get("attributes", {}).get("voice.conversation.id") == conversation_id
-    ]
+    conv_spans = await storage.get_conversation_spans_as_dicts(conversation_id)
 
     if not conv_spans:
         raise HTTPException(
@@ -1,9 +1,13 @@
 """Audio file streaming routes."""
 
+from email.utils import format_datetime, parsedate_to_datetime
+
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from voiceobs.server.dependencies import get_audio_storage
 from voiceobs.server.models import ErrorResponse
+from voiceobs.server.storage import AudioObjectInfo
 
 router = APIRouter(prefix="/api/v1/audio", tags=["Audio"])
 
@@ -52,10 +56,59 @@ def _parse_range_header(range_header: str, file_size: int) -> tuple[int, int, in
     return start, end, status_code
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified(request: Request, info: AudioObjectInfo) -> bool:
+    """Whether a conditional GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, info.etag)
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have one-second resolution
+        return info.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _range_applies(request: Request, info: AudioObjectInfo) -> bool:
+    """Whether to honour the Range header, given an optional If-Range validator."""
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # Strong comparison: weak ETags never match
+        return not if_range.startswith("W/") and if_range == info.etag
+    try:
+        return parsedate_to_datetime(if_range) == info.last_modified.replace(microsecond=0)
+    except (TypeError, ValueError):
+        return False
+
+
 @router.get(
     "/{audio_id}",
     summary="Stream audio file",
-    description="Stream audio file with Range request support for partial content.",
+    description=(
+        "Stream audio file with Range request support for partial content and "
+        "conditional GET (ETag/If-None-Match, Last-Modified/If-Modified-Since)."
+    ),
     responses={
         200: {
             "description": "Audio file stream",
@@ -65,6 +118,7 @@ def _parse_range_header(range_header: str, file_size: int) -> tuple[int, int, in
             "description": "Partial content (Range request)",
             "content": {"audio/wav": {}},
         },
+        304: {"description": "Not modified since the cached version"},
         404: {"model": ErrorResponse, "description": "Audio file not found"},
     },
 )
@@ -78,17 +132,20 @@ async def stream_audio(
     """Stream audio file with Range request support.
 
     Supports HTTP Range requests for partial content delivery,
-    which is useful for audio players that support seeking.
+    which is useful for audio players that support seeking. Only the
+    requested range is read from storage, and it is streamed to the client
+    in chunks.
 
     Args:
         audio_id: Audio file identifier (typically conversation_id).
-        request: FastAPI request object for Range header parsing.
+        request: FastAPI request object for Range and conditional headers.
         audio_type: Optional audio type identifier (e.g., "asr", "tts", "user", "agent").
             Used to distinguish between multiple audio files per conversation.
             Provided as query parameter: ?audio_type=asr
 
     Returns:
-        StreamingResponse with audio data and appropriate headers.
+        StreamingResponse with audio data and appropriate headers, or an
+        empty 304 response if the client's cached copy is current.
     """
     storage = get_audio_storage()
 
@@ -98,28 +155,29 @@ async def stream_audio(
     else:
         storage_key = audio_id
 
-    # Check if file exists
-    if not await storage.exists(storage_key):
-        type_msg = f" (type: {audio_type})" if audio_type else ""
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Audio file with ID {audio_id}{type_msg} not found",
-        )
-
-    # Get audio data
-    audio_data = await storage.get(storage_key)
-    if audio_data is None:
+    # Single metadata lookup: existence, size and validators
+    info = await storage.stat(storage_key)
+    if info is None:
         type_msg = f" (type: {audio_type})" if audio_type else ""
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Audio file with ID {audio_id}{type_msg} not found",
         )
 
-    file_size = len(audio_data)
     content_type = "audio/wav"
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": info.etag,
+        "Last-Modified": format_datetime(info.last_modified, usegmt=True),
+    }
+
+    if _not_modified(request, info):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    file_size = info.size
 
     # Parse Range header if present
-    range_header = request.headers.get("Range", "")
+    range_header = request.headers.get("Range", "") if _range_applies(request, info) else ""
     start, end, parsed_status = _parse_range_header(range_header, file_size)
 
     # Validate range for 416 response (invalid range)
@@ -130,7 +188,7 @@ async def stream_audio(
         )
 
     # Check if range is beyond file size
-    if start >= file_size:
+    if start >= file_size and (range_header or file_size > 0):
         raise HTTPException(
             status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
             detail="Range not satisfiable",
@@ -142,22 +200,13 @@ async def stream_audio(
     else:
         http_status = status.HTTP_200_OK
 
-    # Extract the requested range
-    content_length = end - start + 1
-    audio_chunk = audio_data[start : end + 1]
-
-    # Create response with appropriate headers
-    headers = {
-        "Content-Type": content_type,
-        "Accept-Ranges": "bytes",
-        "Content-Length": str(content_length),
-    }
-
+    headers["Content-Type"] = content_type
+    headers["Content-Length"] = str(end - start + 1)
     if http_status == status.HTTP_206_PARTIAL_CONTENT:
         headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
 
-    return Response(
-        content=audio_chunk,
+    return StreamingResponse(
+        storage.iter_range(storage_key, start, end),
         status_code=http_status,
         headers=headers,
         media_type=content_type,
@@ -7,10 +7,15 @@ from fastapi import APIRouter, Depends
 
 from voiceobs.server.auth.dependencies import get_current_user
 from voiceobs.server.db.models import UserRow
-from voiceobs.server.dependencies import get_organization_repository, get_user_repository
+from voiceobs.server.dependencies import (
+    get_auth_cache,
+    get_organization_repository,
+    get_user_repository,
+)
 from voiceobs.server.models.request import UserUpdateRequest
 from voiceobs.server.models.response import (
     ActiveOrgResponse,
+    AuthCacheStatsResponse,
     AuthMeResponse,
     OrgSummary,
     UserResponse,
@@ -122,4 +127,42 @@ async def update_me(
         # This shouldn't happen since user was just validated
         raise RuntimeError("User not found after authentication")
 
+    # Cached auth contexts hold the old profile and last active org
+    get_auth_cache().invalidate(user.id)
+
     return UserResponse.from_user_row(user)
+
+
+@router.get(
+    "/cache",
+    response_model=AuthCacheStatsResponse,
+    summary="Get auth cache statistics",
+    description="""
+    Get hit, miss, eviction and invalidation counts of the cache of resolved
+    users, organizations and memberships, as counted by this server process
+    since it started.
+    """,
+)
+async def get_auth_cache_stats(
+    current_user: UserRow = Depends(get_current_user),
+) -> AuthCacheStatsResponse:
+    """Get auth cache statistics of this server process.
+
+    Args:
+        current_user: The authenticated user from the JWT.
+
+    Returns:
+        The cache counters.
+    """
+    cache = get_auth_cache()
+    stats = cache.stats()
+    return AuthCacheStatsResponse(
+        ttl_seconds=cache.ttl_seconds,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+        evictions=stats.evictions,
+        invalidations=stats.invalidations,
+        size=stats.size,
+        max_size=stats.max_size,
+    )
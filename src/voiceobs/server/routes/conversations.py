@@ -6,6 +6,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, status
 
 from voiceobs.analyzer import analyze_spans
+from voiceobs.server.db.pagination import offset_page
 from voiceobs.server.dependencies import (
     get_conversation_repository,
     get_storage,
@@ -251,9 +252,14 @@ def _apply_in_memory_sorting(
     - Actor filtering via `actor` parameter
     - Failure filtering via `has_failures` and `failure_type`
     - Latency filtering via `min_latency_ms`
-    - Pagination via `limit` and `offset`
+    - Pagination via `limit` and `cursor` (the previous page's `next_cursor`),
+      or `limit` and `offset`
     - Sorting via `sort` and `sort_order`
+    - Planner-estimated totals via `approximate_total`
     """,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+    },
 )
 async def list_conversations(
     q: str | None = Query(None, description="Full-text search query"),
@@ -273,8 +279,16 @@ async def list_conversations(
     sort_order: str = Query("desc", description="Sort order (asc, desc)"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    approximate_total: bool = Query(False, description="Estimate the total match count"),
 ) -> ConversationsListResponse:
     """List conversations with optional search and filtering."""
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and offset cannot be combined",
+        )
+
     # Use PostgreSQL search if available
     if is_using_postgres():
         repo = get_conversation_repository()
@@ -284,19 +298,24 @@ async def list_conversations(
                 detail="Database repository not available",
             )
 
-        results, total = await repo.search(
-            query=q,
-            start_time=start_time,
-            end_time=end_time,
-            actor=actor,
-            has_failures=has_failures,
-            failure_type=failure_type,
-            min_latency_ms=min_latency_ms,
-            sort=sort,
-            sort_order=sort_order,
-            limit=limit,
-            offset=offset,
-        )
+        try:
+            results, total = await repo.search(
+                query=q,
+                start_time=start_time,
+                end_time=end_time,
+                actor=actor,
+                has_failures=has_failures,
+                failure_type=failure_type,
+                min_latency_ms=min_latency_ms,
+                sort=sort,
+                sort_order=sort_order,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                approximate_total=approximate_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
         summaries = [
             ConversationSummary(
@@ -314,20 +333,26 @@ async def list_conversations(
             conversations=summaries,
             limit=limit,
             offset=offset,
+            next_cursor=results[-1]["cursor"] if len(results) == limit else None,
+            total_is_approximate=approximate_total,
         )
 
     # Fallback to in-memory storage
-    return await _list_conversations_in_memory(
-        q=q,
-        start_time=start_time,
-        end_time=end_time,
-        actor=actor,
-        min_latency_ms=min_latency_ms,
-        sort=sort,
-        sort_order=sort_order,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        return await _list_conversations_in_memory(
+            q=q,
+            start_time=start_time,
+            end_time=end_time,
+            actor=actor,
+            min_latency_ms=min_latency_ms,
+            sort=sort,
+            sort_order=sort_order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 async def _list_conversations_in_memory(
@@ -340,6 +365,7 @@ async def _list_conversations_in_memory(
     sort_order: str,
     limit: int,
     offset: int,
+    cursor: str | None = None,
 ) -> ConversationsListResponse:
     """List conversations using in-memory storage.
 
@@ -353,9 +379,13 @@ async def _list_conversations_in_memory(
         sort_order: Sort order.
         limit: Maximum results.
         offset: Results to skip.
+        cursor: Cursor from the previous page.
 
     Returns:
         Conversations list response.
+
+    Raises:
+        ValueError: If the cursor is invalid.
     """
     storage = get_storage()
     all_spans = await storage.get_spans_as_dicts()
@@ -381,7 +411,7 @@ async def _list_conversations_in_memory(
     # Extract summaries and apply pagination
     summaries = [s["summary"] for s in summaries_data]
     total = len(summaries)
-    summaries = summaries[offset : offset + limit]
+    summaries, next_cursor = offset_page(summaries, limit, cursor, offset)
 
     return ConversationsListResponse(
         count=len(summaries),
@@ -389,6 +419,7 @@ async def _list_conversations_in_memory(
         conversations=summaries,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -402,6 +433,7 @@ async def search_conversations(
     q: str = Query(..., description="Search query"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
 ) -> ConversationsListResponse:
     """Search conversations using full-text search."""
     # Redirect to main list endpoint with search query
@@ -417,6 +449,8 @@ async def search_conversations(
         sort_order="desc",
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        approximate_total=False,
     )
 
 
@@ -432,14 +466,7 @@ async def search_conversations(
 async def get_conversation(conversation_id: str) -> ConversationDetail:
     """Get detailed conversation information."""
     storage = get_storage()
-    all_spans = await storage.get_spans_as_dicts()
-
-    # Filter spans by conversation ID
-    conv_spans = [
-        span
-        for span in all_spans
-        if span.get("attributes", {}).get("voice.conversation.id") == conversation_id
-    ]
+    conv_spans = await storage.get_conversation_spans_as_dicts(conversation_id)
 
     if not conv_spans:
         raise HTTPException(
@@ -1,10 +1,16 @@
 """Failure detection routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, status
 
 from voiceobs.classifier import FailureClassifier
-from voiceobs.server.dependencies import get_storage
-from voiceobs.server.models import FailureResponse, FailuresListResponse
+from voiceobs.server.db.pagination import offset_page
+from voiceobs.server.dependencies import (
+    get_failure_repository,
+    get_storage,
+    is_deriving_spans,
+    is_using_postgres,
+)
+from voiceobs.server.models import ErrorResponse, FailureResponse, FailuresListResponse
 
 router = APIRouter(tags=["Failures"])
 
@@ -13,13 +19,89 @@ router = APIRouter(tags=["Failures"])
     "/failures",
     response_model=FailuresListResponse,
     summary="List detected failures",
-    description="Get all detected failures with optional filtering by severity.",
+    description="""
+    Get detected failures, newest first, with optional filtering by severity and type.
+
+    All matching failures are returned unless `limit` is set. Further pages
+    are fetched by passing the previous page's `next_cursor` as `cursor`.
+    `count`, `total`, `by_severity` and `by_type` cover every failure matching
+    the filters; `page_count` is the number in this page.
+
+    With PostgreSQL and span derivation enabled, failures are read from the
+    failures table, which the server derives from stored spans in the
+    background (including spans stored before the upgrade and spans written
+    by `voiceobs import`). Otherwise they are classified from the spans.
+    """,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+    },
 )
 async def list_failures(
     severity: str | None = None,
     type: str | None = None,
+    limit: int | None = Query(
+        None, ge=1, le=10000, description="Maximum number of failures per page; all if not set"
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+) -> FailuresListResponse:
+    """List detected failures, one page at a time."""
+    try:
+        # Without derivation nothing fills the failures table
+        if is_using_postgres() and is_deriving_spans():
+            return await _list_failures_from_database(severity, type, limit, cursor)
+        return await _list_failures_in_memory(severity, type, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+async def _list_failures_from_database(
+    severity: str | None, failure_type: str | None, limit: int | None, cursor: str | None
+) -> FailuresListResponse:
+    """List failures derived into the failures table.
+
+    Args:
+        severity: Filter by severity.
+        failure_type: Filter by failure type.
+        limit: Maximum results.
+        cursor: Cursor from the previous page.
+
+    Returns:
+        Failures list response.
+    """
+    repo = get_failure_repository()
+    rows = await repo.search(
+        severity=severity, failure_type=failure_type, limit=limit, cursor=cursor
+    )
+    by_severity, by_type = await repo.get_counts(severity=severity, failure_type=failure_type)
+
+    total = sum(by_severity.values())
+    return FailuresListResponse(
+        count=total,
+        total=total,
+        page_count=len(rows),
+        failures=[
+            FailureResponse(**{k: v for k, v in row.items() if k != "cursor"}) for row in rows
+        ],
+        by_severity=by_severity,
+        by_type=by_type,
+        next_cursor=rows[-1]["cursor"] if limit is not None and len(rows) == limit else None,
+    )
+
+
+async def _list_failures_in_memory(
+    severity: str | None, failure_type: str | None, limit: int | None, cursor: str | None
 ) -> FailuresListResponse:
-    """List all detected failures."""
+    """List failures by classifying every stored span.
+
+    Args:
+        severity: Filter by severity.
+        failure_type: Filter by failure type.
+        limit: Maximum results.
+        cursor: Cursor from the previous page.
+
+    Returns:
+        Failures list response.
+    """
     storage = get_storage()
     all_spans = await storage.get_spans_as_dicts()
 
@@ -36,7 +118,7 @@ async def list_failures(
         # Apply filters
         if severity and failure.severity.value != severity:
             continue
-        if type and failure.type.value != type:
+        if failure_type and failure.type.value != failure_type:
             continue
 
         failures.append(
@@ -60,9 +142,14 @@ async def list_failures(
         ftype = failure.type.value
         by_type[ftype] = by_type.get(ftype, 0) + 1
 
+    page, next_cursor = offset_page(failures, limit, cursor)
+
     return FailuresListResponse(
         count=len(failures),
-        failures=failures,
+        total=len(failures),
+        page_count=len(page),
+        failures=page,
         by_severity=by_severity,
         by_type=by_type,
+        next_cursor=next_cursor,
     )
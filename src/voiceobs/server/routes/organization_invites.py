@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from voiceobs.server.auth.dependencies import get_current_user
 from voiceobs.server.db.models import UserRow
 from voiceobs.server.dependencies import (
+    get_auth_cache,
     get_organization_invite_repository,
     get_organization_member_repository,
     get_organization_repository,
@@ -232,6 +233,7 @@ async def accept_invite(
 
     # Add as member
     await member_repo.add(org_id=invite.org_id, user_id=current_user.id, role="member")
+    get_auth_cache().invalidate(current_user.id, invite.org_id)
 
     # Mark invite as accepted
     await invite_repo.update_status(invite.id, "accepted")
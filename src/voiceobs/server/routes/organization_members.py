@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from voiceobs.server.auth.dependencies import get_current_user
 from voiceobs.server.db.models import UserRow
-from voiceobs.server.dependencies import get_organization_member_repository
+from voiceobs.server.dependencies import get_auth_cache, get_organization_member_repository
 from voiceobs.server.models.response import MemberResponse
 
 router = APIRouter(prefix="/api/v1/orgs/{org_id}/members", tags=["Organization Members"])
@@ -94,3 +94,6 @@ async def remove_member(
     removed = await member_repo.remove(org_id=org_id, user_id=user_id)
     if not removed:
         raise HTTPException(status_code=404, detail="Member not found")
+
+    # The removed user must not keep access through a cached auth context
+    get_auth_cache().invalidate(user_id, org_id)
@@ -7,12 +7,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from voiceobs.server.auth.dependencies import get_current_user
 from voiceobs.server.db.models import UserRow
 from voiceobs.server.dependencies import (
+    get_auth_cache,
     get_organization_member_repository,
     get_organization_repository,
+    get_persona_repository,
     get_persona_service,
 )
 from voiceobs.server.models.request import CreateOrgRequest, UpdateOrgRequest
 from voiceobs.server.models.response import OrgResponse
+from voiceobs.server.routes.personas import release_preview_audio
 
 router = APIRouter(prefix="/api/v1/orgs", tags=["Organizations"])
 
@@ -153,6 +156,7 @@ async def update_org(
     org = await org_repo.update(org_id, name=request.name)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
+    get_auth_cache().invalidate_org(org_id)
 
     membership = await member_repo.get(org_id=org_id, user_id=current_user.id)
 
@@ -190,6 +194,14 @@ async def delete_org(
     if membership.role != "owner":
         raise HTTPException(status_code=403, detail="Only owners can delete organizations")
 
+    # The organization's personas are deleted with it, so their preview
+    # audio is released afterwards like on persona delete
+    preview_audio_urls = await get_persona_repository().list_preview_audio_urls(org_id)
+
     deleted = await org_repo.delete(org_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Organization not found")
+    get_auth_cache().invalidate_org(org_id)
+
+    for preview_audio_url in preview_audio_urls:
+        await release_preview_audio(preview_audio_url)
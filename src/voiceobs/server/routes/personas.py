@@ -1,14 +1,22 @@
 """Persona management routes (org-scoped)."""
 
+import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 
 from voiceobs.server.auth.context import AuthContext, require_org_membership
+from voiceobs.server.db.models import PersonaRow
+from voiceobs.server.db.repositories import PersonaRepository
 from voiceobs.server.dependencies import (
     get_audio_storage,
     get_persona_repository,
+    get_tts_audio_cache,
+    get_tts_stream_metrics,
 )
 from voiceobs.server.models import (
     ErrorResponse,
@@ -24,10 +32,13 @@ from voiceobs.server.models.request import (
     PersonaUpdateRequest,
 )
 from voiceobs.server.services.tts_factory import TTSServiceFactory
+from voiceobs.server.services.tts_streaming import TTSAudioStream, open_tts_stream
 from voiceobs.server.utils import parse_uuid
 from voiceobs.server.utils.persona_llm import generate_persona_attributes_with_llm
 from voiceobs.server.utils.storage import get_presigned_url_for_audio
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/v1/orgs/{org_id}/personas", tags=["Personas"])
 
 # Path to TTS provider models file
@@ -47,14 +58,56 @@ DEFAULT_PREVIEW_TEXT = (
 )
 
 
+async def release_preview_audio(preview_audio_url: str) -> None:
+    """Stop a persona from using its preview audio file (best-effort).
+
+    Cached audio may be shared with other personas, so only the persona's
+    reference to it is dropped; other files are deleted.
+    """
+    try:
+        tts_cache = get_tts_audio_cache()
+        if tts_cache is None or not await tts_cache.release(preview_audio_url):
+            audio_storage = get_audio_storage()
+            await audio_storage.delete_by_url(preview_audio_url)
+    except Exception:
+        # Best-effort cleanup - continue even if deletion fails
+        pass
+
+
+async def _set_preview_audio(
+    repo: PersonaRepository,
+    persona_uuid: UUID,
+    org_id: UUID,
+    preview_audio_url: str,
+    preview_text: str,
+    previous_audio_url: str | None,
+) -> None:
+    """Make audio the persona's ready preview audio, releasing its previous audio."""
+    await repo.update(
+        persona_id=persona_uuid,
+        org_id=org_id,
+        preview_audio_url=preview_audio_url,
+        preview_audio_text=preview_text,
+        preview_audio_status="ready",
+        preview_audio_error=None,
+    )
+    if previous_audio_url:
+        await release_preview_audio(previous_audio_url)
+
+
 async def _generate_preview_audio_background(
     persona_id: str,
     org_id: UUID,
     tts_provider: str,
     tts_config: dict,
     preview_text: str,
+    previous_audio_url: str | None = None,
 ) -> None:
-    """Background task to generate preview audio for a persona."""
+    """Background task to generate preview audio for a persona.
+
+    Uses the TTS audio cache when it is enabled, so personas with the same
+    TTS settings and preview text share one synthesized file.
+    """
     from voiceobs.server.dependencies import get_persona_repository
 
     repo = get_persona_repository()
@@ -62,31 +115,114 @@ async def _generate_preview_audio_background(
     persona_uuid = parse_uuid(persona_id, "persona")
 
     try:
-        tts_service = TTSServiceFactory.create(tts_provider)
-        audio_bytes, mime_type, _ = await tts_service.synthesize(preview_text, tts_config)
+        tts_cache = get_tts_audio_cache()
+        if tts_cache is not None:
+            cached = await tts_cache.get_or_synthesize(tts_provider, preview_text, tts_config)
+            preview_audio_url = cached.url
+        else:
+            tts_service = TTSServiceFactory.create(tts_provider)
+            audio_bytes, mime_type, _ = await tts_service.synthesize(preview_text, tts_config)
 
-        audio_storage = get_audio_storage()
-        preview_audio_url = await audio_storage.store_audio(
-            audio_bytes,
-            prefix=f"personas/preview/{persona_id}",
-            content_type=mime_type,
-        )
+            audio_storage = get_audio_storage()
+            preview_audio_url = await audio_storage.store_audio(
+                audio_bytes,
+                prefix=f"personas/preview/{persona_id}",
+                content_type=mime_type,
+            )
 
+        await _set_preview_audio(
+            repo, persona_uuid, org_id, preview_audio_url, preview_text, previous_audio_url
+        )
+    except Exception as e:
         await repo.update(
             persona_id=persona_uuid,
             org_id=org_id,
-            preview_audio_url=preview_audio_url,
-            preview_audio_text=preview_text,
-            preview_audio_status="ready",
-            preview_audio_error=None,
+            preview_audio_status="failed",
+            preview_audio_error=str(e),
         )
+
+
+def _preview_inputs(persona: PersonaRow) -> tuple[Any, ...]:
+    """Fields whose change makes streamed preview audio stale."""
+    return (
+        persona.tts_provider,
+        persona.tts_config,
+        persona.preview_audio_text,
+        persona.preview_audio_url,
+        persona.preview_audio_status,
+    )
+
+
+async def _store_preview_audio(
+    persona_id: str,
+    tts_provider: str,
+    tts_config: dict,
+    preview_text: str,
+    stream: TTSAudioStream,
+) -> str:
+    """Store streamed preview audio, in the TTS audio cache when it is enabled."""
+    tts_cache = get_tts_audio_cache()
+    if tts_cache is not None:
+        cached = await tts_cache.store(
+            tts_provider,
+            preview_text,
+            tts_config,
+            stream.audio_bytes,
+            stream.mime_type,
+            stream.duration_ms,
+        )
+        return cached.url
+
+    audio_storage = get_audio_storage()
+    return await audio_storage.store_audio(
+        stream.audio_bytes,
+        prefix=f"personas/preview/{persona_id}",
+        content_type=stream.mime_type,
+    )
+
+
+async def _stream_preview_audio(
+    stream: TTSAudioStream,
+    persona: PersonaRow,
+    org_id: UUID,
+    preview_text: str,
+) -> AsyncIterator[bytes]:
+    """Yield streamed preview audio, then save it as the persona's preview audio.
+
+    If the client disconnects before the stream completes, nothing is saved.
+    If the persona changed while streaming, the audio is discarded.
+    """
+    repo = get_persona_repository()
+    persona_id = str(persona.id)
+    tts_config = persona.tts_config or {}
+
+    try:
+        async for chunk in stream:
+            yield chunk
     except Exception as e:
+        logger.exception(f"Streaming preview audio for persona {persona_id} failed")
         await repo.update(
-            persona_id=persona_uuid,
+            persona_id=persona.id,
             org_id=org_id,
             preview_audio_status="failed",
             preview_audio_error=str(e),
         )
+        raise
+
+    try:
+        preview_audio_url = await _store_preview_audio(
+            persona_id, persona.tts_provider, tts_config, preview_text, stream
+        )
+        current = await repo.get(persona.id, org_id=org_id)
+        if current is None or _preview_inputs(current) != _preview_inputs(persona):
+            await release_preview_audio(preview_audio_url)
+            return
+        await _set_preview_audio(
+            repo, persona.id, org_id, preview_audio_url, preview_text, persona.preview_audio_url
+        )
+    except Exception:
+        # The client already has the audio; it is synthesized again next time
+        logger.exception(f"Saving streamed preview audio for persona {persona_id} failed")
 
 
 @router.post(
@@ -330,12 +466,7 @@ async def update_persona(
 
     # Delete existing preview audio file if it exists (best-effort)
     if existing.preview_audio_url:
-        try:
-            audio_storage = get_audio_storage()
-            await audio_storage.delete_by_url(existing.preview_audio_url)
-        except Exception:
-            # Best-effort cleanup - continue even if deletion fails
-            pass
+        await release_preview_audio(existing.preview_audio_url)
 
     # Get only explicitly set fields (excludes None defaults)
     update_kwargs = request.model_dump(exclude_unset=True)
@@ -453,15 +584,6 @@ async def delete_persona(
             detail="Cannot delete the last remaining persona. At least one persona must exist.",
         )
 
-    # Delete preview audio file if it exists (best-effort)
-    if persona.preview_audio_url:
-        try:
-            audio_storage = get_audio_storage()
-            await audio_storage.delete_by_url(persona.preview_audio_url)
-        except Exception:
-            # Best-effort cleanup - continue even if deletion fails
-            pass
-
     try:
         deleted = await repo.delete(persona_uuid, org_id=org_id)
     except ForeignKeyViolationError:
@@ -476,6 +598,10 @@ async def delete_persona(
             detail=f"Persona '{persona_id}' not found",
         )
 
+    # Release the preview audio only once no persona points at it (best-effort)
+    if persona.preview_audio_url:
+        await release_preview_audio(persona.preview_audio_url)
+
 
 @router.post(
     "/{persona_id}/set-default",
@@ -622,6 +748,90 @@ async def get_preview_audio_status(
     )
 
 
+@router.get(
+    "/{persona_id}/preview-audio/stream",
+    response_class=StreamingResponse,
+    summary="Stream persona preview audio",
+    description="""
+    Play a persona's preview audio while it is being synthesized. The audio
+    is streamed from the TTS provider as it is produced and saved as the
+    persona's preview audio once complete, so no polling is needed. If
+    preview audio is already available, this redirects to it.
+    """,
+    responses={
+        200: {
+            "content": {"audio/mpeg": {}, "audio/wav": {}},
+            "description": "Preview audio, streamed while it is synthesized",
+        },
+        307: {"description": "Redirect to existing preview audio"},
+        404: {"model": ErrorResponse, "description": "Persona not found"},
+        409: {"model": ErrorResponse, "description": "Preview audio is being generated"},
+        501: {"model": ErrorResponse, "description": "Persona API requires PostgreSQL database"},
+        502: {"model": ErrorResponse, "description": "TTS provider failed"},
+    },
+)
+async def stream_persona_preview_audio(
+    org_id: UUID,
+    persona_id: str,
+    auth: AuthContext = Depends(require_org_membership),
+) -> Response:
+    """Stream persona preview audio while it is synthesized."""
+    repo = get_persona_repository()
+    persona_uuid = parse_uuid(persona_id, "persona")
+
+    persona = await repo.get(persona_uuid, org_id=org_id)
+    if not persona:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Persona '{persona_id}' not found",
+        )
+
+    if persona.preview_audio_status == "ready" and persona.preview_audio_url:
+        audio_url = await get_presigned_url_for_audio(persona.preview_audio_url)
+        return RedirectResponse(audio_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    if persona.preview_audio_status == "generating":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Preview audio is already being generated for this persona",
+        )
+
+    preview_text = persona.preview_audio_text or DEFAULT_PREVIEW_TEXT
+    tts_config = persona.tts_config or {}
+
+    tts_cache = get_tts_audio_cache()
+    if tts_cache is not None:
+        cached = await tts_cache.acquire(persona.tts_provider, preview_text, tts_config)
+        if cached is not None:
+            await _set_preview_audio(
+                repo, persona_uuid, org_id, cached.url, preview_text, persona.preview_audio_url
+            )
+            audio_url = await get_presigned_url_for_audio(cached.url)
+            return RedirectResponse(audio_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    try:
+        stream = await open_tts_stream(
+            persona.tts_provider, preview_text, tts_config, get_tts_stream_metrics()
+        )
+    except Exception as e:
+        await repo.update(
+            persona_id=persona_uuid,
+            org_id=org_id,
+            preview_audio_status="failed",
+            preview_audio_error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to synthesize preview audio: {e}",
+        )
+
+    return StreamingResponse(
+        _stream_preview_audio(stream, persona, org_id, preview_text),
+        media_type=stream.mime_type,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 @router.post(
     "/{persona_id}/preview-audio",
     response_model=PreviewAudioStatusResponse,
@@ -674,6 +884,7 @@ async def generate_persona_preview_audio(
         persona.tts_provider,
         persona.tts_config or {},
         preview_text,
+        persona.preview_audio_url,
     )
 
     return PreviewAudioStatusResponse(
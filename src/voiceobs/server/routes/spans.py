@@ -1,9 +1,15 @@
 """Span ingestion and retrieval routes."""
 
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from voiceobs.server.db.pagination import Cursor
 from voiceobs.server.dependencies import get_storage
 from voiceobs.server.models import (
     ClearSpansResponse,
@@ -18,6 +24,9 @@ from voiceobs.server.models import (
 
 router = APIRouter(tags=["Spans"])
 
+# Spans serialized into each chunk of a streamed export
+EXPORT_CHUNK_SPANS = 500
+
 
 @router.post(
     "/ingest",
@@ -34,10 +43,10 @@ async def ingest(
 ) -> IngestResponse:
     """Ingest spans endpoint.
 
-    Accepts either a single span or a batch of spans.
+    Accepts either a single span or a batch of spans. The whole payload is
+    written through the storage bulk path in one transaction.
     """
     storage = get_storage()
-    span_ids: list[UUID] = []
 
     # Handle single span or batch
     if isinstance(payload, SpanBatchInput):
@@ -45,22 +54,22 @@ async def ingest(
     else:
         spans = [payload]
 
-    for span in spans:
-        # Convert datetime to ISO string if present
-        start_time_str = span.start_time.isoformat() if span.start_time else None
-        end_time_str = span.end_time.isoformat() if span.end_time else None
-
-        span_id = await storage.add_span(
-            name=span.name,
-            start_time=start_time_str,
-            end_time=end_time_str,
-            duration_ms=span.duration_ms,
-            attributes=span.attributes,
-            trace_id=span.trace_id,
-            span_id=span.span_id,
-            parent_span_id=span.parent_span_id,
-        )
-        span_ids.append(span_id)
+    span_ids: list[UUID] = await storage.add_spans(
+        [
+            {
+                "name": span.name,
+                # Convert datetime to ISO string if present
+                "start_time": span.start_time.isoformat() if span.start_time else None,
+                "end_time": span.end_time.isoformat() if span.end_time else None,
+                "duration_ms": span.duration_ms,
+                "attributes": span.attributes,
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_span_id": span.parent_span_id,
+            }
+            for span in spans
+        ]
+    )
 
     return IngestResponse(
         accepted=len(span_ids),
@@ -71,15 +80,44 @@ async def ingest(
 @router.get(
     "/spans",
     response_model=SpansListResponse,
-    summary="List all spans",
-    description="Get all ingested spans with summary information.",
+    summary="List spans",
+    description="""
+    Get ingested spans with summary information, newest first.
+
+    All spans are returned unless `limit` is set. Further pages are fetched
+    by passing the previous page's `next_cursor` as `cursor`. `count` and
+    `total` are the number of spans overall and `page_count` the number in
+    this page. Set `approximate_total` to estimate the total from table
+    statistics instead of counting every span.
+    """,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+    },
 )
-async def list_spans() -> SpansListResponse:
-    """List all ingested spans."""
+async def list_spans(
+    limit: int | None = Query(
+        None, ge=1, le=10000, description="Maximum number of spans per page; all if not set"
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    approximate_total: bool = Query(False, description="Estimate the total span count"),
+) -> SpansListResponse:
+    """List ingested spans, one page at a time."""
     storage = get_storage()
-    spans = await storage.get_all_spans()
+    try:
+        spans = await storage.get_all_spans(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    total = await (storage.estimate_count() if approximate_total else storage.count())
+
+    next_cursor = None
+    if limit is not None and len(spans) == limit:
+        next_cursor = Cursor("created_at", spans[-1].created_at, spans[-1].id).encode()
+
     return SpansListResponse(
-        count=len(spans),
+        count=total,
+        total=total,
+        page_count=len(spans),
         spans=[
             SpanListItem(
                 id=str(span.id),
@@ -89,9 +127,56 @@ async def list_spans() -> SpansListResponse:
             )
             for span in spans
         ],
+        next_cursor=next_cursor,
+        total_is_approximate=approximate_total,
     )
 
 
+@router.get(
+    "/spans/export",
+    summary="Export spans as NDJSON",
+    description="""
+    Stream spans as newline-delimited JSON, oldest first, one span per line
+    in the same shape as the ingest payload.
+
+    Spans are read from the database through a server-side cursor and
+    written as they arrive, so the export is not held in memory.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One span per line"},
+    },
+)
+async def export_spans(
+    conversation_id: str | None = Query(None, description="Only export this conversation"),
+    since: datetime | None = Query(None, description="Only export spans starting at or after"),
+    until: datetime | None = Query(None, description="Only export spans starting before"),
+) -> StreamingResponse:
+    """Stream spans as NDJSON."""
+    storage = get_storage()
+    spans = storage.iter_spans(conversation_id, since=since, until=until)
+    return StreamingResponse(_ndjson_chunks(spans), media_type="application/x-ndjson")
+
+
+async def _ndjson_chunks(spans: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Serialize spans to NDJSON, a few hundred lines per chunk.
+
+    Args:
+        spans: Span dictionaries to serialize.
+
+    Yields:
+        Chunks of newline-terminated JSON lines.
+    """
+    lines = []
+    async for span in spans:
+        lines.append(json.dumps(span) + "\n")
+        if len(lines) >= EXPORT_CHUNK_SPANS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
 @router.get(
     "/spans/{span_id}",
     response_model=SpanDetailResponse,
@@ -1,15 +1,23 @@
 """Test execution management routes."""
 
+import asyncio
+import json
+import math
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from voiceobs.server.db.models import TestExecutionRow
 from voiceobs.server.db.repositories.test_execution import TestExecutionRepository
 from voiceobs.server.db.repositories.test_scenario import TestScenarioRepository
 from voiceobs.server.db.repositories.test_suite import TestSuiteRepository
+from voiceobs.server.dependencies import get_test_execution_pool
 from voiceobs.server.models import (
     ErrorResponse,
     TestExecutionResponse,
+    TestRunProgressResponse,
     TestRunRequest,
     TestRunResponse,
     TestSummaryResponse,
@@ -22,16 +30,28 @@ from voiceobs.server.routes.test_dependencies import (
     parse_suite_id,
     validate_suite_exists,
 )
+from voiceobs.server.utils import parse_uuid
 
 router = APIRouter(prefix="/api/v1/tests", tags=["Test Executions"])
 
+# Seconds per scenario assumed when no execution has completed yet
+DEFAULT_SCENARIO_SECONDS = 300
+
+# Seconds between progress checks while streaming a run's progress
+PROGRESS_POLL_SECONDS = 1.0
+
 
 @router.post(
     "/run",
     response_model=TestRunResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Trigger test execution",
-    description="Trigger execution of test scenarios.",
+    description="""
+    Queue one execution per scenario and return immediately. Executions are
+    run in the background by the test execution workers, up to
+    ``max_workers`` at once for this run. Follow the run with
+    ``GET /api/v1/tests/runs/{run_id}/progress``.
+    """,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request"},
         404: {"model": ErrorResponse, "description": "Test suite or scenario not found"},
@@ -82,25 +102,164 @@ async def run_tests(
             detail="Either suite_id or scenarios must be provided",
         )
 
-    # Create executions for each scenario
-    # For now, we'll create a single execution record representing the batch
-    # In a real implementation, you might create multiple executions or a batch execution
-    execution = await execution_repo.create(
-        scenario_id=scenario_ids[0],  # Use first scenario as representative
-        status="queued",
+    run_id, executions = await execution_repo.enqueue_run(
+        scenario_ids, max_parallel=request.max_workers
     )
+    if not executions:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Test scenarios not found",
+        )
+
+    pool = get_test_execution_pool()
+    if pool is not None:
+        pool.notify()
 
-    # Estimate duration (simple heuristic: 5 minutes per scenario)
-    estimated_duration = len(scenario_ids) * 300
+    suite_uuid = parse_suite_id(request.suite_id) if request.suite_id else None
+    estimated_duration = await _estimate_duration(
+        execution_repo, executions, request.max_workers, suite_uuid
+    )
 
     return TestRunResponse(
-        execution_id=str(execution.id),
-        status=execution.status,
-        scenarios_count=len(scenario_ids),
+        run_id=str(run_id),
+        execution_id=str(executions[0].id),
+        status=executions[0].status,
+        scenarios_count=len(executions),
         estimated_duration=estimated_duration,
     )
 
 
+async def _estimate_duration(
+    execution_repo: TestExecutionRepository,
+    executions: list[TestExecutionRow],
+    max_workers: int,
+    suite_id: UUID | None,
+) -> int:
+    """Estimate how long a run takes from past durations and its parallelism.
+
+    Args:
+        execution_repo: Test execution repository.
+        executions: The run's queued executions.
+        max_workers: Maximum executions of the run running at once.
+        suite_id: Suite whose past durations to use, or None for all suites.
+
+    Returns:
+        Estimated duration in seconds.
+    """
+    summary = await execution_repo.get_summary(suite_id=suite_id)
+    avg_duration_ms = summary.get("avg_duration_ms")
+    per_scenario = avg_duration_ms / 1000 if avg_duration_ms else DEFAULT_SCENARIO_SECONDS
+
+    parallel = max_workers
+    pool = get_test_execution_pool()
+    if pool is not None:
+        parallel = min(parallel, pool.workers)
+        if any(execution.agent_id is not None for execution in executions):
+            parallel = min(parallel, pool.concurrency_per_agent)
+
+    return math.ceil(math.ceil(len(executions) / parallel) * per_scenario)
+
+
+@router.get(
+    "/runs/{run_id}",
+    response_model=TestRunProgressResponse,
+    summary="Get test run progress",
+    description="Get execution counts by status for a test run.",
+    responses={
+        404: {"model": ErrorResponse, "description": "Test run not found"},
+        501: {"model": ErrorResponse, "description": "Test API requires PostgreSQL database"},
+    },
+)
+async def get_test_run(
+    run_id: str,
+    repo: TestExecutionRepository = Depends(get_test_execution_repo),
+) -> TestRunProgressResponse:
+    """Get test run progress."""
+    run_uuid = parse_uuid(run_id, "run")
+    progress = await repo.get_run_progress(run_uuid)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Test run '{run_id}' not found",
+        )
+
+    return _progress_response(run_uuid, progress)
+
+
+@router.get(
+    "/runs/{run_id}/progress",
+    summary="Stream test run progress",
+    description="""
+    Stream a test run's progress as newline-delimited JSON. A line in the
+    shape of ``GET /api/v1/tests/runs/{run_id}`` is written immediately and
+    then whenever an execution changes status. The stream ends once every
+    execution has completed or failed.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One progress update per line",
+        },
+        404: {"model": ErrorResponse, "description": "Test run not found"},
+        501: {"model": ErrorResponse, "description": "Test API requires PostgreSQL database"},
+    },
+)
+async def stream_test_run_progress(
+    run_id: str,
+    repo: TestExecutionRepository = Depends(get_test_execution_repo),
+) -> StreamingResponse:
+    """Stream test run progress as NDJSON."""
+    run_uuid = parse_uuid(run_id, "run")
+    progress = await repo.get_run_progress(run_uuid)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Test run '{run_id}' not found",
+        )
+
+    return StreamingResponse(
+        _progress_lines(repo, run_uuid, progress), media_type="application/x-ndjson"
+    )
+
+
+async def _progress_lines(
+    repo: TestExecutionRepository, run_id: UUID, progress: dict[str, int]
+) -> AsyncIterator[str]:
+    """Yield a progress line now and after every change until the run is done.
+
+    Args:
+        repo: Test execution repository.
+        run_id: The run UUID.
+        progress: The run's current progress counts.
+
+    Yields:
+        Newline-terminated JSON progress lines.
+    """
+    while True:
+        response = _progress_response(run_id, progress)
+        yield json.dumps(response.model_dump()) + "\n"
+        if response.done:
+            return
+
+        previous = progress
+        while progress == previous:
+            await asyncio.sleep(PROGRESS_POLL_SECONDS)
+            latest = await repo.get_run_progress(run_id)
+            if latest is None:
+                return  # The run's scenarios were deleted
+            progress = latest
+
+
+def _progress_response(run_id: UUID, progress: dict[str, int]) -> TestRunProgressResponse:
+    """Build a progress response from the run's counts by status."""
+    return TestRunProgressResponse(
+        run_id=str(run_id),
+        done=progress["completed"] + progress["failed"] >= progress["total"],
+        **progress,
+    )
+
+
 @router.get(
     "/summary",
     response_model=TestSummaryResponse,
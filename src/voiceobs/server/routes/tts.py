@@ -7,8 +7,12 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from voiceobs.server.auth.context import AuthContext, get_auth_context
-from voiceobs.server.dependencies import is_using_postgres
-from voiceobs.server.models import ErrorResponse
+from voiceobs.server.dependencies import get_tts_stream_metrics, is_using_postgres
+from voiceobs.server.models import (
+    ErrorResponse,
+    TTSProviderStreamMetrics,
+    TTSStreamMetricsResponse,
+)
 
 router = APIRouter(prefix="/api/v1/tts", tags=["TTS"])
 
@@ -52,3 +56,34 @@ async def get_tts_models(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to parse TTS models file: {str(e)}",
         )
+
+
+@router.get(
+    "/metrics",
+    response_model=TTSStreamMetricsResponse,
+    summary="Get streaming TTS latency",
+    description="""
+    Get time to first byte and total synthesis time of streaming TTS per
+    provider, as measured by this server process since it started.
+    """,
+)
+async def get_tts_stream_metrics_summary(
+    auth: AuthContext = Depends(get_auth_context),
+) -> TTSStreamMetricsResponse:
+    """Get streaming TTS latency per provider."""
+    metrics = get_tts_stream_metrics()
+    return TTSStreamMetricsResponse(
+        window=metrics.window,
+        providers=[
+            TTSProviderStreamMetrics(
+                provider=stats.provider,
+                streams=stats.streams,
+                failures=stats.failures,
+                time_to_first_byte_ms_p50=stats.time_to_first_byte_ms_p50,
+                time_to_first_byte_ms_p95=stats.time_to_first_byte_ms_p95,
+                total_ms_p50=stats.total_ms_p50,
+                total_ms_p95=stats.total_ms_p95,
+            )
+            for stats in metrics.stats()
+        ],
+    )
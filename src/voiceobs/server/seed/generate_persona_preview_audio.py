@@ -8,6 +8,11 @@ Generate preview audio for personas.
   - Stores the audio file using audio storage
   - Updates the persona with the preview_audio_url
 
+When server.tts_cache_enabled is set (the default), audio goes through the
+TTS audio cache: personas with the same TTS provider, config and preview text
+(e.g. a system persona seeded into every organization) share one synthesized
+file, and only the first of them calls the TTS provider.
+
 Usage:
     # Generate preview audio for all personas missing preview audio
     python generate_persona_preview_audio.py
@@ -36,11 +41,15 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories.tts_audio_cache import TTSAudioCacheRepository
+
 # Import TTS services to register them with the factory
 # This import triggers the registration of providers in services/__init__.py
 from voiceobs.server.services import (  # noqa: F401
     TTSServiceFactory,
 )
+from voiceobs.server.services.tts_cache import TTSAudioCache
 from voiceobs.server.storage import AudioStorage
 from voiceobs.server.utils.storage import get_audio_storage_from_env
 
@@ -71,6 +80,22 @@ def _get_database_url() -> str:
     )
 
 
+def _get_tts_cache_settings() -> tuple[bool, int | None, float | None]:
+    """Get the TTS audio cache settings from the config file.
+
+    Returns:
+        (enabled, max_bytes, max_idle_seconds); a limit is None if it is disabled.
+    """
+    from voiceobs.config import get_config
+
+    server = get_config().server
+    return (
+        server.tts_cache_enabled,
+        server.tts_cache_max_bytes or None,
+        server.tts_cache_max_idle_seconds or None,
+    )
+
+
 async def generate_preview_audio_for_persona(
     persona_id: UUID,
     persona_name: str,
@@ -78,6 +103,7 @@ async def generate_preview_audio_for_persona(
     tts_config: dict[str, Any],
     preview_audio_text: str,
     audio_storage: AudioStorage,
+    tts_cache: TTSAudioCache | None = None,
 ) -> str | None:
     """Generate preview audio for a persona.
 
@@ -88,10 +114,27 @@ async def generate_preview_audio_for_persona(
         tts_config: Provider-specific TTS configuration.
         preview_audio_text: Text to synthesize.
         audio_storage: Audio storage instance.
+        tts_cache: TTS audio cache to reuse and store the audio in, if enabled.
 
     Returns:
         Preview audio URL, or None if generation failed.
     """
+    if tts_cache is not None:
+        try:
+            cached = await tts_cache.get_or_synthesize(tts_provider, preview_audio_text, tts_config)
+        except Exception as e:
+            print(
+                f"[error] Failed to generate audio for '{persona_name}': {e}",
+                file=sys.stderr,
+            )
+            return None
+        source = "cache" if cached.hit else tts_provider
+        print(
+            f"[ok] Audio for '{persona_name}' ({source}): {cached.url}",
+            file=sys.stderr,
+        )
+        return cached.url
+
     try:
         # Get TTS service for the provider
         tts_service = TTSServiceFactory.create(tts_provider)
@@ -128,7 +171,10 @@ async def generate_preview_audio_for_persona(
 
 
 async def process_personas(
-    engine: Engine, audio_storage: AudioStorage, persona_id: UUID | None = None
+    engine: Engine,
+    audio_storage: AudioStorage,
+    persona_id: UUID | None = None,
+    tts_cache: TTSAudioCache | None = None,
 ) -> tuple[int, int]:
     """Process personas and generate preview audio.
 
@@ -137,6 +183,7 @@ async def process_personas(
         audio_storage: Audio storage instance.
         persona_id: Optional persona UUID to process a single persona.
                    If None, processes all personas missing preview audio.
+        tts_cache: TTS audio cache shared with the server, if enabled.
 
     Returns:
         Tuple of (processed_count, success_count).
@@ -224,6 +271,7 @@ async def process_personas(
             tts_config=tts_config,
             preview_audio_text=preview_audio_text,
             audio_storage=audio_storage,
+            tts_cache=tts_cache,
         )
 
         if preview_audio_url:
@@ -253,6 +301,40 @@ async def process_personas(
     return processed_count, success_count
 
 
+async def _process_personas_with_cache(
+    engine: Engine, db_url: str, audio_storage: AudioStorage, persona_id: UUID | None
+) -> tuple[int, int]:
+    """Process personas, going through the TTS audio cache if it is enabled.
+
+    Args:
+        engine: SQLAlchemy engine.
+        db_url: Database URL, used for the cache's connection pool.
+        audio_storage: Audio storage instance.
+        persona_id: Optional persona UUID to process a single persona.
+
+    Returns:
+        Tuple of (processed_count, success_count).
+    """
+    enabled, max_bytes, max_idle_seconds = _get_tts_cache_settings()
+    if not enabled:
+        return await process_personas(engine, audio_storage, persona_id=persona_id)
+
+    database = Database(database_url=db_url, min_pool_size=1, max_pool_size=2)
+    await database.connect()
+    try:
+        tts_cache = TTSAudioCache(
+            repo=TTSAudioCacheRepository(database),
+            audio_storage=audio_storage,
+            max_bytes=max_bytes,
+            max_idle_seconds=max_idle_seconds,
+        )
+        return await process_personas(
+            engine, audio_storage, persona_id=persona_id, tts_cache=tts_cache
+        )
+    finally:
+        await database.disconnect()
+
+
 def main() -> int:
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -294,7 +376,7 @@ def main() -> int:
 
     # Process personas asynchronously
     processed_count, success_count = asyncio.run(
-        process_personas(engine, audio_storage, persona_id=persona_id)
+        _process_personas_with_cache(engine, db_url, audio_storage, persona_id)
     )
 
     if processed_count == 0:
@@ -1,11 +1,13 @@
 """Deepgram TTS service implementation."""
 
+import asyncio
 import io
 import os
 from collections.abc import AsyncIterator
 from typing import Any
 
 from deepgram import DeepgramClient
+from starlette.concurrency import iterate_in_threadpool
 
 from voiceobs.server.services.tts import TTSService
 
@@ -27,6 +29,7 @@ class DeepgramTTSService(TTSService):
     ENCODING = "linear16"  # Fixed encoding
     CONTAINER = "wav"  # Fixed container format
     MIME_TYPE = "audio/wav"  # Fixed MIME type
+    streaming_mime_type = MIME_TYPE
 
     # Audio estimation constants (for duration calculation fallback)
     DEFAULT_SAMPLE_RATE = 24000  # Deepgram default
@@ -121,8 +124,10 @@ class DeepgramTTSService(TTSService):
         # Get client and model
         client, model = self._get_client_and_model(config)
 
-        # Call TTS API with streaming - generate returns an iterator
-        response = client.speak.v1.audio.generate(
+        # Call TTS API with streaming - generate returns a blocking iterator,
+        # so the request and each chunk read run in a worker thread
+        response = await asyncio.to_thread(
+            client.speak.v1.audio.generate,
             text=text,
             model=model,
             encoding=self.ENCODING,
@@ -130,9 +135,13 @@ class DeepgramTTSService(TTSService):
         )
 
         # Stream audio chunks as they arrive
-        for chunk in response:
+        async for chunk in iterate_in_threadpool(response):
             yield chunk
 
+    def calculate_duration(self, audio_bytes: bytes) -> float:
+        """Calculate the duration of WAV audio received from synthesize_streaming."""
+        return self._calculate_duration(audio_bytes)
+
     def _calculate_duration(self, audio_bytes: bytes) -> float:
         """Calculate audio duration from WAV audio data.
 
@@ -0,0 +1,69 @@
+"""Background job that keeps metrics rollups up to date."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from voiceobs.server.db.repositories.metrics_rollup import MetricsRollupRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsRollupScheduler:
+    """Refresh metrics rollups periodically on the event loop.
+
+    The first refresh runs as soon as the scheduler starts. A failed
+    refresh is logged and retried on the next tick.
+    """
+
+    def __init__(self, rollups: MetricsRollupRepository, interval_seconds: float = 60.0) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            rollups: Metrics rollup repository to refresh.
+            interval_seconds: Seconds between refreshes.
+
+        Raises:
+            ValueError: If interval_seconds is not positive.
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+
+        self._rollups = rollups
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the refresh loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the refresh loop. Does nothing if it is already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="metrics-rollup-refresh")
+
+    def cancel(self) -> None:
+        """Cancel the refresh loop without waiting for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def stop(self) -> None:
+        """Stop the refresh loop and wait for it, cancelling a refresh in progress."""
+        task = self._task
+        self.cancel()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        """Refresh, then sleep for the interval, until cancelled."""
+        while True:
+            try:
+                await self._rollups.refresh()
+            except Exception:
+                logger.exception("Metrics rollup refresh failed")
+            await asyncio.sleep(self._interval)
@@ -128,6 +128,10 @@ class OpenAITTSService(TTSService):
             async for chunk in response.iter_bytes():
                 yield chunk
 
+    def calculate_duration(self, audio_bytes: bytes) -> float:
+        """Calculate the duration of MP3 audio received from synthesize_streaming."""
+        return self._calculate_duration(audio_bytes)
+
     def _calculate_duration(self, audio_bytes: bytes) -> float:
         """Calculate audio duration from MP3 data.
 
@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
 from voiceobs.server.db.repositories.persona import PersonaRepository
 
+if TYPE_CHECKING:
+    from voiceobs.server.services.tts_cache import TTSAudioCache
+
 logger = logging.getLogger(__name__)
 
 # Path to the seed catalog
@@ -23,19 +26,25 @@ DEFAULT_PERSONA_INDEX = 0
 class PersonaService:
     """Service for persona business logic."""
 
-    def __init__(self, persona_repo: PersonaRepository) -> None:
+    def __init__(
+        self, persona_repo: PersonaRepository, tts_cache: TTSAudioCache | None = None
+    ) -> None:
         """Initialize the persona service.
 
         Args:
             persona_repo: Persona repository instance.
+            tts_cache: Cache the seeded personas' preview audio is looked up in.
         """
         self._persona_repo = persona_repo
+        self._tts_cache = tts_cache
 
     async def seed_org_personas(self, org_id: UUID) -> None:
         """Seed system personas for a new organization.
 
         Reads the persona catalog and creates system personas for the org.
-        The first persona in the catalog is set as the default.
+        The first persona in the catalog is set as the default. Personas
+        whose preview audio is already cached (e.g. synthesized for another
+        organization) get it right away instead of synthesizing it again.
 
         Args:
             org_id: The organization UUID to seed personas for.
@@ -57,24 +66,58 @@ class PersonaService:
             )
             metadata_raw = persona_data.get("metadata", {})
             metadata: dict[str, Any] = metadata_raw if isinstance(metadata_raw, dict) else {}
-
-            await self._persona_repo.create(
-                org_id=org_id,
-                persona_type="system",
-                name=name,
-                description=description,
-                aggression=float(persona_data["aggression"]),
-                patience=float(persona_data["patience"]),
-                verbosity=float(persona_data["verbosity"]),
-                traits=traits,
-                tts_provider=tts_provider,
-                tts_config=tts_config,
-                preview_audio_text=persona_data.get("preview_audio_text"),
-                metadata=metadata,
-                created_by=None,
-                is_default=(idx == DEFAULT_PERSONA_INDEX),
+            preview_audio_text = persona_data.get("preview_audio_text")
+            preview_audio_url = await self._cached_preview_audio_url(
+                tts_provider, tts_config, preview_audio_text
             )
 
+            try:
+                await self._persona_repo.create(
+                    org_id=org_id,
+                    persona_type="system",
+                    name=name,
+                    description=description,
+                    aggression=float(persona_data["aggression"]),
+                    patience=float(persona_data["patience"]),
+                    verbosity=float(persona_data["verbosity"]),
+                    traits=traits,
+                    tts_provider=tts_provider,
+                    tts_config=tts_config,
+                    preview_audio_url=preview_audio_url,
+                    preview_audio_text=preview_audio_text,
+                    preview_audio_status="ready" if preview_audio_url else None,
+                    metadata=metadata,
+                    created_by=None,
+                    is_default=(idx == DEFAULT_PERSONA_INDEX),
+                )
+            except Exception:
+                # Drop the cache reference taken for a persona that was never created
+                if preview_audio_url is not None and self._tts_cache is not None:
+                    await self._tts_cache.release(preview_audio_url)
+                raise
+
+    async def _cached_preview_audio_url(
+        self, tts_provider: str, tts_config: dict[str, Any], preview_audio_text: str | None
+    ) -> str | None:
+        """Take a reference to cached preview audio, if there is any.
+
+        Args:
+            tts_provider: TTS provider of the persona.
+            tts_config: TTS configuration of the persona.
+            preview_audio_text: Preview text of the persona.
+
+        Returns:
+            URL of the cached audio, or None if it is not cached.
+        """
+        if self._tts_cache is None or not preview_audio_text:
+            return None
+        try:
+            cached = await self._tts_cache.acquire(tts_provider, preview_audio_text, tts_config)
+        except Exception:
+            logger.exception("Looking up cached preview audio failed")
+            return None
+        return cached.url if cached else None
+
     def _load_catalog(self) -> dict[str, Any]:
         """Load persona catalog from JSON file.
 
@@ -0,0 +1,335 @@
+"""Background derivation of turns and failures from ingested spans.
+
+Ingest only writes ``spans`` and ``conversations``. The derivation queue
+picks up newly ingested spans after the request has returned, extracts
+``voice.turn`` spans into ``turns`` rows and runs the failure classifier
+over each conversation's new spans to fill ``failures``.
+
+The in-memory queue is only the fast path. Every derivable span is also
+recorded in the ``span_derivation_backlog`` table when it is stored, and
+leaves it in the transaction that writes its derived rows. A periodic
+catch-up pass derives whatever is left there: batches that failed, spans
+still queued at shutdown or lost in a crash, spans stored before the
+backlog existed and spans written by ``voiceobs import``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from voiceobs.classifier import FailureClassifier
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories.failure import FailureRepository
+from voiceobs.server.db.repositories.span import SpanRepository
+from voiceobs.server.db.repositories.turn import TurnRepository
+
+logger = logging.getLogger(__name__)
+
+# Spans that produce turns or failures; everything else is ignored. The
+# span_derivation_backlog trigger in schema.sql lists the same names.
+DERIVED_SPAN_NAMES = frozenset(
+    {
+        "voice.turn",
+        "voice.asr",
+        "voice.llm",
+        "voice.tts",
+        "voice.stage.asr",
+        "voice.stage.llm",
+        "voice.stage.tts",
+    }
+)
+
+
+@dataclass
+class IngestedSpan:
+    """A stored span waiting for derivation.
+
+    Attributes:
+        span_uuid: UUID of the stored span row.
+        conversation_uuid: UUID of the span's conversation row.
+        span: Span dictionary as ingested (name, duration_ms, attributes, ...).
+    """
+
+    span_uuid: UUID
+    conversation_uuid: UUID
+    span: dict[str, Any]
+
+
+class SpanDerivationQueue:
+    """Bounded queue of ingested spans drained by background workers.
+
+    Workers take up to ``batch_size`` spans at a time and write their turns
+    and failures with one COPY each, in the transaction that removes the
+    spans from the derivation backlog. Spans another worker or process has
+    already derived are skipped, so a span is derived at most once. Failure
+    classification is per span, so classifying only a conversation's new
+    spans yields the same failures as re-classifying the whole conversation.
+
+    When the queue is full, ``submit`` waits for room, which slows ingest
+    down instead of silently dropping derived rows.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        span_repo: SpanRepository,
+        turn_repo: TurnRepository,
+        failure_repo: FailureRepository,
+        classifier: FailureClassifier | None = None,
+        workers: int = 2,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        catch_up_interval: float = 60.0,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            db: Database the derivation transactions run in.
+            span_repo: Repository holding the derivation backlog.
+            turn_repo: Repository the derived turns are written to.
+            failure_repo: Repository the derived failures are written to.
+            classifier: Failure classifier. Uses default thresholds if not provided.
+            workers: Number of worker tasks.
+            max_queue_size: Maximum number of spans waiting for derivation.
+            batch_size: Maximum number of spans derived per write.
+            catch_up_interval: Seconds between catch-up passes over the backlog.
+                Spans younger than this are left to the in-memory queue.
+
+        Raises:
+            ValueError: If workers, max_queue_size, batch_size or
+                catch_up_interval is not positive.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if catch_up_interval <= 0:
+            raise ValueError("catch_up_interval must be > 0")
+
+        self._db = db
+        self._span_repo = span_repo
+        self._turn_repo = turn_repo
+        self._failure_repo = failure_repo
+        self._classifier = classifier or FailureClassifier()
+        self._worker_count = workers
+        self._batch_size = batch_size
+        self._catch_up_interval = catch_up_interval
+        self._queue: asyncio.Queue[IngestedSpan] = asyncio.Queue(maxsize=max_queue_size)
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        """True while the workers are running."""
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def pending(self) -> int:
+        """Number of spans waiting for derivation."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the workers and the catch-up pass. Does nothing if already running."""
+        if not self.running:
+            self._tasks = [
+                asyncio.create_task(self._run(), name=f"span-derivation-{i}")
+                for i in range(self._worker_count)
+            ]
+            self._tasks.append(
+                asyncio.create_task(self._run_catch_up(), name="span-derivation-catch-up")
+            )
+
+    def cancel(self) -> None:
+        """Cancel the workers without waiting for queued spans."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Derive the spans already queued, then stop the workers.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain before cancelling.
+        """
+        if self.running:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Stopping span derivation with {self.pending} spans still queued; "
+                    "the next catch-up pass derives them from the backlog"
+                )
+        tasks = self._tasks
+        self.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def submit(self, spans: Iterable[IngestedSpan]) -> None:
+        """Queue stored spans for derivation.
+
+        Spans that cannot produce turns or failures are skipped.
+
+        Args:
+            spans: Stored spans with their conversation UUIDs.
+        """
+        for item in spans:
+            if item.span.get("name") in DERIVED_SPAN_NAMES:
+                await self._queue.put(item)
+
+    async def derive(self, batch: list[IngestedSpan]) -> int:
+        """Write the turns and failures for a batch of spans.
+
+        The rows are written in one transaction with the removal of the spans
+        from the derivation backlog. If it fails, the spans stay in the
+        backlog for the next catch-up pass.
+
+        Args:
+            batch: Stored spans to derive rows from.
+
+        Returns:
+            Number of spans derived; spans no longer in the backlog are skipped.
+        """
+        async with self._db.transaction() as conn:
+            claimed = await self._span_repo.claim_derivations(
+                [item.span_uuid for item in batch], conn
+            )
+            batch = [item for item in batch if item.span_uuid in claimed]
+            await self._write_derived_rows(batch, conn)
+        return len(batch)
+
+    async def catch_up(self, min_age_seconds: float = 0.0) -> int:
+        """Derive the spans left in the derivation backlog.
+
+        A batch that fails is logged and stays in the backlog for the next pass.
+
+        Args:
+            min_age_seconds: Skip spans added to the backlog more recently than this.
+
+        Returns:
+            Number of spans derived.
+        """
+        derived = 0
+        after = None
+        while rows := await self._span_repo.get_pending_derivations(
+            self._batch_size, after=after, min_age_seconds=min_age_seconds
+        ):
+            after = rows[-1]["id"]
+            batch = [
+                IngestedSpan(
+                    row["id"],
+                    row["conversation_id"],
+                    {
+                        "name": row["name"],
+                        "duration_ms": row["duration_ms"],
+                        "attributes": row["attributes"],
+                    },
+                )
+                for row in rows
+            ]
+            try:
+                derived += await self.derive(batch)
+            except Exception:
+                logger.exception(f"Deriving turns and failures for {len(batch)} spans failed")
+        return derived
+
+    async def _write_derived_rows(
+        self, batch: list[IngestedSpan], conn: asyncpg.Connection
+    ) -> None:
+        """Write the turns and failures for claimed spans in an open transaction."""
+        turns = []
+        for item in batch:
+            if item.span.get("name") != "voice.turn":
+                continue
+            attrs = item.span.get("attributes") or {}
+            turns.append(
+                {
+                    "conversation_id": item.conversation_uuid,
+                    "span_id": item.span_uuid,
+                    "actor": attrs.get("voice.actor", "unknown"),
+                    "turn_id": attrs.get("voice.turn.id"),
+                    "turn_index": attrs.get("voice.turn.index"),
+                    "duration_ms": item.span.get("duration_ms"),
+                    "transcript": attrs.get("voice.transcript"),
+                    "attributes": attrs,
+                }
+            )
+        await self._turn_repo.add_many(turns, conn=conn)
+
+        by_conversation: dict[UUID, list[dict[str, Any]]] = {}
+        for item in batch:
+            by_conversation.setdefault(item.conversation_uuid, []).append(item.span)
+
+        failures = []
+        for conversation_uuid, spans in by_conversation.items():
+            for failure in self._classifier.classify(spans).failures:
+                failures.append((conversation_uuid, failure))
+        if not failures:
+            return
+
+        # Failures reference turns by UUID; the turn may be in this batch or an earlier one
+        keys = list(
+            {
+                (conversation_uuid, str(failure.turn_id))
+                for conversation_uuid, failure in failures
+                if failure.turn_id is not None
+            }
+        )
+        turn_uuids = await self._turn_repo.get_ids_by_turn_id(keys, conn=conn)
+
+        await self._failure_repo.add_many(
+            [
+                {
+                    "failure_type": failure.type.value,
+                    "severity": failure.severity.value,
+                    "message": failure.message,
+                    "conversation_id": conversation_uuid,
+                    "turn_id": (
+                        turn_uuids.get((conversation_uuid, str(failure.turn_id)))
+                        if failure.turn_id is not None
+                        else None
+                    ),
+                    "turn_index": failure.turn_index,
+                    "signal_name": failure.signal_name,
+                    "signal_value": failure.signal_value,
+                    "threshold": failure.threshold,
+                }
+                for conversation_uuid, failure in failures
+            ],
+            conn=conn,
+        )
+
+    async def _run(self) -> None:
+        """Derive batches from the queue until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self.derive(batch)
+            except Exception:
+                logger.exception(f"Deriving turns and failures for {len(batch)} spans failed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _run_catch_up(self) -> None:
+        """Run a catch-up pass now and then every catch_up_interval seconds."""
+        while True:
+            try:
+                derived = await self.catch_up(min_age_seconds=self._catch_up_interval)
+            except Exception:
+                logger.exception("Span derivation catch-up pass failed")
+            else:
+                if derived:
+                    logger.info(f"Derived turns and failures for {derived} spans from the backlog")
+            await asyncio.sleep(self._catch_up_interval)
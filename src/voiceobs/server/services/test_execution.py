@@ -0,0 +1,367 @@
+"""Background execution of queued test scenarios.
+
+``POST /api/v1/tests/run`` queues one ``test_executions`` row per scenario.
+The execution pool claims queued rows from Postgres with
+``FOR UPDATE SKIP LOCKED``, so any number of server processes can share the
+queue, and runs each claimed scenario through a :class:`ScenarioRunner`.
+Concurrency is capped per process (``workers``), per agent
+(``concurrency_per_agent``) and per run (the run's ``max_workers``).
+
+Running executions are locked by the pool's worker ID and kept alive with
+heartbeats. Executions whose worker stopped sending heartbeats are put back
+in the queue, up to ``max_attempts`` claims.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+from uuid import UUID, uuid4
+
+from voiceobs.server.db.models import AgentRow, TestExecutionRow, TestScenarioRow
+from voiceobs.server.db.repositories.agent import AgentRepository
+from voiceobs.server.db.repositories.test_execution import TestExecutionRepository
+from voiceobs.server.db.repositories.test_scenario import TestScenarioRepository
+from voiceobs.server.db.repositories.test_suite import TestSuiteRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of running one test scenario.
+
+    Attributes:
+        passed: Whether the agent met the scenario's goal.
+        details: Extra results stored in ``result_json`` (e.g. avg_latency_ms).
+        conversation_id: UUID of the recorded conversation, if any.
+    """
+
+    passed: bool
+    details: dict[str, Any] = field(default_factory=dict)
+    conversation_id: UUID | None = None
+
+
+class ScenarioRunner(Protocol):
+    """Runs a test scenario against the agent under test."""
+
+    async def run(self, scenario: TestScenarioRow, agent: AgentRow | None) -> ScenarioResult:
+        """Run a scenario.
+
+        Args:
+            scenario: The scenario to run.
+            agent: The agent under test, or None if the scenario's suite has no agent.
+
+        Returns:
+            The scenario result.
+        """
+        ...
+
+
+class SimulatedScenarioRunner:
+    """Scenario runner that simulates the caller, the agent and TTS.
+
+    No calls are placed and no audio is synthesized. Each turn waits for a
+    simulated agent response latency, so runs behave like real ones in
+    timing and concurrency, which makes the runner suitable for local
+    development and for exercising the execution pool. Its results are made
+    up, so servers only use it when explicitly configured to.
+    """
+
+    def __init__(
+        self,
+        latency_ms: tuple[float, float] = (300.0, 1200.0),
+        pass_rate: float = 1.0,
+        speedup: float = 1.0,
+        default_turns: int = 6,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            latency_ms: Range of simulated agent response latencies in milliseconds.
+            pass_rate: Probability that a scenario passes (0.0 to 1.0).
+            speedup: Divides the simulated latencies when sleeping (e.g. 10 runs 10x faster).
+            default_turns: Turns simulated for scenarios without max_turns.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if not 0 <= latency_ms[0] <= latency_ms[1]:
+            raise ValueError("latency_ms must be a (min, max) range of non-negative values")
+        if not 0.0 <= pass_rate <= 1.0:
+            raise ValueError("pass_rate must be between 0 and 1")
+        if speedup <= 0:
+            raise ValueError("speedup must be > 0")
+        if default_turns < 1:
+            raise ValueError("default_turns must be >= 1")
+
+        self._latency_ms = latency_ms
+        self._pass_rate = pass_rate
+        self._speedup = speedup
+        self._default_turns = default_turns
+
+    async def run(self, scenario: TestScenarioRow, agent: AgentRow | None) -> ScenarioResult:
+        """Simulate a conversation for the scenario.
+
+        Latencies and the outcome are seeded by the scenario ID, so re-running
+        a scenario gives the same result.
+
+        Args:
+            scenario: The scenario to run.
+            agent: The agent under test (only its name is used).
+
+        Returns:
+            The simulated scenario result.
+        """
+        rng = random.Random(scenario.id.int)
+        agent_name = agent.name if agent is not None else "Agent"
+        turns = scenario.max_turns or self._default_turns
+
+        transcript: list[dict[str, str]] = []
+        latencies: list[float] = []
+        for turn in range(turns):
+            caller_text = scenario.goal if turn == 0 else f"Simulated caller turn {turn + 1}"
+            transcript.append({"role": "caller", "text": caller_text})
+
+            latency = rng.uniform(*self._latency_ms)
+            await asyncio.sleep(latency / 1000 / self._speedup)
+            latencies.append(latency)
+            transcript.append(
+                {"role": "agent", "text": f"Simulated {agent_name} response {turn + 1}"}
+            )
+
+        return ScenarioResult(
+            passed=rng.random() < self._pass_rate,
+            details={
+                "simulated": True,
+                "turns": turns,
+                "avg_latency_ms": sum(latencies) / len(latencies),
+                "transcript": transcript,
+            },
+        )
+
+
+class TestExecutionPool:
+    """Pool that claims queued test executions and runs them concurrently.
+
+    A single dispatcher task claims as many executions as there are free
+    slots and runs each in its own task. It claims again as soon as a slot
+    frees up or :meth:`notify` is called, and otherwise polls every
+    ``poll_interval`` seconds for executions queued by other processes.
+    """
+
+    def __init__(
+        self,
+        execution_repo: TestExecutionRepository,
+        scenario_repo: TestScenarioRepository,
+        runner: ScenarioRunner,
+        suite_repo: TestSuiteRepository | None = None,
+        agent_repo: AgentRepository | None = None,
+        workers: int = 8,
+        concurrency_per_agent: int = 4,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        default_timeout: float = 600.0,
+        worker_id: str | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            execution_repo: Repository holding the execution queue.
+            scenario_repo: Repository the scenarios are loaded from.
+            runner: Scenario runner the executions are run with.
+            suite_repo: Repository used to resolve an agent's organization.
+            agent_repo: Repository the agents under test are loaded from.
+            workers: Maximum executions running at once in this pool.
+            concurrency_per_agent: Maximum executions running at once per agent,
+                across all pools sharing the database.
+            poll_interval: Seconds between claims when idle.
+            lease_seconds: Seconds without a heartbeat before a running
+                execution is requeued.
+            max_attempts: Maximum claims per execution before it is failed.
+            default_timeout: Seconds a scenario may run if it has no timeout.
+            worker_id: Identifier stored in locked_by. Generated if not provided.
+
+        Raises:
+            ValueError: If a count or interval is not positive.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if concurrency_per_agent < 1:
+            raise ValueError("concurrency_per_agent must be >= 1")
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be > 0")
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be > 0")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+        self._repo = execution_repo
+        self._scenario_repo = scenario_repo
+        self._suite_repo = suite_repo
+        self._agent_repo = agent_repo
+        self._runner = runner
+        self._worker_count = workers
+        self._concurrency_per_agent = concurrency_per_agent
+        self._poll_interval = poll_interval
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._default_timeout = default_timeout
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._task: asyncio.Task[None] | None = None
+        self._active: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def workers(self) -> int:
+        """Maximum executions running at once in this pool."""
+        return self._worker_count
+
+    @property
+    def concurrency_per_agent(self) -> int:
+        """Maximum executions running at once per agent."""
+        return self._concurrency_per_agent
+
+    @property
+    def running(self) -> bool:
+        """True while the dispatcher is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def active(self) -> int:
+        """Number of executions currently running in this pool."""
+        return len(self._active)
+
+    def start(self) -> None:
+        """Start the dispatcher. Does nothing if it is already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="test-execution-dispatcher")
+
+    def notify(self) -> None:
+        """Claim queued executions now instead of at the next poll."""
+        self._wakeup.set()
+
+    def cancel(self) -> None:
+        """Cancel the dispatcher and running executions without waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._active:
+            task.cancel()
+        self._active.clear()
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming, wait for running executions, then cancel the rest.
+
+        Executions still running after ``timeout`` are put back in the queue
+        for another pool (or the next start) to pick up.
+
+        Args:
+            timeout: Seconds to wait for running executions to finish.
+        """
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        active = list(self._active)
+        if active:
+            _, pending = await asyncio.wait(active, timeout=timeout)
+            if pending:
+                logger.warning(f"Stopping test execution with {len(pending)} executions running")
+                for pending_task in pending:
+                    pending_task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                try:
+                    await self._repo.release(self.worker_id)
+                except Exception:
+                    logger.exception("Releasing unfinished test executions failed")
+        self._active.clear()
+
+    async def _run(self) -> None:
+        """Claim and start executions until cancelled."""
+        last_heartbeat = 0.0
+        while True:
+            self._wakeup.clear()
+            try:
+                if time.monotonic() - last_heartbeat >= self._lease_seconds / 3:
+                    last_heartbeat = time.monotonic()
+                    await self._repo.heartbeat(self.worker_id)
+                    requeued = await self._repo.requeue_stale(
+                        self._lease_seconds, self._max_attempts
+                    )
+                    if requeued:
+                        logger.warning(f"Requeued {requeued} stale test executions")
+
+                free = self._worker_count - len(self._active)
+                if free > 0:
+                    for execution in await self._repo.claim(
+                        self.worker_id, free, self._concurrency_per_agent
+                    ):
+                        task = asyncio.create_task(
+                            self._execute(execution), name=f"test-execution-{execution.id}"
+                        )
+                        self._active.add(task)
+                        task.add_done_callback(self._on_done)
+            except Exception:
+                logger.exception("Claiming test executions failed")
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        """Free the execution's slot and claim again."""
+        self._active.discard(task)
+        self._wakeup.set()
+
+    async def _execute(self, execution: TestExecutionRow) -> None:
+        """Run one claimed execution and record its result."""
+        try:
+            scenario = await self._scenario_repo.get(execution.scenario_id)
+            if scenario is None:
+                await self._repo.fail(execution.id, self.worker_id, "Test scenario not found")
+                return
+
+            timeout = scenario.timeout or self._default_timeout
+            try:
+                agent = await self._load_agent(execution, scenario)
+                result = await asyncio.wait_for(self._runner.run(scenario, agent), timeout)
+            except asyncio.TimeoutError:
+                await self._repo.fail(
+                    execution.id, self.worker_id, f"Timed out after {timeout} seconds"
+                )
+                return
+            except Exception as e:
+                logger.exception(f"Test execution {execution.id} failed")
+                await self._repo.fail(execution.id, self.worker_id, str(e))
+                return
+
+            await self._repo.complete(
+                execution.id,
+                self.worker_id,
+                {"passed": result.passed, **result.details},
+                conversation_id=result.conversation_id,
+            )
+        except Exception:
+            logger.exception(f"Recording the result of test execution {execution.id} failed")
+
+    async def _load_agent(
+        self, execution: TestExecutionRow, scenario: TestScenarioRow
+    ) -> AgentRow | None:
+        """Load the agent under test for an execution, if it has one."""
+        if execution.agent_id is None or self._agent_repo is None or self._suite_repo is None:
+            return None
+        suite = await self._suite_repo.get_by_id(scenario.suite_id)
+        if suite is None:
+            return None
+        return await self._agent_repo.get(execution.agent_id, suite.org_id)
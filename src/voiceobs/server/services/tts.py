@@ -12,6 +12,9 @@ class TTSService(ABC):
     the synthesize and synthesize_streaming methods.
     """
 
+    streaming_mime_type: str = "audio/mpeg"
+    """MIME type of the audio chunks yielded by synthesize_streaming."""
+
     @abstractmethod
     async def synthesize(self, text: str, config: dict[str, Any]) -> tuple[bytes, str, float]:
         """Synthesize text to audio.
@@ -46,3 +49,14 @@ class TTSService(ABC):
             Exception: Provider-specific errors during synthesis
         """
         pass
+
+    def calculate_duration(self, audio_bytes: bytes) -> float:
+        """Calculate the duration of audio received from synthesize_streaming.
+
+        Args:
+            audio_bytes: All chunks of a completed stream, concatenated
+
+        Returns:
+            Duration in milliseconds, or 0.0 if the provider can't tell
+        """
+        return 0.0
@@ -0,0 +1,318 @@
+"""Content-addressed cache for synthesized TTS audio.
+
+Synthesized audio is stored once in audio storage per distinct
+(provider, normalized TTS config, text) and shared by every record that
+needs it, e.g. the same system persona's preview in every organization.
+Records take a reference when they start pointing at cached audio and drop
+it when they stop; audio without references is kept for reuse until it is
+evicted by idle time or by the total cache size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from voiceobs.server.db.models import TTSAudioCacheRow
+from voiceobs.server.db.repositories.tts_audio_cache import TTSAudioCacheRepository
+from voiceobs.server.services.tts_factory import TTSServiceFactory
+from voiceobs.server.storage import AudioStorage
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_VERSION = 1
+"""Bumped when the key derivation changes, so old entries stop matching."""
+
+CACHE_PREFIX = "tts/cache"
+"""Audio storage prefix for cached audio."""
+
+
+def normalize_tts_config(config: dict[str, Any] | None) -> dict[str, Any]:
+    """Normalize a TTS config so equivalent configs compare equal.
+
+    Keys are sorted, None values are dropped, numbers are compared as floats
+    (so ``1`` and ``1.0`` match) and surrounding whitespace is stripped from
+    strings. Values are otherwise kept as is, since voice IDs are case sensitive.
+
+    Args:
+        config: Provider-specific TTS configuration.
+
+    Returns:
+        The normalized configuration.
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                str(key): normalize(item)
+                for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))
+                if item is not None
+            }
+        if isinstance(value, list | tuple):
+            return [normalize(item) for item in value]
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, int | float):
+            return round(float(value), 6)
+        if isinstance(value, str):
+            return value.strip()
+        return value
+
+    return normalize(config or {})
+
+
+def tts_cache_key(provider: str, text: str, config: dict[str, Any] | None) -> str:
+    """Compute the cache key of a synthesis request.
+
+    Args:
+        provider: TTS provider identifier (case-insensitive).
+        text: Text to synthesize.
+        config: Provider-specific TTS configuration.
+
+    Returns:
+        Hex SHA-256 digest of the provider, normalized config and text.
+    """
+    payload = json.dumps(
+        {
+            "version": CACHE_KEY_VERSION,
+            "provider": provider.strip().lower(),
+            "config": normalize_tts_config(config),
+            "text": text,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedTTSAudio:
+    """Cached audio a caller holds a reference to.
+
+    Attributes:
+        url: URL of the audio in audio storage.
+        mime_type: MIME type of the audio.
+        duration_ms: Duration of the audio in milliseconds.
+        size_bytes: Size of the audio in bytes.
+        hit: True if the audio was already cached, False if it was synthesized.
+    """
+
+    url: str
+    mime_type: str
+    duration_ms: float
+    size_bytes: int
+    hit: bool
+
+    @classmethod
+    def from_row(cls, row: TTSAudioCacheRow, hit: bool) -> CachedTTSAudio:
+        """Create from a cache entry."""
+        return cls(
+            url=row.audio_url,
+            mime_type=row.mime_type,
+            duration_ms=row.duration_ms,
+            size_bytes=row.size_bytes,
+            hit=hit,
+        )
+
+
+class TTSAudioCache:
+    """Reference-counted, content-addressed cache in front of TTSService.
+
+    Every successful :meth:`acquire` or :meth:`get_or_synthesize` takes a
+    reference to the returned audio, which the caller must drop with
+    :meth:`release` once it no longer points at the URL. Concurrent requests
+    for the same audio in this process share one synthesis.
+    """
+
+    def __init__(
+        self,
+        repo: TTSAudioCacheRepository,
+        audio_storage: AudioStorage,
+        max_bytes: int | None = None,
+        max_idle_seconds: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            repo: Repository holding the cache entries.
+            audio_storage: Storage the cached audio is kept in.
+            max_bytes: Maximum total size of the cache, or None for no limit.
+                Audio still referenced is kept even if the limit is exceeded.
+            max_idle_seconds: Seconds unreferenced audio is kept after its
+                last use, or None to keep it until the size limit is reached.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if max_idle_seconds is not None and max_idle_seconds <= 0:
+            raise ValueError("max_idle_seconds must be > 0")
+
+        self._repo = repo
+        self._storage = audio_storage
+        self._max_bytes = max_bytes
+        self._max_idle_seconds = max_idle_seconds
+        self._synthesizing: dict[str, asyncio.Event] = {}
+
+    async def acquire(
+        self, provider: str, text: str, config: dict[str, Any] | None
+    ) -> CachedTTSAudio | None:
+        """Take a reference to cached audio without synthesizing on a miss.
+
+        Args:
+            provider: TTS provider identifier.
+            text: Text to synthesize.
+            config: Provider-specific TTS configuration.
+
+        Returns:
+            The cached audio, or None if it is not cached.
+        """
+        row = await self._repo.acquire(tts_cache_key(provider, text, config))
+        return CachedTTSAudio.from_row(row, hit=True) if row else None
+
+    async def get_or_synthesize(
+        self, provider: str, text: str, config: dict[str, Any] | None
+    ) -> CachedTTSAudio:
+        """Take a reference to cached audio, synthesizing and storing it on a miss.
+
+        Args:
+            provider: TTS provider identifier.
+            text: Text to synthesize.
+            config: Provider-specific TTS configuration.
+
+        Returns:
+            The cached audio.
+
+        Raises:
+            ValueError: If the provider is not supported.
+            Exception: Provider or storage errors during synthesis.
+        """
+        key = tts_cache_key(provider, text, config)
+        while True:
+            row = await self._repo.acquire(key)
+            if row is not None:
+                return CachedTTSAudio.from_row(row, hit=True)
+            synthesizing = self._synthesizing.get(key)
+            if synthesizing is None:
+                break
+            # Another request in this process is synthesizing the same audio
+            await synthesizing.wait()
+
+        done = asyncio.Event()
+        self._synthesizing[key] = done
+        try:
+            audio = await self._synthesize(key, provider, text, config)
+        finally:
+            del self._synthesizing[key]
+            done.set()
+
+        await self._evict_quietly()
+        return audio
+
+    async def store(
+        self,
+        provider: str,
+        text: str,
+        config: dict[str, Any] | None,
+        audio_bytes: bytes,
+        mime_type: str,
+        duration_ms: float,
+    ) -> CachedTTSAudio:
+        """Take a reference to audio the caller synthesized itself, caching it.
+
+        Used for audio that was streamed to a client while it was synthesized.
+        If the same audio is already cached, the existing copy is used.
+
+        Args:
+            provider: TTS provider identifier.
+            text: Text that was synthesized.
+            config: Provider-specific TTS configuration.
+            audio_bytes: The synthesized audio.
+            mime_type: MIME type of the audio.
+            duration_ms: Duration of the audio in milliseconds.
+
+        Returns:
+            The cached audio.
+        """
+        key = tts_cache_key(provider, text, config)
+        row = await self._repo.acquire(key)
+        if row is not None:
+            return CachedTTSAudio.from_row(row, hit=True)
+
+        audio = await self._store(key, provider, audio_bytes, mime_type, duration_ms)
+        await self._evict_quietly()
+        return audio
+
+    async def release(self, url: str) -> bool:
+        """Drop a reference to cached audio.
+
+        Args:
+            url: URL returned by acquire or get_or_synthesize.
+
+        Returns:
+            True if the URL is cached audio, False if it is not (the caller
+            owns the file and should delete it itself).
+        """
+        if not await self._repo.release(url):
+            return False
+        await self._evict_quietly()
+        return True
+
+    async def evict(self) -> int:
+        """Evict unreferenced audio over the idle time or size limits.
+
+        Returns:
+            Number of evicted entries.
+        """
+        urls = await self._repo.evict(self._max_idle_seconds, self._max_bytes)
+        for url in urls:
+            try:
+                await self._storage.delete_by_url(url)
+            except Exception:
+                logger.exception(f"Deleting evicted TTS audio {url} failed")
+        if urls:
+            logger.info(f"Evicted {len(urls)} cached TTS audio files")
+        return len(urls)
+
+    async def _evict_quietly(self) -> None:
+        """Evict, logging errors instead of failing the caller's request."""
+        try:
+            await self.evict()
+        except Exception:
+            logger.exception("Evicting cached TTS audio failed")
+
+    async def _synthesize(
+        self, key: str, provider: str, text: str, config: dict[str, Any] | None
+    ) -> CachedTTSAudio:
+        """Synthesize, store and cache audio for a key."""
+        tts_service = TTSServiceFactory.create(provider)
+        audio_bytes, mime_type, duration_ms = await tts_service.synthesize(text, config or {})
+        return await self._store(key, provider, audio_bytes, mime_type, duration_ms)
+
+    async def _store(
+        self, key: str, provider: str, audio_bytes: bytes, mime_type: str, duration_ms: float
+    ) -> CachedTTSAudio:
+        """Store and cache audio for a key."""
+        url = await self._storage.store_audio(
+            audio_bytes, prefix=f"{CACHE_PREFIX}/{key[:2]}", content_type=mime_type
+        )
+
+        row = await self._repo.add(
+            cache_key=key,
+            tts_provider=provider.lower(),
+            audio_url=url,
+            mime_type=mime_type,
+            duration_ms=duration_ms,
+            size_bytes=len(audio_bytes),
+        )
+        if row.audio_url != url:
+            # Another server cached the same audio first; use its copy
+            await self._storage.delete_by_url(url)
+            return CachedTTSAudio.from_row(row, hit=True)
+        return CachedTTSAudio.from_row(row, hit=False)
@@ -0,0 +1,220 @@
+"""Streaming TTS synthesis with latency metrics.
+
+Audio is passed on chunk by chunk as the provider produces it, so playback
+can start after the first chunk instead of after the full render, while a
+copy is kept for storing once the stream completes. Time to first byte and
+total synthesis time are recorded per provider.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from voiceobs.server.services.tts_factory import TTSServiceFactory
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(samples: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of unsorted samples, or None if there are none."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+@dataclass(frozen=True)
+class TTSStreamStats:
+    """Streaming latency of one TTS provider.
+
+    Percentiles cover the most recent completed streams (see
+    ``TTSStreamMetrics.window``) and are None until one completes.
+    """
+
+    provider: str
+    streams: int
+    failures: int
+    time_to_first_byte_ms_p50: float | None
+    time_to_first_byte_ms_p95: float | None
+    total_ms_p50: float | None
+    total_ms_p95: float | None
+
+
+class TTSStreamMetrics:
+    """In-process time-to-first-byte and total synthesis time per TTS provider."""
+
+    def __init__(self, window: int = 500) -> None:
+        """Initialize the metrics.
+
+        Args:
+            window: Number of recent streams per provider the percentiles cover.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._streams: dict[str, int] = {}
+        self._failures: dict[str, int] = {}
+        self._time_to_first_byte_ms: dict[str, deque[float]] = {}
+        self._total_ms: dict[str, deque[float]] = {}
+
+    def record(self, provider: str, time_to_first_byte_ms: float, total_ms: float) -> None:
+        """Record a completed stream.
+
+        Args:
+            provider: TTS provider identifier.
+            time_to_first_byte_ms: Milliseconds until the first audio chunk.
+            total_ms: Milliseconds until the last audio chunk.
+        """
+        provider = provider.lower()
+        self._streams[provider] = self._streams.get(provider, 0) + 1
+        self._time_to_first_byte_ms.setdefault(provider, deque(maxlen=self.window)).append(
+            time_to_first_byte_ms
+        )
+        self._total_ms.setdefault(provider, deque(maxlen=self.window)).append(total_ms)
+
+    def record_failure(self, provider: str) -> None:
+        """Record a stream that failed before all audio was synthesized.
+
+        Args:
+            provider: TTS provider identifier.
+        """
+        provider = provider.lower()
+        self._failures[provider] = self._failures.get(provider, 0) + 1
+
+    def stats(self) -> list[TTSStreamStats]:
+        """Return the latency of every provider that has streamed, by provider name."""
+        providers = sorted(set(self._streams) | set(self._failures))
+        result = []
+        for provider in providers:
+            first_byte = list(self._time_to_first_byte_ms.get(provider, ()))
+            total = list(self._total_ms.get(provider, ()))
+            result.append(
+                TTSStreamStats(
+                    provider=provider,
+                    streams=self._streams.get(provider, 0),
+                    failures=self._failures.get(provider, 0),
+                    time_to_first_byte_ms_p50=_percentile(first_byte, 0.5),
+                    time_to_first_byte_ms_p95=_percentile(first_byte, 0.95),
+                    total_ms_p50=_percentile(total, 0.5),
+                    total_ms_p95=_percentile(total, 0.95),
+                )
+            )
+        return result
+
+
+class TTSAudioStream:
+    """A TTS stream whose first chunk has arrived.
+
+    Create with :func:`open_tts_stream`, then iterate to receive the audio.
+    Once iteration completes, :attr:`audio_bytes` and :attr:`duration_ms`
+    hold the whole audio.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        mime_type: str,
+        chunks: AsyncIterator[bytes],
+        first_chunk: bytes,
+        started: float,
+        time_to_first_byte_ms: float,
+        duration_of: Callable[[bytes], float],
+        metrics: TTSStreamMetrics,
+        clock: Callable[[], float],
+    ) -> None:
+        """Initialize the stream (use open_tts_stream instead)."""
+        self.provider = provider
+        self.mime_type = mime_type
+        self.time_to_first_byte_ms = time_to_first_byte_ms
+        self.total_ms: float | None = None
+        self.audio_bytes: bytes | None = None
+        self.duration_ms: float | None = None
+        self._chunks = chunks
+        self._first_chunk = first_chunk
+        self._started = started
+        self._duration_of = duration_of
+        self._metrics = metrics
+        self._clock = clock
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the audio chunks, keeping a copy of them.
+
+        Raises:
+            Exception: Provider errors after the first chunk.
+        """
+        received = [self._first_chunk]
+        yield self._first_chunk
+        try:
+            async for chunk in self._chunks:
+                received.append(chunk)
+                yield chunk
+        except Exception:
+            self._metrics.record_failure(self.provider)
+            raise
+
+        self.total_ms = (self._clock() - self._started) * 1000.0
+        self._metrics.record(self.provider, self.time_to_first_byte_ms, self.total_ms)
+        logger.info(
+            f"TTS stream from {self.provider}: first byte after "
+            f"{self.time_to_first_byte_ms:.0f} ms, complete after {self.total_ms:.0f} ms"
+        )
+        self.audio_bytes = b"".join(received)
+        self.duration_ms = self._duration_of(self.audio_bytes)
+
+
+async def open_tts_stream(
+    provider: str,
+    text: str,
+    config: dict[str, Any],
+    metrics: TTSStreamMetrics,
+    clock: Callable[[], float] = time.perf_counter,
+) -> TTSAudioStream:
+    """Start streaming synthesis and wait for the first audio chunk.
+
+    Waiting for the first chunk lets callers report provider errors (e.g. a
+    missing API key) before they commit to a streaming response.
+
+    Args:
+        provider: TTS provider identifier.
+        text: Text to synthesize.
+        config: Provider-specific TTS configuration.
+        metrics: Metrics the stream's latency is recorded in.
+        clock: Monotonic clock in seconds, overridable for tests.
+
+    Returns:
+        The stream, ready to be iterated.
+
+    Raises:
+        ValueError: If the provider is not supported.
+        RuntimeError: If the provider produced no audio.
+        Exception: Provider errors before the first chunk.
+    """
+    tts_service = TTSServiceFactory.create(provider)
+    started = clock()
+    chunks = aiter(tts_service.synthesize_streaming(text, config))
+    try:
+        first_chunk = await anext(chunks)
+    except StopAsyncIteration:
+        metrics.record_failure(provider)
+        raise RuntimeError(f"TTS provider '{provider}' returned no audio") from None
+    except Exception:
+        metrics.record_failure(provider)
+        raise
+
+    return TTSAudioStream(
+        provider=provider,
+        mime_type=tts_service.streaming_mime_type,
+        chunks=chunks,
+        first_chunk=first_chunk,
+        started=started,
+        time_to_first_byte_ms=(clock() - started) * 1000.0,
+        duration_of=tts_service.calculate_duration,
+        metrics=metrics,
+        clock=clock,
+    )
@@ -5,6 +5,7 @@ and S3 storage backends.
 """
 
 from voiceobs.server.storage.base import (
+    AudioObjectInfo,
     AudioStorage,
     AudioStorageProvider,
     get_extension_from_content_type,
@@ -13,6 +14,7 @@ from voiceobs.server.storage.local import LocalFileStorage
 from voiceobs.server.storage.s3 import S3Storage
 
 __all__ = [
+    "AudioObjectInfo",
     "AudioStorage",
     "AudioStorageProvider",
     "LocalFileStorage",
@@ -2,7 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Protocol
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Size of the chunks yielded by iter_range."""
+
+
+@dataclass(frozen=True)
+class AudioObjectInfo:
+    """Metadata of a stored audio file, used for Range and conditional requests."""
+
+    size: int
+    """Size in bytes."""
+    etag: str
+    """Entity tag, including the surrounding double quotes."""
+    last_modified: datetime
+    """Last modification time (timezone-aware, UTC)."""
 
 
 def get_extension_from_content_type(content_type: str | None) -> str:
@@ -72,6 +90,33 @@ class AudioStorageProvider(Protocol):
         """
         ...
 
+    async def stat(self, audio_id: str) -> AudioObjectInfo | None:
+        """Look up an audio file's size, ETag and modification time.
+
+        Args:
+            audio_id: Audio file identifier.
+
+        Returns:
+            AudioObjectInfo, or None if not found.
+        """
+        ...
+
+    def iter_range(
+        self, audio_id: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an audio file without reading the whole file.
+
+        Args:
+            audio_id: Audio file identifier.
+            start: First byte offset.
+            end: Last byte offset (inclusive). Nothing is yielded if end < start.
+            chunk_size: Maximum size of each yielded chunk.
+
+        Yields:
+            Chunks of audio data.
+        """
+        ...
+
     async def delete(self, audio_id: str) -> bool:
         """Delete audio file.
 
@@ -110,6 +155,10 @@ class AudioStorageProvider(Protocol):
         """
         ...
 
+    def close(self) -> None:
+        """Release resources held by the provider (e.g. thread pools)."""
+        ...
+
 
 class AudioStorage:
     """Audio storage service that uses a configured provider.
@@ -122,7 +171,7 @@ class AudioStorage:
         self,
         provider: str = "local",
         base_path: str | None = None,
-        **kwargs: str,
+        **kwargs: Any,
     ) -> None:
         """Initialize audio storage with a provider.
 
@@ -189,6 +238,33 @@ class AudioStorage:
         """
         return await self._provider.exists(audio_id)
 
+    async def stat(self, audio_id: str) -> AudioObjectInfo | None:
+        """Look up an audio file's size, ETag and modification time.
+
+        Args:
+            audio_id: Audio file identifier.
+
+        Returns:
+            AudioObjectInfo, or None if not found.
+        """
+        return await self._provider.stat(audio_id)
+
+    def iter_range(
+        self, audio_id: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an audio file.
+
+        Args:
+            audio_id: Audio file identifier.
+            start: First byte offset.
+            end: Last byte offset (inclusive).
+            chunk_size: Maximum size of each yielded chunk.
+
+        Returns:
+            Async iterator over chunks of audio data.
+        """
+        return self._provider.iter_range(audio_id, start, end, chunk_size)
+
     async def delete(self, audio_id: str) -> bool:
         """Delete audio file.
 
@@ -226,3 +302,7 @@ class AudioStorage:
             True if deleted, False if not found or invalid URL.
         """
         return await self._provider.delete_by_url(url)
+
+    def close(self) -> None:
+        """Release resources held by the provider. Call on application shutdown."""
+        self._provider.close()
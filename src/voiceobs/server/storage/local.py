@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from pathlib import Path
 
-from voiceobs.server.storage.base import get_extension_from_content_type
+from voiceobs.server.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    AudioObjectInfo,
+    get_extension_from_content_type,
+)
 
 
 class LocalFileStorage:
@@ -109,6 +115,68 @@ class LocalFileStorage:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, file_path.exists)
 
+    async def stat(self, audio_id: str) -> AudioObjectInfo | None:
+        """Look up an audio file's size, ETag and modification time.
+
+        The ETag is derived from the modification time and size, so it
+        changes whenever the file is rewritten.
+
+        Args:
+            audio_id: Conversation ID.
+
+        Returns:
+            AudioObjectInfo, or None if not found.
+        """
+        import asyncio
+
+        file_path = self._get_file_path(audio_id)
+        loop = asyncio.get_event_loop()
+        try:
+            st = await loop.run_in_executor(None, file_path.stat)
+        except FileNotFoundError:
+            return None
+        return AudioObjectInfo(
+            size=st.st_size,
+            etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+            last_modified=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+        )
+
+    async def iter_range(
+        self, audio_id: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an audio file.
+
+        Seeks to ``start`` and reads at most ``chunk_size`` bytes at a time,
+        so only the requested range is read.
+
+        Args:
+            audio_id: Conversation ID.
+            start: First byte offset.
+            end: Last byte offset (inclusive).
+            chunk_size: Maximum size of each yielded chunk.
+
+        Yields:
+            Chunks of audio data.
+        """
+        import asyncio
+
+        if end < start:
+            return
+        file_path = self._get_file_path(audio_id)
+        loop = asyncio.get_event_loop()
+        f = await loop.run_in_executor(None, file_path.open, "rb")
+        try:
+            await loop.run_in_executor(None, f.seek, start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await loop.run_in_executor(None, f.read, min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await loop.run_in_executor(None, f.close)
+
     async def delete(self, audio_id: str) -> bool:
         """Delete audio file from local filesystem.
 
@@ -205,3 +273,6 @@ class LocalFileStorage:
             return True
         except Exception:
             return False
+
+    def close(self) -> None:
+        """Nothing to release; files are opened per call."""
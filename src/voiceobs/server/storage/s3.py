@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import os
 import uuid
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from voiceobs.server.storage.base import get_extension_from_content_type
+from voiceobs.server.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    AudioObjectInfo,
+    get_extension_from_content_type,
+)
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 16
+"""Default number of S3 worker threads and pooled HTTP connections."""
+
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+"""Uploads at least this large are sent as multipart uploads."""
+
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+"""Size of each part of a multipart upload."""
+
 
 class S3Storage:
     """S3 storage provider for audio files.
 
     Uploads audio files to S3 and generates presigned URLs for access.
+
+    boto3 is synchronous, so every S3 call runs on a dedicated thread pool of
+    ``max_concurrency`` workers rather than the event loop's default executor.
+    The client's HTTP connection pool is sized to match, so each worker can
+    hold a keep-alive connection. Large uploads go through boto3's managed
+    transfer as multipart uploads.
     """
 
     def __init__(
@@ -25,6 +51,10 @@ class S3Storage:
         aws_secret_access_key: str | None = None,
         aws_region: str = "us-east-1",
         presigned_url_expiry: int = 3600,
+        endpoint_url: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE,
     ) -> None:
         """Initialize S3 storage provider.
 
@@ -34,7 +64,14 @@ class S3Storage:
             aws_secret_access_key: AWS secret access key (optional, uses env/default).
             aws_region: AWS region name.
             presigned_url_expiry: Presigned URL expiry time in seconds.
+            endpoint_url: Custom S3 endpoint (e.g. MinIO or moto server), or None for AWS.
+            max_concurrency: Number of worker threads and pooled connections.
+            multipart_threshold: Uploads of at least this many bytes use multipart upload.
+            multipart_chunksize: Part size for multipart uploads, in bytes.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         try:
             import boto3  # noqa: F401
         except ImportError as e:
@@ -45,6 +82,15 @@ class S3Storage:
         self.bucket_name = bucket_name
         self.aws_region = aws_region
         self.presigned_url_expiry = presigned_url_expiry
+        self.endpoint_url = endpoint_url
+        self.max_concurrency = max_concurrency
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+
+        # Dedicated pool so S3 I/O never starves the default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="voiceobs-s3"
+        )
 
         # Initialize S3 client
         self._s3_client: S3Client | None = None
@@ -58,15 +104,76 @@ class S3Storage:
         """Get or create S3 client."""
         if self._s3_client is None:
             import boto3
+            from botocore.config import Config
 
             session = boto3.Session(
                 aws_access_key_id=self._aws_access_key_id,
                 aws_secret_access_key=self._aws_secret_access_key,
                 region_name=self.aws_region,
             )
-            self._s3_client = session.client("s3")
+            self._s3_client = session.client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                config=Config(
+                    max_pool_connections=self.max_concurrency,
+                    retries={"mode": "standard"},
+                ),
+            )
         return self._s3_client
 
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking boto3 call on the S3 thread pool.
+
+        Args:
+            func: Callable to run.
+            *args: Positional arguments for the callable.
+
+        Returns:
+            The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def _put_object(self, s3_key: str, audio_data: bytes, content_type: str) -> None:
+        """Upload an object, using multipart upload for large payloads.
+
+        Args:
+            s3_key: Destination key.
+            audio_data: Object contents.
+            content_type: MIME type stored with the object.
+        """
+        if len(audio_data) < self.multipart_threshold:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=audio_data,
+                ContentType=content_type,
+            )
+            return
+
+        from boto3.s3.transfer import TransferConfig
+
+        # boto3 uploads the parts on its own transfer threads; cap them so one
+        # large upload cannot take the whole connection pool
+        self.s3_client.upload_fileobj(
+            io.BytesIO(audio_data),
+            self.bucket_name,
+            s3_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+                max_concurrency=max(1, self.max_concurrency // 4),
+            ),
+        )
+
+    def close(self) -> None:
+        """Shut down the S3 thread pool.
+
+        In-flight calls are allowed to finish; new calls are rejected.
+        """
+        self._executor.shutdown(wait=False)
+
     def _get_s3_key(self, conversation_id: str, audio_type: str | None = None) -> str:
         """Generate S3 key for a conversation ID.
 
@@ -106,21 +213,10 @@ class S3Storage:
         Returns:
             S3 URL to the stored file.
         """
-        import asyncio
-
         s3_key = self._get_s3_key(conversation_id, audio_type)
 
-        # Upload to S3 (boto3 is sync, so we run in executor)
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=audio_data,
-                ContentType="audio/wav",
-            ),
-        )
+        # Upload to S3 (boto3 is sync, so we run on the S3 thread pool)
+        await self._run(self._put_object, s3_key, audio_data, "audio/wav")
 
         return self._get_s3_url(conversation_id, audio_type)
 
@@ -133,17 +229,17 @@ class S3Storage:
         Returns:
             Audio data bytes or None if not found.
         """
-        import asyncio
-
         s3_key = self._get_s3_key(audio_id)
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
+            response = await self._run(
                 lambda: self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key),
             )
-            return response["Body"].read()
+            body = response["Body"]
+            try:
+                return await self._run(body.read)
+            finally:
+                body.close()
         except Exception:
             # Handle NoSuchKey and other client errors
             return None
@@ -157,14 +253,10 @@ class S3Storage:
         Returns:
             True if file exists, False otherwise.
         """
-        import asyncio
-
         s3_key = self._get_s3_key(audio_id)
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
+            await self._run(
                 lambda: self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key),
             )
             return True
@@ -172,6 +264,63 @@ class S3Storage:
             # Handle NoSuchKey and other client errors
             return False
 
+    async def stat(self, audio_id: str) -> AudioObjectInfo | None:
+        """Look up an audio file's size, ETag and modification time with HeadObject.
+
+        Args:
+            audio_id: Conversation ID.
+
+        Returns:
+            AudioObjectInfo, or None if not found.
+        """
+        s3_key = self._get_s3_key(audio_id)
+
+        try:
+            response = await self._run(
+                lambda: self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key),
+            )
+        except Exception:
+            # Handle NoSuchKey and other client errors
+            return None
+        return AudioObjectInfo(
+            size=response["ContentLength"],
+            etag=response["ETag"],
+            last_modified=response["LastModified"],
+        )
+
+    async def iter_range(
+        self, audio_id: str, start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an audio file with a ranged GetObject.
+
+        Only the requested bytes are downloaded, and they are read from the
+        response body ``chunk_size`` bytes at a time.
+
+        Args:
+            audio_id: Conversation ID.
+            start: First byte offset.
+            end: Last byte offset (inclusive).
+            chunk_size: Maximum size of each yielded chunk.
+
+        Yields:
+            Chunks of audio data.
+        """
+        if end < start:
+            return
+        s3_key = self._get_s3_key(audio_id)
+
+        response = await self._run(
+            lambda: self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=s3_key, Range=f"bytes={start}-{end}"
+            ),
+        )
+        body = response["Body"]
+        try:
+            while chunk := await self._run(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
     async def delete(self, audio_id: str) -> bool:
         """Delete audio file from S3.
 
@@ -181,14 +330,10 @@ class S3Storage:
         Returns:
             True if deleted, False if not found.
         """
-        import asyncio
-
         s3_key = self._get_s3_key(audio_id)
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
+            await self._run(
                 lambda: self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key),
             )
             return True
@@ -206,14 +351,10 @@ class S3Storage:
         Returns:
             Presigned URL string.
         """
-        import asyncio
-
         s3_key = self._get_s3_key(audio_id)
         expiry_seconds = expiry or self.presigned_url_expiry
 
-        loop = asyncio.get_event_loop()
-        url = await loop.run_in_executor(
-            None,
+        url = await self._run(
             lambda: self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.bucket_name, "Key": s3_key},
@@ -235,8 +376,6 @@ class S3Storage:
         Raises:
             ValueError: If the URL is not a valid S3 URL or bucket doesn't match.
         """
-        import asyncio
-
         if not s3_url.startswith("s3://"):
             raise ValueError(f"Invalid S3 URL format: {s3_url}")
 
@@ -256,9 +395,7 @@ class S3Storage:
 
         expiry_seconds = expiry or self.presigned_url_expiry
 
-        loop = asyncio.get_event_loop()
-        url = await loop.run_in_executor(
-            None,
+        url = await self._run(
             lambda: self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.bucket_name, "Key": s3_key},
@@ -281,8 +418,6 @@ class S3Storage:
         Returns:
             S3 URL to the stored file.
         """
-        import asyncio
-
         # Determine file extension from content type
         extension = get_extension_from_content_type(content_type)
 
@@ -298,16 +433,7 @@ class S3Storage:
         s3_key = f"{prefix}/{filename}"
 
         # Upload to S3
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=audio_data,
-                ContentType=content_type,
-            ),
-        )
+        await self._run(self._put_object, s3_key, audio_data, content_type)
 
         # Return S3 URL
         return f"s3://{self.bucket_name}/{s3_key}"
@@ -321,8 +447,6 @@ class S3Storage:
         Returns:
             True if deleted, False if not found or invalid URL.
         """
-        import asyncio
-
         # Parse S3 URL format: s3://bucket/key
         if not url.startswith("s3://"):
             return False
@@ -339,9 +463,7 @@ class S3Storage:
             return False
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
+            await self._run(
                 lambda: self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key),
             )
             return True
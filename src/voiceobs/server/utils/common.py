@@ -65,7 +65,7 @@ def analysis_result_to_response(result: AnalysisResult) -> AnalysisResponse:
             ),
         ),
         turns=TurnMetricsResponse(
-            silence_samples=len(result.turn_metrics.silence_after_user_ms),
+            silence_samples=result.turn_metrics.silence_samples,
             silence_mean_ms=result.turn_metrics.silence_mean_ms,
             silence_p95_ms=result.turn_metrics.silence_p95_ms,
             total_agent_turns=result.turn_metrics.total_agent_turns,
@@ -22,6 +22,9 @@ def get_audio_storage_from_env() -> AudioStorage:
         VOICEOBS_AUDIO_S3_BUCKET: S3 bucket name (optional, uses
             VOICEOBS_AUDIO_STORAGE_PATH if not set)
         VOICEOBS_AUDIO_S3_REGION: AWS region for S3 (default: "us-east-1")
+        VOICEOBS_AUDIO_S3_ENDPOINT_URL: Custom S3-compatible endpoint (optional)
+        VOICEOBS_AUDIO_S3_MAX_CONCURRENCY: S3 worker threads and pooled
+            connections (default: 16)
 
     For S3 storage, AWS credentials must be provided via one of:
         - AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables
@@ -43,10 +46,14 @@ def get_audio_storage_from_env() -> AudioStorage:
     if provider == "s3":
         bucket_name = os.environ.get("VOICEOBS_AUDIO_S3_BUCKET", base_path)
         aws_region = os.environ.get("VOICEOBS_AUDIO_S3_REGION", "us-east-1")
+        endpoint_url = os.environ.get("VOICEOBS_AUDIO_S3_ENDPOINT_URL") or None
+        max_concurrency = int(os.environ.get("VOICEOBS_AUDIO_S3_MAX_CONCURRENCY", "16"))
         return AudioStorage(
             provider="s3",
             base_path=bucket_name,
             aws_region=aws_region,
+            endpoint_url=endpoint_url,
+            max_concurrency=max_concurrency,
         )
     else:
         return AudioStorage(
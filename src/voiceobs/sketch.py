@@ -0,0 +1,248 @@
+"""Mergeable quantile sketch for streaming latency metrics.
+
+This module provides a DDSketch-style quantile sketch. Values are counted in
+logarithmically sized buckets, so memory depends on the range of values seen
+rather than on how many values were added, and any quantile estimate is within
+a fixed relative error of the exact value. Sketches with the same accuracy can
+be merged, which makes them suitable for combining partial results.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+"""Default relative accuracy (1%) for quantile estimates."""
+
+DEFAULT_MAX_BUCKETS = 2048
+"""Default cap on buckets per sign before the lowest buckets are collapsed."""
+
+
+class QuantileSketch:
+    """Quantile sketch with a relative error guarantee.
+
+    For any quantile ``q``, :meth:`quantile` returns a value within
+    ``relative_accuracy`` (relative error) of the value at the same rank in the
+    sorted input, as long as the bucket cap has not been reached. Count, sum,
+    mean, min and max are tracked exactly.
+
+    When more than ``max_buckets`` buckets are needed for one sign, the buckets
+    closest to zero are collapsed together. This keeps memory bounded and only
+    loses accuracy for the lowest quantiles, never for p50/p95/p99.
+
+    Example:
+        sketch = QuantileSketch()
+        for duration in durations:
+            sketch.add(duration)
+        p95 = sketch.quantile(0.95)
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates,
+                strictly between 0 and 1.
+            max_buckets: Maximum number of buckets kept for positive values
+                (and, separately, for negative values).
+
+        Raises:
+            ValueError: If relative_accuracy or max_buckets is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be >= 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def __len__(self) -> int:
+        """Number of values added to the sketch."""
+        return self.count
+
+    def __bool__(self) -> bool:
+        """True if the sketch contains at least one value."""
+        return self.count > 0
+
+    @property
+    def mean(self) -> float | None:
+        """Exact mean of the values added, or None if empty."""
+        if self.count == 0:
+            return None
+        return self.sum / self.count
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of buckets currently held (a proxy for memory use)."""
+        return len(self._positive) + len(self._negative) + (1 if self._zero_count else 0)
+
+    def add(self, value: float) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: The value to add.
+        """
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if value > 0:
+            self._add_to(self._positive, self._index(value))
+        elif value < 0:
+            self._add_to(self._negative, self._index(-value))
+        else:
+            self._zero_count += 1
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch to merge. It must use the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+
+        for index, count in other._positive.items():
+            self._add_to(self._positive, index, count)
+        for index, count in other._negative.items():
+            self._add_to(self._negative, index, count)
+        self._zero_count += other._zero_count
+
+        self.count += other.count
+        self.sum += other.sum
+        assert other.min is not None and other.max is not None
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary that :meth:`from_dict` turns back into an equal sketch.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self._zero_count,
+            "positive": {str(index): count for index, count in self._positive.items()},
+            "negative": {str(index): count for index, count in self._negative.items()},
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], max_buckets: int = DEFAULT_MAX_BUCKETS
+    ) -> QuantileSketch:
+        """Rebuild a sketch from :meth:`to_dict` output.
+
+        Bucket keys may be ints or strings, so buckets counted elsewhere (for
+        example by a database query using the same index formula) can be
+        loaded too. Missing bucket maps and zero_count default to empty.
+
+        Args:
+            data: Serialized sketch.
+            max_buckets: Bucket cap for the rebuilt sketch.
+
+        Returns:
+            The rebuilt sketch.
+        """
+        sketch = cls(data["relative_accuracy"], max_buckets)
+        for key, count in data.get("positive", {}).items():
+            sketch._add_to(sketch._positive, int(key), count)
+        for key, count in data.get("negative", {}).items():
+            sketch._add_to(sketch._negative, int(key), count)
+        sketch._zero_count = data.get("zero_count", 0)
+        sketch.count = data["count"]
+        sketch.sum = float(data["sum"])
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        return sketch
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the value at quantile ``q``.
+
+        Uses the same rank as the analyzer's list-based percentiles: the value
+        at index ``int(count * q)`` of the sorted input.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Estimated value, or None if the sketch is empty.
+
+        Raises:
+            ValueError: If q is outside [0, 1].
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = min(int(self.count * q), self.count - 1)
+        seen = 0
+
+        # Negative values, most negative first
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return self._clamp(-self._value(index))
+
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._clamp(self._value(index))
+
+        return self.max  # pragma: no cover - counts always cover the rank
+
+    def _index(self, magnitude: float) -> int:
+        """Bucket index for a positive magnitude."""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        """Representative value of a bucket (relative error <= accuracy)."""
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        """Keep estimates inside the exact observed range."""
+        assert self.min is not None and self.max is not None
+        return min(max(value, self.min), self.max)
+
+    def _add_to(self, buckets: dict[int, int], index: int, count: int = 1) -> None:
+        """Increment a bucket, collapsing the lowest buckets past the cap."""
+        buckets[index] = buckets.get(index, 0) + count
+        if len(buckets) > self.max_buckets:
+            lowest = sorted(buckets)[: len(buckets) - self.max_buckets + 1]
+            collapsed = sum(buckets.pop(i) for i in lowest)
+            buckets[lowest[-1]] = collapsed
@@ -0,0 +1,522 @@
+"""Memory-mapped, indexed local trace store.
+
+``voiceobs index`` builds a compact index next to a JSONL trace file
+(``run.jsonl`` -> ``run.jsonl.vidx``). The index holds, for every span, the
+values the analyzer needs in columnar arrays (span kind, stage duration,
+turn timings, evaluation results and a conversation number) plus the byte
+offset and length of the span's line in the raw file. Spans are also grouped
+by conversation, so one conversation's spans can be found without scanning
+the file.
+
+Both files are read through ``mmap``. Analysis runs over the columns without
+parsing any JSON, and full span dictionaries are only decoded when asked
+for. The raw JSONL file stays the source of truth: the index records its
+size and modification time and is ignored once the file changes, and
+:meth:`TraceStore.to_jsonl` writes the indexed lines back out unchanged.
+
+Compressed trace files (``.jsonl.gz``, ``.jsonl.zst``) cannot be indexed,
+since lines are read by their offset in the raw file; they are always parsed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from voiceobs.analyzer import (
+    AnalysisResult,
+    StageMetrics,
+    create_streaming_result,
+    is_compressed_trace,
+    resolve_stage,
+)
+
+INDEX_SUFFIX = ".vidx"
+"""Suffix appended to a trace file's name to get its index path."""
+
+INDEX_VERSION = 1
+"""Version of the index layout written by :func:`build_index`."""
+
+_MAGIC = b"VOBSIDX\x00"
+_HEADER = struct.Struct("<8sQ")  # magic, metadata length
+_ALIGNMENT = 8
+
+# Span kinds stored in the "kind" column
+KIND_OTHER = 0
+KIND_ASR = 1
+KIND_LLM = 2
+KIND_TTS = 3
+KIND_TURN = 4
+KIND_EVAL = 5
+
+_STAGE_KINDS = {"asr": KIND_ASR, "llm": KIND_LLM, "tts": KIND_TTS}
+
+# Bits stored in the "flags" column
+FLAG_AGENT = 1
+FLAG_INTERRUPTED = 2
+FLAG_INTENT_CORRECT = 4
+FLAG_INTENT_INCORRECT = 8
+
+# Column name -> array typecode. Missing float values are stored as NaN and
+# spans without a conversation have conversation -1.
+_COLUMNS = {
+    "offset": "Q",
+    "length": "I",
+    "kind": "B",
+    "flags": "B",
+    "conversation": "i",
+    "duration_ms": "d",
+    "silence_ms": "d",
+    "overlap_ms": "d",
+    "relevance": "d",
+    "conversation_spans": "i",
+    "conversation_starts": "Q",
+}
+
+
+class StaleIndexError(ValueError):
+    """Raised when an index no longer matches its trace file."""
+
+
+def index_path_for(source: str | Path) -> Path:
+    """Return the default index path for a JSONL trace file.
+
+    Args:
+        source: Path to the JSONL file.
+
+    Returns:
+        The path with :data:`INDEX_SUFFIX` appended.
+    """
+    source = Path(source)
+    return source.with_name(source.name + INDEX_SUFFIX)
+
+
+def _optional_float(value: Any) -> float:
+    """Convert an attribute value to a float column entry (NaN if missing)."""
+    return math.nan if value is None else float(value)
+
+
+def build_index(source: str | Path, output: str | Path | None = None) -> Path:
+    """Build an index for a JSONL trace file.
+
+    The file is read once. The index is written to a temporary file and
+    moved into place, so readers never see a partial index.
+
+    Args:
+        source: Path to the JSONL file.
+        output: Index path. Defaults to :func:`index_path_for` of the source.
+
+    Returns:
+        Path of the written index.
+
+    Raises:
+        FileNotFoundError: If the source file does not exist.
+        ValueError: If the source file is compressed.
+        json.JSONDecodeError: If a line is not valid JSON.
+    """
+    source = Path(source)
+    if is_compressed_trace(source):
+        raise ValueError(f"Compressed trace files cannot be indexed: {source}")
+    output = Path(output) if output is not None else index_path_for(source)
+    stat = source.stat()
+
+    columns = {name: array(typecode) for name, typecode in _COLUMNS.items()}
+    conversations: dict[Any, int] = {}
+
+    with source.open("rb") as f:
+        offset = 0
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            line = line.rstrip()
+            if not line.strip():
+                continue
+
+            span = json.loads(line)
+            name = span.get("name", "")
+            attrs = span.get("attributes", {})
+
+            kind = KIND_OTHER
+            flags = 0
+            duration = silence = overlap = relevance = math.nan
+
+            stage = resolve_stage(span)
+            if stage is not None:
+                stage_type, stage_duration = stage
+                kind = _STAGE_KINDS.get(stage_type, KIND_OTHER)
+                duration = _optional_float(stage_duration)
+            elif name == "voice.turn":
+                kind = KIND_TURN
+                if attrs.get("voice.actor") == "agent":
+                    flags |= FLAG_AGENT
+                if attrs.get("voice.interruption.detected"):
+                    flags |= FLAG_INTERRUPTED
+                silence = _optional_float(attrs.get("voice.silence.after_user_ms"))
+                overlap = _optional_float(attrs.get("voice.turn.overlap_ms"))
+            elif name == "voiceobs.eval":
+                kind = KIND_EVAL
+                intent_correct = attrs.get("eval.intent_correct")
+                if intent_correct is True:
+                    flags |= FLAG_INTENT_CORRECT
+                elif intent_correct is False:
+                    flags |= FLAG_INTENT_INCORRECT
+                relevance = _optional_float(attrs.get("eval.relevance_score"))
+
+            conv_id = attrs.get("voice.conversation.id")
+            conversation = conversations.setdefault(conv_id, len(conversations)) if conv_id else -1
+
+            columns["offset"].append(line_offset)
+            columns["length"].append(len(line))
+            columns["kind"].append(kind)
+            columns["flags"].append(flags)
+            columns["conversation"].append(conversation)
+            columns["duration_ms"].append(duration)
+            columns["silence_ms"].append(silence)
+            columns["overlap_ms"].append(overlap)
+            columns["relevance"].append(relevance)
+
+    # Group span numbers by conversation (counting sort, file order kept
+    # within each conversation).
+    starts = array("Q", [0] * (len(conversations) + 1))
+    for conversation in columns["conversation"]:
+        if conversation >= 0:
+            starts[conversation + 1] += 1
+    for i in range(len(conversations)):
+        starts[i + 1] += starts[i]
+    grouped = array("i", [0] * starts[-1])
+    fill = array("Q", starts[:-1])
+    for span_number, conversation in enumerate(columns["conversation"]):
+        if conversation >= 0:
+            grouped[fill[conversation]] = span_number
+            fill[conversation] += 1
+    columns["conversation_spans"] = grouped
+    columns["conversation_starts"] = starts
+
+    _write_index(output, columns, list(conversations), stat)
+    return output
+
+
+def _write_index(
+    output: Path,
+    columns: dict[str, array],
+    conversations: list[Any],
+    stat: os.stat_result,
+) -> None:
+    """Write the index header, metadata and column data."""
+    layout: dict[str, dict[str, Any]] = {}
+    position = 0
+    for name, column in columns.items():
+        layout[name] = {
+            "typecode": column.typecode,
+            "itemsize": column.itemsize,
+            "offset": position,
+            "count": len(column),
+        }
+        position += _aligned(len(column) * column.itemsize)
+
+    metadata = json.dumps(
+        {
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "span_count": len(columns["offset"]),
+            "conversations": conversations,
+            "columns": layout,
+        }
+    ).encode()
+    data_start = _aligned(_HEADER.size + len(metadata))
+
+    tmp_path = output.with_name(output.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(metadata)))
+        f.write(metadata)
+        f.write(b"\x00" * (data_start - _HEADER.size - len(metadata)))
+        for column in columns.values():
+            data = column.tobytes()
+            f.write(data)
+            f.write(b"\x00" * (_aligned(len(data)) - len(data)))
+    os.replace(tmp_path, output)
+
+
+def _aligned(size: int) -> int:
+    """Round a byte count up to the column alignment."""
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _map_file(path: Path) -> mmap.mmap | None:
+    """Memory-map a file read-only (None for an empty file, which mmap rejects)."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class TraceStore:
+    """Read-only view of an indexed JSONL trace file.
+
+    Columns are memoryviews over the mapped index, so opening a store costs
+    the same however many spans it holds. Close the store (or use it as a
+    context manager) to unmap both files.
+
+    Example:
+        with TraceStore.open("run.jsonl") as store:
+            result = store.analyze(conversation_id="conv-123")
+    """
+
+    def __init__(self, source: Path, index_path: Path) -> None:
+        """Map an index and its trace file.
+
+        Use :meth:`open` rather than calling this directly.
+
+        Args:
+            source: Path to the JSONL file.
+            index_path: Path to its index.
+
+        Raises:
+            StaleIndexError: If the index is unreadable, was written by an
+                incompatible version, or the trace file has changed since
+                it was built.
+        """
+        self.source = source
+        self.index_path = index_path
+        self._views: list[memoryview] = []
+        self._index_map = _map_file(index_path)
+        self._source_map: mmap.mmap | None = None
+        try:
+            self._load_index()
+            self._source_map = _map_file(source)
+        except BaseException:
+            self.close()
+            raise
+
+    def _load_index(self) -> None:
+        """Validate the index header and map its columns."""
+        if self._index_map is None or len(self._index_map) < _HEADER.size:
+            raise StaleIndexError(f"Not a trace index: {self.index_path}")
+        magic, metadata_length = _HEADER.unpack_from(self._index_map, 0)
+        if magic != _MAGIC:
+            raise StaleIndexError(f"Not a trace index: {self.index_path}")
+        metadata = json.loads(self._index_map[_HEADER.size : _HEADER.size + metadata_length])
+        if metadata["version"] != INDEX_VERSION or metadata["byteorder"] != sys.byteorder:
+            raise StaleIndexError(f"Index format not supported, rebuild it: {self.index_path}")
+
+        stat = self.source.stat()
+        if (
+            stat.st_size != metadata["source_size"]
+            or stat.st_mtime_ns != metadata["source_mtime_ns"]
+        ):
+            raise StaleIndexError(f"Trace file changed since it was indexed: {self.source}")
+
+        self.span_count: int = metadata["span_count"]
+        self.conversations: list[Any] = metadata["conversations"]
+        self._conversation_numbers = {
+            conv_id: number for number, conv_id in enumerate(self.conversations)
+        }
+
+        data_start = _aligned(_HEADER.size + metadata_length)
+        base = memoryview(self._index_map)
+        self._views.append(base)
+        for name, column in metadata["columns"].items():
+            if array(column["typecode"]).itemsize != column["itemsize"]:
+                raise StaleIndexError(f"Index format not supported, rebuild it: {self.index_path}")
+            start = data_start + column["offset"]
+            raw = base[start : start + column["count"] * column["itemsize"]]
+            view = raw.cast(column["typecode"])
+            self._views.extend((raw, view))
+            setattr(self, f"_{name}", view)
+
+    @classmethod
+    def open(cls, source: str | Path, index_path: str | Path | None = None) -> TraceStore:
+        """Open the index of a JSONL trace file.
+
+        Args:
+            source: Path to the JSONL file.
+            index_path: Index path. Defaults to :func:`index_path_for` of
+                the source.
+
+        Returns:
+            An open TraceStore.
+
+        Raises:
+            FileNotFoundError: If the trace file or index does not exist.
+            StaleIndexError: If the index does not match the trace file.
+        """
+        source = Path(source)
+        return cls(source, Path(index_path) if index_path else index_path_for(source))
+
+    def close(self) -> None:
+        """Unmap the index and trace file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        for mapped in (self._index_map, self._source_map):
+            if mapped is not None:
+                mapped.close()
+        self._index_map = self._source_map = None
+
+    def __enter__(self) -> TraceStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.span_count
+
+    def span_numbers(self, conversation_id: Any | None = None) -> Sequence[int]:
+        """Return span numbers in file order, optionally for one conversation.
+
+        Args:
+            conversation_id: Only return this conversation's spans.
+
+        Returns:
+            Span numbers; empty if the conversation is not in the trace.
+        """
+        if conversation_id is None:
+            return range(self.span_count)
+        number = self._conversation_numbers.get(conversation_id)
+        if number is None:
+            return range(0)
+        starts = self._conversation_starts
+        # Copied out so no view of the index outlives close()
+        return self._conversation_spans[starts[number] : starts[number + 1]].tolist()
+
+    def iter_lines(self, conversation_id: Any | None = None) -> Iterator[bytes]:
+        """Yield raw JSON lines (without newline) from the trace file.
+
+        Args:
+            conversation_id: Only yield this conversation's spans.
+
+        Yields:
+            Span lines as bytes, in file order.
+        """
+        offsets = self._offset
+        lengths = self._length
+        source = self._source_map
+        for i in self.span_numbers(conversation_id):
+            assert source is not None
+            start = offsets[i]
+            yield source[start : start + lengths[i]]
+
+    def iter_spans(self, conversation_id: Any | None = None) -> Iterator[dict]:
+        """Yield parsed span dictionaries, optionally for one conversation.
+
+        Args:
+            conversation_id: Only yield this conversation's spans.
+
+        Yields:
+            Span dictionaries, in file order.
+        """
+        for line in self.iter_lines(conversation_id):
+            yield json.loads(line)
+
+    def to_jsonl(self, out: BinaryIO, conversation_id: Any | None = None) -> int:
+        """Write indexed spans back out as JSONL.
+
+        Lines are copied byte for byte from the trace file, so the output is
+        the original file minus blank lines and trailing whitespace.
+
+        Args:
+            out: Binary stream to write to.
+            conversation_id: Only write this conversation's spans.
+
+        Returns:
+            Number of spans written.
+        """
+        written = 0
+        for line in self.iter_lines(conversation_id):
+            out.write(line)
+            out.write(b"\n")
+            written += 1
+        return written
+
+    def analyze(
+        self, conversation_id: Any | None = None, streaming: bool = False
+    ) -> AnalysisResult:
+        """Compute analysis metrics from the index columns.
+
+        The result matches ``analyze_spans`` (or ``analyze_stream`` with
+        ``streaming=True``) over the same spans, without parsing any JSON.
+
+        Args:
+            conversation_id: Only analyze this conversation's spans.
+            streaming: Record samples in quantile sketches instead of lists.
+
+        Returns:
+            AnalysisResult with computed metrics.
+        """
+        result = create_streaming_result() if streaming else AnalysisResult()
+        stages: dict[int, StageMetrics] = {
+            KIND_ASR: result.asr_metrics,
+            KIND_LLM: result.llm_metrics,
+            KIND_TTS: result.tts_metrics,
+        }
+        turns = result.turn_metrics
+        evals = result.eval_metrics
+        kinds = self._kind
+        flags = self._flags
+        conversation = self._conversation
+        durations = self._duration_ms
+        silences = self._silence_ms
+        overlaps = self._overlap_ms
+        relevances = self._relevance
+        seen: set[int] = set()
+
+        for i in self.span_numbers(conversation_id):
+            result.total_spans += 1
+            if conversation[i] >= 0:
+                seen.add(conversation[i])
+
+            kind = kinds[i]
+            if kind in stages:
+                duration = durations[i]
+                if not math.isnan(duration):
+                    stages[kind].add(duration)
+            elif kind == KIND_TURN:
+                result.total_turns += 1
+                if flags[i] & FLAG_AGENT:
+                    turns.total_agent_turns += 1
+                    if not math.isnan(silences[i]):
+                        turns.add_silence(silences[i])
+                    if not math.isnan(overlaps[i]):
+                        turns.add_overlap(overlaps[i])
+                    if flags[i] & FLAG_INTERRUPTED:
+                        turns.interruptions += 1
+            elif kind == KIND_EVAL:
+                evals.total_evals += 1
+                if flags[i] & FLAG_INTENT_CORRECT:
+                    evals.intent_correct_count += 1
+                elif flags[i] & FLAG_INTENT_INCORRECT:
+                    evals.intent_incorrect_count += 1
+                if not math.isnan(relevances[i]):
+                    evals.add_relevance_score(relevances[i])
+
+        result.conversation_ids = {self.conversations[number] for number in seen}
+        result.total_conversations = len(result.conversation_ids)
+        return result
+
+
+def open_fresh_index(source: str | Path) -> TraceStore | None:
+    """Open a trace file's index if one exists and is up to date.
+
+    Args:
+        source: Path to the JSONL file.
+
+    Returns:
+        An open TraceStore, or None if there is no usable index.
+    """
+    if is_compressed_trace(source):
+        return None
+    try:
+        return TraceStore.open(source)
+    except (FileNotFoundError, StaleIndexError):
+        return None
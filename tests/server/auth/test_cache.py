@@ -0,0 +1,129 @@
+"""Tests for the auth context cache."""
+
+from uuid import uuid4
+
+import pytest
+
+from voiceobs.server.auth.cache import AuthCache
+from voiceobs.server.auth.context import AuthContext
+from voiceobs.server.db.models import OrganizationRow, UserRow
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_ctx(user_id=None, org_id=None) -> AuthContext:
+    """Create an AuthContext for the given user and org IDs."""
+    user_id = user_id or uuid4()
+    org_id = org_id or uuid4()
+    return AuthContext(
+        user=UserRow(id=user_id, email="test@example.com"),
+        org=OrganizationRow(id=org_id, name="Test Org", created_by=user_id),
+    )
+
+
+class TestAuthCache:
+    """Tests for AuthCache."""
+
+    def test_get_returns_cached_context(self):
+        """Test that a stored context is returned for the same key."""
+        cache = AuthCache()
+        ctx = make_ctx()
+
+        cache.put(ctx.user.id, ctx.org.id, ctx)
+
+        assert cache.get(ctx.user.id, ctx.org.id) is ctx
+        assert cache.get(ctx.user.id, None) is None
+        assert cache.get(uuid4(), ctx.org.id) is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are not served after the TTL has passed."""
+        clock = FakeClock()
+        cache = AuthCache(ttl_seconds=10, clock=clock)
+        ctx = make_ctx()
+        cache.put(ctx.user.id, ctx.org.id, ctx)
+
+        clock.now = 9.9
+        assert cache.get(ctx.user.id, ctx.org.id) is ctx
+        clock.now = 10.0
+        assert cache.get(ctx.user.id, ctx.org.id) is None
+        assert cache.stats().size == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within max_size by evicting the LRU entry."""
+        cache = AuthCache(max_size=2)
+        a, b, c = make_ctx(), make_ctx(), make_ctx()
+        cache.put(a.user.id, None, a)
+        cache.put(b.user.id, None, b)
+        cache.get(a.user.id, None)  # a is now most recently used
+
+        cache.put(c.user.id, None, c)
+
+        assert cache.get(a.user.id, None) is a
+        assert cache.get(b.user.id, None) is None
+        assert cache.get(c.user.id, None) is c
+        assert cache.stats().evictions == 1
+
+    def test_invalidate_user_and_org(self):
+        """Test invalidating one membership, all of a user's entries, or an org."""
+        user_id = uuid4()
+        org_a, org_b = uuid4(), uuid4()
+        cache = AuthCache()
+        ctx_a = make_ctx(user_id, org_a)
+        ctx_b = make_ctx(user_id, org_b)
+        cache.put(user_id, org_a, ctx_a)
+        cache.put(user_id, None, ctx_a)  # resolved via last active org
+        cache.put(user_id, org_b, ctx_b)
+        other = make_ctx(org_id=org_b)
+        cache.put(other.user.id, org_b, other)
+
+        cache.invalidate(user_id, org_a)
+        assert cache.get(user_id, org_a) is None
+        assert cache.get(user_id, None) is None
+        assert cache.get(user_id, org_b) is ctx_b
+
+        cache.invalidate_org(org_b)
+        assert cache.get(user_id, org_b) is None
+        assert cache.get(other.user.id, org_b) is None
+        assert cache.stats().invalidations == 4
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 stores nothing."""
+        cache = AuthCache(ttl_seconds=0)
+        ctx = make_ctx()
+
+        cache.put(ctx.user.id, ctx.org.id, ctx)
+
+        assert not cache.enabled
+        assert cache.get(ctx.user.id, ctx.org.id) is None
+        assert cache.stats().size == 0
+
+    def test_stats_hit_rate(self):
+        """Test hit and miss counters and the derived hit rate."""
+        cache = AuthCache()
+        ctx = make_ctx()
+        assert cache.stats().hit_rate == 0.0
+
+        cache.get(ctx.user.id, ctx.org.id)
+        cache.put(ctx.user.id, ctx.org.id, ctx)
+        cache.get(ctx.user.id, ctx.org.id)
+        cache.get(ctx.user.id, ctx.org.id)
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+        cache.clear()
+        assert cache.stats().hits == 0
+
+    def test_rejects_empty_cache(self):
+        """Test that max_size must be positive."""
+        with pytest.raises(ValueError, match="max_size"):
+            AuthCache(max_size=0)
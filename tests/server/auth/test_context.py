@@ -6,10 +6,23 @@ from uuid import uuid4
 import pytest
 from fastapi import HTTPException
 
-from voiceobs.server.auth.context import AuthContext, get_auth_context
+from voiceobs.server.auth.cache import AuthCache
+from voiceobs.server.auth.context import AuthContext, get_auth_context, require_org_membership
 from voiceobs.server.db.models import OrganizationRow, UserRow
 
 
+@pytest.fixture(autouse=True)
+def auth_cache():
+    """Use a fresh auth cache and accept any bearer token for a random subject."""
+    cache = AuthCache(ttl_seconds=30.0, max_size=100)
+    with patch("voiceobs.server.auth.context.get_auth_cache", return_value=cache):
+        with patch(
+            "voiceobs.server.auth.context.decode_bearer_token",
+            return_value={"sub": str(uuid4())},
+        ):
+            yield cache
+
+
 class TestAuthContext:
     """Tests for AuthContext dataclass."""
 
@@ -45,7 +58,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=True)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -83,7 +96,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=True)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -118,7 +131,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=False)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -143,7 +156,7 @@ class TestGetAuthContext:
 
         user = UserRow(id=user_id, email="test@example.com", last_active_org_id=None)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with pytest.raises(HTTPException) as exc_info:
                 await get_auth_context(
                     x_organization_id=None,
@@ -164,7 +177,7 @@ class TestGetAuthContext:
         mock_org_repo = AsyncMock()
         mock_org_repo.get = AsyncMock(return_value=None)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -185,7 +198,7 @@ class TestGetAuthContext:
 
         user = UserRow(id=user_id, email="test@example.com")
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with pytest.raises(HTTPException) as exc_info:
                 await get_auth_context(
                     x_organization_id="not-a-valid-uuid",
@@ -214,7 +227,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=True)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -252,7 +265,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=True)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -288,7 +301,7 @@ class TestGetAuthContext:
         mock_member_repo = AsyncMock()
         mock_member_repo.is_member = AsyncMock(return_value=True)
 
-        with patch("voiceobs.server.auth.context.get_current_user", return_value=user):
+        with patch("voiceobs.server.auth.context.load_user", return_value=user):
             with patch(
                 "voiceobs.server.auth.context.get_organization_repository",
                 return_value=mock_org_repo,
@@ -309,3 +322,120 @@ class TestGetAuthContext:
         # Should still return valid context even without updating last_active_org_id
         assert ctx.user == user
         assert ctx.org == org
+
+
+class TestAuthContextCaching:
+    """Tests for serving repeated auth lookups from the auth cache."""
+
+    def _patch_repos(self, user, org, is_member=True):
+        """Patch load_user and the repositories, returning the mocks."""
+        mock_load_user = AsyncMock(return_value=user)
+        mock_org_repo = AsyncMock()
+        mock_org_repo.get = AsyncMock(return_value=org)
+        mock_member_repo = AsyncMock()
+        mock_member_repo.is_member = AsyncMock(return_value=is_member)
+        mock_user_repo = AsyncMock()
+        patches = [
+            patch("voiceobs.server.auth.context.load_user", mock_load_user),
+            patch(
+                "voiceobs.server.auth.context.get_organization_repository",
+                return_value=mock_org_repo,
+            ),
+            patch(
+                "voiceobs.server.auth.context.get_organization_member_repository",
+                return_value=mock_member_repo,
+            ),
+            patch("voiceobs.server.auth.context.get_user_repository", return_value=mock_user_repo),
+        ]
+        for p in patches:
+            p.start()
+        return patches, mock_load_user, mock_org_repo, mock_member_repo
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_database(self, auth_cache):
+        """Test that a second request for the same org is served from the cache."""
+        user_id = uuid4()
+        org_id = uuid4()
+        user = UserRow(id=user_id, email="test@example.com", last_active_org_id=org_id)
+        org = OrganizationRow(id=org_id, name="Test Org", created_by=user_id)
+        patches, load_user, org_repo, member_repo = self._patch_repos(user, org)
+        try:
+            first = await get_auth_context(x_organization_id=str(org_id), authorization="Bearer t")
+            second = await get_auth_context(x_organization_id=str(org_id), authorization="Bearer t")
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert second is first
+        assert load_user.await_count == 1
+        assert org_repo.get.await_count == 1
+        assert member_repo.is_member.await_count == 1
+        stats = auth_cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_require_org_membership_uses_cache(self, auth_cache):
+        """Test that require_org_membership shares the cache with get_auth_context."""
+        user_id = uuid4()
+        org_id = uuid4()
+        user = UserRow(id=user_id, email="test@example.com", last_active_org_id=org_id)
+        org = OrganizationRow(id=org_id, name="Test Org", created_by=user_id)
+        patches, load_user, _, _ = self._patch_repos(user, org)
+        try:
+            await get_auth_context(x_organization_id=str(org_id), authorization="Bearer t")
+            ctx = await require_org_membership(org_id=org_id, authorization="Bearer t")
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert ctx.org == org
+        assert load_user.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_membership_is_checked_again(self, auth_cache):
+        """Test that invalidating a user's membership forces a fresh membership check."""
+        user_id = uuid4()
+        org_id = uuid4()
+        user = UserRow(id=user_id, email="test@example.com", last_active_org_id=org_id)
+        org = OrganizationRow(id=org_id, name="Test Org", created_by=user_id)
+        patches, _, _, member_repo = self._patch_repos(user, org)
+        # The token's subject is the user being invalidated
+        patches.append(
+            patch(
+                "voiceobs.server.auth.context.decode_bearer_token",
+                return_value={"sub": str(user_id)},
+            )
+        )
+        patches[-1].start()
+        try:
+            await require_org_membership(org_id=org_id, authorization="Bearer t")
+            member_repo.is_member.return_value = False
+            auth_cache.invalidate(user_id, org_id)
+            with pytest.raises(HTTPException) as exc_info:
+                await require_org_membership(org_id=org_id, authorization="Bearer t")
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, auth_cache):
+        """Test that a rejected membership is not cached."""
+        user_id = uuid4()
+        org_id = uuid4()
+        user = UserRow(id=user_id, email="test@example.com")
+        org = OrganizationRow(id=org_id, name="Test Org", created_by=uuid4())
+        patches, _, _, member_repo = self._patch_repos(user, org, is_member=False)
+        try:
+            with pytest.raises(HTTPException):
+                await require_org_membership(org_id=org_id, authorization="Bearer t")
+            member_repo.is_member.return_value = True
+            ctx = await require_org_membership(org_id=org_id, authorization="Bearer t")
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert ctx.org == org
+        assert auth_cache.stats().size == 1
@@ -1,17 +1,22 @@
 """Tests for JWT validation using JWKS."""
 
+import asyncio
+import json
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from jose.exceptions import JWKError
 
 from voiceobs.server.auth.jwt import (
+    JWKSManager,
     JWTValidationError,
-    _fetch_jwks,
     clear_jwks_cache,
     decode_supabase_jwt,
+    get_jwks_manager,
     get_supabase_url,
 )
 
@@ -66,49 +71,156 @@ def test_get_supabase_url_raises_when_not_set():
             get_supabase_url()
 
 
-def test_fetch_jwks_success():
-    """Test fetching JWKS from Supabase."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_JWKS
-    mock_response.raise_for_status = MagicMock()
+class JWKSStub:
+    """Local JWKS HTTP endpoint that counts requests."""
+
+    def __init__(self, jwks: dict) -> None:
+        self.jwks = jwks
+        self.body: bytes | None = None
+        self.status = 200
+        self.delay = 0.0
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                stub.requests += 1
+                time.sleep(stub.delay)
+                body = stub.body if stub.body is not None else json.dumps(stub.jwks).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/jwks.json"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def jwks_stub():
+    """Serve MOCK_JWKS from a local HTTP server."""
+    stub = JWKSStub(MOCK_JWKS)
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def mock_jwks_manager():
+    """Patch the JWKS manager so decode tests do not fetch keys."""
+    manager = MagicMock()
+    manager.get_jwks = AsyncMock(return_value=MOCK_JWKS)
+    manager.get_key = AsyncMock(return_value=MOCK_JWKS["keys"][0])
+    with patch("voiceobs.server.auth.jwt.get_jwks_manager", return_value=manager):
+        yield manager
+
+
+class TestJWKSManager:
+    """Tests for JWKSManager against a local JWKS endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_and_caches_jwks(self, jwks_stub):
+        """Test that keys are fetched once and then served from the cache."""
+        manager = JWKSManager(jwks_stub.url)
+
+        assert await manager.get_jwks() == MOCK_JWKS
+        assert await manager.get_jwks() == MOCK_JWKS
+        assert jwks_stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_start_fetches_once(self, jwks_stub):
+        """Test that concurrent callers share a single in-flight fetch."""
+        jwks_stub.delay = 0.2
+        manager = JWKSManager(jwks_stub.url)
+
+        results = await asyncio.gather(*(manager.get_jwks() for _ in range(20)))
+
+        assert all(result == MOCK_JWKS for result in results)
+        assert jwks_stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self, jwks_stub):
+        """Test that near-expiry keys are served while a refresh runs in the background."""
+        manager = JWKSManager(jwks_stub.url, ttl=60, refresh_before=10)
+        await manager.get_jwks()
+        manager._fetched_at -= 55
+        rotated = {"keys": [{**MOCK_JWKS["keys"][0], "kid": "rotated"}]}
+        jwks_stub.jwks = rotated
+
+        assert await manager.get_jwks() == MOCK_JWKS
+        await manager._refresh_task
+
+        assert jwks_stub.requests == 2
+        assert await manager.get_jwks() == rotated
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_triggers_refresh(self, jwks_stub):
+        """Test that a token signed with an unknown key ID refreshes the keys."""
+        manager = JWKSManager(jwks_stub.url, min_refresh_interval=0)
+        await manager.get_jwks()
+        new_key = {**MOCK_JWKS["keys"][0], "kid": "new-key-id"}
+        jwks_stub.jwks = {"keys": [new_key]}
+
+        assert await manager.get_key("new-key-id") == new_key
+        assert jwks_stub.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refresh_is_rate_limited(self, jwks_stub):
+        """Test that unknown key IDs do not refetch within min_refresh_interval."""
+        manager = JWKSManager(jwks_stub.url, min_refresh_interval=60)
+
+        assert await manager.get_key("missing") is None
+        assert await manager.get_key("missing") is None
+        assert jwks_stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_keys(self, jwks_stub):
+        """Test that a failed refresh falls back to the previously fetched keys."""
+        manager = JWKSManager(jwks_stub.url)
+        await manager.get_jwks()
+        jwks_stub.status = 500
+
+        assert await manager.refresh() == MOCK_JWKS
 
-    with patch("voiceobs.server.auth.jwt.httpx.Client") as mock_client:
-        mock_client_instance = MagicMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.__enter__ = MagicMock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = MagicMock(return_value=False)
-        mock_client.return_value = mock_client_instance
+    @pytest.mark.asyncio
+    async def test_failed_fetch_without_keys_raises(self, jwks_stub):
+        """Test that a failed first fetch raises JWTValidationError."""
+        jwks_stub.status = 500
+        manager = JWKSManager(jwks_stub.url)
+
+        with pytest.raises(JWTValidationError, match="Failed to fetch JWKS"):
+            await manager.get_jwks()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b"<html>maintenance</html>", b"[]"])
+    async def test_malformed_jwks_raises(self, jwks_stub, body):
+        """Test that a response that is not a JSON object raises JWTValidationError."""
+        jwks_stub.body = body
+        manager = JWKSManager(jwks_stub.url)
+
+        with pytest.raises(JWTValidationError, match="Failed to fetch JWKS"):
+            await manager.get_jwks()
 
-        jwks = _fetch_jwks(TEST_SUPABASE_URL)
-        assert jwks == MOCK_JWKS
-        mock_client_instance.get.assert_called_once_with(
-            f"{TEST_SUPABASE_URL}/auth/v1/.well-known/jwks.json"
-        )
+
+def test_get_jwks_manager_uses_supabase_jwks_url():
+    """Test that managers are shared per project and use the Supabase JWKS path."""
+    manager = get_jwks_manager(TEST_SUPABASE_URL)
+
+    assert manager is get_jwks_manager(TEST_SUPABASE_URL)
+    assert manager.jwks_url == f"{TEST_SUPABASE_URL}/auth/v1/.well-known/jwks.json"
 
 
-def test_fetch_jwks_caches_result():
-    """Test that JWKS is cached."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_JWKS
-    mock_response.raise_for_status = MagicMock()
-
-    with patch("voiceobs.server.auth.jwt.httpx.Client") as mock_client:
-        mock_client_instance = MagicMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.__enter__ = MagicMock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = MagicMock(return_value=False)
-        mock_client.return_value = mock_client_instance
-
-        # First call should fetch
-        _fetch_jwks(TEST_SUPABASE_URL)
-        # Second call should use cache
-        _fetch_jwks(TEST_SUPABASE_URL)
-
-        # Should only be called once due to caching
-        assert mock_client_instance.get.call_count == 1
-
-
-def test_decode_jwt_with_mocked_jwks():
+@pytest.mark.asyncio
+async def test_decode_jwt_with_mocked_jwks(mock_jwks_manager):
     """Test decoding a JWT with mocked JWKS verification."""
     user_id = str(uuid4())
     expected_payload = {
@@ -119,108 +231,108 @@ def test_decode_jwt_with_mocked_jwks():
         "iat": int(time.time()),
     }
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
-        with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
-        ):
-            with patch("voiceobs.server.auth.jwt.jwt.decode", return_value=expected_payload):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    payload = decode_supabase_jwt("test-token")
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
+        with patch("voiceobs.server.auth.jwt.jwt.decode", return_value=expected_payload):
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                payload = await decode_supabase_jwt("test-token")
 
-                    assert payload["sub"] == user_id
-                    assert payload["email"] == "test@example.com"
+                assert payload["sub"] == user_id
+                assert payload["email"] == "test@example.com"
 
 
-def test_decode_expired_token():
+@pytest.mark.asyncio
+async def test_decode_expired_token(mock_jwks_manager):
     """Test decoding an expired JWT raises JWTValidationError."""
     from jose import JWTError
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
         with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWTError("Signature has expired"),
         ):
-            with patch(
-                "voiceobs.server.auth.jwt.jwt.decode",
-                side_effect=JWTError("Signature has expired"),
-            ):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    with pytest.raises(JWTValidationError, match="expired"):
-                        decode_supabase_jwt("expired-token")
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                with pytest.raises(JWTValidationError, match="expired"):
+                    await decode_supabase_jwt("expired-token")
 
 
-def test_decode_invalid_signature():
+@pytest.mark.asyncio
+async def test_decode_invalid_signature(mock_jwks_manager):
     """Test decoding a JWT with invalid signature."""
     from jose import JWTError
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
         with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWTError("Signature verification failed"),
         ):
-            with patch(
-                "voiceobs.server.auth.jwt.jwt.decode",
-                side_effect=JWTError("Signature verification failed"),
-            ):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    with pytest.raises(JWTValidationError, match="signature"):
-                        decode_supabase_jwt("bad-signature-token")
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                with pytest.raises(JWTValidationError, match="signature"):
+                    await decode_supabase_jwt("bad-signature-token")
 
 
-def test_decode_invalid_audience():
+@pytest.mark.asyncio
+async def test_decode_invalid_audience(mock_jwks_manager):
     """Test decoding a JWT with invalid audience."""
     from jose import JWTError
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
         with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWTError("Invalid audience"),
         ):
-            with patch(
-                "voiceobs.server.auth.jwt.jwt.decode",
-                side_effect=JWTError("Invalid audience"),
-            ):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    with pytest.raises(JWTValidationError, match="audience"):
-                        decode_supabase_jwt("wrong-audience-token")
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                with pytest.raises(JWTValidationError, match="audience"):
+                    await decode_supabase_jwt("wrong-audience-token")
 
 
-def test_decode_malformed_token():
+@pytest.mark.asyncio
+async def test_decode_malformed_token(mock_jwks_manager):
     """Test decoding a malformed JWT."""
     from jose import JWTError
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
         with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWTError("Invalid token"),
         ):
-            with patch(
-                "voiceobs.server.auth.jwt.jwt.decode",
-                side_effect=JWTError("Invalid token"),
-            ):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    with pytest.raises(JWTValidationError):
-                        decode_supabase_jwt("not-a-valid-jwt")
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                with pytest.raises(JWTValidationError):
+                    await decode_supabase_jwt("not-a-valid-jwt")
 
 
-def test_decode_jwk_error():
+@pytest.mark.asyncio
+async def test_decode_jwk_error(mock_jwks_manager):
     """Test handling JWK errors."""
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS):
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
         with patch(
-            "voiceobs.server.auth.jwt.jwt.get_unverified_header",
-            return_value=MOCK_HEADER,
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWKError("Invalid key"),
         ):
-            with patch(
-                "voiceobs.server.auth.jwt.jwt.decode",
-                side_effect=JWKError("Invalid key"),
-            ):
-                with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
-                    with pytest.raises(JWTValidationError, match="Invalid key"):
-                        decode_supabase_jwt("test-token")
+            with patch.dict("os.environ", {"SUPABASE_URL": TEST_SUPABASE_URL}):
+                with pytest.raises(JWTValidationError, match="Invalid key"):
+                    await decode_supabase_jwt("test-token")
 
 
-def test_decode_with_explicit_url():
+@pytest.mark.asyncio
+async def test_decode_with_explicit_url():
     """Test decoding with explicitly provided Supabase URL."""
     user_id = str(uuid4())
     expected_payload = {
@@ -229,13 +341,89 @@ def test_decode_with_explicit_url():
         "aud": "authenticated",
     }
 
-    with patch("voiceobs.server.auth.jwt._fetch_jwks", return_value=MOCK_JWKS) as mock_fetch:
+    manager = MagicMock()
+    manager.get_jwks = AsyncMock(return_value=MOCK_JWKS)
+
+    with patch("voiceobs.server.auth.jwt.get_jwks_manager", return_value=manager) as mock_get:
         with patch(
             "voiceobs.server.auth.jwt.jwt.get_unverified_header",
             return_value=MOCK_HEADER,
         ):
             with patch("voiceobs.server.auth.jwt.jwt.decode", return_value=expected_payload):
-                payload = decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+                payload = await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
 
                 assert payload["sub"] == user_id
-                mock_fetch.assert_called_once_with(TEST_SUPABASE_URL)
+                mock_get.assert_called_once_with(TEST_SUPABASE_URL)
+
+
+@pytest.mark.asyncio
+async def test_decode_uses_key_matching_kid(mock_jwks_manager):
+    """Test that a token with a kid is verified against that key only."""
+    payload = {"sub": str(uuid4()), "aud": "authenticated", "exp": int(time.time()) + 3600}
+    key = MOCK_JWKS["keys"][0]
+
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value={"alg": "ES256", "kid": "test-key-id"},
+    ):
+        with patch("voiceobs.server.auth.jwt.jwt.decode", return_value=payload) as mock_decode:
+            await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+
+    mock_jwks_manager.get_key.assert_awaited_once_with("test-key-id")
+    assert mock_decode.call_args.args[1] == {"keys": [key]}
+
+
+@pytest.mark.asyncio
+async def test_decode_unknown_kid_fails(mock_jwks_manager):
+    """Test that a token signed with an unpublished key is rejected."""
+    mock_jwks_manager.get_key.return_value = None
+
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value={"alg": "ES256", "kid": "unknown"},
+    ):
+        with pytest.raises(JWTValidationError, match="Unknown signing key"):
+            await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+
+
+@pytest.mark.asyncio
+async def test_decode_caches_verified_token_until_exp(mock_jwks_manager):
+    """Test that verified claims are reused for the same token until it expires."""
+    payload = {"sub": str(uuid4()), "aud": "authenticated", "exp": int(time.time()) + 3600}
+
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
+        with patch("voiceobs.server.auth.jwt.jwt.decode", return_value=payload) as mock_decode:
+            first = await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+            second = await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+            await decode_supabase_jwt("other-token", supabase_url=TEST_SUPABASE_URL)
+
+            assert first == second == payload
+            assert mock_decode.call_count == 2
+
+            with patch("voiceobs.server.auth.jwt.time.time", return_value=payload["exp"]):
+                await decode_supabase_jwt("test-token", supabase_url=TEST_SUPABASE_URL)
+
+            assert mock_decode.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_decode_does_not_cache_failures(mock_jwks_manager):
+    """Test that a rejected token is verified again on the next request."""
+    from jose import JWTError
+
+    with patch(
+        "voiceobs.server.auth.jwt.jwt.get_unverified_header",
+        return_value=MOCK_HEADER,
+    ):
+        with patch(
+            "voiceobs.server.auth.jwt.jwt.decode",
+            side_effect=JWTError("Signature verification failed"),
+        ) as mock_decode:
+            for _ in range(2):
+                with pytest.raises(JWTValidationError):
+                    await decode_supabase_jwt("bad-token", supabase_url=TEST_SUPABASE_URL)
+
+    assert mock_decode.call_count == 2
@@ -97,13 +97,25 @@ def prevent_database_access(request, monkeypatch):
                 self.spans[new_span_id] = span
                 return new_span_id
 
+            async def add_spans(self, spans: list[dict]):
+                """Add a batch of spans and return their IDs."""
+                return [await self.add_span(**span) for span in spans]
+
             async def get_span(self, span_id):
                 """Get a span by ID."""
                 return self.spans.get(span_id)
 
-            async def get_all_spans(self):
-                """Get all spans."""
-                return list(self.spans.values())
+            async def get_all_spans(self, limit=None, cursor=None):
+                """Get spans newest first, optionally one page after a cursor."""
+                from voiceobs.server.db.pagination import Cursor
+
+                spans = sorted(
+                    self.spans.values(), key=lambda s: (s.created_at, s.id), reverse=True
+                )
+                if cursor is not None:
+                    after = Cursor.decode(cursor, "created_at")
+                    spans = [s for s in spans if (s.created_at, s.id) < (after.value, after.id)]
+                return spans[:limit]
 
             async def get_spans_as_dicts(self, **kwargs):
                 """Get spans as dicts with optional filtering."""
@@ -122,10 +134,45 @@ def prevent_database_access(request, monkeypatch):
                     for span in self.spans.values()
                 ]
 
+            async def get_conversation_spans_as_dicts(self, conversation_id: str):
+                """Get one conversation's spans as dicts."""
+                return [
+                    span
+                    for span in await self.get_spans_as_dicts()
+                    if span["attributes"].get("voice.conversation.id") == conversation_id
+                ]
+
+            async def iter_spans(self, conversation_id=None, since=None, until=None):
+                """Stream spans as export dicts, oldest first."""
+                for span in sorted(self.spans.values(), key=lambda s: (s.created_at, s.id)):
+                    if (
+                        conversation_id is not None
+                        and span.attributes.get("voice.conversation.id") != conversation_id
+                    ):
+                        continue
+                    if since is not None and (span.start_time is None or span.start_time < since):
+                        continue
+                    if until is not None and (span.start_time is None or span.start_time >= until):
+                        continue
+                    yield {
+                        "name": span.name,
+                        "start_time": span.start_time.isoformat() if span.start_time else None,
+                        "end_time": span.end_time.isoformat() if span.end_time else None,
+                        "duration_ms": span.duration_ms,
+                        "attributes": span.attributes,
+                        "trace_id": span.trace_id,
+                        "span_id": span.span_id,
+                        "parent_span_id": span.parent_span_id,
+                    }
+
             async def count(self):
                 """Get count of spans."""
                 return len(self.spans)
 
+            async def estimate_count(self):
+                """Get estimated count of spans."""
+                return len(self.spans)
+
             async def clear(self):
                 """Clear all spans."""
                 count = len(self.spans)
@@ -46,6 +46,33 @@ class TestConversationRepository:
         mock_db.execute.assert_called_once()
         assert "INSERT INTO conversations" in mock_db.execute.call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_get_or_create_many(self, mock_db):
+        """Test get_or_create_many resolves all IDs with one upsert."""
+        repo = ConversationRepository(mock_db)
+        id_a, id_b = uuid4(), uuid4()
+        mock_db.fetch.return_value = [
+            MockRecord({"id": id_a, "conversation_id": "conv-a"}),
+            MockRecord({"id": id_b, "conversation_id": "conv-b"}),
+        ]
+
+        result = await repo.get_or_create_many(["conv-b", "conv-a", "conv-b"])
+
+        assert result == {"conv-a": id_a, "conv-b": id_b}
+        mock_db.fetch.assert_called_once()
+        call_args = mock_db.fetch.call_args[0]
+        assert "ON CONFLICT (conversation_id)" in call_args[0]
+        assert "RETURNING" in call_args[0]
+        assert call_args[1] == ["conv-a", "conv-b"]
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_many_empty(self, mock_db):
+        """Test get_or_create_many skips the query when there are no IDs."""
+        repo = ConversationRepository(mock_db)
+
+        assert await repo.get_or_create_many([]) == {}
+        mock_db.fetch.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_conversation(self, mock_db):
         """Test getting a conversation by UUID."""
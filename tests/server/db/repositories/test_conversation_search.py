@@ -1,14 +1,21 @@
 """Additional tests for ConversationRepository search functionality."""
 
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.pagination import Cursor
 from voiceobs.server.db.repositories.conversation import ConversationRepository
 
 from .conftest import MockRecord
 
+TEST_DATABASE_URL = os.environ.get("VOICEOBS_TEST_DATABASE_URL")
+
+T0 = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+
 
 class TestConversationRepositorySearch:
     """Tests for ConversationRepository search functionality."""
@@ -25,6 +32,7 @@ class TestConversationRepositorySearch:
                     "span_count": 5,
                     "turn_count": 3,
                     "has_failures": False,
+                    "sort_value": T0,
                 }
             )
         ]
@@ -104,8 +112,7 @@ class TestConversationRepositorySearch:
 
         assert len(results) == 0
         query = mock_db.fetch.call_args[0][0]
-        assert "EXISTS" in query
-        assert "failures" in query.lower()
+        assert "cs.failure_count > 0" in query
 
     @pytest.mark.asyncio
     async def test_search_with_has_failures_false(self, mock_db):
@@ -118,8 +125,7 @@ class TestConversationRepositorySearch:
 
         assert len(results) == 0
         query = mock_db.fetch.call_args[0][0]
-        assert "NOT EXISTS" in query
-        assert "failures" in query.lower()
+        assert "cs.failure_count = 0" in query
 
     @pytest.mark.asyncio
     async def test_search_with_failure_type(self, mock_db):
@@ -181,8 +187,7 @@ class TestConversationRepositorySearch:
 
         assert len(results) == 0
         query = mock_db.fetch.call_args[0][0]
-        assert "MIN(span_times.start_time)" in query
-        assert "ASC" in query
+        assert "ORDER BY cs.first_start_time ASC, cs.conversation_id ASC" in query
 
     @pytest.mark.asyncio
     async def test_search_sort_by_latency(self, mock_db):
@@ -195,8 +200,7 @@ class TestConversationRepositorySearch:
 
         assert len(results) == 0
         query = mock_db.fetch.call_args[0][0]
-        assert "AVG(span_times.duration_ms)" in query
-        assert "DESC" in query
+        assert "ORDER BY cs.avg_duration_ms DESC, cs.conversation_id DESC" in query
 
     @pytest.mark.asyncio
     async def test_search_sort_by_relevance(self, mock_db):
@@ -256,6 +260,7 @@ class TestConversationRepositorySearch:
                     "span_count": 5,
                     "turn_count": 3,
                     "has_failures": True,
+                    "sort_value": T0,
                 }
             )
         ]
@@ -268,6 +273,58 @@ class TestConversationRepositorySearch:
         assert results[0]["span_count"] == 5
         assert results[0]["turn_count"] == 3
         assert results[0]["has_failures"] is True
+        assert Cursor.decode(results[0]["cursor"], "start_time") == Cursor(
+            "start_time", T0, conv_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_with_cursor(self, mock_db):
+        """Test a cursor adds a keyset condition to the page but not to the count."""
+        repo = ConversationRepository(mock_db)
+        mock_db.fetch.return_value = []
+        mock_db.fetchval.return_value = 7
+        conv_id = uuid4()
+        cursor = Cursor("latency", 120.5, conv_id).encode()
+
+        results, total = await repo.search(
+            has_failures=True, sort="latency", sort_order="asc", limit=10, cursor=cursor
+        )
+
+        assert total == 7
+        query, *params = mock_db.fetch.call_args[0]
+        assert (
+            "((cs.avg_duration_ms, cs.conversation_id) > ($1, $2) OR cs.avg_duration_ms IS NULL)"
+            in query
+        )
+        assert "LIMIT $3 OFFSET $4" in query
+        assert params == [120.5, conv_id, 10, 0]
+        count_query, *count_params = mock_db.fetchval.call_args[0]
+        assert "avg_duration_ms" not in count_query
+        assert count_params == []
+
+    @pytest.mark.asyncio
+    async def test_search_rejects_cursor_for_other_sort(self, mock_db):
+        """Test a cursor created for one sort cannot page another."""
+        repo = ConversationRepository(mock_db)
+        cursor = Cursor("latency", 120.5, uuid4()).encode()
+
+        with pytest.raises(ValueError, match="latency"):
+            await repo.search(sort="start_time", cursor=cursor)
+        mock_db.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_approximate_total(self, mock_db):
+        """Test the approximate total comes from the planner estimate."""
+        repo = ConversationRepository(mock_db)
+        mock_db.fetch.return_value = []
+        mock_db.fetchval.return_value = '[{"Plan": {"Plan Rows": 1234}}]'
+
+        _, total = await repo.search(query="refund", approximate_total=True)
+
+        assert total == 1234
+        explain_query, *explain_params = mock_db.fetchval.call_args[0]
+        assert explain_query.startswith("EXPLAIN (FORMAT JSON) SELECT 1")
+        assert explain_params == ["%refund%", "refund"]
 
     @pytest.mark.asyncio
     async def test_search_count_query_excludes_limit_offset(self, mock_db):
@@ -407,9 +464,7 @@ class TestConversationRepositorySearch:
 
         repo._add_has_failures_condition(True, conditions)
 
-        assert len(conditions) == 1
-        assert "EXISTS" in conditions[0]
-        assert "NOT EXISTS" not in conditions[0]
+        assert conditions == ["cs.failure_count > 0"]
 
     @pytest.mark.asyncio
     async def test_add_has_failures_condition_false(self, mock_db):
@@ -419,8 +474,7 @@ class TestConversationRepositorySearch:
 
         repo._add_has_failures_condition(False, conditions)
 
-        assert len(conditions) == 1
-        assert "NOT EXISTS" in conditions[0]
+        assert conditions == ["cs.failure_count = 0"]
 
     @pytest.mark.asyncio
     async def test_add_failure_type_condition(self, mock_db):
@@ -459,8 +513,7 @@ class TestConversationRepositorySearch:
 
         order_by = repo._build_order_by("start_time", "asc", None, None)
 
-        assert "MIN(span_times.start_time)" in order_by
-        assert "ASC" in order_by
+        assert order_by == "cs.first_start_time ASC, cs.conversation_id ASC"
 
     @pytest.mark.asyncio
     async def test_build_order_by_latency(self, mock_db):
@@ -469,8 +522,7 @@ class TestConversationRepositorySearch:
 
         order_by = repo._build_order_by("latency", "desc", None, None)
 
-        assert "AVG(span_times.duration_ms)" in order_by
-        assert "DESC" in order_by
+        assert order_by == "cs.avg_duration_ms DESC, cs.conversation_id DESC"
 
     @pytest.mark.asyncio
     async def test_build_order_by_relevance(self, mock_db):
@@ -500,3 +552,150 @@ class TestConversationRepositorySearch:
 
         assert "c.created_at" in order_by
         assert "ASC" in order_by
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="Set VOICEOBS_TEST_DATABASE_URL to a scratch PostgreSQL database",
+)
+class TestConversationSummariesPostgres:
+    """Check trigger-maintained summaries and search on a real database.
+
+    These tests truncate the conversations, spans, turns and failures tables.
+    """
+
+    # Appending transcripts with || shifts lexeme positions, which search ignores
+    SUMMARY_QUERY = """
+        SELECT conversation_id, span_count, turn_count, failure_count,
+               first_start_time, last_start_time, duration_sum, duration_count,
+               avg_duration_ms, max_duration_ms, strip(search_vector)::text AS search_vector
+        FROM conversation_summaries
+        ORDER BY conversation_id
+    """
+
+    @pytest.fixture
+    async def db(self):
+        db = Database(database_url=TEST_DATABASE_URL, min_pool_size=1, max_pool_size=2)
+        await db.connect()
+        await db.init_schema()
+        await db.execute("TRUNCATE failures, turns, spans, conversations CASCADE")
+        yield db
+        await db.disconnect()
+
+    async def seed(self, db) -> list:
+        """Insert three conversations with spans, turns and one failure."""
+        ids = [
+            await db.fetchval(
+                "INSERT INTO conversations (conversation_id) VALUES ($1) RETURNING id", name
+            )
+            for name in ("conv-a", "conv-b", "conv-c")
+        ]
+        # conv-a: early and slow, conv-b: late and fast, conv-c: no spans yet
+        await db.execute(
+            """
+            INSERT INTO spans (name, start_time, duration_ms, conversation_id)
+            VALUES ('voice.llm', $1, 900, $3), ('voice.tts', $1 + interval '1 minute', 100, $3),
+                   ('voice.llm', $2, 50, $4), ('voice.tts', $2, 30, $4)
+            """,
+            T0,
+            T0 + timedelta(hours=1),
+            ids[0],
+            ids[1],
+        )
+        await db.execute(
+            """
+            INSERT INTO turns (conversation_id, span_id, actor, turn_id, turn_index, transcript)
+            SELECT t.conversation_id, s.id, t.actor, t.turn_id, t.turn_index, t.transcript
+            FROM (VALUES ($1::uuid, 'user', 't1', 0, 'I need to reschedule my appointment'),
+                         ($1::uuid, 'agent', 't2', 1, 'Sure, which day works?'),
+                         ($2::uuid, 'user', 't1', 0, 'What is my account balance'))
+                AS t (conversation_id, actor, turn_id, turn_index, transcript)
+            JOIN spans s ON s.conversation_id = t.conversation_id AND s.name = 'voice.tts'
+            """,
+            ids[0],
+            ids[1],
+        )
+        await db.execute(
+            """
+            INSERT INTO failures (conversation_id, failure_type, severity, message)
+            VALUES ($1, 'slow_response', 'high', 'LLM took 900ms')
+            """,
+            ids[0],
+        )
+        return ids
+
+    async def assert_summaries_match_refresh(self, db) -> list:
+        """Incrementally maintained rows must equal a full recompute."""
+        maintained = [dict(r) for r in await db.fetch(self.SUMMARY_QUERY)]
+        await db.execute(
+            "SELECT refresh_conversation_summaries(ARRAY(SELECT id FROM conversations))"
+        )
+        assert maintained == [dict(r) for r in await db.fetch(self.SUMMARY_QUERY)]
+        return maintained
+
+    async def test_triggers_keep_summaries_current(self, db):
+        """Test inserts, updates, deletes and truncates are reflected in summaries."""
+        ids = await self.seed(db)
+        rows = {r["conversation_id"]: r for r in await self.assert_summaries_match_refresh(db)}
+        assert rows[ids[0]]["span_count"] == 2
+        assert rows[ids[0]]["turn_count"] == 2
+        assert rows[ids[0]]["failure_count"] == 1
+        assert rows[ids[0]]["avg_duration_ms"] == 500
+        assert rows[ids[0]]["max_duration_ms"] == 900
+        assert rows[ids[2]]["span_count"] == 0
+        assert rows[ids[2]]["first_start_time"] is None
+
+        await db.execute("UPDATE spans SET conversation_id = $1 WHERE duration_ms = 900", ids[2])
+        await db.execute("DELETE FROM failures")
+        await db.execute("DELETE FROM turns WHERE turn_id = 't2'")
+        rows = {r["conversation_id"]: r for r in await self.assert_summaries_match_refresh(db)}
+        assert rows[ids[0]]["max_duration_ms"] == 100
+        assert rows[ids[2]]["max_duration_ms"] == 900
+        assert rows[ids[0]]["failure_count"] == 0
+
+        await db.execute("TRUNCATE turns, spans CASCADE")
+        rows = await self.assert_summaries_match_refresh(db)
+        assert [r["span_count"] for r in rows] == [0, 0, 0]
+
+        await db.execute("DELETE FROM conversations WHERE id = $1", ids[0])
+        assert await db.fetchval("SELECT COUNT(*) FROM conversation_summaries") == 2
+
+    async def test_search_reads_summaries(self, db):
+        """Test filters, sorting and counts on maintained summaries."""
+        await self.seed(db)
+        repo = ConversationRepository(db)
+
+        results, total = await repo.search(sort="start_time", sort_order="asc")
+        assert total == 3
+        assert [r["id"] for r in results][:2] == ["conv-a", "conv-b"]
+        assert results[0] == {
+            "id": "conv-a",
+            "span_count": 2,
+            "turn_count": 2,
+            "has_failures": True,
+            "cursor": results[0]["cursor"],
+        }
+
+        results, total = await repo.search(query="appointment")
+        assert (total, [r["id"] for r in results]) == (1, ["conv-a"])
+
+        results, _ = await repo.search(query="conv-b", sort="relevance")
+        assert [r["id"] for r in results] == ["conv-b"]
+
+        results, _ = await repo.search(start_time=T0 + timedelta(minutes=30))
+        assert [r["id"] for r in results] == ["conv-b"]
+
+        results, _ = await repo.search(end_time=T0 + timedelta(minutes=30))
+        assert [r["id"] for r in results] == ["conv-a"]
+
+        results, _ = await repo.search(min_latency_ms=500)
+        assert [r["id"] for r in results] == ["conv-a"]
+
+        results, total = await repo.search(has_failures=False, limit=1)
+        assert (total, len(results)) == (2, 1)
+
+        results, _ = await repo.search(sort="latency", sort_order="asc")
+        assert [r["id"] for r in results][:2] == ["conv-b", "conv-a"]
+
+        results, _ = await repo.search(actor="agent", failure_type="slow_response")
+        assert [r["id"] for r in results] == ["conv-a"]
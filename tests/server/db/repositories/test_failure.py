@@ -1,10 +1,12 @@
 """Tests for the FailureRepository class."""
 
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 import pytest
 
 from voiceobs.server.db.models import FailureRow
+from voiceobs.server.db.pagination import Cursor
 from voiceobs.server.db.repositories import FailureRepository
 
 from .conftest import MockRecord
@@ -56,6 +58,83 @@ class TestFailureRepository:
         assert call_args[9] == 5000.0
         assert call_args[10] == 3000.0
 
+    @pytest.mark.asyncio
+    async def test_add_many_uses_copy_in_transaction(self, mock_db):
+        """Test add_many writes all failures with a single COPY."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock
+
+        repo = FailureRepository(mock_db)
+        conv_id = uuid4()
+        turn_id = uuid4()
+        mock_conn = AsyncMock()
+
+        @asynccontextmanager
+        async def mock_transaction():
+            yield mock_conn
+
+        mock_db.transaction = mock_transaction
+
+        failure_ids = await repo.add_many(
+            [
+                {
+                    "failure_type": "excessive_silence",
+                    "severity": "high",
+                    "message": "Silence of 5000ms",
+                    "conversation_id": conv_id,
+                    "turn_id": turn_id,
+                    "turn_index": 2,
+                    "signal_name": "voice.silence.after_user_ms",
+                    "signal_value": 5000.0,
+                    "threshold": 3000.0,
+                },
+                {"failure_type": "interruption", "severity": "low", "message": "Interrupted"},
+            ]
+        )
+
+        assert len(failure_ids) == 2
+        mock_db.execute.assert_not_called()
+        call = mock_conn.copy_records_to_table.call_args
+        assert call[0][0] == "failures"
+        records = call[1]["records"]
+        assert [record[0] for record in records] == failure_ids
+        assert records[0][1:] == (
+            "excessive_silence",
+            "high",
+            "Silence of 5000ms",
+            conv_id,
+            turn_id,
+            2,
+            "voice.silence.after_user_ms",
+            5000.0,
+            3000.0,
+        )
+        assert records[1][4:] == (None,) * 6
+
+    @pytest.mark.asyncio
+    async def test_add_many_in_open_transaction(self, mock_db):
+        """Test add_many writes on a given connection without its own transaction."""
+        from unittest.mock import AsyncMock
+
+        repo = FailureRepository(mock_db)
+        mock_conn = AsyncMock()
+
+        await repo.add_many(
+            [{"failure_type": "slow_response", "severity": "low", "message": "Slow"}],
+            conn=mock_conn,
+        )
+
+        mock_db.transaction.assert_not_called()
+        assert mock_conn.copy_records_to_table.call_args[0][0] == "failures"
+
+    @pytest.mark.asyncio
+    async def test_add_many_empty(self, mock_db):
+        """Test add_many with no failures does not touch the database."""
+        repo = FailureRepository(mock_db)
+
+        assert await repo.add_many([]) == []
+        mock_db.transaction.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_failure(self, mock_db):
         """Test getting a failure by UUID."""
@@ -237,3 +316,98 @@ class TestFailureRepository:
         count = await repo.count()
 
         assert count == 20
+
+    @pytest.mark.asyncio
+    async def test_search_returns_external_ids_and_cursors(self, mock_db):
+        """Test a page of failures carries external IDs and a cursor per row."""
+        repo = FailureRepository(mock_db)
+        failure_id = uuid4()
+        created_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        mock_db.fetch.return_value = [
+            MockRecord(
+                {
+                    "id": failure_id,
+                    "failure_type": "slow_response",
+                    "severity": "high",
+                    "message": "LLM took 5000ms",
+                    "conversation_id": "conv-1",
+                    "turn_id": "turn-2",
+                    "turn_index": 2,
+                    "signal_name": "llm_ms",
+                    "signal_value": 5000.0,
+                    "threshold": 2000.0,
+                    "created_at": created_at,
+                }
+            )
+        ]
+
+        [failure] = await repo.search(limit=10)
+
+        assert failure["id"] == str(failure_id)
+        assert failure["type"] == "slow_response"
+        assert failure["conversation_id"] == "conv-1"
+        assert failure["turn_id"] == "turn-2"
+        assert Cursor.decode(failure["cursor"], "created_at") == Cursor(
+            "created_at", created_at, failure_id
+        )
+        query, *params = mock_db.fetch.call_args[0]
+        assert "WHERE" not in query
+        assert "ORDER BY f.created_at DESC, f.id DESC" in query
+        assert params == [10]
+
+    @pytest.mark.asyncio
+    async def test_search_with_filters_and_cursor(self, mock_db):
+        """Test filters and the cursor condition share parameter numbering."""
+        repo = FailureRepository(mock_db)
+        mock_db.fetch.return_value = []
+        created_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        failure_id = uuid4()
+        cursor = Cursor("created_at", created_at, failure_id).encode()
+
+        await repo.search(severity="high", failure_type="slow_response", limit=5, cursor=cursor)
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert (
+            "WHERE f.severity = $1 AND f.failure_type = $2 AND (f.created_at, f.id) < ($3, $4)"
+        ) in query
+        assert "LIMIT $5" in query
+        assert params == ["high", "slow_response", created_at, failure_id, 5]
+
+    @pytest.mark.asyncio
+    async def test_search_without_limit(self, mock_db):
+        """Test no limit returns every matching failure."""
+        repo = FailureRepository(mock_db)
+        mock_db.fetch.return_value = []
+
+        await repo.search(severity="high", limit=None)
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert "LIMIT" not in query
+        assert params == ["high"]
+
+    @pytest.mark.asyncio
+    async def test_get_counts(self, mock_db):
+        """Test filtered counts are folded by severity and by type."""
+        repo = FailureRepository(mock_db)
+        mock_db.fetch.return_value = [
+            MockRecord({"severity": "high", "failure_type": "slow_response", "count": 3}),
+            MockRecord({"severity": "high", "failure_type": "interruption", "count": 1}),
+            MockRecord({"severity": "low", "failure_type": "slow_response", "count": 2}),
+        ]
+
+        by_severity, by_type = await repo.get_counts()
+
+        assert by_severity == {"high": 4, "low": 2}
+        assert by_type == {"slow_response": 5, "interruption": 1}
+        assert "WHERE" not in mock_db.fetch.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_get_counts_with_filters(self, mock_db):
+        """Test counts only cover failures matching the filters."""
+        repo = FailureRepository(mock_db)
+        mock_db.fetch.return_value = []
+
+        assert await repo.get_counts(severity="high", failure_type="slow_response") == ({}, {})
+        query, *params = mock_db.fetch.call_args[0]
+        assert "WHERE severity = $1 AND failure_type = $2" in query
+        assert params == ["high", "slow_response"]
@@ -74,6 +74,24 @@ class TestMetricsRepository:
         assert end_time in mock_db.fetchrow.call_args[0][1:]
         assert "conv-1" in mock_db.fetchrow.call_args[0][1:]
 
+    @pytest.mark.asyncio
+    async def test_get_summary_aggregates_tables_independently(self, mock_db):
+        """Test get_summary aggregates spans, turns and failures without a fan-out join."""
+        repo = MetricsRepository(mock_db)
+        mock_db.fetchrow.return_value = None
+        start_time = datetime.now(timezone.utc)
+
+        await repo.get_summary(start_time=start_time, conversation_id="conv-1")
+
+        query = mock_db.fetchrow.call_args[0][0]
+        assert "LEFT JOIN" not in query
+        assert "span_stats AS" in query
+        assert "turn_stats AS" in query
+        assert "failure_stats AS" in query
+        # The time filter limits spans and the conversations counted
+        assert query.count("s.start_time >= $2") == 2
+        assert mock_db.fetchrow.call_args[0][1:] == ("conv-1", start_time)
+
     @pytest.mark.asyncio
     async def test_get_summary_none_result(self, mock_db):
         """Test get_summary when fetchrow returns None."""
@@ -0,0 +1,448 @@
+"""Tests for the MetricsRollupRepository class."""
+
+import json
+import math
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.repositories.metrics import MetricsRepository
+from voiceobs.server.db.repositories.metrics_rollup import MetricsRollupRepository, _Segment
+
+from .conftest import MockRecord
+
+TEST_DATABASE_URL = os.environ.get("VOICEOBS_TEST_DATABASE_URL")
+
+T0 = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def make_repo(mock_db, watermark):
+    """Create a rollup repository whose watermark query returns the given time."""
+    mock_db.fetchval.return_value = watermark
+    return MetricsRollupRepository(mock_db)
+
+
+class TestMetricsRollupPlan:
+    """Tests for splitting query ranges into rollup and raw segments."""
+
+    @pytest.mark.asyncio
+    async def test_never_refreshed(self, mock_db):
+        """Test rollups cannot answer before the first refresh."""
+        repo = make_repo(mock_db, None)
+
+        assert await repo._plan(None, None) is None
+        assert await repo.get_latency_breakdown() is None
+        assert await repo.get_trends("latency", "1h") is None
+        assert await repo.get_conversation_volume() is None
+        mock_db.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unbounded_range(self, mock_db):
+        """Test an unbounded range uses hours, then minutes, then raw rows."""
+        repo = make_repo(mock_db, T0 + timedelta(hours=2, minutes=30, seconds=15))
+
+        segments = await repo._plan(None, None)
+
+        assert segments == [
+            _Segment("hour", None, T0 + timedelta(hours=2)),
+            _Segment("minute", T0 + timedelta(hours=2), T0 + timedelta(hours=2, minutes=30)),
+            _Segment("raw", T0 + timedelta(hours=2, minutes=30), None, end_inclusive=True),
+            _Segment("untimed", None, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unaligned_range(self, mock_db):
+        """Test partial minutes at both ends are read from raw rows."""
+        repo = make_repo(mock_db, T0 + timedelta(days=1))
+        start = T0 + timedelta(minutes=50, seconds=10)
+        end = T0 + timedelta(hours=3, minutes=5, seconds=20)
+
+        segments = await repo._plan(start, end)
+
+        assert segments == [
+            _Segment("raw", start, T0 + timedelta(minutes=51)),
+            _Segment("minute", T0 + timedelta(minutes=51), T0 + timedelta(hours=1)),
+            _Segment("hour", T0 + timedelta(hours=1), T0 + timedelta(hours=3)),
+            _Segment("minute", T0 + timedelta(hours=3), T0 + timedelta(hours=3, minutes=5)),
+            _Segment("raw", T0 + timedelta(hours=3, minutes=5), end, end_inclusive=True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_range_within_an_hour(self, mock_db):
+        """Test a range without a whole hour only uses minute rollups."""
+        repo = make_repo(mock_db, T0 + timedelta(days=1))
+        start = T0 + timedelta(minutes=10)
+        end = T0 + timedelta(minutes=20)
+
+        segments = await repo._plan(start, end)
+
+        assert segments == [
+            _Segment("minute", start, end),
+            _Segment("raw", end, end, end_inclusive=True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_range_after_watermark_is_raw(self, mock_db):
+        """Test a range newer than the last refresh is read from raw rows only."""
+        repo = make_repo(mock_db, T0)
+        start = T0 + timedelta(minutes=5)
+
+        segments = await repo._plan(start, None)
+
+        assert segments == [_Segment("raw", start, None, end_inclusive=True)]
+
+    @pytest.mark.asyncio
+    async def test_naive_datetimes_are_utc(self, mock_db):
+        """Test naive datetimes are treated as UTC."""
+        repo = make_repo(mock_db, T0 + timedelta(days=1))
+
+        segments = await repo._plan(T0.replace(tzinfo=None), T0.replace(tzinfo=None))
+
+        assert segments == [_Segment("raw", T0, T0, end_inclusive=True)]
+
+    def test_segment_filters(self, mock_db):
+        """Test segment conditions and parameters."""
+        repo = MetricsRollupRepository(mock_db)
+        params: list = []
+        segments = [
+            _Segment("hour", None, T0),
+            _Segment("raw", T0, None, end_inclusive=True),
+            _Segment("untimed", None, None),
+        ]
+
+        rollup_where, raw_where = repo._segment_filters(segments, "s.start_time", params)
+
+        assert rollup_where == "((r.resolution = $1 AND r.bucket_start < $2))"
+        assert raw_where == "((s.start_time >= $3) OR s.start_time IS NULL)"
+        assert params == ["hour", T0, T0]
+
+
+class TestMetricsRollupQueries:
+    """Tests for reading metrics from rollups with a mocked database."""
+
+    @pytest.mark.asyncio
+    async def test_latency_breakdown_merges_sketches(self, mock_db):
+        """Test percentiles come from merged sketch buckets, sorted by count."""
+        repo = make_repo(mock_db, T0 + timedelta(days=1))
+        index = math.ceil(math.log(100.0) / math.log(1.01 / 0.99))
+        mock_db.fetch.side_effect = [
+            [
+                MockRecord(
+                    {
+                        "stage_type": "asr",
+                        "count": 2,
+                        "total": 200.0,
+                        "min_ms": 100.0,
+                        "max_ms": 100.0,
+                        "zero_count": 0,
+                    }
+                ),
+                MockRecord(
+                    {
+                        "stage_type": "llm",
+                        "count": 3,
+                        "total": 0.0,
+                        "min_ms": 0.0,
+                        "max_ms": 0.0,
+                        "zero_count": 3,
+                    }
+                ),
+            ],
+            [MockRecord({"stage_type": "asr", "sign": 1, "idx": index, "count": 2})],
+        ]
+
+        result = await repo.get_latency_breakdown(T0, T0 + timedelta(hours=1))
+
+        assert [item["group"] for item in result] == ["llm", "asr"]
+        assert result[0]["count"] == 3
+        assert result[0]["p50_ms"] is None
+        assert result[1]["mean_ms"] == 100.0
+        assert result[1]["p95_ms"] == pytest.approx(100.0, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_latency_breakdown_empty(self, mock_db):
+        """Test no spans gives an empty breakdown without a bucket query."""
+        repo = make_repo(mock_db, T0)
+        mock_db.fetch.return_value = []
+
+        assert await repo.get_latency_breakdown() == []
+        assert mock_db.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_trends_read_event_rollups(self, mock_db):
+        """Test failure trends combine event rollups with raw failures."""
+        repo = make_repo(mock_db, T0)
+        mock_db.fetch.return_value = [
+            MockRecord({"timestamp": "2026-03-01T09:00:00Z", "value": 4.0, "rolling_avg": 4.0})
+        ]
+
+        result = await repo.get_trends("failures", "1h")
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert "FROM event_rollups r" in query
+        assert "FROM failures e" in query
+        assert "failure" in params
+        assert result == [{"timestamp": "2026-03-01T09:00:00Z", "value": 4.0, "rolling_avg": 4.0}]
+
+    @pytest.mark.asyncio
+    async def test_conversation_volume(self, mock_db):
+        """Test conversation volume groups rollup and raw counts by day."""
+        repo = make_repo(mock_db, T0)
+        mock_db.fetch.return_value = [MockRecord({"time_bucket": "2026-03-01", "count": 7})]
+
+        result = await repo.get_conversation_volume("day")
+
+        query = mock_db.fetch.call_args[0][0]
+        assert "date_trunc('day', parts.t)" in query
+        assert result == [{"time_bucket": "2026-03-01", "count": 7}]
+
+
+class TestMetricsRollupRefresh:
+    """Tests for refreshing rollups with a mocked connection."""
+
+    def _mock_transaction(self, mock_db, conn):
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock(return_value=conn)
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        mock_db.transaction = MagicMock(return_value=transaction)
+
+    @pytest.mark.asyncio
+    async def test_skips_when_another_refresh_holds_the_lock(self, mock_db):
+        """Test a concurrent refresh is skipped."""
+        conn = AsyncMock()
+        conn.fetchval.return_value = False
+        self._mock_transaction(mock_db, conn)
+
+        assert await MetricsRollupRepository(mock_db).refresh() is None
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_rebuilds_everything(self, mock_db):
+        """Test the first refresh deletes and rebuilds every resolution."""
+        conn = AsyncMock()
+        conn.fetchval.side_effect = [True, T0, None]
+        self._mock_transaction(mock_db, conn)
+
+        assert await MetricsRollupRepository(mock_db).refresh() == T0
+
+        queries = [c[0][0] for c in conn.execute.call_args_list]
+        assert sum("INSERT INTO span_rollups" in q for q in queries) == 2
+        assert sum("INSERT INTO event_rollups" in q for q in queries) == 4
+        assert "INSERT INTO rollup_watermarks" in queries[-1]
+        conn.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_recomputes_dirty_buckets(self, mock_db):
+        """Test later refreshes only recompute buckets with new rows."""
+        conn = AsyncMock()
+        conn.fetchval.side_effect = [True, T0 + timedelta(minutes=10), T0]
+        conn.fetch.return_value = []
+        self._mock_transaction(mock_db, conn)
+
+        await MetricsRollupRepository(mock_db, overlap=timedelta(minutes=5)).refresh()
+
+        since = T0 - timedelta(minutes=5)
+        assert conn.fetch.call_args_list[0][0][1] == since
+        queries = [c[0][0] for c in conn.execute.call_args_list]
+        assert not any("INSERT INTO span_rollups" in q for q in queries)
+        event_deletes = [
+            c[0] for c in conn.execute.call_args_list if "DELETE FROM event_rollups" in c[0][0]
+        ]
+        assert event_deletes[0][1:] == ("minute", "conversation", since)
+
+
+class TestMetricsRepositoryRollups:
+    """Tests for MetricsRepository answering from rollups."""
+
+    @pytest.mark.asyncio
+    async def test_uses_rollups_without_conversation_filter(self, mock_db):
+        """Test unfiltered stage breakdowns, trends and volume come from rollups."""
+        rollups = AsyncMock()
+        rollups.get_latency_breakdown.return_value = [{"group": "llm"}]
+        rollups.get_trends.return_value = [{"timestamp": "t"}]
+        rollups.get_conversation_volume.return_value = [{"time_bucket": "t"}]
+        repo = MetricsRepository(mock_db, rollups=rollups)
+
+        assert await repo.get_latency_breakdown(start_time=T0) == [{"group": "llm"}]
+        assert await repo.get_trends("failures", "1d") == [{"timestamp": "t"}]
+        assert await repo.get_conversation_volume("day") == [{"time_bucket": "t"}]
+
+        rollups.get_latency_breakdown.assert_called_once_with(T0, None)
+        rollups.get_trends.assert_called_once_with("failures", "1d", None, None)
+        mock_db.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_raw_queries(self, mock_db):
+        """Test conversation filters, other groupings and missing rollups use raw rows."""
+        rollups = AsyncMock()
+        rollups.get_trends.return_value = None
+        repo = MetricsRepository(mock_db, rollups=rollups)
+        mock_db.fetch.return_value = []
+
+        await repo.get_latency_breakdown(conversation_id="conv-1")
+        await repo.get_latency_breakdown(group_by="voice.actor")
+        await repo.get_conversation_volume(conversation_id="conv-1")
+        await repo.get_trends("latency")
+
+        rollups.get_latency_breakdown.assert_not_called()
+        rollups.get_conversation_volume.assert_not_called()
+        assert mock_db.fetch.call_count == 4
+
+
+def nearest_rank(values: list[float], q: float) -> float:
+    """Value at the rank the sketch targets."""
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="Set VOICEOBS_TEST_DATABASE_URL to a scratch PostgreSQL database",
+)
+class TestMetricsRollupPostgres:
+    """Compare rollup answers with raw queries on a real database.
+
+    These tests truncate the conversations, spans, failures and rollup tables.
+    """
+
+    @pytest.fixture
+    async def db(self):
+        db = Database(database_url=TEST_DATABASE_URL, min_pool_size=1, max_pool_size=2)
+        await db.connect()
+        await db.init_schema()
+        await db.execute(
+            "TRUNCATE failures, turns, spans, conversations, "
+            "span_rollups, event_rollups, rollup_watermarks CASCADE"
+        )
+        yield db
+        await db.disconnect()
+
+    async def seed(
+        self, db, base: datetime, count: int, seed: int, backdate_events: bool = True
+    ) -> list[tuple]:
+        """Insert spans spread over six hours, with conversations and failures.
+
+        The server never sets created_at itself, so backdated events are only
+        used to fill rollups before the first refresh.
+        """
+        rng = random.Random(seed)
+        spans = []
+        for i in range(count):
+            start = base + timedelta(seconds=rng.uniform(0, 6 * 3600))
+            stage = rng.choice(["asr", "llm", "tts", None])
+            duration = rng.choice([0.0, rng.lognormvariate(5.0, 0.8)])
+            spans.append((stage, start, duration))
+            await db.execute(
+                """
+                INSERT INTO spans (name, start_time, duration_ms, attributes)
+                VALUES ('voice.stage', $1, $2, $3::jsonb)
+                """,
+                start,
+                duration,
+                json.dumps({"voice.stage.type": stage} if stage else {}),
+            )
+        for i in range(count // 10):
+            created = base + timedelta(seconds=rng.uniform(0, 6 * 3600))
+            if not backdate_events:
+                created = await db.fetchval("SELECT clock_timestamp()")
+            conv_id = await db.fetchval(
+                "INSERT INTO conversations (conversation_id, created_at) "
+                "VALUES ($1, $2) RETURNING id",
+                f"conv-{seed}-{i}",
+                created,
+            )
+            await db.execute(
+                "INSERT INTO failures (failure_type, severity, message, conversation_id, "
+                "created_at) VALUES ('slow_response', 'low', 'slow', $1, $2)",
+                conv_id,
+                created + timedelta(seconds=30),
+            )
+        return spans
+
+    async def assert_matches_raw(self, db, spans, start, end):
+        raw = MetricsRepository(db)
+        rolled = MetricsRepository(db, rollups=MetricsRollupRepository(db))
+
+        expected = {
+            item["group"]: item
+            for item in await raw.get_latency_breakdown(start_time=start, end_time=end)
+        }
+        actual = {
+            item["group"]: item
+            for item in await rolled.get_latency_breakdown(start_time=start, end_time=end)
+        }
+        assert actual.keys() == expected.keys()
+        for group, item in actual.items():
+            assert item["count"] == expected[group]["count"]
+            assert item["mean_ms"] == pytest.approx(expected[group]["mean_ms"])
+            durations = [
+                d
+                for stage, t, d in spans
+                if (stage or "unknown") == group
+                and (start is None or t >= start)
+                and (end is None or t <= end)
+            ]
+            for q, key in ((0.5, "p50_ms"), (0.95, "p95_ms"), (0.99, "p99_ms")):
+                exact = nearest_rank(durations, q)
+                if exact == 0:
+                    assert item[key] is None
+                else:
+                    assert item[key] == pytest.approx(exact, rel=0.0101)
+
+        for metric in ("latency", "failures", "conversations"):
+            for window in ("1h", "2d"):
+                expected_trend = await raw.get_trends(metric, window, start, end)
+                actual_trend = await rolled.get_trends(metric, window, start, end)
+                assert [p["timestamp"] for p in actual_trend] == [
+                    p["timestamp"] for p in expected_trend
+                ]
+                for a, e in zip(actual_trend, expected_trend, strict=True):
+                    assert a["value"] == pytest.approx(e["value"])
+                    assert a["rolling_avg"] == pytest.approx(e["rolling_avg"])
+
+        for group_by in ("hour", "day"):
+            assert await rolled.get_conversation_volume(
+                group_by, start, end
+            ) == await raw.get_conversation_volume(group_by, start, end)
+
+    @pytest.mark.asyncio
+    async def test_rollups_match_raw_queries(self, db):
+        """Test rollup answers match raw queries for aligned and unaligned ranges."""
+        base = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=8)
+        spans = await self.seed(db, base, 600, seed=1)
+        rollups = MetricsRollupRepository(db)
+
+        assert await rollups.refresh() is not None
+        hour_rows = await db.fetchval("SELECT COUNT(*) FROM span_rollups WHERE resolution = 'hour'")
+        assert hour_rows > 0
+
+        aligned = base.replace(minute=0, second=0) + timedelta(hours=1)
+        ranges = [
+            (None, None),
+            (aligned, aligned + timedelta(hours=3)),
+            (base + timedelta(minutes=37, seconds=13), base + timedelta(hours=4, seconds=7)),
+            (base + timedelta(minutes=5), None),
+            (None, base + timedelta(minutes=3, seconds=30)),
+        ]
+        for start, end in ranges:
+            await self.assert_matches_raw(db, spans, start, end)
+
+        # Rows added to rolled-up buckets are picked up by the next refresh
+        spans += await self.seed(db, base, 200, seed=2, backdate_events=False)
+        await rollups.refresh()
+        await self.assert_matches_raw(db, spans, None, None)
+        await self.assert_matches_raw(db, spans, *ranges[2])
+
+        # A full rebuild gives the same rollups, up to float summation order
+        query = "SELECT * FROM span_rollups ORDER BY resolution, bucket_start, stage_type"
+        before = [dict(row) for row in await db.fetch(query)]
+        await rollups.refresh(full=True)
+        after = [dict(row) for row in await db.fetch(query)]
+        assert [row.pop("duration_sum") for row in after] == pytest.approx(
+            [row.pop("duration_sum") for row in before]
+        )
+        assert after == before
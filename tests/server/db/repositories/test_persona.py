@@ -644,6 +644,22 @@ class TestPersonaRepository:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_list_preview_audio_urls(self, mock_db):
+        """Test listing the preview audio URLs of an organization's personas."""
+        repo = PersonaRepository(mock_db)
+        mock_db.fetch.return_value = [
+            {"preview_audio_url": "/audio/tts/cache/ab/1.mp3"},
+            {"preview_audio_url": "/audio/personas/preview/p/1.mp3"},
+        ]
+
+        urls = await repo.list_preview_audio_urls(TEST_ORG_ID)
+
+        assert urls == ["/audio/tts/cache/ab/1.mp3", "/audio/personas/preview/p/1.mp3"]
+        sql, org_id = mock_db.fetch.call_args[0]
+        assert "preview_audio_url IS NOT NULL" in sql
+        assert org_id == TEST_ORG_ID
+
     @pytest.mark.asyncio
     async def test_count_active(self, mock_db):
         """Test counting active personas (default)."""
@@ -1,10 +1,13 @@
 """Tests for the SpanRepository class."""
 
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 
 from voiceobs.server.db.models import SpanRow
+from voiceobs.server.db.pagination import Cursor
 from voiceobs.server.db.repositories import SpanRepository
 
 from .conftest import MockRecord
@@ -59,6 +62,59 @@ class TestSpanRepository:
         assert call_args[7] == "trace123"
         assert call_args[10] == conv_id
 
+    @pytest.mark.asyncio
+    async def test_add_many_uses_copy_in_transaction(self, mock_db):
+        """Test add_many writes all spans with a single COPY."""
+        from contextlib import asynccontextmanager
+        from datetime import datetime, timezone
+        from unittest.mock import AsyncMock
+
+        repo = SpanRepository(mock_db)
+        conv_id = uuid4()
+        mock_conn = AsyncMock()
+
+        @asynccontextmanager
+        async def mock_transaction():
+            yield mock_conn
+
+        mock_db.transaction = mock_transaction
+
+        span_ids = await repo.add_many(
+            [
+                {
+                    "name": "voice.asr",
+                    "start_time": "2024-01-01T00:00:00Z",
+                    "duration_ms": 100.0,
+                    "attributes": {"voice.stage.type": "asr"},
+                    "conversation_id": conv_id,
+                },
+                {"name": "voice.llm"},
+            ]
+        )
+
+        assert len(span_ids) == 2
+        assert all(isinstance(span_id, UUID) for span_id in span_ids)
+        mock_db.execute.assert_not_called()
+        mock_conn.copy_records_to_table.assert_called_once()
+        call = mock_conn.copy_records_to_table.call_args
+        assert call[0][0] == "spans"
+        records = call[1]["records"]
+        assert [record[0] for record in records] == span_ids
+        assert records[0][1] == "voice.asr"
+        assert records[0][2] == datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        assert records[0][5] == '{"voice.stage.type": "asr"}'
+        assert records[0][9] == conv_id
+        assert records[1][5] == "{}"
+        assert records[1][9] is None
+
+    @pytest.mark.asyncio
+    async def test_add_many_empty(self, mock_db):
+        """Test add_many with no spans does not touch the database."""
+        repo = SpanRepository(mock_db)
+
+        assert await repo.add_many([]) == []
+        mock_db.transaction.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_span_found(self, mock_db):
         """Test getting an existing span."""
@@ -162,6 +218,33 @@ class TestSpanRepository:
         assert result[0]["duration_ms"] == 100.0
         assert result[0]["attributes"] == {"voice.actor": "user"}
 
+    @pytest.mark.asyncio
+    async def test_get_as_dicts_by_conversation(self, mock_db):
+        """Test getting one conversation's spans filters in SQL."""
+        repo = SpanRepository(mock_db)
+        mock_db.fetch.return_value = [
+            MockRecord(
+                {
+                    "name": "voice.turn",
+                    "duration_ms": 100.0,
+                    "attributes": '{"voice.conversation.id": "conv-1"}',
+                }
+            ),
+        ]
+
+        result = await repo.get_as_dicts_by_conversation("conv-1")
+
+        assert result == [
+            {
+                "name": "voice.turn",
+                "duration_ms": 100.0,
+                "attributes": {"voice.conversation.id": "conv-1"},
+            }
+        ]
+        call_args = mock_db.fetch.call_args[0]
+        assert "WHERE c.conversation_id = $1" in call_args[0]
+        assert call_args[1] == "conv-1"
+
     @pytest.mark.asyncio
     async def test_get_by_conversation(self, mock_db):
         """Test getting spans by conversation."""
@@ -212,6 +295,108 @@ class TestSpanRepository:
 
         assert count == 10
 
+    @pytest.mark.asyncio
+    async def test_estimate_count_spans(self, mock_db):
+        """Test estimating the span count from the query plan."""
+        repo = SpanRepository(mock_db)
+        mock_db.fetchval.return_value = '[{"Plan": {"Plan Rows": 250000}}]'
+
+        assert await repo.estimate_count() == 250000
+        assert mock_db.fetchval.call_args[0][0] == "EXPLAIN (FORMAT JSON) SELECT 1 FROM spans"
+
+    @pytest.mark.asyncio
+    async def test_get_all_spans_page_after_cursor(self, mock_db):
+        """Test a page starts after the cursor's (created_at, id)."""
+        repo = SpanRepository(mock_db)
+        mock_db.fetch.return_value = []
+        created_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        span_id = uuid4()
+        cursor = Cursor("created_at", created_at, span_id).encode()
+
+        await repo.get_all(limit=100, cursor=cursor)
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert "WHERE (created_at, id) < ($1, $2)" in query
+        assert "ORDER BY created_at DESC, id DESC" in query
+        assert "LIMIT $3" in query
+        assert params == [created_at, span_id, 100]
+
+    @pytest.mark.asyncio
+    async def test_get_all_spans_rejects_foreign_cursor(self, mock_db):
+        """Test a cursor from another listing is rejected."""
+        repo = SpanRepository(mock_db)
+        cursor = Cursor("latency", 1.0, uuid4()).encode()
+
+        with pytest.raises(ValueError):
+            await repo.get_all(limit=100, cursor=cursor)
+
+    @pytest.mark.asyncio
+    async def test_iter_export_streams_rows(self, mock_db):
+        """Test export rows are streamed from a cursor and serialized."""
+        repo = SpanRepository(mock_db)
+        start = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        rows = [
+            MockRecord(
+                {
+                    "name": "voice.turn",
+                    "start_time": start,
+                    "end_time": None,
+                    "duration_ms": 100.0,
+                    "attributes": '{"voice.actor": "user"}',
+                    "trace_id": "trace-1",
+                    "span_id": "span-1",
+                    "parent_span_id": None,
+                }
+            )
+        ]
+
+        async def iterate(query, *args, prefetch):
+            for row in rows:
+                yield row
+
+        mock_db.iterate = MagicMock(side_effect=iterate)
+
+        result = [span async for span in repo.iter_export(batch_size=50)]
+
+        assert result == [
+            {
+                "name": "voice.turn",
+                "start_time": "2026-03-01T10:00:00+00:00",
+                "end_time": None,
+                "duration_ms": 100.0,
+                "attributes": {"voice.actor": "user"},
+                "trace_id": "trace-1",
+                "span_id": "span-1",
+                "parent_span_id": None,
+            }
+        ]
+        query, *params = mock_db.iterate.call_args[0]
+        assert "WHERE" not in query
+        assert "ORDER BY s.created_at, s.id" in query
+        assert params == []
+        assert mock_db.iterate.call_args[1] == {"prefetch": 50}
+
+    @pytest.mark.asyncio
+    async def test_iter_export_filters(self, mock_db):
+        """Test export filters by conversation and start time range."""
+        repo = SpanRepository(mock_db)
+        since = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        until = datetime(2026, 3, 2, tzinfo=timezone.utc)
+
+        async def iterate(query, *args, prefetch):
+            return
+            yield
+
+        mock_db.iterate = MagicMock(side_effect=iterate)
+
+        assert [s async for s in repo.iter_export("conv-1", since=since, until=until)] == []
+
+        query, *params = mock_db.iterate.call_args[0]
+        assert "SELECT id FROM conversations WHERE conversation_id = $1" in query
+        assert "s.start_time >= $2" in query
+        assert "s.start_time < $3" in query
+        assert params == ["conv-1", since, until]
+
     @pytest.mark.asyncio
     async def test_add_span_with_datetime_objects(self, mock_db):
         """Test adding span with datetime objects instead of strings."""
@@ -292,3 +477,50 @@ class TestSpanRepository:
 
         assert result is not None
         assert result.attributes == {}
+
+    @pytest.mark.asyncio
+    async def test_get_pending_derivations(self, mock_db):
+        """Test backlog spans are read in UUID order after a cursor."""
+        repo = SpanRepository(mock_db)
+        span_id, conv_id, after = uuid4(), uuid4(), uuid4()
+        mock_db.fetch.return_value = [
+            MockRecord(
+                {
+                    "id": span_id,
+                    "conversation_id": conv_id,
+                    "name": "voice.turn",
+                    "duration_ms": 100.0,
+                    "attributes": '{"voice.actor": "user"}',
+                }
+            )
+        ]
+
+        result = await repo.get_pending_derivations(100, after=after, min_age_seconds=60.0)
+
+        assert result == [
+            {
+                "id": span_id,
+                "conversation_id": conv_id,
+                "name": "voice.turn",
+                "duration_ms": 100.0,
+                "attributes": {"voice.actor": "user"},
+            }
+        ]
+        query, *args = mock_db.fetch.call_args[0]
+        assert "span_derivation_backlog" in query
+        assert "ORDER BY b.span_id" in query
+        assert args == [after, 60.0, 100]
+
+    @pytest.mark.asyncio
+    async def test_claim_derivations(self, mock_db):
+        """Test claiming deletes the spans from the backlog on the given connection."""
+        repo = SpanRepository(mock_db)
+        span_ids = [uuid4(), uuid4()]
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = [MockRecord({"span_id": span_ids[0]})]
+
+        assert await repo.claim_derivations(span_ids, mock_conn) == {span_ids[0]}
+        query, ids = mock_conn.fetch.call_args[0]
+        assert query.startswith("DELETE FROM span_derivation_backlog")
+        assert ids == span_ids
+        mock_db.fetch.assert_not_called()
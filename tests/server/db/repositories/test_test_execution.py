@@ -1,14 +1,22 @@
 """Tests for the TestExecutionRepository class."""
 
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from datetime import datetime
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.migrations import run_migrations
 from voiceobs.server.db.repositories.test_execution import TestExecutionRepository
 
 from .conftest import MockRecord
 
+TEST_DATABASE_URL = os.environ.get("VOICEOBS_TEST_DATABASE_URL")
+
 
 class TestTestExecutionRepository:
     """Tests for the TestExecutionRepository class."""
@@ -369,3 +377,241 @@ class TestTestExecutionRepository:
         assert result["passed"] == 0
         assert result["failed"] == 5
         assert result["pass_rate"] == 0.0
+
+
+def _queue_record(execution_id, scenario_id, status="queued", **extra):
+    """Build a test_executions row including the queue columns."""
+    return MockRecord(
+        {
+            "id": execution_id,
+            "scenario_id": scenario_id,
+            "conversation_id": None,
+            "status": status,
+            "started_at": None,
+            "completed_at": None,
+            "result_json": "{}",
+            "run_id": extra.get("run_id"),
+            "agent_id": extra.get("agent_id"),
+            "attempts": extra.get("attempts", 0),
+        }
+    )
+
+
+class TestTestExecutionQueue:
+    """Tests for the job queue methods of TestExecutionRepository."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_run_inserts_one_execution_per_scenario(self, mock_db):
+        """Test a run queues every scenario in one statement, resolving agents in SQL."""
+        repo = TestExecutionRepository(mock_db)
+        scenario_ids = [uuid4(), uuid4()]
+        agent_id = uuid4()
+        mock_db.fetch.side_effect = lambda query, run_id, ids, sids, max_parallel: [
+            _queue_record(eid, sid, run_id=run_id, agent_id=agent_id) for eid, sid in zip(ids, sids)
+        ]
+
+        run_id, executions = await repo.enqueue_run(scenario_ids, max_parallel=5)
+
+        query, _, execution_ids, passed_scenarios, max_parallel = mock_db.fetch.call_args[0]
+        assert "INSERT INTO test_executions" in query
+        assert "JOIN test_suites" in query
+        assert "'queued'" in query
+        assert passed_scenarios == scenario_ids
+        assert max_parallel == 5
+        assert [e.id for e in executions] == execution_ids
+        assert all(e.run_id == run_id and e.agent_id == agent_id for e in executions)
+        assert executions[0].result_json == {}
+
+    @pytest.mark.asyncio
+    async def test_claim_uses_skip_locked_and_limits(self, mock_db):
+        """Test claiming locks queued rows with SKIP LOCKED and caps per agent and run."""
+        repo = TestExecutionRepository(mock_db)
+        execution_id = uuid4()
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = [
+            _queue_record(execution_id, uuid4(), status="running", attempts=1)
+        ]
+
+        @asynccontextmanager
+        async def mock_transaction():
+            yield mock_conn
+
+        mock_db.transaction = mock_transaction
+
+        claimed = await repo.claim("worker-1", limit=4, per_agent_limit=2)
+
+        assert "pg_advisory_xact_lock" in mock_conn.execute.call_args[0][0]
+        query, *args = mock_conn.fetch.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert "PARTITION BY c.agent_id" in query
+        assert "r.max_parallel" in query
+        assert "SET status = 'running'" in query
+        assert args == ["worker-1", 4, 2, 500]
+        assert claimed[0].id == execution_id
+        assert claimed[0].status == "running"
+        assert claimed[0].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_complete_only_updates_executions_held_by_worker(self, mock_db):
+        """Test completing stores results and is guarded by the worker's lock."""
+        repo = TestExecutionRepository(mock_db)
+        execution_id = uuid4()
+        conversation_id = uuid4()
+        mock_db.execute.return_value = "UPDATE 1"
+
+        updated = await repo.complete(
+            execution_id, "worker-1", {"passed": True}, conversation_id=conversation_id
+        )
+
+        query, *args = mock_db.execute.call_args[0]
+        assert "locked_by = $2 AND status = 'running'" in query
+        assert args == [execution_id, "worker-1", "completed", '{"passed": true}', conversation_id]
+        assert updated is True
+
+        mock_db.execute.return_value = "UPDATE 0"
+        assert await repo.fail(execution_id, "worker-1", "Agent hung up") is False
+        assert mock_db.execute.call_args[0][3:5] == ("failed", '{"error": "Agent hung up"}')
+
+    @pytest.mark.asyncio
+    async def test_requeue_stale_returns_count(self, mock_db):
+        """Test stale running executions are requeued or failed after max attempts."""
+        repo = TestExecutionRepository(mock_db)
+        mock_db.fetch.return_value = [MockRecord({"id": uuid4()}), MockRecord({"id": uuid4()})]
+
+        count = await repo.requeue_stale(lease_seconds=300.0, max_attempts=3)
+
+        query, *args = mock_db.fetch.call_args[0]
+        assert "WHEN attempts >= $2 THEN 'failed' ELSE 'queued'" in query
+        assert args == [300.0, 3]
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_and_release(self, mock_db):
+        """Test heartbeats and releases only touch the worker's running executions."""
+        repo = TestExecutionRepository(mock_db)
+
+        await repo.heartbeat("worker-1")
+        await repo.release("worker-1")
+
+        heartbeat, release = mock_db.execute.call_args_list
+        assert "SET locked_at = NOW()" in heartbeat[0][0]
+        assert "SET status = 'queued'" in release[0][0]
+        assert heartbeat[0][1] == release[0][1] == "worker-1"
+
+    @pytest.mark.asyncio
+    async def test_get_run_progress(self, mock_db):
+        """Test run progress counts, and None for an unknown run."""
+        repo = TestExecutionRepository(mock_db)
+        run_id = uuid4()
+        mock_db.fetchrow.return_value = MockRecord(
+            {"total": 5, "queued": 1, "running": 2, "completed": 2, "failed": 0, "passed": None}
+        )
+
+        progress = await repo.get_run_progress(run_id)
+
+        assert progress == {
+            "total": 5,
+            "queued": 1,
+            "running": 2,
+            "completed": 2,
+            "failed": 0,
+            "passed": 0,
+        }
+        assert mock_db.fetchrow.call_args[0][1] == run_id
+
+        mock_db.fetchrow.return_value = MockRecord(
+            {"total": 0, "queued": 0, "running": 0, "completed": 0, "failed": 0, "passed": 0}
+        )
+        assert await repo.get_run_progress(uuid4()) is None
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="Set VOICEOBS_TEST_DATABASE_URL to a scratch PostgreSQL database",
+)
+class TestTestExecutionClaimPostgres:
+    """Check claim limits under concurrent claimers on a real database.
+
+    These tests migrate the database and truncate the test and agent tables.
+    """
+
+    @pytest.fixture
+    async def db(self):
+        result = await asyncio.to_thread(run_migrations, TEST_DATABASE_URL)
+        assert result["success"], result
+        db = Database(database_url=TEST_DATABASE_URL, min_pool_size=1, max_pool_size=8)
+        await db.connect()
+        await db.execute(
+            "TRUNCATE test_executions, test_scenarios, test_suites, personas, agents, "
+            "organizations, users CASCADE"
+        )
+        yield db
+        await db.disconnect()
+
+    async def enqueue(self, db, count: int, with_agent: bool, max_parallel: int | None):
+        """Queue a run of ``count`` scenarios, for an agent or without one."""
+        user_id = await db.fetchval(
+            "INSERT INTO users (id, email) VALUES (gen_random_uuid(), $1) RETURNING id",
+            f"{uuid4()}@example.com",
+        )
+        org_id = await db.fetchval(
+            "INSERT INTO organizations (name, created_by) VALUES ('Org', $1) RETURNING id",
+            user_id,
+        )
+        agent_id = None
+        if with_agent:
+            agent_id = await db.fetchval(
+                "INSERT INTO agents (name, contact_info, goal, org_id) "
+                "VALUES ('Agent', '{}'::jsonb, 'Help', $1) RETURNING id",
+                org_id,
+            )
+        suite_id = await db.fetchval(
+            "INSERT INTO test_suites (name, org_id, agent_id) VALUES ('Suite', $1, $2) "
+            "RETURNING id",
+            org_id,
+            agent_id,
+        )
+        persona_id = await db.fetchval(
+            "INSERT INTO personas (name, aggression, patience, verbosity, tts_provider, org_id) "
+            "VALUES ('Persona', 0.5, 0.5, 0.5, 'openai', $1) RETURNING id",
+            org_id,
+        )
+        scenario_ids = [
+            await db.fetchval(
+                "INSERT INTO test_scenarios (suite_id, name, goal, persona_id) "
+                "VALUES ($1, 'Scenario', 'Goal', $2) RETURNING id",
+                suite_id,
+                persona_id,
+            )
+            for _ in range(count)
+        ]
+        run_id, _ = await TestExecutionRepository(db).enqueue_run(
+            scenario_ids, max_parallel=max_parallel
+        )
+        return run_id
+
+    async def claim_concurrently(self, db, claimers: int) -> int:
+        """Claim from several workers at once, each scanning a disjoint window."""
+        repo = TestExecutionRepository(db)
+        results = await asyncio.gather(
+            *(
+                repo.claim(f"worker-{i}", limit=10, per_agent_limit=2, scan_limit=2)
+                for i in range(claimers)
+            )
+        )
+        return sum(len(claimed) for claimed in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_claims_respect_agent_limit(self, db):
+        """Test concurrent claimers never run more than per_agent_limit for an agent."""
+        await self.enqueue(db, 8, with_agent=True, max_parallel=None)
+
+        assert await self.claim_concurrently(db, 4) == 2
+        assert await self.claim_concurrently(db, 4) == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_claims_respect_run_limit(self, db):
+        """Test concurrent claimers never run more than a run's max_parallel."""
+        await self.enqueue(db, 8, with_agent=False, max_parallel=1)
+
+        assert await self.claim_concurrently(db, 4) == 1
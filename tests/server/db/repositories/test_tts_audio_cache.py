@@ -0,0 +1,107 @@
+"""Tests for the TTSAudioCacheRepository class."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from voiceobs.server.db.repositories.tts_audio_cache import TTSAudioCacheRepository
+
+from .conftest import MockRecord
+
+
+def _cache_record(**overrides):
+    """Build a tts_audio_cache row."""
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    return MockRecord(
+        {
+            "cache_key": "ab" * 32,
+            "tts_provider": "openai",
+            "audio_url": "/audio/tts/cache/ab/1.mp3",
+            "mime_type": "audio/mpeg",
+            "duration_ms": 1500.0,
+            "size_bytes": 24000,
+            "ref_count": 1,
+            "created_at": now,
+            "last_used_at": now,
+            **overrides,
+        }
+    )
+
+
+class TestTTSAudioCacheRepository:
+    """Tests for the TTSAudioCacheRepository class."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_increments_ref_count(self, mock_db):
+        """Test acquire takes a reference and returns the entry."""
+        repo = TTSAudioCacheRepository(mock_db)
+        mock_db.fetchrow.return_value = _cache_record(ref_count=2)
+
+        entry = await repo.acquire("ab" * 32)
+
+        query, key = mock_db.fetchrow.call_args[0]
+        assert "ref_count = ref_count + 1" in query
+        assert key == "ab" * 32
+        assert entry.ref_count == 2
+        assert entry.audio_url == "/audio/tts/cache/ab/1.mp3"
+
+    @pytest.mark.asyncio
+    async def test_acquire_miss_returns_none(self, mock_db):
+        """Test acquire returns None for keys that are not cached."""
+        repo = TTSAudioCacheRepository(mock_db)
+        mock_db.fetchrow.return_value = None
+
+        assert await repo.acquire("cd" * 32) is None
+        assert await repo.get("cd" * 32) is None
+
+    @pytest.mark.asyncio
+    async def test_add_upserts_with_one_reference(self, mock_db):
+        """Test add inserts with ref_count 1, or takes a reference on conflict."""
+        repo = TTSAudioCacheRepository(mock_db)
+        mock_db.fetchrow.return_value = _cache_record()
+
+        entry = await repo.add(
+            "ab" * 32, "openai", "/audio/tts/cache/ab/1.mp3", "audio/mpeg", 1.5, 3
+        )
+
+        query, *args = mock_db.fetchrow.call_args[0]
+        assert "ON CONFLICT (cache_key) DO UPDATE" in query
+        assert "ref_count = tts_audio_cache.ref_count + 1" in query
+        assert args == ["ab" * 32, "openai", "/audio/tts/cache/ab/1.mp3", "audio/mpeg", 1.5, 3]
+        assert entry.tts_provider == "openai"
+
+    @pytest.mark.asyncio
+    async def test_release_reports_whether_url_is_cached(self, mock_db):
+        """Test release decrements by URL and reports whether it matched an entry."""
+        repo = TTSAudioCacheRepository(mock_db)
+        mock_db.execute.side_effect = ["UPDATE 1", "UPDATE 0"]
+
+        assert await repo.release("/audio/tts/cache/ab/1.mp3") is True
+        assert await repo.release("/audio/personas/preview/x/2.mp3") is False
+
+        query = mock_db.execute.call_args_list[0][0][0]
+        assert "GREATEST(ref_count - 1, 0)" in query
+        assert "WHERE audio_url = $1" in query
+
+    @pytest.mark.asyncio
+    async def test_evict_deletes_only_unreferenced_entries(self, mock_db):
+        """Test evict applies both limits to unreferenced entries and returns their URLs."""
+        repo = TTSAudioCacheRepository(mock_db)
+        mock_db.fetch.return_value = [MockRecord({"audio_url": "/audio/tts/cache/ab/1.mp3"})]
+
+        urls = await repo.evict(max_idle_seconds=3600.0, max_bytes=1024)
+
+        query, max_idle_seconds, max_bytes = mock_db.fetch.call_args[0]
+        assert "DELETE FROM tts_audio_cache" in query
+        assert "c.ref_count = 0" in query
+        assert "ORDER BY last_used_at DESC" in query
+        assert (max_idle_seconds, max_bytes) == (3600.0, 1024)
+        assert urls == ["/audio/tts/cache/ab/1.mp3"]
+
+    @pytest.mark.asyncio
+    async def test_evict_without_limits_does_nothing(self, mock_db):
+        """Test evict skips the query when no limit is configured."""
+        repo = TTSAudioCacheRepository(mock_db)
+
+        assert await repo.evict() == []
+        mock_db.fetch.assert_not_called()
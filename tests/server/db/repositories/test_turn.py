@@ -57,6 +57,110 @@ class TestTurnRepository:
         assert call_args[7] == 500.0
         assert call_args[8] == "Hello, how can I help?"
 
+    @pytest.mark.asyncio
+    async def test_add_many_uses_copy_in_transaction(self, mock_db):
+        """Test add_many writes all turns with a single COPY."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock
+
+        repo = TurnRepository(mock_db)
+        conv_id = uuid4()
+        span_ids = [uuid4(), uuid4()]
+        mock_conn = AsyncMock()
+
+        @asynccontextmanager
+        async def mock_transaction():
+            yield mock_conn
+
+        mock_db.transaction = mock_transaction
+
+        turn_ids = await repo.add_many(
+            [
+                {
+                    "conversation_id": conv_id,
+                    "span_id": span_ids[0],
+                    "actor": "user",
+                    "turn_id": "turn-1",
+                    "turn_index": 0,
+                    "transcript": "Hello",
+                    "attributes": {"voice.actor": "user"},
+                },
+                {"conversation_id": conv_id, "span_id": span_ids[1], "actor": "agent"},
+            ]
+        )
+
+        assert len(turn_ids) == 2
+        mock_db.execute.assert_not_called()
+        call = mock_conn.copy_records_to_table.call_args
+        assert call[0][0] == "turns"
+        records = call[1]["records"]
+        assert [record[0] for record in records] == turn_ids
+        assert records[0][1:8] == ("turn-1", conv_id, span_ids[0], "user", 0, None, "Hello")
+        assert records[0][8] == '{"voice.actor": "user"}'
+        assert records[1][8] == "{}"
+
+    @pytest.mark.asyncio
+    async def test_add_many_empty(self, mock_db):
+        """Test add_many with no turns does not touch the database."""
+        repo = TurnRepository(mock_db)
+
+        assert await repo.add_many([]) == []
+        mock_db.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_many_in_open_transaction(self, mock_db):
+        """Test add_many writes on a given connection without its own transaction."""
+        from unittest.mock import AsyncMock
+
+        repo = TurnRepository(mock_db)
+        mock_conn = AsyncMock()
+
+        await repo.add_many(
+            [{"conversation_id": uuid4(), "span_id": uuid4(), "actor": "user"}], conn=mock_conn
+        )
+
+        mock_db.transaction.assert_not_called()
+        assert mock_conn.copy_records_to_table.call_args[0][0] == "turns"
+
+    @pytest.mark.asyncio
+    async def test_get_ids_by_turn_id_on_connection(self, mock_db):
+        """Test the lookup runs on a given connection, seeing its uncommitted turns."""
+        from unittest.mock import AsyncMock
+
+        repo = TurnRepository(mock_db)
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = []
+
+        assert await repo.get_ids_by_turn_id([(uuid4(), "turn-1")], conn=mock_conn) == {}
+        mock_conn.fetch.assert_awaited_once()
+        mock_db.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_ids_by_turn_id(self, mock_db):
+        """Test looking up turn UUIDs by conversation and external turn ID."""
+        repo = TurnRepository(mock_db)
+        conv_id = uuid4()
+        turn_uuid = uuid4()
+        mock_db.fetch.return_value = [
+            MockRecord({"conversation_id": conv_id, "turn_id": "turn-1", "id": turn_uuid})
+        ]
+
+        result = await repo.get_ids_by_turn_id([(conv_id, "turn-1"), (conv_id, "turn-2")])
+
+        assert result == {(conv_id, "turn-1"): turn_uuid}
+        args = mock_db.fetch.call_args[0]
+        assert "unnest" in args[0]
+        assert args[1] == [conv_id, conv_id]
+        assert args[2] == ["turn-1", "turn-2"]
+
+    @pytest.mark.asyncio
+    async def test_get_ids_by_turn_id_empty(self, mock_db):
+        """Test an empty lookup does not query the database."""
+        repo = TurnRepository(mock_db)
+
+        assert await repo.get_ids_by_turn_id([]) == {}
+        mock_db.fetch.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_turn(self, mock_db):
         """Test getting a turn by UUID."""
@@ -199,6 +199,39 @@ class TestDatabase:
             mock_pool.fetchval.assert_called_once_with("SELECT COUNT(*) FROM test")
             assert result == 42
 
+    @pytest.mark.asyncio
+    async def test_iterate_requires_connection(self):
+        """Test iterate raises error if not connected."""
+        db = Database()
+
+        with pytest.raises(RuntimeError, match="Database not connected"):
+            async for _ in db.iterate("SELECT 1"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_iterate_uses_cursor_in_transaction(self):
+        """Test iterate streams rows from a server-side cursor."""
+        db = Database()
+
+        async def rows():
+            for i in range(3):
+                yield {"n": i}
+
+        mock_conn = MagicMock()
+        mock_conn.transaction.return_value.__aenter__ = AsyncMock()
+        mock_conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_conn.cursor.return_value = rows()
+        mock_pool = MagicMock()
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+        db._pool = mock_pool
+
+        result = [row async for row in db.iterate("SELECT n FROM t WHERE x = $1", 1, prefetch=2)]
+
+        assert result == [{"n": 0}, {"n": 1}, {"n": 2}]
+        mock_conn.cursor.assert_called_once_with("SELECT n FROM t WHERE x = $1", 1, prefetch=2)
+        mock_conn.transaction.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_init_schema_requires_connection(self):
         """Test init_schema raises error if not connected."""
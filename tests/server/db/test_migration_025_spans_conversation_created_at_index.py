@@ -0,0 +1,64 @@
+"""Tests for migration 025: index spans on (conversation_id, created_at)."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260301_000000_025_add_spans_conversation_created_at_index.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_025", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration025Metadata:
+    """Tests for migration 025 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 025 follows 024."""
+        m = _load_migration_module()
+        assert m.revision == "025"
+        assert m.down_revision == "024"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+
+class TestMigration025Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_creates_conversation_created_at_index(self):
+        """Upgrade creates the composite index on spans."""
+        m = _load_migration_module()
+        with patch.object(op, "create_index") as mock_create_index:
+            m.upgrade()
+
+        mock_create_index.assert_called_once_with(
+            "idx_spans_conversation_created_at",
+            "spans",
+            ["conversation_id", "created_at"],
+            if_not_exists=True,
+        )
+
+    def test_downgrade_drops_conversation_created_at_index(self):
+        """Downgrade drops the composite index."""
+        m = _load_migration_module()
+        with patch.object(op, "drop_index") as mock_drop_index:
+            m.downgrade()
+
+        mock_drop_index.assert_called_once_with(
+            "idx_spans_conversation_created_at", "spans", if_exists=True
+        )
@@ -0,0 +1,75 @@
+"""Tests for migration 026: add metrics rollup tables."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260305_000000_026_add_metrics_rollup_tables.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_026", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration026Metadata:
+    """Tests for migration 026 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 026 follows 025."""
+        m = _load_migration_module()
+        assert m.revision == "026"
+        assert m.down_revision == "025"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+    def test_has_docstring_mentioning_rollups(self):
+        """Migration module must have a docstring describing the rollup tables."""
+        m = _load_migration_module()
+        assert m.__doc__ is not None
+        assert "span_rollups" in m.__doc__
+
+
+class TestMigration026Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_creates_tables_and_index(self):
+        """Upgrade creates the rollup tables and the spans start_time index."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_table") as mock_create_table,
+            patch.object(op, "create_index") as mock_create_index,
+        ):
+            m.upgrade()
+
+        tables = [c[0][0] for c in mock_create_table.call_args_list]
+        assert tables == ["span_rollups", "event_rollups", "rollup_watermarks"]
+        mock_create_index.assert_called_once_with(
+            "idx_spans_start_time", "spans", ["start_time"], if_not_exists=True
+        )
+
+    def test_downgrade_drops_tables_and_index(self):
+        """Downgrade drops everything upgrade created."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "drop_table") as mock_drop_table,
+            patch.object(op, "drop_index") as mock_drop_index,
+        ):
+            m.downgrade()
+
+        tables = {c[0][0] for c in mock_drop_table.call_args_list}
+        assert tables == {"span_rollups", "event_rollups", "rollup_watermarks"}
+        mock_drop_index.assert_called_once_with("idx_spans_start_time", "spans", if_exists=True)
@@ -0,0 +1,83 @@
+"""Tests for migration 027: add conversation summaries."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260308_000000_027_add_conversation_summaries.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_027", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration027Metadata:
+    """Tests for migration 027 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 027 follows 026."""
+        m = _load_migration_module()
+        assert m.revision == "027"
+        assert m.down_revision == "026"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+    def test_has_docstring_mentioning_summaries(self):
+        """Migration module must have a docstring describing the summary table."""
+        m = _load_migration_module()
+        assert m.__doc__ is not None
+        assert "conversation_summaries" in m.__doc__
+
+
+class TestMigration027Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_creates_table_triggers_and_backfills(self):
+        """Upgrade creates the table, its indexes and triggers, then backfills."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_table") as mock_create_table,
+            patch.object(op, "create_index") as mock_create_index,
+            patch.object(op, "execute") as mock_execute,
+        ):
+            m.upgrade()
+
+        assert mock_create_table.call_args[0][0] == "conversation_summaries"
+        indexes = {c[0][0]: c for c in mock_create_index.call_args_list}
+        assert "idx_conversation_summaries_first_start_time" in indexes
+        assert indexes["idx_conversation_summaries_search_vector"][1] == {"postgresql_using": "gin"}
+
+        statements = [c[0][0] for c in mock_execute.call_args_list]
+        assert len([s for s in statements if "CREATE TRIGGER" in s]) == len(m.TRIGGERS)
+        assert "CREATE TRIGGER conversation_summaries_insert AFTER INSERT ON spans " in (
+            "\n".join(statements)
+        )
+        assert statements[-1].startswith("SELECT refresh_conversation_summaries(")
+
+    def test_downgrade_drops_triggers_functions_and_table(self):
+        """Downgrade drops everything upgrade created."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "drop_table") as mock_drop_table,
+            patch.object(op, "execute") as mock_execute,
+        ):
+            m.downgrade()
+
+        statements = [c[0][0] for c in mock_execute.call_args_list]
+        assert len([s for s in statements if s.startswith("DROP TRIGGER")]) == len(m.TRIGGERS)
+        assert "DROP FUNCTION IF EXISTS refresh_conversation_summaries(UUID[])" in statements
+        mock_drop_table.assert_called_once_with("conversation_summaries")
@@ -0,0 +1,75 @@
+"""Tests for migration 028: index spans and failures on (created_at, id)."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import call, patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260310_000000_028_add_created_at_id_indexes.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_028", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration028Metadata:
+    """Tests for migration 028 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 028 follows 027."""
+        m = _load_migration_module()
+        assert m.revision == "028"
+        assert m.down_revision == "027"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+
+class TestMigration028Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_replaces_created_at_indexes(self):
+        """Upgrade creates the composite indexes and drops the old ones."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_index") as mock_create_index,
+            patch.object(op, "drop_index") as mock_drop_index,
+        ):
+            m.upgrade()
+
+        assert mock_create_index.call_args_list == [
+            call("idx_spans_created_at_id", "spans", ["created_at", "id"], if_not_exists=True),
+            call(
+                "idx_failures_created_at_id", "failures", ["created_at", "id"], if_not_exists=True
+            ),
+        ]
+        assert mock_drop_index.call_args_list == [
+            call("idx_spans_created_at", "spans", if_exists=True),
+            call("idx_failures_created_at", "failures", if_exists=True),
+        ]
+
+    def test_downgrade_restores_created_at_indexes(self):
+        """Downgrade restores the single-column indexes."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_index") as mock_create_index,
+            patch.object(op, "drop_index") as mock_drop_index,
+        ):
+            m.downgrade()
+
+        created = [c[0][0] for c in mock_create_index.call_args_list]
+        dropped = [c[0][0] for c in mock_drop_index.call_args_list]
+        assert created == ["idx_spans_created_at", "idx_failures_created_at"]
+        assert dropped == ["idx_spans_created_at_id", "idx_failures_created_at_id"]
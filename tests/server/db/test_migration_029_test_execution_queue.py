@@ -0,0 +1,108 @@
+"""Tests for migration 029: test execution queue columns."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260315_000000_029_add_test_execution_queue.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_029", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration029Metadata:
+    """Tests for migration 029 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 029 follows 028."""
+        m = _load_migration_module()
+        assert m.revision == "029"
+        assert m.down_revision == "028"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+
+class TestMigration029Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_adds_queue_columns_and_indexes(self):
+        """Upgrade adds the queue columns, the agent FK and the claim indexes."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "add_column") as mock_add_column,
+            patch.object(op, "create_foreign_key") as mock_create_fk,
+            patch.object(op, "create_index") as mock_create_index,
+        ):
+            m.upgrade()
+
+        columns = [c[0][1].name for c in mock_add_column.call_args_list]
+        assert columns == [
+            "run_id",
+            "agent_id",
+            "max_parallel",
+            "queued_at",
+            "attempts",
+            "locked_by",
+            "locked_at",
+        ]
+        assert all(c[0][0] == "test_executions" for c in mock_add_column.call_args_list)
+
+        fk_args = mock_create_fk.call_args
+        assert fk_args[0][:5] == (
+            "fk_test_executions_agent_id",
+            "test_executions",
+            "agents",
+            ["agent_id"],
+            ["id"],
+        )
+        assert fk_args[1]["ondelete"] == "SET NULL"
+
+        indexes = {c[0][0]: c for c in mock_create_index.call_args_list}
+        assert set(indexes) == {
+            "idx_test_executions_run_id",
+            "idx_test_executions_queued",
+            "idx_test_executions_running_agent_id",
+        }
+        queued = indexes["idx_test_executions_queued"]
+        assert queued[0][2] == ["queued_at", "id"]
+        assert str(queued[1]["postgresql_where"]) == "status = 'queued'"
+
+    def test_downgrade_removes_queue_columns(self):
+        """Downgrade drops the indexes, the FK and every added column."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "drop_index") as mock_drop_index,
+            patch.object(op, "drop_constraint") as mock_drop_constraint,
+            patch.object(op, "drop_column") as mock_drop_column,
+        ):
+            m.downgrade()
+
+        assert len(mock_drop_index.call_args_list) == 3
+        mock_drop_constraint.assert_called_once_with(
+            "fk_test_executions_agent_id", "test_executions", type_="foreignkey"
+        )
+        dropped = {c[0][1] for c in mock_drop_column.call_args_list}
+        assert dropped == {
+            "run_id",
+            "agent_id",
+            "max_parallel",
+            "queued_at",
+            "attempts",
+            "locked_by",
+            "locked_at",
+        }
@@ -0,0 +1,87 @@
+"""Tests for migration 030: TTS audio cache."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        Path(__file__).parent.parent.parent.parent
+        / "src"
+        / "voiceobs"
+        / "server"
+        / "db"
+        / "alembic"
+        / "versions"
+        / "20260320_000000_030_add_tts_audio_cache.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_030", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration030Metadata:
+    """Tests for migration 030 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 030 follows 029."""
+        m = _load_migration_module()
+        assert m.revision == "030"
+        assert m.down_revision == "029"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+
+class TestMigration030Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_creates_cache_table(self):
+        """Upgrade creates tts_audio_cache keyed by cache_key with an eviction index."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_table") as mock_create_table,
+            patch.object(op, "create_index") as mock_create_index,
+        ):
+            m.upgrade()
+
+        args = mock_create_table.call_args[0]
+        assert args[0] == "tts_audio_cache"
+        columns = [c.name for c in args[1:] if hasattr(c, "type")]
+        assert columns == [
+            "cache_key",
+            "tts_provider",
+            "audio_url",
+            "mime_type",
+            "duration_ms",
+            "size_bytes",
+            "ref_count",
+            "created_at",
+            "last_used_at",
+        ]
+
+        index_args = mock_create_index.call_args
+        assert index_args[0] == (
+            "idx_tts_audio_cache_unreferenced",
+            "tts_audio_cache",
+            ["last_used_at"],
+        )
+        assert str(index_args[1]["postgresql_where"]) == "ref_count = 0"
+
+    def test_downgrade_drops_cache_table(self):
+        """Downgrade drops the index and the table."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "drop_index") as mock_drop_index,
+            patch.object(op, "drop_table") as mock_drop_table,
+        ):
+            m.downgrade()
+
+        mock_drop_index.assert_called_once_with(
+            "idx_tts_audio_cache_unreferenced", "tts_audio_cache"
+        )
+        mock_drop_table.assert_called_once_with("tts_audio_cache")
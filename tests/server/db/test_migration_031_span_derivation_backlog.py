@@ -0,0 +1,82 @@
+"""Tests for migration 031: add the span derivation backlog."""
+
+import importlib.util
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+from alembic import op
+
+from voiceobs.server.services.span_derivation import DERIVED_SPAN_NAMES
+
+SRC_DIR = Path(__file__).parent.parent.parent.parent / "src" / "voiceobs" / "server" / "db"
+
+
+def _load_migration_module():
+    """Load the migration module by file path (its name starts with digits)."""
+    migration_path = (
+        SRC_DIR / "alembic" / "versions" / "20260325_000000_031_add_span_derivation_backlog.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_031", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration031Metadata:
+    """Tests for migration 031 metadata."""
+
+    def test_revision_chain(self):
+        """Migration 031 follows 030."""
+        m = _load_migration_module()
+        assert m.revision == "031"
+        assert m.down_revision == "030"
+        assert m.branch_labels is None
+        assert m.depends_on is None
+
+    def test_span_names_match_derivation(self):
+        """The trigger and schema.sql queue exactly the spans the derivation uses."""
+        m = _load_migration_module()
+        assert set(re.findall(r"'([\w.]+)'", m.DERIVED_SPAN_NAMES_SQL)) == DERIVED_SPAN_NAMES
+
+        schema = (SRC_DIR / "schema.sql").read_text()
+        for names in re.findall(r"name IN \(([^)]*)\)", schema):
+            assert set(re.findall(r"'([\w.]+)'", names)) == DERIVED_SPAN_NAMES
+
+
+class TestMigration031Operations:
+    """Tests for the upgrade and downgrade functions."""
+
+    def test_upgrade_creates_backlog_trigger_and_backfill(self):
+        """Upgrade creates the table, the insert trigger, and queues old spans."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "create_table") as mock_create_table,
+            patch.object(op, "execute") as mock_execute,
+        ):
+            m.upgrade()
+
+        table_args = mock_create_table.call_args[0]
+        assert table_args[0] == "span_derivation_backlog"
+        assert [c.name for c in table_args[1:3]] == ["span_id", "enqueued_at"]
+
+        statements = [c[0][0] for c in mock_execute.call_args_list]
+        assert statements == [m.FUNCTION, m.TRIGGER, m.BACKFILL]
+        assert "AFTER INSERT ON spans" in m.TRIGGER
+        assert "NOT EXISTS (SELECT 1 FROM turns" in m.BACKFILL
+
+    def test_downgrade_drops_backlog(self):
+        """Downgrade drops the trigger, the function and the table."""
+        m = _load_migration_module()
+        with (
+            patch.object(op, "execute") as mock_execute,
+            patch.object(op, "drop_table") as mock_drop_table,
+        ):
+            m.downgrade()
+
+        statements = [c[0][0] for c in mock_execute.call_args_list]
+        assert statements == [
+            "DROP TRIGGER IF EXISTS span_derivation_backlog_insert ON spans",
+            "DROP FUNCTION IF EXISTS span_derivation_backlog_spans_inserted()",
+        ]
+        mock_drop_table.assert_called_once_with("span_derivation_backlog")
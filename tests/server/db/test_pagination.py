@@ -0,0 +1,281 @@
+"""Tests for keyset pagination helpers."""
+
+import base64
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.pagination import Cursor, estimate_count, keyset_condition, offset_page
+from voiceobs.server.db.repositories import (
+    ConversationRepository,
+    FailureRepository,
+    SpanRepository,
+)
+
+TEST_DATABASE_URL = os.environ.get("VOICEOBS_TEST_DATABASE_URL")
+
+ROW_ID = uuid4()
+
+
+class TestCursor:
+    """Tests for Cursor encoding."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime(2026, 3, 1, 10, 0, 0, 123456, tzinfo=timezone.utc), 12.5, 0.0, None],
+    )
+    def test_round_trip(self, value):
+        """Test sort values survive encoding."""
+        token = Cursor("start_time", value, ROW_ID).encode()
+
+        assert Cursor.decode(token, "start_time") == Cursor("start_time", value, ROW_ID)
+
+    def test_token_is_url_safe(self):
+        """Test tokens need no escaping in a query string."""
+        token = Cursor("created_at", datetime.now(timezone.utc), ROW_ID).encode()
+
+        assert token.replace("-", "").replace("_", "").isalnum()
+
+    def test_offset_cursor(self):
+        """Test offset cursors carry only a position."""
+        token = Cursor("offset", 50).encode()
+
+        assert Cursor.decode(token, "offset") == Cursor("offset", 50)
+
+    def test_sort_mismatch(self):
+        """Test a cursor cannot be reused with another sort."""
+        token = Cursor("latency", 12.5, ROW_ID).encode()
+
+        with pytest.raises(ValueError, match="'latency', not 'start_time'"):
+            Cursor.decode(token, "start_time")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not json",
+            b'["created_at", 1.0]',
+            b'["created_at", 1.0, "not-a-uuid"]',
+            b'["created_at", 1.0, null]',
+            b'["created_at", {"ts": "yesterday"}, null]',
+            b'["offset", -1, null]',
+            b'["offset", "5", null]',
+        ],
+    )
+    def test_invalid_tokens(self, payload):
+        """Test malformed tokens raise ValueError."""
+        token = base64.urlsafe_b64encode(payload).decode()
+        sort = "offset" if b"offset" in payload else "created_at"
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            Cursor.decode(token, sort)
+
+    def test_not_base64(self):
+        """Test garbage input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            Cursor.decode("!!!", "created_at")
+
+
+class TestKeysetCondition:
+    """Tests for keyset_condition."""
+
+    def test_descending(self):
+        """Test descending pages use a row comparison."""
+        cursor = Cursor("created_at", 5.0, ROW_ID)
+
+        condition, params = keyset_condition("s.created_at", "s.id", cursor, True, 3)
+
+        assert condition == "(s.created_at, s.id) < ($3, $4)"
+        assert params == [5.0, ROW_ID]
+
+    def test_ascending_nullable(self):
+        """Test ascending pages over a nullable key still reach the NULL rows."""
+        cursor = Cursor("latency", 5.0, ROW_ID)
+
+        condition, params = keyset_condition("k", "id", cursor, False, 1, nullable=True)
+
+        assert condition == "((k, id) > ($1, $2) OR k IS NULL)"
+        assert params == [5.0, ROW_ID]
+
+    def test_null_cursor_descending(self):
+        """Test NULLs come first when descending."""
+        cursor = Cursor("latency", None, ROW_ID)
+
+        condition, params = keyset_condition("k", "id", cursor, True, 1, nullable=True)
+
+        assert condition == "((k IS NULL AND id < $1) OR k IS NOT NULL)"
+        assert params == [ROW_ID]
+
+    def test_null_cursor_ascending(self):
+        """Test NULLs come last when ascending."""
+        cursor = Cursor("latency", None, ROW_ID)
+
+        condition, params = keyset_condition("k", "id", cursor, False, 2, nullable=True)
+
+        assert condition == "(k IS NULL AND id > $2)"
+        assert params == [ROW_ID]
+
+
+class TestEstimateCount:
+    """Tests for estimate_count."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "plan", ['[{"Plan": {"Plan Rows": 42}}]', [{"Plan": {"Plan Rows": 42.0}}]]
+    )
+    async def test_reads_plan_rows(self, plan):
+        """Test the estimate is read from the JSON plan, as text or decoded."""
+        db = AsyncMock()
+        db.fetchval.return_value = plan
+
+        assert await estimate_count(db, "SELECT 1 FROM spans WHERE name = $1", "x") == 42
+        db.fetchval.assert_awaited_once_with(
+            "EXPLAIN (FORMAT JSON) SELECT 1 FROM spans WHERE name = $1", "x"
+        )
+
+
+class TestOffsetPage:
+    """Tests for offset_page."""
+
+    def test_walks_all_pages(self):
+        """Test following next cursors returns every item once."""
+        items = list(range(7))
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = offset_page(items, 3, cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert seen == items
+
+    def test_offset_without_cursor(self):
+        """Test the offset applies when there is no cursor."""
+        page, next_cursor = offset_page(list(range(7)), 3, offset=5)
+
+        assert page == [5, 6]
+        assert next_cursor is None
+
+    def test_no_limit_returns_the_rest(self):
+        """Test a missing limit returns every remaining item on one page."""
+        _, cursor = offset_page(list(range(7)), 3)
+        page, next_cursor = offset_page(list(range(7)), None, cursor)
+
+        assert page == [3, 4, 5, 6]
+        assert next_cursor is None
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="Set VOICEOBS_TEST_DATABASE_URL to a scratch PostgreSQL database",
+)
+class TestKeysetPaginationPostgres:
+    """Walk cursor pages on a real database and compare with one big page.
+
+    These tests truncate the conversations, spans, turns and failures tables.
+    """
+
+    @pytest.fixture
+    async def db(self):
+        db = Database(database_url=TEST_DATABASE_URL, min_pool_size=1, max_pool_size=2)
+        await db.connect()
+        await db.init_schema()
+        await db.execute("TRUNCATE failures, turns, spans, conversations CASCADE")
+        yield db
+        await db.disconnect()
+
+    async def seed(self, db) -> None:
+        """Insert conversations with tied, distinct and missing sort keys."""
+        created_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        await db.execute(
+            """
+            INSERT INTO conversations (conversation_id, created_at)
+            SELECT 'conv-' || g, $1::timestamptz + make_interval(mins => g % 3)
+            FROM generate_series(1, 12) AS g
+            """,
+            created_at,
+        )
+        # Conversations 1-9 get spans with tied start times and latencies; 10-12 have none
+        await db.execute(
+            """
+            INSERT INTO spans (name, start_time, duration_ms, conversation_id, created_at)
+            SELECT 'voice.llm', c.created_at, 100 * (g % 4), c.id,
+                   c.created_at + make_interval(secs => g % 2)
+            FROM conversations c, generate_series(1, 2) AS g
+            WHERE substring(c.conversation_id from 6)::int <= 9
+            """
+        )
+        await db.execute(
+            """
+            INSERT INTO failures (conversation_id, failure_type, severity, message, created_at)
+            SELECT id, 'slow_response', 'high', 'slow', created_at FROM conversations
+            """
+        )
+
+    async def walk(self, fetch_page) -> list:
+        """Follow cursors until the last page and return every item."""
+        items = []
+        cursor = None
+        while True:
+            page = await fetch_page(cursor)
+            items.extend(page)
+            if len(page) < 5:
+                return items
+            cursor = page[-1]["cursor"]
+
+    @pytest.mark.parametrize("sort", ["start_time", "latency", "relevance", "created_at"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_conversation_pages(self, db, sort, sort_order):
+        """Test cursor pages match the unpaged order, including NULL sort keys."""
+        await self.seed(db)
+        repo = ConversationRepository(db)
+        query = "conv" if sort == "relevance" else None
+
+        expected, total = await repo.search(
+            query=query, sort=sort, sort_order=sort_order, limit=100
+        )
+        walked = await self.walk(
+            lambda cursor: self._conversation_page(repo, query, sort, sort_order, cursor)
+        )
+
+        assert total == 12
+        assert [r["id"] for r in walked] == [r["id"] for r in expected]
+
+    async def _conversation_page(self, repo, query, sort, sort_order, cursor):
+        results, _ = await repo.search(
+            query=query, sort=sort, sort_order=sort_order, limit=5, cursor=cursor
+        )
+        return results
+
+    async def test_span_and_failure_pages(self, db):
+        """Test span and failure pages match the unpaged order."""
+        await self.seed(db)
+        spans = SpanRepository(db)
+        failures = FailureRepository(db)
+
+        async def span_page(cursor):
+            rows = await spans.get_all(limit=5, cursor=cursor)
+            return [
+                {"id": row.id, "cursor": Cursor("created_at", row.created_at, row.id).encode()}
+                for row in rows
+            ]
+
+        assert [s["id"] for s in await self.walk(span_page)] == [
+            s.id for s in await spans.get_all()
+        ]
+        walked = await self.walk(lambda cursor: failures.search(limit=5, cursor=cursor))
+        assert [f["id"] for f in walked] == [f["id"] for f in await failures.search(limit=100)]
+        assert len(walked) == 12
+
+    async def test_estimates(self, db):
+        """Test planner estimates are in the right ballpark after ANALYZE."""
+        await self.seed(db)
+        await db.execute("ANALYZE spans")
+
+        assert 10 <= await SpanRepository(db).estimate_count() <= 30
+        _, total = await ConversationRepository(db).search(approximate_total=True)
+        assert total >= 1
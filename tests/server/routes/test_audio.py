@@ -182,6 +182,107 @@ class TestAudioEndpoint:
         assert response.content == audio_data
 
 
+class TestAudioConditionalRequests:
+    """Tests for ETag/Last-Modified handling and streamed range reads."""
+
+    def _save(self, audio_storage, audio_data, conversation_id="conv-123"):
+        import asyncio
+
+        asyncio.run(audio_storage.save(audio_data, conversation_id))
+
+    def test_response_has_validators(self, client, audio_storage, audio_data):
+        """Test that responses carry ETag and Last-Modified headers."""
+        self._save(audio_storage, audio_data)
+
+        response = client.get("/api/v1/audio/conv-123")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Last-Modified"].endswith("GMT")
+        assert response.headers["Content-Length"] == str(len(audio_data))
+
+    def test_if_none_match_returns_304(self, client, audio_storage, audio_data):
+        """Test that a matching If-None-Match gives 304 without a body."""
+        self._save(audio_storage, audio_data)
+        etag = client.get("/api/v1/audio/conv-123").headers["ETag"]
+
+        response = client.get(
+            "/api/v1/audio/conv-123", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_stale_if_none_match_returns_content(self, client, audio_storage, audio_data):
+        """Test that a non-matching If-None-Match serves the file."""
+        self._save(audio_storage, audio_data)
+
+        response = client.get("/api/v1/audio/conv-123", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.content == audio_data
+
+    def test_if_modified_since(self, client, audio_storage, audio_data):
+        """Test that If-Modified-Since gives 304 unless the file is newer."""
+        self._save(audio_storage, audio_data)
+        last_modified = client.get("/api/v1/audio/conv-123").headers["Last-Modified"]
+
+        not_modified = client.get(
+            "/api/v1/audio/conv-123", headers={"If-Modified-Since": last_modified}
+        )
+        modified = client.get(
+            "/api/v1/audio/conv-123",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+
+    def test_if_range_mismatch_serves_full_file(self, client, audio_storage, audio_data):
+        """Test that a Range with a stale If-Range validator gets the full file."""
+        self._save(audio_storage, audio_data)
+        etag = client.get("/api/v1/audio/conv-123").headers["ETag"]
+
+        stale = client.get(
+            "/api/v1/audio/conv-123", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+        fresh = client.get(
+            "/api/v1/audio/conv-123", headers={"Range": "bytes=0-9", "If-Range": etag}
+        )
+
+        assert stale.status_code == 200
+        assert stale.content == audio_data
+        assert fresh.status_code == 206
+        assert fresh.content == audio_data[:10]
+
+    def test_range_is_streamed_without_reading_whole_file(self, client, audio_storage, monkeypatch):
+        """Test that ranges are read with iter_range rather than get()."""
+        audio_data = bytes(range(256)) * 1024  # larger than one chunk
+        self._save(audio_storage, audio_data)
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("whole file should not be read")
+
+        monkeypatch.setattr(audio_storage, "get", fail)
+        monkeypatch.setattr(audio_storage, "exists", fail)
+
+        response = client.get("/api/v1/audio/conv-123", headers={"Range": "bytes=1000-199999"})
+
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == f"bytes 1000-199999/{len(audio_data)}"
+        assert response.content == audio_data[1000:200000]
+
+    def test_empty_file(self, client, audio_storage):
+        """Test that an empty file is served with 200 and no body."""
+        self._save(audio_storage, b"")
+
+        response = client.get("/api/v1/audio/conv-123")
+
+        assert response.status_code == 200
+        assert response.content == b""
+
+
 class TestAudioStorageStoreAudio:
     """Tests for AudioStorage.store_audio() method."""
 
@@ -459,3 +459,47 @@ def test_get_me_active_org_not_found_falls_back_to_first_org(client):
     assert data["active_org"]["name"] == "Org 1"
     # Should persist the selection
     mock_user_repo.update.assert_called_once_with(user_id, last_active_org_id=org_id)
+
+
+def test_get_auth_cache_stats(client):
+    """Test GET /api/v1/auth/cache returns this process's cache counters."""
+    from voiceobs.server.auth.cache import AuthCache
+
+    user_id = uuid4()
+    token = create_test_token(str(user_id), "test@example.com")
+    payload = create_test_payload(str(user_id), "test@example.com")
+
+    mock_repo = AsyncMock()
+    mock_repo.upsert.return_value = UserRow(
+        id=user_id, email="test@example.com", name="Test User", auth_provider="google"
+    )
+
+    cache = AuthCache(ttl_seconds=15.0, max_size=100)
+    cache.get(user_id, None)
+    cache.invalidate(user_id)
+
+    with patch("voiceobs.server.auth.dependencies.decode_supabase_jwt", return_value=payload):
+        with patch("voiceobs.server.auth.dependencies.get_user_repository", return_value=mock_repo):
+            with patch("voiceobs.server.routes.auth.get_auth_cache", return_value=cache):
+                response = client.get(
+                    "/api/v1/auth/cache",
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "ttl_seconds": 15.0,
+        "hits": 0,
+        "misses": 1,
+        "hit_rate": 0.0,
+        "evictions": 0,
+        "invalidations": cache.stats().invalidations,
+        "size": 0,
+        "max_size": 100,
+    }
+
+
+def test_get_auth_cache_stats_unauthenticated(client):
+    """Test GET /api/v1/auth/cache without token returns 401."""
+    response = client.get("/api/v1/auth/cache")
+    assert response.status_code == 401
@@ -1,5 +1,7 @@
 """Tests for the failures endpoints."""
 
+from unittest.mock import AsyncMock, patch
+
 
 class TestFailuresEndpoints:
     """Tests for the /failures endpoints."""
@@ -156,3 +158,133 @@ class TestFailuresEndpoints:
         # The slow_response failures should be excluded
         assert data["count"] == 0
         assert len(data["failures"]) == 0
+
+    def test_list_failures_pages_with_cursor(self, client):
+        """Test failures classified in memory are paged with next_cursor."""
+        client.post(
+            "/ingest",
+            json={
+                "spans": [
+                    {
+                        "name": "voice.llm",
+                        "duration_ms": 5000.0,
+                        "attributes": {"voice.conversation.id": f"conv-{i}"},
+                    }
+                    for i in range(3)
+                ]
+            },
+        )
+
+        first = client.get("/failures", params={"limit": 2}).json()
+        second = client.get("/failures", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+
+        assert (first["page_count"], first["count"], first["total"]) == (2, 3, 3)
+        assert (second["page_count"], second["next_cursor"]) == (1, None)
+        ids = [f["id"] for f in first["failures"] + second["failures"]]
+        assert ids == ["0", "1", "2"]
+
+    def test_list_failures_unpaged_by_default(self, client):
+        """Test all failures are returned when no limit is given."""
+        client.post(
+            "/ingest",
+            json={
+                "spans": [
+                    {"name": "voice.llm", "duration_ms": 5000.0, "attributes": {}} for _ in range(3)
+                ]
+            },
+        )
+
+        data = client.get("/failures").json()
+
+        assert (data["count"], data["page_count"], data["next_cursor"]) == (3, 3, None)
+
+    def test_list_failures_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/failures", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+
+class TestFailuresFromDatabase:
+    """Tests for /failures served from the failures table."""
+
+    def test_list_failures_from_repository(self, client):
+        """Test failures, counts and next_cursor come from the repository."""
+        repo = AsyncMock()
+        repo.search.return_value = [
+            {
+                "id": "3f0e7f4e-0000-0000-0000-000000000001",
+                "type": "slow_response",
+                "severity": "high",
+                "message": "LLM took 5000ms",
+                "conversation_id": "conv-1",
+                "turn_id": None,
+                "turn_index": None,
+                "signal_name": "llm_ms",
+                "signal_value": 5000.0,
+                "threshold": 2000.0,
+                "cursor": "next-page",
+            }
+        ]
+        repo.get_counts.return_value = ({"high": 3}, {"slow_response": 3})
+
+        with (
+            patch("voiceobs.server.routes.failures.is_using_postgres", return_value=True),
+            patch("voiceobs.server.routes.failures.is_deriving_spans", return_value=True),
+            patch("voiceobs.server.routes.failures.get_failure_repository", return_value=repo),
+        ):
+            response = client.get(
+                "/failures", params={"severity": "high", "limit": 1, "cursor": "prev-page"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["count"], data["total"], data["page_count"]) == (3, 3, 1)
+        assert data["next_cursor"] == "next-page"
+        assert data["by_type"] == {"slow_response": 3}
+        assert data["failures"][0]["conversation_id"] == "conv-1"
+        repo.search.assert_awaited_once_with(
+            severity="high", failure_type=None, limit=1, cursor="prev-page"
+        )
+        repo.get_counts.assert_awaited_once_with(severity="high", failure_type=None)
+
+    def test_list_failures_last_page(self, client):
+        """Test a short page has no next_cursor."""
+        repo = AsyncMock()
+        repo.search.return_value = []
+        repo.get_counts.return_value = ({}, {})
+
+        with (
+            patch("voiceobs.server.routes.failures.is_using_postgres", return_value=True),
+            patch("voiceobs.server.routes.failures.is_deriving_spans", return_value=True),
+            patch("voiceobs.server.routes.failures.get_failure_repository", return_value=repo),
+        ):
+            data = client.get("/failures").json()
+
+        assert (data["count"], data["total"], data["next_cursor"]) == (0, 0, None)
+
+    def test_list_failures_without_derivation_classifies_spans(self, client):
+        """Test failures are classified from spans when nothing fills the table."""
+        repo = AsyncMock()
+        client.post(
+            "/ingest",
+            json={
+                "spans": [
+                    {
+                        "name": "voice.llm",
+                        "duration_ms": 9000.0,
+                        "attributes": {"voice.stage.type": "llm"},
+                    }
+                ]
+            },
+        )
+
+        with (
+            patch("voiceobs.server.routes.failures.is_using_postgres", return_value=True),
+            patch("voiceobs.server.routes.failures.is_deriving_spans", return_value=False),
+            patch("voiceobs.server.routes.failures.get_failure_repository", return_value=repo),
+        ):
+            data = client.get("/failures").json()
+
+        assert data["by_type"] == {"slow_response": 1}
+        repo.search.assert_not_called()
@@ -598,6 +598,9 @@ class TestDeleteOrg:
         mock_member_repo = AsyncMock()
         mock_member_repo.get.return_value = mock_member
 
+        mock_persona_repo = AsyncMock()
+        mock_persona_repo.list_preview_audio_urls.return_value = ["/audio/tts/cache/ab/1.mp3"]
+
         with patch(
             "voiceobs.server.auth.dependencies.decode_supabase_jwt",
             return_value=payload,
@@ -614,13 +617,22 @@ class TestDeleteOrg:
                         "voiceobs.server.routes.organizations.get_organization_member_repository",
                         return_value=mock_member_repo,
                     ):
-                        response = client.delete(
-                            f"/api/v1/orgs/{org_id}",
-                            headers={"Authorization": f"Bearer {token}"},
-                        )
+                        with patch(
+                            "voiceobs.server.routes.organizations.get_persona_repository",
+                            return_value=mock_persona_repo,
+                        ):
+                            with patch(
+                                "voiceobs.server.routes.organizations.release_preview_audio"
+                            ) as mock_release:
+                                response = client.delete(
+                                    f"/api/v1/orgs/{org_id}",
+                                    headers={"Authorization": f"Bearer {token}"},
+                                )
 
         assert response.status_code == 204
         mock_org_repo.delete.assert_called_once_with(org_id)
+        mock_persona_repo.list_preview_audio_urls.assert_awaited_once_with(org_id)
+        mock_release.assert_awaited_once_with("/audio/tts/cache/ab/1.mp3")
 
     def test_delete_org_not_owner(self, client):
         """Test deleting organization as member (not owner) returns 403."""
@@ -760,12 +772,20 @@ class TestDeleteOrg:
                         "voiceobs.server.routes.organizations.get_organization_member_repository",
                         return_value=mock_member_repo,
                     ):
-                        response = client.delete(
-                            f"/api/v1/orgs/{org_id}",
-                            headers={"Authorization": f"Bearer {token}"},
-                        )
+                        with patch(
+                            "voiceobs.server.routes.organizations.get_persona_repository",
+                            return_value=AsyncMock(),
+                        ):
+                            with patch(
+                                "voiceobs.server.routes.organizations.release_preview_audio"
+                            ) as mock_release:
+                                response = client.delete(
+                                    f"/api/v1/orgs/{org_id}",
+                                    headers={"Authorization": f"Bearer {token}"},
+                                )
 
         assert response.status_code == 404
+        mock_release.assert_not_called()
 
     def test_delete_org_unauthenticated(self, client):
         """Test deleting organization without token returns 401."""
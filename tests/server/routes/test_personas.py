@@ -361,6 +361,39 @@ class TestPersonas:
         assert response.status_code == 204
         mock_repo.delete.assert_called_once_with(persona.id, org_id=self.org.id)
 
+    @patch("voiceobs.server.routes.personas.get_persona_repository")
+    @patch("voiceobs.server.routes.personas.get_tts_audio_cache")
+    def test_delete_persona_releases_preview_audio_after_delete(
+        self,
+        mock_get_cache,
+        mock_get_persona_repo,
+        client,
+    ):
+        """Test preview audio is released only once the persona is deleted."""
+        from asyncpg.exceptions import ForeignKeyViolationError
+
+        persona = make_persona(self.org.id, preview_audio_url="/audio/tts/cache/ab/1.mp3")
+        mock_repo = AsyncMock()
+        mock_repo.get.return_value = persona
+        mock_repo.count.return_value = 2
+        mock_repo.delete.side_effect = ForeignKeyViolationError("used by scenarios")
+        mock_get_persona_repo.return_value = mock_repo
+        tts_cache = AsyncMock()
+        tts_cache.release.return_value = True
+        mock_get_cache.return_value = tts_cache
+
+        response = client.delete(f"/api/v1/orgs/{self.org.id}/personas/{persona.id}")
+
+        assert response.status_code == 409
+        tts_cache.release.assert_not_called()
+
+        mock_repo.delete.side_effect = None
+        mock_repo.delete.return_value = True
+        response = client.delete(f"/api/v1/orgs/{self.org.id}/personas/{persona.id}")
+
+        assert response.status_code == 204
+        tts_cache.release.assert_awaited_once_with("/audio/tts/cache/ab/1.mp3")
+
     @patch("voiceobs.server.routes.personas.get_persona_repository")
     def test_delete_persona_not_found(
         self,
@@ -720,3 +753,286 @@ class TestPersonas:
         )
 
         assert response.status_code == 400
+
+
+class TestPersonaPreviewAudioCache:
+    """Tests for preview audio going through the TTS audio cache."""
+
+    @pytest.mark.asyncio
+    @patch("voiceobs.server.routes.personas.get_tts_audio_cache")
+    @patch("voiceobs.server.dependencies.get_persona_repository")
+    async def test_background_generation_uses_cache(self, mock_get_persona_repo, mock_get_cache):
+        """Test preview generation reuses cached audio and releases the previous file."""
+        from voiceobs.server.routes.personas import _generate_preview_audio_background
+
+        org_id = uuid4()
+        persona_id = uuid4()
+        mock_repo = AsyncMock()
+        mock_get_persona_repo.return_value = mock_repo
+        tts_cache = AsyncMock()
+        tts_cache.get_or_synthesize.return_value.url = "/audio/tts/cache/ab/1.mp3"
+        tts_cache.release.return_value = True
+        mock_get_cache.return_value = tts_cache
+
+        await _generate_preview_audio_background(
+            str(persona_id),
+            org_id,
+            "openai",
+            {"voice": "alloy"},
+            "Hello",
+            "/audio/tts/cache/cd/2.mp3",
+        )
+
+        tts_cache.get_or_synthesize.assert_awaited_once_with("openai", "Hello", {"voice": "alloy"})
+        mock_repo.update.assert_awaited_once_with(
+            persona_id=persona_id,
+            org_id=org_id,
+            preview_audio_url="/audio/tts/cache/ab/1.mp3",
+            preview_audio_text="Hello",
+            preview_audio_status="ready",
+            preview_audio_error=None,
+        )
+        tts_cache.release.assert_awaited_once_with("/audio/tts/cache/cd/2.mp3")
+
+    @pytest.mark.asyncio
+    @patch("voiceobs.server.routes.personas.get_tts_audio_cache")
+    @patch("voiceobs.server.dependencies.get_persona_repository")
+    async def test_background_generation_records_cache_errors(
+        self, mock_get_persona_repo, mock_get_cache
+    ):
+        """Test a failed synthesis marks the preview failed."""
+        from voiceobs.server.routes.personas import _generate_preview_audio_background
+
+        persona_id = uuid4()
+        mock_repo = AsyncMock()
+        mock_get_persona_repo.return_value = mock_repo
+        tts_cache = AsyncMock()
+        tts_cache.get_or_synthesize.side_effect = RuntimeError("quota exceeded")
+        mock_get_cache.return_value = tts_cache
+
+        await _generate_preview_audio_background(str(persona_id), uuid4(), "openai", {}, "Hello")
+
+        assert mock_repo.update.call_args.kwargs["preview_audio_status"] == "failed"
+        assert mock_repo.update.call_args.kwargs["preview_audio_error"] == "quota exceeded"
+        tts_cache.release.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("voiceobs.server.routes.personas.get_audio_storage")
+    @patch("voiceobs.server.routes.personas.get_tts_audio_cache")
+    async def test_release_deletes_only_uncached_files(self, mock_get_cache, mock_get_storage):
+        """Test cached audio is released, and other files are deleted."""
+        from voiceobs.server.routes.personas import release_preview_audio
+
+        tts_cache = AsyncMock()
+        tts_cache.release.side_effect = lambda url: url.startswith("/audio/tts/cache/")
+        mock_get_cache.return_value = tts_cache
+        audio_storage = AsyncMock()
+        mock_get_storage.return_value = audio_storage
+
+        await release_preview_audio("/audio/tts/cache/ab/1.mp3")
+        audio_storage.delete_by_url.assert_not_called()
+
+        await release_preview_audio("/audio/personas/preview/p/1.mp3")
+        audio_storage.delete_by_url.assert_awaited_once_with("/audio/personas/preview/p/1.mp3")
+
+
+class FakeStreamingTTSService:
+    """TTS service streaming fixed MP3 chunks, optionally failing first."""
+
+    streaming_mime_type = "audio/mpeg"
+
+    def __init__(self, error=None):
+        self.error = error
+
+    async def synthesize_streaming(self, text, config):
+        if self.error is not None:
+            raise self.error
+        yield b"ID3-chunk-1"
+        yield b"chunk-2"
+
+    def calculate_duration(self, audio_bytes):
+        return 1500.0
+
+
+class TestPersonaPreviewAudioStream:
+    """Tests for streaming preview audio while it is synthesized."""
+
+    @pytest.fixture(autouse=True)
+    def setup_auth(self, client):
+        """Override require_org_membership with a test AuthContext."""
+        self.org = make_org()
+        self.auth_context = AuthContext(user=make_user(), org=self.org)
+
+        async def override_require_org_membership():
+            return self.auth_context
+
+        client.app.dependency_overrides[require_org_membership] = override_require_org_membership
+        yield
+        client.app.dependency_overrides.pop(require_org_membership, None)
+
+    @pytest.fixture
+    def mock_repo(self):
+        """Persona repository returned by get_persona_repository."""
+        repo = AsyncMock()
+        with patch("voiceobs.server.routes.personas.get_persona_repository", return_value=repo):
+            yield repo
+
+    @pytest.fixture
+    def mock_storage(self):
+        """Audio storage returned by get_audio_storage."""
+        storage = AsyncMock()
+        storage.store_audio.return_value = "/audio/personas/preview/p/new.mp3"
+        with patch("voiceobs.server.routes.personas.get_audio_storage", return_value=storage):
+            yield storage
+
+    @pytest.fixture
+    def tts_cache(self):
+        """TTS audio cache returned by get_tts_audio_cache (None unless set)."""
+        with patch("voiceobs.server.routes.personas.get_tts_audio_cache") as mock_get_cache:
+            mock_get_cache.return_value = None
+            yield mock_get_cache
+
+    def stream_url(self, persona):
+        return f"/api/v1/orgs/{self.org.id}/personas/{persona.id}/preview-audio/stream"
+
+    def test_streams_and_saves_audio(self, client, mock_repo, mock_storage, tts_cache):
+        """Test audio is streamed, then stored and saved as the preview audio."""
+        persona = make_persona(self.org.id, preview_audio_url="/audio/personas/preview/p/old.mp3")
+        mock_repo.get.return_value = persona
+
+        with patch(
+            "voiceobs.server.services.tts_streaming.TTSServiceFactory.create",
+            return_value=FakeStreamingTTSService(),
+        ):
+            response = client.get(self.stream_url(persona))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.content == b"ID3-chunk-1chunk-2"
+        mock_storage.store_audio.assert_awaited_once_with(
+            b"ID3-chunk-1chunk-2",
+            prefix=f"personas/preview/{persona.id}",
+            content_type="audio/mpeg",
+        )
+        mock_repo.update.assert_awaited_once_with(
+            persona_id=persona.id,
+            org_id=self.org.id,
+            preview_audio_url="/audio/personas/preview/p/new.mp3",
+            preview_audio_text=DEFAULT_PREVIEW_TEXT,
+            preview_audio_status="ready",
+            preview_audio_error=None,
+        )
+        mock_storage.delete_by_url.assert_awaited_once_with("/audio/personas/preview/p/old.mp3")
+
+    def test_streamed_audio_goes_into_cache(self, client, mock_repo, mock_storage, tts_cache):
+        """Test streamed audio is stored through the TTS audio cache when enabled."""
+        persona = make_persona(self.org.id, tts_config={"voice": "alloy"})
+        mock_repo.get.return_value = persona
+        cache = AsyncMock()
+        cache.acquire.return_value = None
+        cache.store.return_value.url = "/audio/tts/cache/ab/1.mp3"
+        tts_cache.return_value = cache
+
+        with patch(
+            "voiceobs.server.services.tts_streaming.TTSServiceFactory.create",
+            return_value=FakeStreamingTTSService(),
+        ):
+            response = client.get(self.stream_url(persona))
+
+        assert response.status_code == 200
+        cache.store.assert_awaited_once_with(
+            "openai",
+            DEFAULT_PREVIEW_TEXT,
+            {"voice": "alloy"},
+            b"ID3-chunk-1chunk-2",
+            "audio/mpeg",
+            1500.0,
+        )
+        mock_storage.store_audio.assert_not_called()
+        assert mock_repo.update.call_args.kwargs["preview_audio_url"] == (
+            "/audio/tts/cache/ab/1.mp3"
+        )
+
+    def test_persona_changed_while_streaming(self, client, mock_repo, mock_storage, tts_cache):
+        """Test audio is discarded if the persona changed while it streamed."""
+        persona = make_persona(self.org.id)
+        changed = make_persona(self.org.id, id=persona.id, tts_config={"voice": "nova"})
+        mock_repo.get.side_effect = [persona, changed]
+
+        with patch(
+            "voiceobs.server.services.tts_streaming.TTSServiceFactory.create",
+            return_value=FakeStreamingTTSService(),
+        ):
+            response = client.get(self.stream_url(persona))
+
+        assert response.content == b"ID3-chunk-1chunk-2"
+        mock_repo.update.assert_not_called()
+        mock_storage.delete_by_url.assert_awaited_once_with("/audio/personas/preview/p/new.mp3")
+
+    def test_ready_audio_redirects(self, client, mock_repo, tts_cache):
+        """Test existing preview audio is served by redirecting to it."""
+        persona = make_persona(
+            self.org.id,
+            preview_audio_url="https://example.com/preview.mp3",
+            preview_audio_status="ready",
+        )
+        mock_repo.get.return_value = persona
+
+        response = client.get(self.stream_url(persona), follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://example.com/preview.mp3"
+        mock_repo.update.assert_not_called()
+
+    def test_cached_audio_redirects(self, client, mock_repo, tts_cache):
+        """Test audio already in the TTS audio cache is used without synthesizing."""
+        persona = make_persona(self.org.id)
+        mock_repo.get.return_value = persona
+        cache = AsyncMock()
+        cache.acquire.return_value.url = "https://example.com/cached.mp3"
+        tts_cache.return_value = cache
+
+        with patch("voiceobs.server.services.tts_streaming.TTSServiceFactory.create") as create:
+            response = client.get(self.stream_url(persona), follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://example.com/cached.mp3"
+        create.assert_not_called()
+        assert mock_repo.update.call_args.kwargs["preview_audio_status"] == "ready"
+
+    def test_generating_conflict(self, client, mock_repo, tts_cache):
+        """Test streaming is refused while background generation is running."""
+        persona = make_persona(self.org.id, preview_audio_status="generating")
+        mock_repo.get.return_value = persona
+
+        response = client.get(self.stream_url(persona))
+
+        assert response.status_code == 409
+
+    def test_provider_error(self, client, mock_repo, tts_cache):
+        """Test provider errors before any audio return 502 and mark the preview failed."""
+        persona = make_persona(self.org.id)
+        mock_repo.get.return_value = persona
+
+        with patch(
+            "voiceobs.server.services.tts_streaming.TTSServiceFactory.create",
+            return_value=FakeStreamingTTSService(error=ValueError("missing API key")),
+        ):
+            response = client.get(self.stream_url(persona))
+
+        assert response.status_code == 502
+        assert "missing API key" in response.json()["detail"]
+        mock_repo.update.assert_awaited_once_with(
+            persona_id=persona.id,
+            org_id=self.org.id,
+            preview_audio_status="failed",
+            preview_audio_error="missing API key",
+        )
+
+    def test_persona_not_found(self, client, mock_repo, tts_cache):
+        """Test streaming for an unknown persona returns 404."""
+        mock_repo.get.return_value = None
+
+        response = client.get(self.stream_url(make_persona(self.org.id)))
+
+        assert response.status_code == 404
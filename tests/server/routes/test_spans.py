@@ -1,5 +1,6 @@
 """Tests for the spans endpoints."""
 
+import json
 from uuid import UUID
 
 
@@ -125,6 +126,128 @@ class TestSpansEndpoints:
         assert len(data["spans"]) == 1
         assert data["spans"][0]["name"] == "voice.turn"
 
+    def test_list_spans_pages_with_cursor(self, client):
+        """Test walking every page of spans with next_cursor."""
+        client.post(
+            "/ingest",
+            json={"spans": [{"name": f"span{i}", "attributes": {}} for i in range(5)]},
+        )
+
+        names = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            data = client.get("/spans", params=params).json()
+            assert (data["count"], data["total"]) == (5, 5)
+            assert data["page_count"] == len(data["spans"])
+            names.extend(span["name"] for span in data["spans"])
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert sorted(names) == [f"span{i}" for i in range(5)]
+
+    def test_list_spans_unpaged_by_default(self, client):
+        """Test all spans are returned when no limit is given, as before paging."""
+        client.post(
+            "/ingest",
+            json={"spans": [{"name": f"span{i}", "attributes": {}} for i in range(3)]},
+        )
+
+        data = client.get("/spans").json()
+
+        assert (data["count"], data["page_count"], data["next_cursor"]) == (3, 3, None)
+
+    def test_list_spans_approximate_total(self, client):
+        """Test the total can come from the storage estimate."""
+        client.post("/ingest", json={"name": "span", "attributes": {}})
+
+        data = client.get("/spans", params={"approximate_total": True}).json()
+
+        assert data["total"] == 1
+        assert data["total_is_approximate"] is True
+
+    def test_list_spans_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/spans", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+
+    def test_export_spans_ndjson(self, client, monkeypatch):
+        """Test export streams one JSON span per line across chunks."""
+        monkeypatch.setattr("voiceobs.server.routes.spans.EXPORT_CHUNK_SPANS", 2)
+        client.post(
+            "/ingest",
+            json={"spans": [{"name": f"span{i}", "duration_ms": float(i)} for i in range(5)]},
+        )
+
+        response = client.get("/spans/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["name"] for line in lines) == [f"span{i}" for i in range(5)]
+        assert set(lines[0]) == {
+            "name",
+            "start_time",
+            "end_time",
+            "duration_ms",
+            "attributes",
+            "trace_id",
+            "span_id",
+            "parent_span_id",
+        }
+
+    def test_export_spans_filters(self, client):
+        """Test export filters by conversation and start time range."""
+        client.post(
+            "/ingest",
+            json={
+                "spans": [
+                    {
+                        "name": "early",
+                        "start_time": "2026-03-01T09:00:00+00:00",
+                        "attributes": {"voice.conversation.id": "conv-1"},
+                    },
+                    {
+                        "name": "in-range",
+                        "start_time": "2026-03-01T10:30:00+00:00",
+                        "attributes": {"voice.conversation.id": "conv-1"},
+                    },
+                    {
+                        "name": "other-conversation",
+                        "start_time": "2026-03-01T10:30:00+00:00",
+                        "attributes": {"voice.conversation.id": "conv-2"},
+                    },
+                ]
+            },
+        )
+
+        response = client.get(
+            "/spans/export",
+            params={
+                "conversation_id": "conv-1",
+                "since": "2026-03-01T10:00:00+00:00",
+                "until": "2026-03-01T11:00:00+00:00",
+            },
+        )
+
+        assert response.status_code == 200
+        assert [json.loads(line)["name"] for line in response.text.splitlines()] == ["in-range"]
+
+    def test_export_spans_empty(self, client):
+        """Test exporting an empty store returns an empty body."""
+        response = client.get("/spans/export")
+
+        assert response.status_code == 200
+        assert response.text == ""
+
     def test_get_span_by_id(self, client):
         """Test getting a specific span by ID."""
         # Ingest a span
@@ -1,7 +1,8 @@
 """Tests for the test execution API endpoints."""
 
+import json
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from voiceobs.server.db.models import TestExecutionRow, TestScenarioRow, TestSuiteRow
@@ -65,8 +66,10 @@ class TestTestExecution:
         mock_scenario_repo.list_all.return_value = [mock_scenario]
         mock_get_scenario_repository.return_value = mock_scenario_repo
 
+        run_id = uuid4()
         mock_execution_repo = AsyncMock()
-        mock_execution_repo.create.return_value = mock_execution
+        mock_execution_repo.enqueue_run.return_value = (run_id, [mock_execution])
+        mock_execution_repo.get_summary.return_value = {"avg_duration_ms": None}
         mock_get_execution_repository.return_value = mock_execution_repo
 
         # get_test_repos returns a tuple of (suite_repo, scenario_repo, execution_repo)
@@ -81,7 +84,11 @@ class TestTestExecution:
         data = response.json()
         assert data["status"] == "queued"
         assert data["scenarios_count"] == 1
-        assert "execution_id" in data
+        assert data["run_id"] == str(run_id)
+        assert data["execution_id"] == str(execution_id)
+        assert data["estimated_duration"] == 300
+        mock_execution_repo.enqueue_run.assert_called_once_with([scenario_id], max_parallel=10)
+        mock_execution_repo.get_summary.assert_called_once_with(suite_id=suite_id)
 
     @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
     @patch("voiceobs.server.routes.test_dependencies.get_test_scenario_repository")
@@ -138,8 +145,15 @@ class TestTestExecution:
         mock_scenario_repo.get.side_effect = [mock_scenario1, mock_scenario2]
         mock_get_scenario_repository.return_value = mock_scenario_repo
 
+        mock_execution2 = TestExecutionRow(id=uuid4(), scenario_id=scenario_id2, status="queued")
+
         mock_execution_repo = AsyncMock()
-        mock_execution_repo.create.return_value = mock_execution
+        mock_execution_repo.enqueue_run.return_value = (
+            uuid4(),
+            [mock_execution, mock_execution2],
+        )
+        # Past executions took 60 seconds on average
+        mock_execution_repo.get_summary.return_value = {"avg_duration_ms": 60000.0}
         mock_get_execution_repository.return_value = mock_execution_repo
 
         # get_test_repos returns a tuple of (suite_repo, scenario_repo, execution_repo)
@@ -157,6 +171,11 @@ class TestTestExecution:
         data = response.json()
         assert data["status"] == "queued"
         assert data["scenarios_count"] == 2
+        # Both scenarios run in parallel
+        assert data["estimated_duration"] == 60
+        mock_execution_repo.enqueue_run.assert_called_once_with(
+            [scenario_id1, scenario_id2], max_parallel=10
+        )
 
     @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
     @patch("voiceobs.server.routes.test_dependencies.get_test_scenario_repository")
@@ -297,3 +316,130 @@ class TestTestExecution:
         response = client.get(f"/api/v1/tests/executions/{execution_id}")
 
         assert response.status_code == 404
+
+    @patch("voiceobs.server.routes.test_executions.get_test_execution_pool")
+    @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
+    @patch("voiceobs.server.routes.test_dependencies.get_test_scenario_repository")
+    @patch("voiceobs.server.routes.test_dependencies.get_test_suite_repository")
+    @patch("voiceobs.server.routes.test_dependencies.is_using_postgres", return_value=True)
+    def test_run_tests_wakes_pool_and_estimates_parallel_duration(
+        self,
+        mock_is_postgres,
+        mock_get_suite_repository,
+        mock_get_scenario_repository,
+        mock_get_execution_repository,
+        mock_get_pool,
+        client,
+    ):
+        """Test a run wakes the execution pool and its estimate reflects the agent limit."""
+        suite_id = uuid4()
+        agent_id = uuid4()
+        scenarios = [
+            TestScenarioRow(
+                id=uuid4(), suite_id=suite_id, name=f"S{i}", goal="Goal", persona_id=uuid4()
+            )
+            for i in range(10)
+        ]
+        executions = [
+            TestExecutionRow(id=uuid4(), scenario_id=s.id, status="queued", agent_id=agent_id)
+            for s in scenarios
+        ]
+
+        mock_suite_repo = AsyncMock()
+        mock_suite_repo.get_by_id.return_value = TestSuiteRow(
+            id=suite_id, org_id=uuid4(), name="Suite", agent_id=agent_id
+        )
+        mock_get_suite_repository.return_value = mock_suite_repo
+        mock_scenario_repo = AsyncMock()
+        mock_scenario_repo.list_all.return_value = scenarios
+        mock_get_scenario_repository.return_value = mock_scenario_repo
+        mock_execution_repo = AsyncMock()
+        mock_execution_repo.enqueue_run.return_value = (uuid4(), executions)
+        mock_execution_repo.get_summary.return_value = {"avg_duration_ms": 30000.0}
+        mock_get_execution_repository.return_value = mock_execution_repo
+        mock_pool = MagicMock(workers=8, concurrency_per_agent=4)
+        mock_get_pool.return_value = mock_pool
+
+        response = client.post(
+            "/api/v1/tests/run",
+            json={"suite_id": str(suite_id), "max_workers": 10},
+        )
+
+        assert response.status_code == 201
+        # 10 executions, 4 at a time against the agent: 3 rounds of 30 seconds
+        assert response.json()["estimated_duration"] == 90
+        mock_pool.notify.assert_called_once()
+
+    @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
+    @patch("voiceobs.server.routes.test_dependencies.is_using_postgres", return_value=True)
+    def test_get_run_progress(self, mock_is_postgres, mock_get_repository, client):
+        """Test getting a run's progress counts."""
+        mock_repo = AsyncMock()
+        mock_repo.get_run_progress.return_value = {
+            "total": 3,
+            "queued": 1,
+            "running": 1,
+            "completed": 1,
+            "failed": 0,
+            "passed": 1,
+        }
+        mock_get_repository.return_value = mock_repo
+
+        run_id = uuid4()
+        response = client.get(f"/api/v1/tests/runs/{run_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["run_id"] == str(run_id)
+        assert data["queued"] == 1
+        assert data["done"] is False
+        mock_repo.get_run_progress.assert_called_once_with(run_id)
+
+    @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
+    @patch("voiceobs.server.routes.test_dependencies.is_using_postgres", return_value=True)
+    def test_get_run_progress_not_found(self, mock_is_postgres, mock_get_repository, client):
+        """Test unknown runs and malformed run IDs."""
+        mock_repo = AsyncMock()
+        mock_repo.get_run_progress.return_value = None
+        mock_get_repository.return_value = mock_repo
+
+        assert client.get(f"/api/v1/tests/runs/{uuid4()}").status_code == 404
+        assert client.get(f"/api/v1/tests/runs/{uuid4()}/progress").status_code == 404
+        assert client.get("/api/v1/tests/runs/not-a-uuid").status_code == 400
+
+    @patch("voiceobs.server.routes.test_executions.PROGRESS_POLL_SECONDS", 0)
+    @patch("voiceobs.server.routes.test_dependencies.get_test_execution_repository")
+    @patch("voiceobs.server.routes.test_dependencies.is_using_postgres", return_value=True)
+    def test_stream_run_progress(self, mock_is_postgres, mock_get_repository, client):
+        """Test progress is streamed as NDJSON on every change until the run is done."""
+
+        def progress(queued, running, completed):
+            return {
+                "total": 2,
+                "queued": queued,
+                "running": running,
+                "completed": completed,
+                "failed": 0,
+                "passed": completed,
+            }
+
+        mock_repo = AsyncMock()
+        mock_repo.get_run_progress.side_effect = [
+            progress(2, 0, 0),
+            progress(2, 0, 0),  # Unchanged, not streamed
+            progress(0, 2, 0),
+            progress(0, 0, 2),
+        ]
+        mock_get_repository.return_value = mock_repo
+
+        response = client.get(f"/api/v1/tests/runs/{uuid4()}/progress")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(line["queued"], line["running"], line["completed"]) for line in lines] == [
+            (2, 0, 0),
+            (0, 2, 0),
+            (0, 0, 2),
+        ]
+        assert [line["done"] for line in lines] == [False, False, True]
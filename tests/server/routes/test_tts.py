@@ -0,0 +1,58 @@
+"""Tests for the TTS API endpoints."""
+
+from uuid import uuid4
+
+import pytest
+
+from voiceobs.server.auth.context import AuthContext, get_auth_context
+from voiceobs.server.db.models import OrganizationRow, UserRow
+from voiceobs.server.dependencies import get_tts_stream_metrics
+
+
+class TestTTSStreamMetrics:
+    """Tests for GET /api/v1/tts/metrics."""
+
+    @pytest.fixture(autouse=True)
+    def setup_auth(self, client):
+        """Override get_auth_context with a test AuthContext."""
+        user = UserRow(id=uuid4(), email="test@example.com", name="Test User", is_active=True)
+        org = OrganizationRow(id=uuid4(), name="Test Org", created_by=user.id)
+
+        async def override_get_auth_context():
+            return AuthContext(user=user, org=org)
+
+        client.app.dependency_overrides[get_auth_context] = override_get_auth_context
+        yield
+        client.app.dependency_overrides.pop(get_auth_context, None)
+
+    def test_no_streams_yet(self, client):
+        """Test the metrics are empty before any stream."""
+        response = client.get("/api/v1/tts/metrics")
+
+        assert response.status_code == 200
+        assert response.json() == {"window": 500, "providers": []}
+
+    def test_latency_per_provider(self, client):
+        """Test recorded streams are reported per provider."""
+        metrics = get_tts_stream_metrics()
+        metrics.record("openai", 300.0, 4000.0)
+        metrics.record("openai", 500.0, 6000.0)
+        metrics.record_failure("elevenlabs")
+
+        response = client.get("/api/v1/tts/metrics")
+
+        assert response.status_code == 200
+        elevenlabs, openai = response.json()["providers"]
+        assert elevenlabs == {
+            "provider": "elevenlabs",
+            "streams": 0,
+            "failures": 1,
+            "time_to_first_byte_ms_p50": None,
+            "time_to_first_byte_ms_p95": None,
+            "total_ms_p50": None,
+            "total_ms_p95": None,
+        }
+        assert openai["streams"] == 2
+        assert openai["time_to_first_byte_ms_p50"] == 300.0
+        assert openai["time_to_first_byte_ms_p95"] == 500.0
+        assert openai["total_ms_p50"] == 4000.0
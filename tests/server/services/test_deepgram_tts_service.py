@@ -1,6 +1,8 @@
 """Tests for Deepgram TTS service implementation."""
 
+import asyncio
 import os
+import threading
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -275,6 +277,35 @@ class TestDeepgramTTSService:
             assert kwargs["encoding"] == "linear16"  # Fixed encoding
             assert kwargs["container"] == "wav"  # Fixed container
 
+    async def test_synthesize_streaming_does_not_block_event_loop(
+        self, mock_env_with_api_key: None
+    ) -> None:
+        """Test that reading the blocking SDK iterator leaves the event loop free."""
+        from voiceobs.server.services.deepgram_tts import DeepgramTTSService
+
+        released = threading.Event()
+
+        def blocking_chunks():
+            # Only another task on the event loop can release the iterator
+            if not released.wait(timeout=5):
+                raise TimeoutError("event loop was blocked")
+            yield b"chunk"
+
+        async def release() -> None:
+            released.set()
+
+        with patch("voiceobs.server.services.deepgram_tts.DeepgramClient") as mock_deepgram:
+            mock_client = MagicMock()
+            mock_client.speak.v1.audio.generate = MagicMock(return_value=blocking_chunks())
+            mock_deepgram.return_value = mock_client
+
+            service = DeepgramTTSService()
+            release_task = asyncio.create_task(release())
+            chunks = [chunk async for chunk in service.synthesize_streaming("Hello", {})]
+            await release_task
+
+            assert chunks == [b"chunk"]
+
     async def test_synthesize_streaming_raises_error_when_api_key_missing(
         self,
     ) -> None:
@@ -298,6 +329,7 @@ class TestDeepgramTTSService:
         assert DeepgramTTSService.ENCODING == "linear16"
         assert DeepgramTTSService.CONTAINER == "wav"
         assert DeepgramTTSService.MIME_TYPE == "audio/wav"
+        assert DeepgramTTSService.streaming_mime_type == "audio/wav"
 
     async def test_synthesize_with_voice_parameter(
         self, mock_env_with_api_key: None, mock_deepgram_client: MagicMock
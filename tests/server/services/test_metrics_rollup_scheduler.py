@@ -0,0 +1,59 @@
+"""Tests for the metrics rollup refresh scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from voiceobs.server.services.metrics_rollup_scheduler import MetricsRollupScheduler
+
+
+class TestMetricsRollupScheduler:
+    """Tests for MetricsRollupScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_periodically_until_stopped(self):
+        """Test refresh runs immediately and then every interval."""
+        rollups = AsyncMock()
+        scheduler = MetricsRollupScheduler(rollups, interval_seconds=0.01)
+
+        scheduler.start()
+        assert scheduler.running
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert not scheduler.running
+        calls = rollups.refresh.await_count
+        assert calls >= 2
+        await asyncio.sleep(0.03)
+        assert rollups.refresh.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_retried(self):
+        """Test an exception in refresh does not stop the loop."""
+        rollups = AsyncMock()
+        rollups.refresh.side_effect = [RuntimeError("database down"), None, None, None, None]
+        scheduler = MetricsRollupScheduler(rollups, interval_seconds=0.01)
+
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert rollups.refresh.await_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_start_twice_and_stop_without_start(self):
+        """Test start is idempotent and stop is safe before start."""
+        scheduler = MetricsRollupScheduler(AsyncMock(), interval_seconds=60)
+        await scheduler.stop()
+
+        scheduler.start()
+        task = scheduler._task
+        scheduler.start()
+        assert scheduler._task is task
+        await scheduler.stop()
+
+    def test_rejects_non_positive_interval(self):
+        """Test the interval must be positive."""
+        with pytest.raises(ValueError, match="interval_seconds"):
+            MetricsRollupScheduler(AsyncMock(), interval_seconds=0)
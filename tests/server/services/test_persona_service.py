@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -293,6 +293,69 @@ class TestPersonaServiceSeedOrgPersonas:
         assert call.kwargs["tts_provider"] == "openai"
         assert call.kwargs["tts_config"] == {}
 
+    @pytest.mark.asyncio
+    async def test_seed_org_personas_reuses_cached_preview_audio(self, mock_persona_repo):
+        """Personas whose preview audio is cached get it without synthesizing."""
+        tts_cache = AsyncMock()
+        tts_cache.acquire.side_effect = [
+            MagicMock(url="/audio/tts/cache/ab/1.mp3"),
+            None,
+            RuntimeError("connection lost"),
+        ]
+        service = PersonaService(persona_repo=mock_persona_repo, tts_cache=tts_cache)
+        catalog = {
+            "personas": [
+                {
+                    "name": name,
+                    "aggression": 0.5,
+                    "patience": 0.5,
+                    "verbosity": 0.5,
+                    "preview_audio_text": f"Hi, I'm {name}",
+                    "providers": {"openai": {"voice": "alloy"}},
+                }
+                for name in ("Cached", "Uncached", "Lookup fails")
+            ]
+        }
+
+        with patch.object(PersonaService, "_load_catalog", return_value=catalog):
+            await service.seed_org_personas(uuid4())
+
+        tts_cache.acquire.assert_any_await("openai", "Hi, I'm Cached", {"voice": "alloy"})
+        calls = [c.kwargs for c in mock_persona_repo.create.call_args_list]
+        assert calls[0]["preview_audio_url"] == "/audio/tts/cache/ab/1.mp3"
+        assert calls[0]["preview_audio_status"] == "ready"
+        for kwargs in calls[1:]:
+            assert kwargs["preview_audio_url"] is None
+            assert kwargs["preview_audio_status"] is None
+            assert kwargs["preview_audio_text"] is not None
+
+    @pytest.mark.asyncio
+    async def test_seed_org_personas_releases_preview_audio_when_create_fails(
+        self, mock_persona_repo
+    ):
+        """The cached preview audio reference is dropped if the persona is not created."""
+        tts_cache = AsyncMock()
+        tts_cache.acquire.return_value = MagicMock(url="/audio/tts/cache/ab/1.mp3")
+        mock_persona_repo.create.side_effect = RuntimeError("insert failed")
+        service = PersonaService(persona_repo=mock_persona_repo, tts_cache=tts_cache)
+        catalog = {
+            "personas": [
+                {
+                    "name": "Cached",
+                    "aggression": 0.5,
+                    "patience": 0.5,
+                    "verbosity": 0.5,
+                    "preview_audio_text": "Hi, I'm Cached",
+                }
+            ]
+        }
+
+        with patch.object(PersonaService, "_load_catalog", return_value=catalog):
+            with pytest.raises(RuntimeError, match="insert failed"):
+                await service.seed_org_personas(uuid4())
+
+        tts_cache.release.assert_awaited_once_with("/audio/tts/cache/ab/1.mp3")
+
 
 class TestPersonaServiceLoadModels:
     """Tests for _load_models edge cases."""
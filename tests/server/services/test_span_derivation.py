@@ -0,0 +1,366 @@
+"""Tests for the span derivation queue."""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from voiceobs.server.db.connection import Database
+from voiceobs.server.db.migrations import run_migrations
+from voiceobs.server.db.repositories import (
+    ConversationRepository,
+    FailureRepository,
+    SpanRepository,
+    TurnRepository,
+)
+from voiceobs.server.services.span_derivation import IngestedSpan, SpanDerivationQueue
+
+TEST_DATABASE_URL = os.environ.get("VOICEOBS_TEST_DATABASE_URL")
+
+
+def _turn(conv_uuid, turn_id, actor="agent", **attrs):
+    return IngestedSpan(
+        span_uuid=uuid4(),
+        conversation_uuid=conv_uuid,
+        span={
+            "name": "voice.turn",
+            "duration_ms": 1000.0,
+            "attributes": {
+                "voice.turn.id": turn_id,
+                "voice.turn.index": 1,
+                "voice.actor": actor,
+                "voice.transcript": "Hello",
+                **attrs,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def conn():
+    """Mock connection of the derivation transaction."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repos(conn):
+    """Mock database, span, turn and failure repositories.
+
+    Every span is in the derivation backlog until it is claimed once.
+    """
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def transaction():
+        yield conn
+
+    db.transaction = transaction
+
+    span_repo = AsyncMock()
+    claimed = set()
+
+    async def claim_derivations(span_ids, _conn):
+        new = set(span_ids) - claimed
+        claimed.update(new)
+        return new
+
+    span_repo.claim_derivations.side_effect = claim_derivations
+    span_repo.get_pending_derivations.return_value = []
+    turn_repo = AsyncMock()
+    turn_repo.get_ids_by_turn_id.return_value = {}
+    failure_repo = AsyncMock()
+    return db, span_repo, turn_repo, failure_repo
+
+
+class TestSpanDerivationQueue:
+    """Tests for SpanDerivationQueue."""
+
+    def test_invalid_settings(self, repos):
+        """Test non-positive sizes are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            SpanDerivationQueue(*repos, workers=0)
+        with pytest.raises(ValueError, match="max_queue_size"):
+            SpanDerivationQueue(*repos, max_queue_size=0)
+        with pytest.raises(ValueError, match="batch_size"):
+            SpanDerivationQueue(*repos, batch_size=0)
+        with pytest.raises(ValueError, match="catch_up_interval"):
+            SpanDerivationQueue(*repos, catch_up_interval=0)
+
+    @pytest.mark.asyncio
+    async def test_derive_writes_turns_and_failures(self, repos, conn):
+        """Test turns are extracted and failures linked to their turn UUIDs."""
+        _db, _span_repo, turn_repo, failure_repo = repos
+        conv_uuid = uuid4()
+        turn_uuid = uuid4()
+        turn_repo.get_ids_by_turn_id.return_value = {(conv_uuid, "turn-1"): turn_uuid}
+        queue = SpanDerivationQueue(*repos)
+        turn = _turn(conv_uuid, "turn-1", **{"voice.silence.after_user_ms": 5000.0})
+        slow_llm = IngestedSpan(
+            uuid4(),
+            conv_uuid,
+            {"name": "voice.llm", "duration_ms": 9000.0, "attributes": {}},
+        )
+
+        assert await queue.derive([turn, slow_llm]) == 2
+
+        [turns] = turn_repo.add_many.call_args[0]
+        assert turns == [
+            {
+                "conversation_id": conv_uuid,
+                "span_id": turn.span_uuid,
+                "actor": "agent",
+                "turn_id": "turn-1",
+                "turn_index": 1,
+                "duration_ms": 1000.0,
+                "transcript": "Hello",
+                "attributes": turn.span["attributes"],
+            }
+        ]
+        assert turn_repo.add_many.call_args.kwargs == {"conn": conn}
+        turn_repo.get_ids_by_turn_id.assert_awaited_once_with([(conv_uuid, "turn-1")], conn=conn)
+        [failures] = failure_repo.add_many.call_args[0]
+        assert failure_repo.add_many.call_args.kwargs == {"conn": conn}
+        by_type = {f["failure_type"]: f for f in failures}
+        assert set(by_type) == {"excessive_silence", "slow_response"}
+        assert by_type["excessive_silence"]["conversation_id"] == conv_uuid
+        assert by_type["excessive_silence"]["turn_id"] == turn_uuid
+        assert by_type["excessive_silence"]["signal_value"] == 5000.0
+        assert by_type["slow_response"]["turn_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_derive_without_failures_skips_failure_write(self, repos):
+        """Test a batch with no failures only writes turns."""
+        _db, _span_repo, turn_repo, failure_repo = repos
+        queue = SpanDerivationQueue(*repos)
+
+        await queue.derive([_turn(uuid4(), "turn-1", actor="user")])
+
+        turn_repo.add_many.assert_awaited_once()
+        turn_repo.get_ids_by_turn_id.assert_not_called()
+        failure_repo.add_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_derive_skips_spans_no_longer_in_backlog(self, repos, conn):
+        """Test spans another worker already derived are not derived again."""
+        _db, span_repo, turn_repo, _failure_repo = repos
+        queue = SpanDerivationQueue(*repos)
+        turn = _turn(uuid4(), "turn-1")
+
+        assert await queue.derive([turn]) == 1
+        assert await queue.derive([turn]) == 0
+
+        span_repo.claim_derivations.assert_awaited_with([turn.span_uuid], conn)
+        assert [len(call[0][0]) for call in turn_repo.add_many.call_args_list] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_workers_drain_submitted_spans_in_batches(self, repos):
+        """Test submitted spans are derived in the background and drained on stop."""
+        _db, _span_repo, turn_repo, failure_repo = repos
+        queue = SpanDerivationQueue(*repos, workers=1, batch_size=2)
+        conv_uuid = uuid4()
+        ignored = IngestedSpan(uuid4(), conv_uuid, {"name": "voice.conversation"})
+
+        await queue.submit([_turn(conv_uuid, f"turn-{i}") for i in range(5)] + [ignored])
+        assert queue.pending == 5
+
+        queue.start()
+        assert queue.running
+        await queue.stop()
+
+        assert not queue.running
+        assert queue.pending == 0
+        batches = [len(call[0][0]) for call in turn_repo.add_many.call_args_list]
+        assert batches == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_logged_and_skipped(self, repos, caplog):
+        """Test a database error does not stop the workers."""
+        _db, _span_repo, turn_repo, failure_repo = repos
+        turn_repo.add_many.side_effect = [RuntimeError("database down"), None]
+        queue = SpanDerivationQueue(*repos, workers=1, batch_size=1)
+        queue.start()
+
+        await queue.submit([_turn(uuid4(), "turn-1"), _turn(uuid4(), "turn-2")])
+        await queue.stop()
+
+        assert turn_repo.add_many.await_count == 2
+        assert "Deriving turns and failures for 1 spans failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_submit_waits_when_queue_is_full(self, repos):
+        """Test a full queue applies backpressure instead of dropping spans."""
+        queue = SpanDerivationQueue(*repos, workers=1, max_queue_size=1)
+        await queue.submit([_turn(uuid4(), "turn-1")])
+
+        blocked = asyncio.create_task(queue.submit([_turn(uuid4(), "turn-2")]))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        queue.start()
+        await asyncio.wait_for(blocked, 1)
+        await queue.stop()
+        assert repos[2].add_many.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_times_out_and_cancel(self, repos):
+        """Test stop gives up on a stuck queue and cancel is safe to repeat."""
+        _db, _span_repo, turn_repo, failure_repo = repos
+        release = asyncio.Event()
+
+        async def stuck(_turns):
+            await release.wait()
+
+        turn_repo.add_many.side_effect = stuck
+        queue = SpanDerivationQueue(*repos, workers=1)
+        queue.start()
+        queue.start()
+        await queue.submit([_turn(uuid4(), "turn-1")])
+
+        await queue.stop(timeout=0.01)
+
+        assert not queue.running
+        queue.cancel()
+        await queue.stop()
+
+
+class TestSpanDerivationCatchUp:
+    """Tests for deriving spans left in the derivation backlog."""
+
+    @staticmethod
+    def _pending(conv_uuid, turn_id):
+        span = _turn(conv_uuid, turn_id)
+        return {"id": span.span_uuid, "conversation_id": conv_uuid, **span.span}
+
+    @pytest.mark.asyncio
+    async def test_catch_up_pages_through_backlog(self, repos, caplog):
+        """Test every page is derived and a failed page is left for the next pass."""
+        _db, span_repo, turn_repo, _failure_repo = repos
+        conv_uuid = uuid4()
+        pages = [
+            [self._pending(conv_uuid, "turn-1"), self._pending(conv_uuid, "turn-2")],
+            [self._pending(conv_uuid, "turn-3")],
+        ]
+        span_repo.get_pending_derivations.side_effect = [*pages, []]
+        turn_repo.add_many.side_effect = [RuntimeError("database down"), None]
+        queue = SpanDerivationQueue(*repos, batch_size=2)
+
+        assert await queue.catch_up(min_age_seconds=30.0) == 1
+
+        after = [call.kwargs["after"] for call in span_repo.get_pending_derivations.call_args_list]
+        assert after == [None, pages[0][-1]["id"], pages[1][-1]["id"]]
+        assert span_repo.get_pending_derivations.call_args.kwargs["min_age_seconds"] == 30.0
+        [turns] = turn_repo.add_many.call_args[0]
+        assert [turn["span_id"] for turn in turns] == [pages[1][0]["id"]]
+        assert turns[0]["turn_id"] == "turn-3"
+        assert "Deriving turns and failures for 2 spans failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_start_runs_catch_up_pass(self, repos):
+        """Test the background catch-up skips spans younger than its interval."""
+        _db, span_repo, _turn_repo, _failure_repo = repos
+        queue = SpanDerivationQueue(*repos, workers=1, catch_up_interval=5.0)
+
+        queue.start()
+        await asyncio.sleep(0)
+        await queue.stop()
+
+        span_repo.get_pending_derivations.assert_awaited_once_with(
+            500, after=None, min_age_seconds=5.0
+        )
+        assert not queue.running
+
+    @pytest.mark.asyncio
+    async def test_failed_catch_up_pass_is_logged(self, repos, caplog):
+        """Test a failing backlog read does not stop the catch-up task."""
+        _db, span_repo, _turn_repo, _failure_repo = repos
+        span_repo.get_pending_derivations.side_effect = RuntimeError("database down")
+        queue = SpanDerivationQueue(*repos, workers=1, catch_up_interval=0.01)
+
+        queue.start()
+        await asyncio.sleep(0.05)
+        assert queue.running
+        await queue.stop()
+
+        assert span_repo.get_pending_derivations.await_count >= 2
+        assert "Span derivation catch-up pass failed" in caplog.text
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="Set VOICEOBS_TEST_DATABASE_URL to a scratch PostgreSQL database",
+)
+class TestSpanDerivationPostgres:
+    """Check the derivation backlog on a real database.
+
+    These tests migrate the database and truncate the span tables.
+    """
+
+    @pytest.fixture
+    async def db(self):
+        result = await asyncio.to_thread(run_migrations, TEST_DATABASE_URL)
+        assert result["success"], result
+        db = Database(database_url=TEST_DATABASE_URL, min_pool_size=1, max_pool_size=8)
+        await db.connect()
+        # schema.sql runs at every server start, also on migrated databases
+        await db.init_schema()
+        await db.execute("TRUNCATE failures, turns, spans, conversations CASCADE")
+        yield db
+        await db.disconnect()
+
+    def queue(self, db):
+        return SpanDerivationQueue(
+            db, SpanRepository(db), TurnRepository(db), FailureRepository(db), batch_size=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_stored_spans_are_derived_once(self, db):
+        """Test every derivable span enters the backlog and concurrent passes derive it once."""
+        conversation = await ConversationRepository(db).get_or_create("conv-1")
+        turns = [
+            {
+                "name": "voice.turn",
+                "duration_ms": 100.0,
+                "attributes": {"voice.turn.id": f"turn-{i}", "voice.actor": "agent"},
+                "conversation_id": conversation.id,
+            }
+            for i in range(10)
+        ]
+        ignored = [
+            {"name": "voice.conversation", "conversation_id": conversation.id},
+            {"name": "voice.turn", "attributes": {"voice.actor": "user"}},
+        ]
+        await SpanRepository(db).add_many(turns + ignored)
+        assert await db.fetchval("SELECT COUNT(*) FROM span_derivation_backlog") == 10
+
+        derived = await asyncio.gather(*(self.queue(db).catch_up() for _ in range(4)))
+
+        assert sum(derived) == 10
+        assert await db.fetchval("SELECT COUNT(*) FROM turns") == 10
+        assert await db.fetchval("SELECT COUNT(*) FROM span_derivation_backlog") == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_derivation_stays_in_backlog(self, db):
+        """Test a rolled-back derivation leaves its spans for the next pass."""
+        conversation = await ConversationRepository(db).get_or_create("conv-1")
+        [span_uuid] = await SpanRepository(db).add_many(
+            [
+                {
+                    "name": "voice.turn",
+                    "attributes": {"voice.turn.id": "turn-1"},
+                    "conversation_id": conversation.id,
+                }
+            ]
+        )
+        queue = self.queue(db)
+        item = IngestedSpan(span_uuid, conversation.id, {"name": "voice.turn", "attributes": {}})
+        broken = IngestedSpan(span_uuid, uuid4(), item.span)
+
+        with pytest.raises(Exception, match="foreign key"):
+            await queue.derive([broken])
+
+        assert await db.fetchval("SELECT COUNT(*) FROM span_derivation_backlog") == 1
+        assert await queue.catch_up() == 1
+        assert await db.fetchval("SELECT COUNT(*) FROM turns") == 1
@@ -0,0 +1,328 @@
+"""Tests for the test execution pool and the simulated scenario runner."""
+
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from voiceobs.server.db.models import AgentRow, TestExecutionRow, TestScenarioRow, TestSuiteRow
+from voiceobs.server.services.test_execution import (
+    ScenarioResult,
+    SimulatedScenarioRunner,
+    TestExecutionPool,
+)
+
+
+class FakeExecutionQueue:
+    """In-memory stand-in for the claim/complete methods of TestExecutionRepository."""
+
+    def __init__(self) -> None:
+        self.executions: dict = {}
+        self.results: dict = {}
+        self.released: list[str] = []
+
+    def add(self, scenario_id, agent_id=None) -> TestExecutionRow:
+        execution = TestExecutionRow(
+            id=uuid4(), scenario_id=scenario_id, status="queued", agent_id=agent_id
+        )
+        self.executions[execution.id] = execution
+        return execution
+
+    def count(self, status: str) -> int:
+        return sum(1 for e in self.executions.values() if e.status == status)
+
+    async def claim(self, worker_id, limit, per_agent_limit, scan_limit=500):
+        running: dict = {}
+        for e in self.executions.values():
+            if e.status == "running" and e.agent_id is not None:
+                running[e.agent_id] = running.get(e.agent_id, 0) + 1
+        claimed = []
+        for e in self.executions.values():
+            if len(claimed) == limit:
+                break
+            if e.status != "queued":
+                continue
+            if e.agent_id is not None and running.get(e.agent_id, 0) >= per_agent_limit:
+                continue
+            if e.agent_id is not None:
+                running[e.agent_id] = running.get(e.agent_id, 0) + 1
+            e.status = "running"
+            e.attempts += 1
+            claimed.append(e)
+        return claimed
+
+    async def complete(self, execution_id, worker_id, result_json, conversation_id=None):
+        self.executions[execution_id].status = "completed"
+        self.results[execution_id] = result_json
+        return True
+
+    async def fail(self, execution_id, worker_id, error):
+        self.executions[execution_id].status = "failed"
+        self.results[execution_id] = {"error": error}
+        return True
+
+    async def heartbeat(self, worker_id):
+        pass
+
+    async def requeue_stale(self, lease_seconds, max_attempts):
+        return 0
+
+    async def release(self, worker_id):
+        self.released.append(worker_id)
+        for e in self.executions.values():
+            if e.status == "running":
+                e.status = "queued"
+
+
+class RecordingRunner:
+    """Runner that sleeps and records how many runs overlap."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self, scenario, agent):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return ScenarioResult(passed=True, details={"avg_latency_ms": 500.0})
+
+
+def _scenario(**kwargs) -> TestScenarioRow:
+    defaults = {
+        "id": uuid4(),
+        "suite_id": uuid4(),
+        "name": "Scenario",
+        "goal": "Book an appointment",
+        "persona_id": uuid4(),
+    }
+    return TestScenarioRow(**{**defaults, **kwargs})
+
+
+@pytest.fixture
+def queue():
+    """In-memory execution queue."""
+    return FakeExecutionQueue()
+
+
+@pytest.fixture
+def scenario_repo():
+    """Scenario repository returning a scenario for any ID."""
+    repo = AsyncMock()
+    repo.get.side_effect = lambda scenario_id: _scenario(id=scenario_id, max_turns=2)
+    return repo
+
+
+async def _wait_until(predicate, timeout: float = 5.0) -> None:
+    """Wait until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "Timed out waiting"
+        await asyncio.sleep(0.01)
+
+
+class TestSimulatedScenarioRunner:
+    """Tests for SimulatedScenarioRunner."""
+
+    @pytest.mark.asyncio
+    async def test_result_is_deterministic_per_scenario(self):
+        """Test the same scenario always produces the same simulated result."""
+        runner = SimulatedScenarioRunner(latency_ms=(100.0, 200.0), speedup=1000)
+        scenario = _scenario(max_turns=3)
+        agent = AgentRow(id=uuid4(), org_id=uuid4(), name="Front Desk", goal="Book")
+
+        first = await runner.run(scenario, agent)
+        second = await runner.run(scenario, None)
+
+        assert first.passed is True
+        assert first.details["simulated"] is True
+        assert first.details["turns"] == 3
+        assert 100.0 <= first.details["avg_latency_ms"] <= 200.0
+        assert first.details["avg_latency_ms"] == second.details["avg_latency_ms"]
+        assert len(first.details["transcript"]) == 6
+        assert first.details["transcript"][0] == {"role": "caller", "text": scenario.goal}
+        assert "Front Desk" in first.details["transcript"][1]["text"]
+
+    @pytest.mark.asyncio
+    async def test_pass_rate_zero_fails(self):
+        """Test pass_rate=0 makes every scenario fail."""
+        runner = SimulatedScenarioRunner(pass_rate=0.0, speedup=1000, default_turns=1)
+
+        result = await runner.run(_scenario(), None)
+
+        assert result.passed is False
+        assert result.details["turns"] == 1
+
+    def test_invalid_settings(self):
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ValueError, match="latency_ms"):
+            SimulatedScenarioRunner(latency_ms=(500.0, 100.0))
+        with pytest.raises(ValueError, match="pass_rate"):
+            SimulatedScenarioRunner(pass_rate=1.5)
+        with pytest.raises(ValueError, match="speedup"):
+            SimulatedScenarioRunner(speedup=0)
+        with pytest.raises(ValueError, match="default_turns"):
+            SimulatedScenarioRunner(default_turns=0)
+
+
+class TestTestExecutionPool:
+    """Tests for TestExecutionPool."""
+
+    def test_invalid_settings(self, queue, scenario_repo):
+        """Test non-positive settings are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            TestExecutionPool(queue, scenario_repo, RecordingRunner(), workers=0)
+        with pytest.raises(ValueError, match="concurrency_per_agent"):
+            TestExecutionPool(queue, scenario_repo, RecordingRunner(), concurrency_per_agent=0)
+        with pytest.raises(ValueError, match="poll_interval"):
+            TestExecutionPool(queue, scenario_repo, RecordingRunner(), poll_interval=0)
+        with pytest.raises(ValueError, match="lease_seconds"):
+            TestExecutionPool(queue, scenario_repo, RecordingRunner(), lease_seconds=0)
+        with pytest.raises(ValueError, match="max_attempts"):
+            TestExecutionPool(queue, scenario_repo, RecordingRunner(), max_attempts=0)
+
+    @pytest.mark.asyncio
+    async def test_runs_executions_in_parallel(self, queue, scenario_repo):
+        """Test queued executions run concurrently, up to the worker count."""
+        executions = [queue.add(uuid4()) for _ in range(40)]
+        runner = RecordingRunner(delay=0.05)
+        pool = TestExecutionPool(queue, scenario_repo, runner=runner, workers=10)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        pool.start()
+        await _wait_until(lambda: queue.count("completed") == 40)
+        elapsed = loop.time() - start
+        await pool.stop()
+
+        assert runner.max_in_flight == 10
+        assert elapsed < 40 * 0.05 / 2  # Far faster than running one at a time
+        assert queue.results[executions[0].id] == {"passed": True, "avg_latency_ms": 500.0}
+        assert not pool.running
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency_per_agent(self, queue, scenario_repo):
+        """Test executions for one agent never exceed concurrency_per_agent."""
+        agent_id = uuid4()
+        for _ in range(6):
+            queue.add(uuid4(), agent_id=agent_id)
+        runner = RecordingRunner(delay=0.02)
+        pool = TestExecutionPool(
+            queue, scenario_repo, runner=runner, workers=8, concurrency_per_agent=2
+        )
+
+        pool.start()
+        await _wait_until(lambda: queue.count("completed") == 6)
+        await pool.stop()
+
+        assert runner.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_notify_claims_before_next_poll(self, queue, scenario_repo):
+        """Test notify() picks up new executions without waiting for the poll interval."""
+        pool = TestExecutionPool(
+            queue, scenario_repo, runner=RecordingRunner(delay=0), poll_interval=60
+        )
+        pool.start()
+        await asyncio.sleep(0.01)
+
+        queue.add(uuid4())
+        pool.notify()
+        await _wait_until(lambda: queue.count("completed") == 1, timeout=1.0)
+        await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_loads_agent_for_runner(self, queue, scenario_repo):
+        """Test the agent under test is loaded within the suite's organization."""
+        org_id = uuid4()
+        agent = AgentRow(id=uuid4(), org_id=org_id, name="Agent", goal="Help")
+        suite_repo = AsyncMock()
+        suite_repo.get_by_id.return_value = TestSuiteRow(id=uuid4(), org_id=org_id, name="S")
+        agent_repo = AsyncMock()
+        agent_repo.get.return_value = agent
+        runner = AsyncMock()
+        runner.run.return_value = ScenarioResult(passed=False)
+        execution = queue.add(uuid4(), agent_id=agent.id)
+        pool = TestExecutionPool(
+            queue, scenario_repo, runner, suite_repo=suite_repo, agent_repo=agent_repo
+        )
+
+        pool.start()
+        await _wait_until(lambda: queue.count("completed") == 1)
+        await pool.stop()
+
+        agent_repo.get.assert_awaited_once_with(agent.id, org_id)
+        assert runner.run.call_args[0][1] is agent
+        assert queue.results[execution.id] == {"passed": False}
+
+    @pytest.mark.asyncio
+    async def test_runner_errors_and_timeouts_fail_execution(self, queue, scenario_repo):
+        """Test a raising or slow runner marks the execution failed."""
+        failing = queue.add(uuid4())
+        slow = queue.add(uuid4())
+        scenario_repo.get.side_effect = lambda scenario_id: _scenario(
+            id=scenario_id, timeout=0.05 if scenario_id == slow.scenario_id else None
+        )
+
+        async def run(scenario, agent):
+            if scenario.id == failing.scenario_id:
+                raise RuntimeError("Agent hung up")
+            await asyncio.sleep(10)
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        pool = TestExecutionPool(queue, scenario_repo, runner=runner)
+
+        pool.start()
+        await _wait_until(lambda: queue.count("failed") == 2)
+        await pool.stop()
+
+        assert queue.results[failing.id] == {"error": "Agent hung up"}
+        assert queue.results[slow.id] == {"error": "Timed out after 0.05 seconds"}
+
+    @pytest.mark.asyncio
+    async def test_missing_scenario_fails_execution(self, queue, scenario_repo):
+        """Test an execution whose scenario is gone is failed, not retried."""
+        execution = queue.add(uuid4())
+        scenario_repo.get.side_effect = None
+        scenario_repo.get.return_value = None
+        pool = TestExecutionPool(queue, scenario_repo, runner=RecordingRunner())
+
+        pool.start()
+        await _wait_until(lambda: queue.count("failed") == 1)
+        await pool.stop()
+
+        assert queue.results[execution.id] == {"error": "Test scenario not found"}
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_unfinished_executions(self, queue, scenario_repo):
+        """Test stop() requeues executions still running after the timeout."""
+        execution = queue.add(uuid4())
+        pool = TestExecutionPool(queue, scenario_repo, runner=RecordingRunner(delay=10))
+
+        pool.start()
+        await _wait_until(lambda: pool.active == 1)
+        await pool.stop(timeout=0.01)
+
+        assert queue.released == [pool.worker_id]
+        assert queue.executions[execution.id].status == "queued"
+        assert pool.active == 0
+
+    @pytest.mark.asyncio
+    async def test_claim_errors_are_logged_and_retried(self, scenario_repo, caplog):
+        """Test a failed claim does not stop the dispatcher."""
+        repo = AsyncMock()
+        repo.claim.side_effect = [RuntimeError("connection lost"), []]
+        pool = TestExecutionPool(repo, scenario_repo, RecordingRunner(), poll_interval=0.01)
+
+        pool.start()
+        await _wait_until(lambda: repo.claim.await_count >= 2)
+        await pool.stop()
+
+        assert "Claiming test executions failed" in caplog.text
+        repo.heartbeat.assert_awaited_with(pool.worker_id)
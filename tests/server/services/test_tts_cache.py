@@ -0,0 +1,257 @@
+"""Tests for the content-addressed TTS audio cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from voiceobs.server.db.models import TTSAudioCacheRow
+from voiceobs.server.services.tts_cache import (
+    TTSAudioCache,
+    normalize_tts_config,
+    tts_cache_key,
+)
+from voiceobs.server.storage import AudioStorage
+
+
+class FakeCacheRepository:
+    """In-memory stand-in for TTSAudioCacheRepository."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, TTSAudioCacheRow] = {}
+        self.evict_calls: list[tuple] = []
+        self.evict_result: list[str] = []
+
+    async def acquire(self, cache_key):
+        entry = self.entries.get(cache_key)
+        if entry is not None:
+            entry.ref_count += 1
+        return entry
+
+    async def add(self, cache_key, tts_provider, audio_url, mime_type, duration_ms, size_bytes):
+        if cache_key not in self.entries:
+            self.entries[cache_key] = TTSAudioCacheRow(
+                cache_key=cache_key,
+                tts_provider=tts_provider,
+                audio_url=audio_url,
+                mime_type=mime_type,
+                duration_ms=duration_ms,
+                size_bytes=size_bytes,
+            )
+        entry = self.entries[cache_key]
+        entry.ref_count += 1
+        return entry
+
+    async def release(self, audio_url):
+        for entry in self.entries.values():
+            if entry.audio_url == audio_url:
+                entry.ref_count = max(entry.ref_count - 1, 0)
+                return True
+        return False
+
+    async def evict(self, max_idle_seconds=None, max_bytes=None):
+        self.evict_calls.append((max_idle_seconds, max_bytes))
+        return self.evict_result
+
+
+class SlowTTSService:
+    """TTS service that counts calls and takes a moment to synthesize."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def synthesize(self, text, config):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"audio:{text}".encode(), "audio/mpeg", 1200.0
+
+
+@pytest.fixture
+def repo():
+    """In-memory cache repository."""
+    return FakeCacheRepository()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local audio storage in a temporary directory."""
+    return AudioStorage(provider="local", base_path=str(tmp_path))
+
+
+@pytest.fixture
+def tts_service():
+    """TTS service returned by TTSServiceFactory.create."""
+    service = SlowTTSService()
+    with patch("voiceobs.server.services.tts_cache.TTSServiceFactory.create", return_value=service):
+        yield service
+
+
+class TestCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_equivalent_configs_share_a_key(self):
+        """Test key order, None values, number form and provider case don't matter."""
+        key = tts_cache_key("openai", "Hello", {"model": "tts-1", "voice": "alloy", "speed": 1})
+        assert key == tts_cache_key(
+            "OpenAI", "Hello", {"speed": 1.0, "voice": " alloy", "model": "tts-1", "x": None}
+        )
+        assert len(key) == 64
+
+    def test_different_requests_get_different_keys(self):
+        """Test text, provider and every config value are part of the key."""
+        base = tts_cache_key("openai", "Hello", {"voice": "alloy", "speed": 1.0})
+        assert base != tts_cache_key("openai", "Hello!", {"voice": "alloy", "speed": 1.0})
+        assert base != tts_cache_key("deepgram", "Hello", {"voice": "alloy", "speed": 1.0})
+        assert base != tts_cache_key("openai", "Hello", {"voice": "Alloy", "speed": 1.0})
+        assert base != tts_cache_key("openai", "Hello", {"voice": "alloy", "speed": 1.25})
+
+    def test_normalize_tts_config(self):
+        """Test nested configs are normalized recursively."""
+        assert normalize_tts_config(None) == {}
+        assert normalize_tts_config({"b": [1, True], "a": {"y": 2, "x": None}}) == {
+            "a": {"y": 2.0},
+            "b": [1.0, True],
+        }
+
+
+class TestTTSAudioCache:
+    """Tests for TTSAudioCache."""
+
+    def test_invalid_limits(self, repo, storage):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            TTSAudioCache(repo, storage, max_bytes=0)
+        with pytest.raises(ValueError, match="max_idle_seconds"):
+            TTSAudioCache(repo, storage, max_idle_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_synthesizes_once_and_reuses(self, repo, storage, tts_service):
+        """Test a miss synthesizes and stores audio, and later requests reuse it."""
+        cache = TTSAudioCache(repo, storage, max_bytes=10_000, max_idle_seconds=60.0)
+
+        first = await cache.get_or_synthesize("openai", "Hello", {"voice": "alloy"})
+        second = await cache.get_or_synthesize("OPENAI", "Hello", {"voice": "alloy"})
+
+        assert tts_service.calls == 1
+        assert first.hit is False
+        assert second.hit is True
+        assert first.url == second.url
+        assert first.url.startswith("/audio/tts/cache/")
+        assert (first.mime_type, first.duration_ms, first.size_bytes) == (
+            "audio/mpeg",
+            1200.0,
+            len(b"audio:Hello"),
+        )
+        entry = next(iter(repo.entries.values()))
+        assert entry.ref_count == 2
+        assert repo.evict_calls == [(60.0, 10_000)]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_synthesis(self, repo, storage, tts_service):
+        """Test concurrent requests for the same audio synthesize it once."""
+        cache = TTSAudioCache(repo, storage)
+
+        results = await asyncio.gather(
+            *(cache.get_or_synthesize("openai", "Hello", {}) for _ in range(5))
+        )
+
+        assert tts_service.calls == 1
+        assert len({r.url for r in results}) == 1
+        assert [r.hit for r in results].count(False) == 1
+        assert next(iter(repo.entries.values())).ref_count == 5
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_synthesize(self, repo, storage, tts_service):
+        """Test acquire only returns audio that is already cached."""
+        cache = TTSAudioCache(repo, storage)
+
+        assert await cache.acquire("openai", "Hello", {}) is None
+        stored = await cache.get_or_synthesize("openai", "Hello", {})
+        acquired = await cache.acquire("openai", "Hello", {})
+
+        assert tts_service.calls == 1
+        assert acquired.url == stored.url
+        assert acquired.hit is True
+
+    @pytest.mark.asyncio
+    async def test_store_caches_streamed_audio(self, repo, storage, tts_service):
+        """Test audio synthesized by the caller is cached and later reused."""
+        cache = TTSAudioCache(repo, storage)
+        storage.store_audio = AsyncMock(wraps=storage.store_audio)
+
+        first = await cache.store("openai", "Hello", {}, b"streamed", "audio/wav", 900.0)
+        second = await cache.store("openai", "Hello", {}, b"streamed", "audio/wav", 900.0)
+        reused = await cache.get_or_synthesize("openai", "Hello", {})
+
+        assert first.hit is False
+        assert second.hit is True
+        assert first.url == second.url == reused.url
+        assert (first.mime_type, first.duration_ms, first.size_bytes) == ("audio/wav", 900.0, 8)
+        assert storage.store_audio.await_count == 1
+        assert tts_service.calls == 0
+        assert next(iter(repo.entries.values())).ref_count == 3
+
+    @pytest.mark.asyncio
+    async def test_lost_race_uses_other_servers_copy(self, repo, storage, tts_service):
+        """Test audio cached by another server meanwhile replaces the local copy."""
+        cache = TTSAudioCache(repo, storage)
+        key = tts_cache_key("openai", "Hello", {})
+        repo.acquire = AsyncMock(return_value=None)
+        repo.entries[key] = TTSAudioCacheRow(
+            cache_key=key,
+            tts_provider="openai",
+            audio_url="/audio/tts/cache/other.mp3",
+            mime_type="audio/mpeg",
+            duration_ms=1000.0,
+            size_bytes=10,
+        )
+        storage.delete_by_url = AsyncMock(return_value=True)
+
+        audio = await cache.get_or_synthesize("openai", "Hello", {})
+
+        assert audio.url == "/audio/tts/cache/other.mp3"
+        assert audio.hit is True
+        deleted_url = storage.delete_by_url.call_args[0][0]
+        assert deleted_url.startswith("/audio/tts/cache/")
+        assert deleted_url != audio.url
+
+    @pytest.mark.asyncio
+    async def test_release_and_eviction(self, repo, storage, tts_service, tmp_path):
+        """Test release only handles cached URLs and evicted audio is deleted."""
+        cache = TTSAudioCache(repo, storage, max_idle_seconds=1.0)
+        audio = await cache.get_or_synthesize("openai", "Hello", {})
+        stored_file = tmp_path / audio.url.removeprefix("/audio/")
+        assert stored_file.read_bytes() == b"audio:Hello"
+
+        repo.evict_result = [audio.url]
+        assert await cache.release("/audio/personas/preview/p/1.mp3") is False
+        assert await cache.release(audio.url) is True
+
+        assert next(iter(repo.entries.values())).ref_count == 0
+        assert not stored_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_synthesis_errors_propagate(self, repo, storage):
+        """Test provider errors reach the caller and nothing is cached."""
+        cache = TTSAudioCache(repo, storage)
+        failing = AsyncMock()
+        failing.synthesize.side_effect = RuntimeError("quota exceeded")
+
+        with patch(
+            "voiceobs.server.services.tts_cache.TTSServiceFactory.create", return_value=failing
+        ):
+            with pytest.raises(RuntimeError, match="quota exceeded"):
+                await cache.get_or_synthesize("openai", "Hello", {})
+
+        assert repo.entries == {}
+
+    @pytest.mark.asyncio
+    async def test_eviction_errors_do_not_fail_requests(self, repo, storage, tts_service, caplog):
+        """Test a failed eviction is logged instead of failing the request."""
+        cache = TTSAudioCache(repo, storage, max_bytes=1)
+        repo.evict = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        audio = await cache.get_or_synthesize("openai", "Hello", {})
+
+        assert audio.hit is False
+        assert "Evicting cached TTS audio failed" in caplog.text
@@ -43,3 +43,9 @@ class TestTTSService:
         assert audio_bytes == b"mock_audio_data"
         assert mime_type == "audio/mpeg"
         assert duration_ms == 1500.0
+
+    def test_streaming_defaults(self) -> None:
+        """Test streamed audio defaults to MP3 of unknown duration."""
+        service = MockTTSService()
+        assert service.streaming_mime_type == "audio/mpeg"
+        assert service.calculate_duration(b"mock_chunk_1mock_chunk_2") == 0.0
@@ -0,0 +1,141 @@
+"""Tests for streaming TTS synthesis with latency metrics."""
+
+from unittest.mock import patch
+
+import pytest
+
+from voiceobs.server.services.tts_streaming import TTSStreamMetrics, open_tts_stream
+
+
+class FakeStreamingService:
+    """TTS service streaming fixed chunks, optionally failing partway."""
+
+    streaming_mime_type = "audio/wav"
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def synthesize_streaming(self, text, config):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+    def calculate_duration(self, audio_bytes):
+        return len(audio_bytes) * 10.0
+
+
+def fake_clock(*times):
+    """Clock returning the given times in seconds, one per call."""
+    return iter(times).__next__
+
+
+def patch_service(service):
+    """Make TTSServiceFactory.create return a service."""
+    return patch(
+        "voiceobs.server.services.tts_streaming.TTSServiceFactory.create", return_value=service
+    )
+
+
+class TestOpenTTSStream:
+    """Tests for open_tts_stream and TTSAudioStream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_and_keeps_audio(self):
+        """Test chunks pass through, the audio is kept and latency is recorded."""
+        metrics = TTSStreamMetrics()
+        with patch_service(FakeStreamingService([b"ab", b"cd", b"e"])):
+            stream = await open_tts_stream(
+                "OpenAI", "Hello", {}, metrics, clock=fake_clock(10.0, 10.25, 12.0)
+            )
+
+        assert stream.mime_type == "audio/wav"
+        assert stream.time_to_first_byte_ms == 250.0
+        assert stream.audio_bytes is None
+        assert [chunk async for chunk in stream] == [b"ab", b"cd", b"e"]
+        assert stream.audio_bytes == b"abcde"
+        assert stream.duration_ms == 50.0
+        assert stream.total_ms == 2000.0
+
+        [stats] = metrics.stats()
+        assert stats.provider == "openai"
+        assert (stats.streams, stats.failures) == (1, 0)
+        assert stats.time_to_first_byte_ms_p50 == 250.0
+        assert stats.total_ms_p95 == 2000.0
+
+    @pytest.mark.asyncio
+    async def test_error_before_first_chunk(self):
+        """Test errors before any audio are raised and recorded as failures."""
+        metrics = TTSStreamMetrics()
+        with patch_service(FakeStreamingService([], error=ValueError("missing API key"))):
+            with pytest.raises(ValueError, match="missing API key"):
+                await open_tts_stream("openai", "Hello", {}, metrics)
+
+        [stats] = metrics.stats()
+        assert (stats.streams, stats.failures) == (0, 1)
+        assert stats.time_to_first_byte_ms_p50 is None
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self):
+        """Test a provider returning no audio is an error."""
+        metrics = TTSStreamMetrics()
+        with patch_service(FakeStreamingService([])):
+            with pytest.raises(RuntimeError, match="returned no audio"):
+                await open_tts_stream("deepgram", "Hello", {}, metrics)
+
+        assert metrics.stats()[0].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_error_mid_stream(self):
+        """Test errors after the first chunk are raised and recorded as failures."""
+        metrics = TTSStreamMetrics()
+        with patch_service(FakeStreamingService([b"ab"], error=RuntimeError("reset"))):
+            stream = await open_tts_stream("openai", "Hello", {}, metrics)
+
+        with pytest.raises(RuntimeError, match="reset"):
+            async for _ in stream:
+                pass
+
+        assert stream.audio_bytes is None
+        assert (metrics.stats()[0].streams, metrics.stats()[0].failures) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_recorded(self):
+        """Test a stream the client stops reading keeps no audio and records nothing."""
+        metrics = TTSStreamMetrics()
+        with patch_service(FakeStreamingService([b"ab", b"cd"])):
+            stream = await open_tts_stream("openai", "Hello", {}, metrics)
+
+        chunks = stream.__aiter__()
+        assert await anext(chunks) == b"ab"
+        await chunks.aclose()
+
+        assert stream.audio_bytes is None
+        assert metrics.stats() == []
+
+
+class TestTTSStreamMetrics:
+    """Tests for TTSStreamMetrics."""
+
+    def test_percentiles_cover_recent_streams(self):
+        """Test percentiles use only the most recent streams of each provider."""
+        metrics = TTSStreamMetrics(window=4)
+        for ttfb in (900.0, 100.0, 200.0, 300.0, 400.0):
+            metrics.record("openai", ttfb, ttfb * 10)
+        metrics.record("ElevenLabs", 50.0, 500.0)
+        metrics.record_failure("deepgram")
+
+        deepgram, elevenlabs, openai = metrics.stats()
+        assert (deepgram.provider, deepgram.streams, deepgram.failures) == ("deepgram", 0, 1)
+        assert elevenlabs.provider == "elevenlabs"
+        assert elevenlabs.time_to_first_byte_ms_p95 == 50.0
+        assert openai.streams == 5
+        assert openai.time_to_first_byte_ms_p50 == 200.0
+        assert openai.time_to_first_byte_ms_p95 == 400.0
+        assert openai.total_ms_p50 == 2000.0
+
+    def test_invalid_window(self):
+        """Test the window must hold at least one stream."""
+        with pytest.raises(ValueError, match="window"):
+            TTSStreamMetrics(window=0)
@@ -1,6 +1,7 @@
 """Tests for conversation search and filtering endpoints."""
 
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -177,6 +178,89 @@ class TestConversationSearch:
         assert data["limit"] == 5
         assert data["offset"] == 5
 
+    def test_cursor_pagination(self, client):
+        """Test walking every page with next_cursor."""
+        spans = {
+            "spans": [
+                {
+                    "name": "voice.turn",
+                    "attributes": {"voice.conversation.id": f"conv-{i}", "voice.actor": "user"},
+                }
+                for i in range(5)
+            ]
+        }
+        client.post("/ingest", json=spans)
+
+        first = client.get("/conversations?limit=3").json()
+        second = client.get(f"/conversations?limit=3&cursor={first['next_cursor']}").json()
+
+        assert first["count"] == 3
+        assert second["count"] == 2
+        assert second["next_cursor"] is None
+        ids = [c["id"] for c in first["conversations"] + second["conversations"]]
+        assert sorted(ids) == [f"conv-{i}" for i in range(5)]
+
+    def test_cursor_and_offset_rejected(self, client):
+        """Test cursor and offset cannot be combined."""
+        response = client.get("/conversations?cursor=abc&offset=5")
+        assert response.status_code == 400
+
+    def test_invalid_cursor_rejected(self, client):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/conversations?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_postgres_search_cursor(self, client):
+        """Test the cursor and approximate total are passed to the repository."""
+        repo = AsyncMock()
+        repo.search.return_value = (
+            [
+                {
+                    "id": f"conv-{i}",
+                    "span_count": 1,
+                    "turn_count": 1,
+                    "has_failures": False,
+                    "cursor": f"cursor-{i}",
+                }
+                for i in range(2)
+            ],
+            1000,
+        )
+
+        with (
+            patch("voiceobs.server.routes.conversations.is_using_postgres", return_value=True),
+            patch(
+                "voiceobs.server.routes.conversations.get_conversation_repository",
+                return_value=repo,
+            ),
+        ):
+            data = client.get(
+                "/conversations?limit=2&cursor=cursor-prev&approximate_total=true"
+            ).json()
+
+        assert data["next_cursor"] == "cursor-1"
+        assert data["total"] == 1000
+        assert data["total_is_approximate"] is True
+        assert repo.search.call_args.kwargs["cursor"] == "cursor-prev"
+        assert repo.search.call_args.kwargs["approximate_total"] is True
+
+    def test_postgres_search_invalid_cursor(self, client):
+        """Test a cursor rejected by the repository is a bad request."""
+        repo = AsyncMock()
+        repo.search.side_effect = ValueError("Invalid cursor")
+
+        with (
+            patch("voiceobs.server.routes.conversations.is_using_postgres", return_value=True),
+            patch(
+                "voiceobs.server.routes.conversations.get_conversation_repository",
+                return_value=repo,
+            ),
+        ):
+            response = client.get("/conversations?cursor=bad")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
     @pytest.mark.xfail(
         reason="Start time sorting in in-memory mode has edge cases with datetime comparison"
     )
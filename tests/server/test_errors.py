@@ -164,7 +164,7 @@ class TestServiceUnavailableErrors:
         """Test that storage failure on ingest returns 500."""
         with patch("voiceobs.server.routes.spans.get_storage") as mock_get_storage:
             mock_storage = AsyncMock()
-            mock_storage.add_span.side_effect = Exception("Database connection failed")
+            mock_storage.add_spans.side_effect = Exception("Database connection failed")
             mock_get_storage.return_value = mock_storage
 
             response = client_no_raise.post(
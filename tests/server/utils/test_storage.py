@@ -58,6 +58,8 @@ class TestGetAudioStorageFromEnv:
             provider="s3",
             base_path="my-bucket",
             aws_region="us-east-1",
+            endpoint_url=None,
+            max_concurrency=16,
         )
 
     @patch.dict(
@@ -80,6 +82,8 @@ class TestGetAudioStorageFromEnv:
             provider="s3",
             base_path="explicit-bucket",
             aws_region="us-east-1",
+            endpoint_url=None,
+            max_concurrency=16,
         )
 
     @patch.dict(
@@ -102,6 +106,33 @@ class TestGetAudioStorageFromEnv:
             provider="s3",
             base_path="my-bucket",
             aws_region="eu-west-1",
+            endpoint_url=None,
+            max_concurrency=16,
+        )
+
+    @patch.dict(
+        os.environ,
+        {
+            "VOICEOBS_AUDIO_STORAGE_PROVIDER": "s3",
+            "VOICEOBS_AUDIO_STORAGE_PATH": "my-bucket",
+            "VOICEOBS_AUDIO_S3_ENDPOINT_URL": "http://localhost:5000",
+            "VOICEOBS_AUDIO_S3_MAX_CONCURRENCY": "32",
+        },
+        clear=True,
+    )
+    @patch("voiceobs.server.utils.storage.AudioStorage")
+    def test_s3_storage_with_endpoint_and_concurrency(self, mock_audio_storage):
+        """Should pass the custom endpoint and pool size to S3 storage."""
+        from voiceobs.server.utils.storage import get_audio_storage_from_env
+
+        get_audio_storage_from_env()
+
+        mock_audio_storage.assert_called_once_with(
+            provider="s3",
+            base_path="my-bucket",
+            aws_region="us-east-1",
+            endpoint_url="http://localhost:5000",
+            max_concurrency=32,
         )
 
 
@@ -1,5 +1,6 @@
 """Tests for voiceobs analyzer."""
 
+import gzip
 import io
 import json
 import textwrap
@@ -12,9 +13,15 @@ from voiceobs.analyzer import (
     StageMetrics,
     TurnMetrics,
     analyze_file,
+    analyze_files,
     analyze_spans,
+    analyze_stream,
+    expand_trace_paths,
+    iter_jsonl,
+    open_trace_file,
     parse_jsonl,
     parse_jsonl_stream,
+    resolve_stage,
 )
 
 
@@ -154,6 +161,25 @@ class TestParseJSONL:
         spans = parse_jsonl_stream(stream)
         assert len(spans) == 2
 
+    def test_parse_gzip_file(self, tmp_path):
+        """Test .gz trace files are decompressed while they are read."""
+        file_path = tmp_path / "spans.jsonl.gz"
+        with gzip.open(file_path, "wt") as f:
+            f.write('{"name": "voice.turn"}\n{"name": "voice.asr"}\n')
+
+        assert [span["name"] for span in parse_jsonl(file_path)] == ["voice.turn", "voice.asr"]
+        with open_trace_file(file_path, "rb") as f:
+            assert f.readline() == b'{"name": "voice.turn"}\n'
+
+    def test_parse_zstd_file(self, tmp_path):
+        """Test .zst trace files are decompressed while they are read."""
+        zstandard = pytest.importorskip("zstandard")
+        file_path = tmp_path / "spans.jsonl.zst"
+        data = b'{"name": "voice.turn"}\n{"name": "voice.asr"}\n'
+        file_path.write_bytes(zstandard.ZstdCompressor().compress(data))
+
+        assert [span["name"] for span in parse_jsonl(file_path)] == ["voice.turn", "voice.asr"]
+
     def test_parse_empty_lines(self):
         """Test that empty lines are skipped."""
         data = '{"name": "span1"}\n\n{"name": "span2"}\n\n'
@@ -163,6 +189,29 @@ class TestParseJSONL:
         assert len(spans) == 2
 
 
+class TestResolveStage:
+    """Tests for stage type and duration resolution."""
+
+    def test_both_naming_conventions(self):
+        """voice.asr and voice.stage.asr both resolve to the asr stage."""
+        assert resolve_stage({"name": "voice.asr", "duration_ms": 10}) == ("asr", 10)
+        assert resolve_stage({"name": "voice.stage.llm", "duration_ms": 20}) == ("llm", 20)
+
+    def test_attributes_take_precedence(self):
+        """The stage type and duration attributes win over the span itself."""
+        span = {
+            "name": "voice.stage.asr",
+            "duration_ms": 10,
+            "attributes": {"voice.stage.type": "tts", "voice.stage.duration_ms": 42},
+        }
+        assert resolve_stage(span) == ("tts", 42)
+
+    def test_non_stage_span(self):
+        """Spans that are not stages resolve to None."""
+        assert resolve_stage({"name": "voice.turn", "duration_ms": 10}) is None
+        assert resolve_stage({"name": "voice.stage.other"}) is None
+
+
 class TestAnalyzeSpans:
     """Tests for span analysis."""
 
@@ -403,6 +452,290 @@ class TestAnalyzeFile:
         assert result.turn_metrics.total_agent_turns == 1
 
 
+class TestAnalyzeStream:
+    """Tests for the bounded-memory streaming analyzer."""
+
+    @staticmethod
+    def _generate_spans(count: int):
+        import random
+
+        rng = random.Random(11)
+        for i in range(count):
+            kind = i % 5
+            if kind < 3:
+                stage = ("asr", "llm", "tts")[kind]
+                yield {
+                    "name": f"voice.{stage}",
+                    "duration_ms": rng.lognormvariate(5.0, 0.8),
+                    "attributes": {"voice.conversation.id": f"conv-{i // 50}"},
+                }
+            elif kind == 3:
+                yield {
+                    "name": "voice.turn",
+                    "duration_ms": 1000.0,
+                    "attributes": {
+                        "voice.actor": "agent",
+                        "voice.conversation.id": f"conv-{i // 50}",
+                        "voice.silence.after_user_ms": rng.uniform(100.0, 3000.0),
+                        "voice.turn.overlap_ms": rng.uniform(0.0, 500.0),
+                        "voice.interruption.detected": i % 7 == 0,
+                    },
+                }
+            else:
+                yield {
+                    "name": "voiceobs.eval",
+                    "attributes": {
+                        "eval.intent_correct": i % 3 != 0,
+                        "eval.relevance_score": rng.random(),
+                    },
+                }
+
+    def test_matches_exact_analysis_within_error_bound(self):
+        """Test streaming results match analyze_spans within the sketch accuracy."""
+        spans = list(self._generate_spans(20_000))
+        exact = analyze_spans(spans)
+        streamed = analyze_stream(iter(spans), relative_accuracy=0.01)
+
+        assert streamed.total_spans == exact.total_spans
+        assert streamed.total_conversations == exact.total_conversations
+        assert streamed.total_turns == exact.total_turns
+        assert streamed.turn_metrics.interruptions == exact.turn_metrics.interruptions
+        assert streamed.turn_metrics.silence_samples == exact.turn_metrics.silence_samples
+        assert streamed.eval_metrics.to_dict() == pytest.approx(exact.eval_metrics.to_dict())
+
+        for name in ("asr_metrics", "llm_metrics", "tts_metrics"):
+            exact_stage = getattr(exact, name)
+            streamed_stage = getattr(streamed, name)
+            assert streamed_stage.count == exact_stage.count
+            assert streamed_stage.mean_ms == pytest.approx(exact_stage.mean_ms)
+            assert streamed_stage.p95_ms == pytest.approx(exact_stage.p95_ms, rel=0.01)
+            assert streamed_stage.p99_ms == pytest.approx(exact_stage.p99_ms, rel=0.01)
+            # Exact p50 interpolates between the middle samples; the sketch does not
+            assert streamed_stage.p50_ms == pytest.approx(exact_stage.p50_ms, rel=0.02)
+
+        assert streamed.turn_metrics.silence_p95_ms == pytest.approx(
+            exact.turn_metrics.silence_p95_ms, rel=0.01
+        )
+
+    def test_does_not_retain_samples(self):
+        """Test no raw sample lists grow while streaming."""
+        result = analyze_stream(self._generate_spans(5_000))
+
+        assert result.asr_metrics.count == 1_000
+        assert result.asr_metrics.durations_ms == []
+        assert result.turn_metrics.silence_after_user_ms == []
+        assert result.turn_metrics.overlap_ms == []
+        assert result.eval_metrics.relevance_scores == []
+
+    def test_consumes_generator_lazily(self):
+        """Test spans are pulled one at a time from the iterable."""
+        pulled = []
+
+        def spans():
+            for i in range(3):
+                pulled.append(i)
+                yield {"name": "voice.asr", "duration_ms": 100.0 * (i + 1), "attributes": {}}
+
+        result = analyze_stream(spans())
+
+        assert pulled == [0, 1, 2]
+        assert result.asr_metrics.count == 3
+        assert result.asr_metrics.mean_ms == 200.0
+
+    def test_empty_stream(self):
+        """Test an empty stream produces an empty report."""
+        result = analyze_stream(iter([]))
+
+        assert result.total_spans == 0
+        assert result.asr_metrics.p95_ms is None
+        assert result.turn_metrics.silence_p95_ms is None
+        assert result.eval_metrics.avg_relevance_score is None
+        assert "no data" in result.format_report()
+
+    def test_iter_jsonl_and_streaming_analyze_file(self, tmp_path):
+        """Test iter_jsonl is lazy and analyze_file(streaming=True) uses it."""
+        file_path = tmp_path / "spans.jsonl"
+        spans = list(self._generate_spans(100))
+        file_path.write_text("\n".join(json.dumps(s) for s in spans) + "\n\n")
+
+        iterator = iter_jsonl(file_path)
+        assert next(iterator) == spans[0]
+
+        result = analyze_file(file_path, streaming=True)
+        assert result.total_spans == 100
+        assert result.asr_metrics.sketch is not None
+        assert result.to_dict()["summary"] == analyze_file(file_path).to_dict()["summary"]
+
+
+class TestMerge:
+    """Tests for merging partial analysis results."""
+
+    @staticmethod
+    def _spans(conv_id: str, durations: list[float]) -> list[dict]:
+        spans = [
+            {
+                "name": "voice.asr",
+                "duration_ms": d,
+                "attributes": {"voice.conversation.id": conv_id},
+            }
+            for d in durations
+        ]
+        spans.append(
+            {
+                "name": "voice.turn",
+                "attributes": {
+                    "voice.actor": "agent",
+                    "voice.conversation.id": conv_id,
+                    "voice.silence.after_user_ms": durations[0],
+                    "voice.interruption.detected": True,
+                },
+            }
+        )
+        spans.append(
+            {
+                "name": "voiceobs.eval",
+                "attributes": {"eval.intent_correct": True, "eval.relevance_score": 0.5},
+            }
+        )
+        return spans
+
+    def test_merge_list_based_matches_single_pass(self):
+        """Test merging list-based partials equals analyzing all spans at once."""
+        first = self._spans("conv-1", [100.0, 200.0])
+        second = self._spans("conv-1", [300.0]) + self._spans("conv-2", [400.0])
+
+        merged = analyze_spans(first).merge(analyze_spans(second))
+
+        assert merged.to_dict() == analyze_spans(first + second).to_dict()
+        assert merged.total_conversations == 2
+        assert merged.asr_metrics.durations_ms == [100.0, 200.0, 300.0, 400.0]
+
+    def test_merge_sketch_based(self):
+        """Test merging sketch-backed partials keeps counts exact."""
+        first = self._spans("conv-1", [100.0, 200.0])
+        second = self._spans("conv-2", [300.0, 400.0])
+
+        merged = analyze_stream(first).merge(analyze_stream(second))
+        expected = analyze_stream(first + second)
+
+        assert merged.to_dict() == expected.to_dict()
+        assert merged.asr_metrics.sketch is not None
+        assert merged.asr_metrics.durations_ms == []
+
+    def test_merge_mixed_promotes_to_sketch(self):
+        """Test merging list- and sketch-backed metrics produces a sketch."""
+        exact = StageMetrics("asr", durations_ms=[100.0, 200.0])
+        streamed = analyze_stream([{"name": "voice.asr", "duration_ms": 300.0}]).asr_metrics
+
+        exact.merge(streamed)
+
+        assert exact.sketch is not None
+        assert exact.durations_ms == []
+        assert exact.count == 3
+        assert exact.mean_ms == pytest.approx(200.0)
+
+        streamed = analyze_stream([{"name": "voice.asr", "duration_ms": 300.0}]).asr_metrics
+        streamed.merge(StageMetrics("asr", durations_ms=[100.0]))
+        assert streamed.count == 2
+        assert streamed.durations_ms == []
+
+    def test_merge_without_conversation_ids_sums_totals(self):
+        """Test hand-built results without conversation IDs add their totals."""
+        merged = AnalysisResult(total_conversations=2).merge(AnalysisResult(total_conversations=3))
+
+        assert merged.total_conversations == 5
+
+    def test_merge_turn_and_eval_metrics(self):
+        """Test turn and eval counters are summed."""
+        turns = TurnMetrics(interruptions=1, total_agent_turns=2, overlap_ms=[10.0])
+        turns.merge(TurnMetrics(interruptions=2, total_agent_turns=3, overlap_ms=[20.0]))
+        evals = EvalMetrics(total_evals=1, intent_correct_count=1, relevance_scores=[0.2])
+        evals.merge(EvalMetrics(total_evals=2, intent_incorrect_count=2, relevance_scores=[0.8]))
+
+        assert turns.interruptions == 3
+        assert turns.total_agent_turns == 5
+        assert turns.overlap_ms == [10.0, 20.0]
+        assert evals.total_evals == 3
+        assert evals.intent_correct_count == 1
+        assert evals.intent_incorrect_count == 2
+        assert evals.avg_relevance_score == pytest.approx(0.5)
+
+
+class TestExpandTracePaths:
+    """Tests for resolving trace file inputs."""
+
+    def test_files_directories_and_globs(self, tmp_path):
+        """Test files, directories and globs resolve to unique sorted files."""
+        (tmp_path / "hour").mkdir()
+        names = ("hour/b.jsonl", "hour/a.jsonl", "hour/c.jsonl.gz", "hour/notes.txt", "c.jsonl")
+        for name in names:
+            (tmp_path / name).write_text("")
+
+        paths = expand_trace_paths(
+            [tmp_path / "c.jsonl", tmp_path / "hour", str(tmp_path / "*" / "*.jsonl")]
+        )
+
+        assert paths == [
+            tmp_path / "c.jsonl",
+            tmp_path / "hour" / "a.jsonl",
+            tmp_path / "hour" / "b.jsonl",
+            tmp_path / "hour" / "c.jsonl.gz",
+        ]
+
+    def test_missing_input_raises(self, tmp_path):
+        """Test an input that matches nothing raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="missing"):
+            expand_trace_paths([tmp_path / "missing.jsonl"])
+        with pytest.raises(FileNotFoundError):
+            expand_trace_paths([str(tmp_path / "*.jsonl")])
+        with pytest.raises(FileNotFoundError):
+            expand_trace_paths([tmp_path])
+
+
+class TestAnalyzeFiles:
+    """Tests for parallel multi-file analysis."""
+
+    @staticmethod
+    def _write(tmp_path, count: int) -> list:
+        paths = []
+        all_spans = []
+        for i in range(count):
+            spans = TestMerge._spans(f"conv-{i // 2}", [100.0 * (i + 1), 50.0 * (i + 1)])
+            path = tmp_path / f"worker-{i}.jsonl"
+            path.write_text("\n".join(json.dumps(s) for s in spans) + "\n")
+            paths.append(path)
+            all_spans.extend(spans)
+        return paths, all_spans
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_single_pass(self, tmp_path, workers):
+        """Test merged per-file results equal analyzing all spans at once."""
+        paths, all_spans = self._write(tmp_path, 4)
+
+        result = analyze_files(paths, workers=workers)
+
+        assert result.to_dict() == analyze_spans(all_spans).to_dict()
+        assert result.total_conversations == 2
+
+    def test_streaming(self, tmp_path):
+        """Test streaming partials are merged into sketch-backed metrics."""
+        paths, all_spans = self._write(tmp_path, 3)
+
+        result = analyze_files(paths, streaming=True, workers=2)
+
+        assert result.asr_metrics.sketch is not None
+        assert result.to_dict() == analyze_stream(all_spans).to_dict()
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test empty paths and non-positive workers are rejected."""
+        paths, _ = self._write(tmp_path, 1)
+
+        with pytest.raises(ValueError, match="No trace files"):
+            analyze_files([])
+        with pytest.raises(ValueError, match="workers"):
+            analyze_files(paths, workers=0)
+
+
 class TestFormatReport:
     """Tests for report formatting (snapshot tests)."""
 
@@ -575,6 +908,27 @@ class TestCLIIntegration:
         assert "Total spans: 2" in result.output
         assert "ASR (n=1):" in result.output
 
+    def test_analyze_command_stream(self, tmp_path):
+        """Test analyze command with --stream."""
+        from typer.testing import CliRunner
+
+        from voiceobs.cli import app
+
+        file_path = tmp_path / "test.jsonl"
+        spans = [
+            {"name": "voice.asr", "duration_ms": 150.0, "attributes": {}},
+            {"name": "voice.asr", "duration_ms": 250.0, "attributes": {}},
+        ]
+        file_path.write_text("\n".join(json.dumps(s) for s in spans) + "\n")
+
+        runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+        result = runner.invoke(app, ["analyze", "--input", str(file_path), "--stream"])
+
+        assert result.exit_code == 0
+        assert "Total spans: 2" in result.output
+        assert "ASR (n=2):" in result.output
+        assert "mean: 200.000" in result.output
+
     def test_analyze_command_file_not_found(self, tmp_path):
         """Test analyze command with non-existent file."""
         from typer.testing import CliRunner
@@ -587,6 +941,23 @@ class TestCLIIntegration:
         # Typer validates file existence and should exit with error
         assert result.exit_code != 0
 
+    def test_analyze_command_directory(self, tmp_path):
+        """Test analyze command merges every file in a directory."""
+        from typer.testing import CliRunner
+
+        from voiceobs.cli import app
+
+        for i in range(3):
+            span = {"name": "voice.asr", "duration_ms": 100.0 * (i + 1), "attributes": {}}
+            (tmp_path / f"worker-{i}.jsonl").write_text(json.dumps(span) + "\n")
+
+        runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+        result = runner.invoke(app, ["analyze", "--input", str(tmp_path), "--workers", "2"])
+
+        assert result.exit_code == 0
+        assert "Total spans: 3" in result.output
+        assert "mean: 200.000" in result.output
+
     def test_analyze_command_invalid_json(self, tmp_path):
         """Test analyze command with invalid JSON file."""
         from typer.testing import CliRunner
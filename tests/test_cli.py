@@ -684,6 +684,48 @@ class TestReportCommand:
         assert "markdown" in plain_output
         assert "html" in plain_output
 
+    def test_report_with_plugin(self, tmp_path, monkeypatch):
+        """Test that --plugin loads a metric plugin into the report."""
+        import json
+
+        (tmp_path / "report_plugins.py").write_text(
+            "from voiceobs.pipeline import MetricPlugin\n"
+            "\n"
+            "class Turns(MetricPlugin):\n"
+            "    name = 'turns'\n"
+            "\n"
+            "    def __init__(self):\n"
+            "        self.count = 0\n"
+            "\n"
+            "    def visit(self, span):\n"
+            "        self.count += span.kind == 'turn'\n"
+            "\n"
+            "    def result(self):\n"
+            "        return {'count': self.count}\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr("voiceobs.pipeline._metric_plugins", {})
+        input_file = tmp_path / "run.jsonl"
+        input_file.write_text(json.dumps({"name": "voice.turn", "attributes": {}}))
+
+        result = runner.invoke(
+            app, ["report", "--input", str(input_file), "--plugin", "report_plugins:Turns"]
+        )
+
+        assert result.exit_code == 0
+        assert "### turns" in result.output
+        assert "- count: 1" in result.output
+
+    def test_report_with_invalid_plugin_fails(self, tmp_path):
+        """Test that report fails when a plugin cannot be loaded."""
+        input_file = tmp_path / "run.jsonl"
+        input_file.write_text("{}")
+
+        result = runner.invoke(app, ["report", "--input", str(input_file), "--plugin", "nope"])
+
+        assert result.exit_code == 1
+        assert "Could not load metric plugin" in result.output
+
     def test_report_generates_json_format(self, tmp_path):
         """Test that report command generates JSON when specified."""
         import json
@@ -780,6 +822,85 @@ class TestAnalyzeJsonOutput:
         assert output_data["stages"]["asr"]["mean_ms"] is None
 
 
+class TestIndexCommand:
+    """Tests for the index command."""
+
+    def _write_trace(self, path):
+        import json
+
+        data = [
+            {
+                "name": "voice.asr",
+                "duration_ms": 100.0,
+                "attributes": {"voice.stage.type": "asr", "voice.conversation.id": "conv-1"},
+            },
+            {
+                "name": "voice.asr",
+                "duration_ms": 300.0,
+                "attributes": {"voice.stage.type": "asr", "voice.conversation.id": "conv-2"},
+            },
+        ]
+        path.write_text("\n".join(json.dumps(d) for d in data) + "\n")
+
+    def test_index_writes_index_file(self, tmp_path):
+        """Test that index writes a .vidx file next to the trace file."""
+        input_file = tmp_path / "run.jsonl"
+        self._write_trace(input_file)
+
+        result = runner.invoke(app, ["index", "--input", str(input_file)])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "run.jsonl.vidx").exists()
+        assert "Indexed 2 spans, 2 conversations" in result.output
+
+    def test_index_missing_file(self, tmp_path):
+        """Test that index fails for a missing file."""
+        result = runner.invoke(app, ["index", "--input", str(tmp_path / "missing.jsonl")])
+
+        assert result.exit_code == 1
+        assert "not found" in result.output.lower()
+
+    def test_index_skips_compressed_file(self, tmp_path):
+        """Test that index skips compressed files and analyze still reads them."""
+        import gzip
+        import json
+
+        plain_file = tmp_path / "run.jsonl"
+        self._write_trace(plain_file)
+        input_file = tmp_path / "run.jsonl.gz"
+        with gzip.open(input_file, "wb") as f:
+            f.write(plain_file.read_bytes())
+        plain_file.unlink()
+
+        result = runner.invoke(app, ["index", "--input", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Skipped compressed file" in result.output
+        assert not (tmp_path / "run.jsonl.gz.vidx").exists()
+
+        result = runner.invoke(app, ["analyze", "--input", str(input_file), "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["summary"]["total_spans"] == 2
+
+    def test_analyze_conversation_from_index(self, tmp_path):
+        """Test analyze --conversation on an indexed file."""
+        import json
+
+        input_file = tmp_path / "run.jsonl"
+        self._write_trace(input_file)
+        runner.invoke(app, ["index", "--input", str(input_file)])
+
+        result = runner.invoke(
+            app, ["analyze", "--input", str(input_file), "--conversation", "conv-2", "--json"]
+        )
+
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["summary"]["total_spans"] == 1
+        assert output_data["stages"]["asr"]["mean_ms"] == 300.0
+
+
 class TestCompareJsonOutput:
     """Tests for the compare command JSON output."""
 
@@ -900,6 +1021,39 @@ class TestCompareJsonOutput:
         assert output_data["has_regressions"] is False
         assert output_data["regressions"] == []
 
+    def test_compare_directory_sets(self, tmp_path):
+        """Test compare merges directories of trace files on each side."""
+        import json
+
+        for side, duration in (("baseline", 200.0), ("current", 400.0)):
+            (tmp_path / side).mkdir()
+            for worker in range(2):
+                span = {
+                    "name": "voice.llm",
+                    "duration_ms": duration,
+                    "attributes": {"voice.stage.type": "llm"},
+                }
+                (tmp_path / side / f"worker-{worker}.jsonl").write_text(json.dumps(span))
+
+        result = runner.invoke(
+            app,
+            [
+                "compare",
+                "--baseline",
+                str(tmp_path / "baseline"),
+                "--current",
+                str(tmp_path / "current"),
+                "--workers",
+                "1",
+                "--json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["files"]["baseline"] == str(tmp_path / "baseline")
+        assert output_data["has_regressions"] is True
+
 
 class TestCliErrorMessages:
     """Tests for CLI error message improvements."""
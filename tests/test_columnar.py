@@ -0,0 +1,151 @@
+"""Tests for the columnar NumPy backend."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voiceobs.analyzer import analyze_spans  # noqa: E402
+from voiceobs.classifier import FailureClassifier, classify_spans  # noqa: E402
+from voiceobs.columnar import SpanColumns, analyze_columns, classify_columns  # noqa: E402
+from voiceobs.failures import FailureThresholds  # noqa: E402
+
+
+def random_spans(count: int, seed: int = 7) -> list[dict]:
+    """Random spans that exercise every analyzer and classifier branch."""
+    rng = random.Random(seed)
+    spans = []
+    for i in range(count):
+        attrs = {
+            "voice.conversation.id": rng.choice([None, "", f"conv-{i // 20}"]),
+            "voice.turn.id": f"turn-{i}",
+            "voice.turn.index": i % 10,
+        }
+        choice = rng.randrange(6)
+        if choice == 0:
+            name = rng.choice(["voice.asr", "voice.stage.asr"])
+            if rng.random() < 0.7:
+                attrs["voice.asr.confidence"] = rng.uniform(0.0, 1.0)
+        elif choice == 1:
+            name = rng.choice(["voice.llm", "voice.stage.llm", "voice.tts", "voice.stage.tts"])
+            if rng.random() < 0.2:
+                attrs["voice.stage.type"] = rng.choice(["asr", "custom"])
+        elif choice == 2:
+            name = "voice.turn"
+            attrs["voice.actor"] = rng.choice(["agent", "user"])
+            if rng.random() < 0.8:
+                attrs["voice.silence.after_user_ms"] = rng.uniform(0.0, 10000.0)
+            if rng.random() < 0.5:
+                attrs["voice.turn.overlap_ms"] = rng.uniform(-300.0, 800.0)
+            attrs["voice.interruption.detected"] = rng.random() < 0.3
+        elif choice == 3:
+            name = "voiceobs.eval"
+            attrs["eval.intent_correct"] = rng.choice([True, False, None])
+            if rng.random() < 0.8:
+                attrs["eval.relevance_score"] = rng.random()
+        else:
+            name = rng.choice(["voice.conversation", "custom.span"])
+        span = {"name": name, "attributes": attrs}
+        if rng.random() < 0.9:
+            span["duration_ms"] = rng.choice([rng.uniform(10.0, 7000.0), rng.randint(10, 7000)])
+        if name.startswith("voice.") and rng.random() < 0.3:
+            attrs["voice.stage.duration_ms"] = rng.uniform(10.0, 7000.0)
+        spans.append(span)
+    return spans
+
+
+class TestSpanColumns:
+    """Tests for SpanColumns extraction."""
+
+    def test_from_spans(self):
+        """Test attributes are extracted into typed arrays."""
+        columns = SpanColumns.from_spans(
+            [
+                {
+                    "name": "voice.stage.llm",
+                    "duration_ms": 900.0,
+                    "attributes": {"voice.stage.duration_ms": 450.0},
+                },
+                {
+                    "name": "voice.turn",
+                    "attributes": {"voice.actor": "agent", "voice.interruption.detected": 1},
+                },
+                {"name": "voiceobs.eval", "attributes": {"eval.intent_correct": False}},
+            ]
+        )
+
+        assert len(columns) == 3
+        assert columns.stage_rows.tolist() == [0]
+        assert columns.stage_type.tolist() == ["llm"]
+        assert columns.stage_duration_ms.tolist() == [450.0]
+        assert np.isnan(columns.asr_confidence[0])
+        assert columns.turn_rows.tolist() == [1]
+        assert columns.turn_agent.tolist() == [True]
+        assert columns.turn_interrupted.tolist() == [True]
+        assert np.isnan(columns.turn_silence_ms[0])
+        assert columns.eval_rows.tolist() == [2]
+        assert columns.eval_intent.tolist() == [-1]
+
+    def test_empty(self):
+        """Test no spans give empty columns and empty results."""
+        columns = SpanColumns.from_spans([])
+
+        assert len(columns) == 0
+        assert analyze_columns(columns).to_dict() == analyze_spans([]).to_dict()
+        assert classify_columns(columns).failures == []
+
+
+class TestNumpyBackendMatchesPython:
+    """The numpy backend must give the same results as the Python path."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_analyze_spans(self, seed):
+        """Test analysis results match."""
+        spans = random_spans(2000, seed)
+
+        expected = analyze_spans(spans)
+        result = analyze_spans(spans, backend="numpy")
+
+        assert result.to_dict() == expected.to_dict()
+        assert result.conversation_ids == expected.conversation_ids
+        assert result.asr_metrics.durations_ms == sorted(expected.asr_metrics.durations_ms)
+        assert result.turn_metrics.overlap_ms == sorted(expected.turn_metrics.overlap_ms)
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_classify(self, seed):
+        """Test failures match, in the same order."""
+        spans = random_spans(2000, seed)
+
+        expected = FailureClassifier().classify(spans)
+        result = FailureClassifier(backend="numpy").classify(spans)
+
+        assert result.failure_count > 0
+        assert result.failures == expected.failures
+        assert result.total_spans == expected.total_spans
+        assert result.total_turns == expected.total_turns
+        assert result.total_agent_turns == expected.total_agent_turns
+
+    def test_classify_custom_thresholds(self):
+        """Test custom thresholds are applied the same way."""
+        spans = random_spans(1000)
+        thresholds = FailureThresholds(
+            slow_asr_ms=500.0,
+            slow_tts_ms=800.0,
+            excessive_silence_ms=1000.0,
+            interruption_overlap_ms=100.0,
+            asr_min_confidence=0.9,
+        )
+
+        expected = classify_spans(spans, thresholds)
+        result = classify_spans(spans, thresholds, backend="numpy")
+
+        assert result.failures == expected.failures
+
+    def test_shared_columns(self):
+        """Test one extraction can feed both analysis and classification."""
+        spans = random_spans(500)
+        columns = SpanColumns.from_spans(spans)
+
+        assert analyze_columns(columns).to_dict() == analyze_spans(spans).to_dict()
+        assert classify_columns(columns).failures == classify_spans(spans).failures
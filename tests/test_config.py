@@ -15,6 +15,7 @@ from voiceobs.config import (
     FailuresConfig,
     RegressionConfig,
     RegressionLatencyConfig,
+    ServerConfig,
     VoiceobsConfig,
     _deep_merge,
     _dict_to_config,
@@ -151,6 +152,72 @@ class TestValidateConfig:
         errors = _validate_config(config)
         assert any("path is required" in e for e in errors)
 
+    def test_jsonl_invalid_writer_settings_fail(self) -> None:
+        """Test that negative jsonl writer settings and unknown compression fail."""
+        config = VoiceobsConfig(
+            exporters=ExportersConfig(
+                jsonl=ExporterJsonlConfig(
+                    enabled=True,
+                    flush_interval_ms=-1,
+                    max_bytes=-1,
+                    backup_count=-1,
+                    compression="brotli",  # type: ignore[arg-type]
+                )
+            )
+        )
+        errors = _validate_config(config)
+        assert any("flush_interval_ms must be >= 0" in e for e in errors)
+        assert any("max_bytes must be >= 0" in e for e in errors)
+        assert any("backup_count must be >= 0" in e for e in errors)
+        assert any("compression must be" in e for e in errors)
+
+    def test_negative_metrics_rollup_interval_fails(self) -> None:
+        """Test that a negative rollup refresh interval fails validation."""
+        config = VoiceobsConfig(server=ServerConfig(metrics_rollup_interval_seconds=-1))
+        errors = _validate_config(config)
+        assert any("metrics_rollup_interval_seconds must be >= 0" in e for e in errors)
+
+    def test_invalid_derivation_settings_fail(self) -> None:
+        """Test negative derivation workers and an empty queue are rejected."""
+        config = VoiceobsConfig(server=ServerConfig(derivation_workers=-1, derivation_queue_size=0))
+        errors = _validate_config(config)
+        assert any("derivation_workers must be >= 0" in e for e in errors)
+        assert any("derivation_queue_size must be >= 1" in e for e in errors)
+
+    def test_invalid_auth_cache_settings_fail(self) -> None:
+        """Test a negative auth cache TTL and an empty cache are rejected."""
+        config = VoiceobsConfig(
+            server=ServerConfig(auth_cache_ttl_seconds=-1, auth_cache_max_size=0)
+        )
+        errors = _validate_config(config)
+        assert any("auth_cache_ttl_seconds must be >= 0" in e for e in errors)
+        assert any("auth_cache_max_size must be >= 1" in e for e in errors)
+
+    def test_invalid_test_execution_settings_fail(self) -> None:
+        """Test negative workers, unknown runners, zero per-agent limits and leases fail."""
+        config = VoiceobsConfig(
+            server=ServerConfig(
+                test_execution_workers=-1,
+                test_execution_runner="live",
+                test_execution_concurrency_per_agent=0,
+                test_execution_lease_seconds=0,
+            )
+        )
+        errors = _validate_config(config)
+        assert any("test_execution_workers must be >= 0" in e for e in errors)
+        assert any("test_execution_runner must be one of" in e for e in errors)
+        assert any("test_execution_concurrency_per_agent must be >= 1" in e for e in errors)
+        assert any("test_execution_lease_seconds must be > 0" in e for e in errors)
+
+    def test_invalid_tts_cache_settings_fail(self) -> None:
+        """Test negative TTS cache limits are rejected."""
+        config = VoiceobsConfig(
+            server=ServerConfig(tts_cache_max_bytes=-1, tts_cache_max_idle_seconds=-1)
+        )
+        errors = _validate_config(config)
+        assert any("tts_cache_max_bytes must be >= 0" in e for e in errors)
+        assert any("tts_cache_max_idle_seconds must be >= 0" in e for e in errors)
+
 
 class TestLoadYamlFile:
     """Tests for load_yaml_file function."""
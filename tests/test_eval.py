@@ -1,5 +1,7 @@
 """Tests for the semantic evaluation module."""
 
+import asyncio
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -164,6 +166,11 @@ class TestEvalConfig:
         config = EvalConfig(provider="openai", model="gpt-4o")
         assert config.get_model() == "gpt-4o"
 
+    def test_rejects_invalid_max_concurrency(self) -> None:
+        """max_concurrency below 1 would block aevaluate_batch forever."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            EvalConfig(max_concurrency=0)
+
 
 class TestSemanticEvaluatorMocked:
     """Tests for SemanticEvaluator with mocked LLM."""
@@ -738,3 +745,382 @@ class TestProviderRegistry:
         assert registry.is_registered("custom_test")
         provider = registry.get("custom_test")
         assert provider.default_model == "custom-model"
+
+
+class FakeStructuredLLM:
+    """Structured LLM stand-in that records concurrency and answers asynchronously."""
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.failures: set[str] = set()
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, prompt: str):
+        from voiceobs.eval.evaluator import EvalOutput
+
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = next((d for key, d in self.delays.items() if key in prompt), 0.01)
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        if any(key in prompt for key in self.failures):
+            raise RuntimeError("provider error")
+        # Echo the transcript so results can be matched to inputs
+        transcript = prompt.split("## User's Input\n", 1)[1].split("\n", 1)[0]
+        return EvalOutput(intent_correct=True, relevance_score=0.5, explanation=transcript)
+
+
+@pytest.fixture
+def fake_provider():
+    """Register a fake provider through the provider registry."""
+    from voiceobs.eval.providers import LLMProvider, get_registry
+
+    structured_llm = FakeStructuredLLM()
+
+    class FakeProvider(LLMProvider):
+        @property
+        def name(self) -> str:
+            return "fake_async"
+
+        @property
+        def default_model(self) -> str:
+            return "fake-model"
+
+        def create_llm(self, config):
+            base_llm = MagicMock()
+            base_llm.with_structured_output.return_value = structured_llm
+            return base_llm
+
+    registry = get_registry()
+    registry.register(FakeProvider())
+    yield structured_llm
+    registry._providers.pop("fake_async", None)
+
+
+class TestAsyncEvaluateBatch:
+    """Tests for SemanticEvaluator.aevaluate_batch."""
+
+    async def test_preserves_input_order(self, fake_provider) -> None:
+        """Results come back in input order even when requests finish out of order."""
+        from voiceobs.eval import SemanticEvaluator
+
+        fake_provider.delays = {"Q0": 0.05, "Q1": 0.03, "Q2": 0.0}
+        evaluator = SemanticEvaluator(EvalConfig(provider="fake_async", cache_enabled=False))
+        inputs = [EvalInput(user_transcript=f"Q{i}", agent_response=f"A{i}") for i in range(3)]
+
+        results = await evaluator.aevaluate_batch(inputs)
+
+        assert [r.explanation for r in results] == ["Q0", "Q1", "Q2"]
+        assert all(r.cached is False for r in results)
+
+    async def test_deduplicates_by_content_hash(self, fake_provider) -> None:
+        """Identical inputs share one request but keep their own IDs."""
+        from voiceobs.eval import SemanticEvaluator
+
+        evaluator = SemanticEvaluator(EvalConfig(provider="fake_async", cache_enabled=False))
+        inputs = [
+            EvalInput(user_transcript="Hello", agent_response="Hi", turn_id="t1"),
+            EvalInput(user_transcript="Other", agent_response="Reply", turn_id="t2"),
+            EvalInput(user_transcript="Hello", agent_response="Hi", turn_id="t3"),
+        ]
+
+        results = await evaluator.aevaluate_batch(inputs)
+
+        assert len(fake_provider.prompts) == 2
+        assert [r.turn_id for r in results] == ["t1", "t2", "t3"]
+        assert results[0].content_hash == results[2].content_hash
+        assert results[2].explanation == "Hello"
+
+    async def test_limits_concurrency(self, fake_provider) -> None:
+        """No more than max_concurrency requests are in flight."""
+        from voiceobs.eval import SemanticEvaluator
+
+        evaluator = SemanticEvaluator(
+            EvalConfig(provider="fake_async", cache_enabled=False, max_concurrency=3)
+        )
+        inputs = [EvalInput(user_transcript=f"Q{i}", agent_response="A") for i in range(12)]
+
+        await evaluator.aevaluate_batch(inputs)
+
+        assert len(fake_provider.prompts) == 12
+        assert fake_provider.max_in_flight == 3
+
+    async def test_rate_limits_requests(self, fake_provider) -> None:
+        """requests_per_second paces requests through the provider's token bucket."""
+        from voiceobs.eval import SemanticEvaluator
+
+        evaluator = SemanticEvaluator(
+            EvalConfig(provider="fake_async", cache_enabled=False, requests_per_second=50.0)
+        )
+        inputs = [EvalInput(user_transcript=f"Q{i}", agent_response="A") for i in range(6)]
+
+        start = time.monotonic()
+        await evaluator.aevaluate_batch(inputs)
+
+        # One token up front, then one every 20ms
+        assert time.monotonic() - start >= 0.1
+
+    async def test_uses_and_updates_cache(self, fake_provider, tmp_path: Path) -> None:
+        """Cached inputs are not re-sent and new results are persisted."""
+        from voiceobs.eval import SemanticEvaluator
+
+        config = EvalConfig(provider="fake_async", cache_enabled=True, cache_dir=str(tmp_path))
+        evaluator = SemanticEvaluator(config)
+        first = [EvalInput(user_transcript="Q1", agent_response="A1")]
+        await evaluator.aevaluate_batch(first)
+
+        reloaded = SemanticEvaluator(config)
+        results = await reloaded.aevaluate_batch(
+            [
+                EvalInput(user_transcript="Q1", agent_response="A1", turn_id="again"),
+                EvalInput(user_transcript="Q2", agent_response="A2"),
+            ]
+        )
+
+        assert len(fake_provider.prompts) == 2
+        assert results[0].cached is True
+        assert results[0].turn_id == "again"
+        assert results[1].cached is False
+        assert list(tmp_path.glob("eval_cache.*.sqlite"))
+
+    async def test_failed_request_keeps_other_results(self, fake_provider, tmp_path: Path) -> None:
+        """One failing request re-raises but the successful results are cached."""
+        from voiceobs.eval import SemanticEvaluator
+
+        fake_provider.failures = {"Q1"}
+        config = EvalConfig(provider="fake_async", cache_enabled=True, cache_dir=str(tmp_path))
+        evaluator = SemanticEvaluator(config)
+        inputs = [EvalInput(user_transcript=f"Q{i}", agent_response="A") for i in range(3)]
+
+        with pytest.raises(RuntimeError, match="provider error"):
+            await evaluator.aevaluate_batch(inputs)
+
+        fake_provider.failures = set()
+        fake_provider.prompts.clear()
+        results = await SemanticEvaluator(config).aevaluate_batch(inputs)
+
+        assert [r.cached for r in results] == [True, False, True]
+        assert len(fake_provider.prompts) == 1
+
+    async def test_empty_batch_sends_nothing(self, fake_provider) -> None:
+        """An empty batch returns no results without creating the LLM."""
+        from voiceobs.eval import SemanticEvaluator
+
+        evaluator = SemanticEvaluator(EvalConfig(provider="fake_async", cache_enabled=False))
+
+        assert await evaluator.aevaluate_batch([]) == []
+        assert evaluator._structured_llm is None
+
+
+class TestTokenBucket:
+    """Tests for the provider token-bucket rate limiter."""
+
+    def test_allows_burst_then_spaces_requests(self) -> None:
+        """A full bucket serves the burst, then one token per 1/rate seconds."""
+        from voiceobs.eval.rate_limit import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(rate=10.0, burst=2, clock=lambda: now[0])
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    def test_refills_over_time_up_to_burst(self) -> None:
+        """Tokens refill with elapsed time but never beyond the burst size."""
+        from voiceobs.eval.rate_limit import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(rate=10.0, burst=2, clock=lambda: now[0])
+        bucket.reserve()
+        bucket.reserve()
+
+        now[0] = 10.0
+        assert [bucket.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.1])
+
+    @pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1.0, "burst": 0}])
+    def test_invalid_parameters(self, kwargs) -> None:
+        """Non-positive rate or burst raises ValueError."""
+        from voiceobs.eval.rate_limit import TokenBucket
+
+        with pytest.raises(ValueError):
+            TokenBucket(**kwargs)
+
+    def test_shared_per_provider(self) -> None:
+        """Limiters are shared per provider and replaced when settings change."""
+        from voiceobs.eval.rate_limit import get_rate_limiter
+
+        first = get_rate_limiter("shared_test", 5.0)
+        assert get_rate_limiter("shared_test", 5.0) is first
+        assert get_rate_limiter("other_test", 5.0) is not first
+        assert get_rate_limiter("shared_test", 10.0) is not first
+
+
+def _write_cache_entries(cache_dir: str, prefix: str, count: int) -> None:
+    """Write entries from a separate process."""
+    from voiceobs.eval.cache import EvalCache
+
+    cache = EvalCache(cache_dir, shards=4)
+    for i in range(count):
+        cache.put(
+            EvalResult(
+                intent_correct=True,
+                relevance_score=0.5,
+                explanation=f"{prefix}-{i}",
+                content_hash=EvalInput(
+                    user_transcript=f"{prefix}-{i}", agent_response="A"
+                ).content_hash(),
+            )
+        )
+    cache.close()
+
+
+class TestEvalCache:
+    """Tests for the sharded SQLite evaluation cache."""
+
+    @staticmethod
+    def _result(text: str) -> EvalResult:
+        return EvalResult(
+            intent_correct=True,
+            relevance_score=0.7,
+            explanation=text,
+            turn_id=f"turn-{text}",
+            content_hash=EvalInput(user_transcript=text, agent_response="A").content_hash(),
+        )
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """Stored results are returned as cached; unknown hashes miss."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path)
+        stored = self._result("hello")
+        cache.put(stored)
+
+        result = cache.get(stored.content_hash)
+        assert result is not None
+        assert result.cached is True
+        assert result.explanation == "hello"
+        assert result.turn_id == "turn-hello"
+        assert cache.get("0" * 64) is None
+
+    def test_get_many(self, tmp_path: Path) -> None:
+        """get_many returns every hit across shards."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path, shards=4)
+        results = [self._result(f"q{i}") for i in range(20)]
+        cache.put_many(results)
+
+        found = cache.get_many([r.content_hash for r in results] + ["f" * 64])
+        assert set(found) == {r.content_hash for r in results}
+
+    def test_opens_shards_lazily(self, tmp_path: Path) -> None:
+        """No files are created at init and a lookup opens a single shard."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path / "cache")
+        assert not (tmp_path / "cache").exists()
+
+        cache.get("00" + "0" * 62)
+        assert [p.name for p in (tmp_path / "cache").glob("*.sqlite")] == ["eval_cache.00.sqlite"]
+
+    def test_expired_entries_are_ignored_and_evicted(self, tmp_path: Path) -> None:
+        """Entries older than max_age_days miss and are deleted by evict."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path, shards=1, max_age_days=1)
+        old = self._result("old")
+        with patch("voiceobs.eval.cache.time.time", return_value=time.time() - 2 * 86400):
+            cache.put(old)
+        cache.put(self._result("new"))
+
+        assert cache.get(old.content_hash) is None
+        assert cache.evict() == 1
+        assert len(cache) == 1
+
+    def test_size_eviction_drops_oldest(self, tmp_path: Path) -> None:
+        """Each shard is trimmed to its share of max_entries, oldest first."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path, shards=1, max_entries=3, max_age_days=None)
+        results = [self._result(f"q{i}") for i in range(5)]
+        for i, result in enumerate(results):
+            with patch("voiceobs.eval.cache.time.time", return_value=1000.0 + i):
+                cache.put(result)
+
+        assert cache.evict() == 2
+        assert set(cache.get_many(r.content_hash for r in results)) == {
+            r.content_hash for r in results[2:]
+        }
+
+    def test_imports_legacy_json_cache(self, tmp_path: Path) -> None:
+        """An eval_cache.json from earlier versions is imported once and moved aside."""
+        import json
+
+        from voiceobs.eval.cache import EvalCache
+
+        legacy = self._result("legacy")
+        (tmp_path / "eval_cache.json").write_text(
+            json.dumps(
+                {
+                    legacy.content_hash: {
+                        "intent_correct": False,
+                        "relevance_score": 0.2,
+                        "explanation": "legacy",
+                    }
+                }
+            )
+        )
+
+        result = EvalCache(tmp_path).get(legacy.content_hash)
+
+        assert result is not None
+        assert result.intent_correct is False
+        assert not (tmp_path / "eval_cache.json").exists()
+        assert (tmp_path / "eval_cache.json.imported").exists()
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear removes every entry."""
+        from voiceobs.eval.cache import EvalCache
+
+        cache = EvalCache(tmp_path, shards=2)
+        cache.put_many([self._result("a"), self._result("b")])
+        cache.clear()
+
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("kwargs", [{"shards": 0}, {"shards": 257}, {"max_entries": 0}])
+    def test_invalid_parameters(self, tmp_path: Path, kwargs) -> None:
+        """Out-of-range shard counts or sizes raise ValueError."""
+        from voiceobs.eval.cache import EvalCache
+
+        with pytest.raises(ValueError):
+            EvalCache(tmp_path, **kwargs)
+
+    def test_concurrent_processes(self, tmp_path: Path) -> None:
+        """Several processes can write to the same cache without losing entries."""
+        import multiprocessing
+
+        from voiceobs.eval.cache import EvalCache
+
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            pytest.skip("fork start method not available")
+
+        processes = [
+            context.Process(target=_write_cache_entries, args=(str(tmp_path), f"p{n}", 50))
+            for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0
+
+        assert len(EvalCache(tmp_path, shards=4)) == 200
@@ -1,10 +1,13 @@
 """Tests for voiceobs exporters."""
 
+import gzip
 import json
+import time
 from unittest.mock import patch
 
+import pytest
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExportResult
 
 from voiceobs import JSONLSpanExporter
 from voiceobs.config import ExporterJsonlConfig, ExportersConfig, VoiceobsConfig
@@ -69,6 +72,152 @@ class TestJSONLSpanExporter:
 
             assert result == SpanExportResult.FAILURE
 
+    def test_rejects_unknown_compression(self, tmp_path):
+        """Test that an unknown compression raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            JSONLSpanExporter(str(tmp_path / "spans.jsonl"), compression="lz4")
+
+
+def _export_spans(exporter: JSONLSpanExporter, count: int) -> None:
+    """Export ``count`` spans, one per export call."""
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("test")
+    for i in range(count):
+        with tracer.start_as_current_span("voice.turn") as span:
+            span.set_attribute("voice.turn.index", i)
+
+
+class TestJSONLBufferedWriter:
+    """Tests for JSONLSpanExporter buffering, rotation and compression."""
+
+    def test_keeps_file_open_between_exports(self, tmp_path):
+        """Test that the file is opened once, not once per export."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path))
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            _export_spans(exporter, 5)
+
+        assert mock_open.call_count == 1
+        assert len(file_path.read_text().splitlines()) == 5
+
+    def test_flush_interval_buffers_until_force_flush(self, tmp_path):
+        """Test that spans stay buffered until the interval or force_flush."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path), flush_interval_ms=60_000)
+
+        _export_spans(exporter, 3)
+        assert file_path.read_text() == ""
+
+        assert exporter.force_flush() is True
+        assert len(file_path.read_text().splitlines()) == 3
+
+    def test_flush_interval_flushes_without_exports(self, tmp_path):
+        """Test that buffered spans are flushed once the interval passes."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path), flush_interval_ms=20)
+
+        _export_spans(exporter, 2)
+        deadline = time.monotonic() + 5
+        while not file_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(file_path.read_text().splitlines()) == 2
+        exporter.shutdown()
+        assert not exporter._flusher.is_alive()
+
+    def test_export_after_shutdown_fails(self, tmp_path):
+        """Test that exports after shutdown fail instead of reopening the file."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path))
+        _export_spans(exporter, 1)
+        exporter.shutdown()
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert exporter.export([]) == SpanExportResult.FAILURE
+
+        mock_open.assert_not_called()
+        assert exporter._file is None
+        assert len(file_path.read_text().splitlines()) == 1
+
+    def test_shutdown_flushes_and_closes(self, tmp_path):
+        """Test that shutdown writes buffered spans and closes the file."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path), flush_interval_ms=60_000)
+
+        _export_spans(exporter, 2)
+        exporter.shutdown()
+
+        assert len(file_path.read_text().splitlines()) == 2
+        assert exporter._file is None
+
+    def test_rotates_when_max_bytes_reached(self, tmp_path):
+        """Test that files rotate and only backup_count backups are kept."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path), max_bytes=1, backup_count=2)
+
+        _export_spans(exporter, 4)
+        exporter.shutdown()
+
+        assert file_path.read_text() == ""
+        newest = json.loads((tmp_path / "spans.1.jsonl").read_text())
+        older = json.loads((tmp_path / "spans.2.jsonl").read_text())
+        assert newest["attributes"]["voice.turn.index"] == 3
+        assert older["attributes"]["voice.turn.index"] == 2
+        assert not (tmp_path / "spans.3.jsonl").exists()
+
+    def test_rotation_without_backups_discards_file(self, tmp_path):
+        """Test that backup_count=0 truncates the file on rotation."""
+        file_path = tmp_path / "spans.jsonl"
+        exporter = JSONLSpanExporter(str(file_path), max_bytes=1, backup_count=0)
+
+        _export_spans(exporter, 2)
+
+        assert file_path.read_text() == ""
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["spans.jsonl"]
+
+    def test_gzip_compression(self, tmp_path):
+        """Test that gzip output is readable after each flush."""
+        file_path = tmp_path / "spans.jsonl.gz"
+        exporter = JSONLSpanExporter(str(file_path), compression="gzip")
+
+        _export_spans(exporter, 3)
+        exporter.shutdown()
+
+        with gzip.open(file_path, "rt") as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["voice.turn"] * 3
+
+    def test_gzip_rotation_keeps_extension(self, tmp_path):
+        """Test that rotated gzip files keep the .jsonl.gz suffix."""
+        file_path = tmp_path / "spans.jsonl.gz"
+        exporter = JSONLSpanExporter(str(file_path), compression="gzip", max_bytes=1)
+
+        _export_spans(exporter, 1)
+
+        with gzip.open(tmp_path / "spans.1.jsonl.gz", "rt") as f:
+            assert json.loads(f.read())["name"] == "voice.turn"
+
+    def test_zstd_compression(self, tmp_path):
+        """Test that zstd output can be decompressed."""
+        zstandard = pytest.importorskip("zstandard")
+        file_path = tmp_path / "spans.jsonl.zst"
+        exporter = JSONLSpanExporter(str(file_path), compression="zstd")
+
+        _export_spans(exporter, 3)
+        exporter.shutdown()
+
+        with open(file_path, "rb") as f:
+            data = zstandard.ZstdDecompressor().stream_reader(f).read()
+        assert len(data.decode().splitlines()) == 3
+
+    def test_zstd_missing_dependency(self, tmp_path):
+        """Test that zstd without zstandard raises a helpful ImportError."""
+        with patch.dict("sys.modules", {"zstandard": None}):
+            with pytest.raises(ImportError, match="pip install zstandard"):
+                JSONLSpanExporter(str(tmp_path / "spans.jsonl.zst"), compression="zstd")
+
 
 class TestGetJSONLExporterFromConfig:
     """Tests for get_jsonl_exporter_from_config function."""
@@ -91,6 +240,29 @@ class TestGetJSONLExporterFromConfig:
             assert exporter is not None
             assert isinstance(exporter, JSONLSpanExporter)
 
+    def test_passes_writer_settings(self, tmp_path):
+        """Test that buffering, rotation and compression settings are applied."""
+        file_path = tmp_path / "test.jsonl.gz"
+        config = VoiceobsConfig(
+            exporters=ExportersConfig(
+                jsonl=ExporterJsonlConfig(
+                    enabled=True,
+                    path=str(file_path),
+                    flush_interval_ms=250,
+                    max_bytes=1024,
+                    backup_count=3,
+                    compression="gzip",
+                )
+            )
+        )
+        with patch("voiceobs.config.get_config", return_value=config):
+            exporter = get_jsonl_exporter_from_config()
+
+        assert exporter._flush_interval_s == 0.25
+        assert exporter._max_bytes == 1024
+        assert exporter._backup_count == 3
+        assert exporter._compression == "gzip"
+
 
 class TestJSONLExportIntegration:
     """Integration tests for JSONL export with voice spans."""
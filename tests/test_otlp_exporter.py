@@ -1,6 +1,8 @@
 """Tests for OTLP exporter."""
 
 import sys
+import threading
+import time
 from types import ModuleType
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +22,16 @@ def _create_mock_module(name: str) -> ModuleType:
     return module
 
 
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
 @pytest.fixture(autouse=True)
 def setup_opentelemetry_mocks():
     """Set up mock opentelemetry.exporter modules before each test."""
@@ -176,11 +188,13 @@ class TestOTLPSpanExporter:
         assert result == SpanExportResult.SUCCESS
         mock_otlp_grpc.export.assert_not_called()
 
-        # Add one more span - should flush now
+        # Add one more span - the sender thread should send the full batch
         with tracer.start_as_current_span("span.2") as span:
             result = exporter.export([span])
         assert result == SpanExportResult.SUCCESS
-        assert mock_otlp_grpc.export.call_count == 1
+        assert _wait_for(lambda: mock_otlp_grpc.export.call_count == 1)
+        assert len(mock_otlp_grpc.export.call_args[0][0]) == 3
+        exporter.shutdown()
 
     def test_flushes_on_timeout(self, mock_otlp_grpc):
         """Test that batch flushes when timeout is reached."""
@@ -218,7 +232,7 @@ class TestOTLPSpanExporter:
 
         from voiceobs.exporters.otlp import OTLPSpanExporter
 
-        exporter = OTLPSpanExporter(batch_size=1, max_retries=2)
+        exporter = OTLPSpanExporter(batch_size=1, max_retries=2, initial_backoff_ms=1)
         # First two calls fail, third succeeds
         mock_otlp_grpc.export.side_effect = [
             SpanExportResult.FAILURE,
@@ -234,7 +248,9 @@ class TestOTLPSpanExporter:
 
         # Should have retried and eventually succeeded
         assert result == SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
         assert mock_otlp_grpc.export.call_count == 3
+        assert exporter.exported_spans == 1
 
     def test_returns_failure_after_max_retries(self, mock_otlp_grpc):
         """Test that exporter returns failure after max retries."""
@@ -243,18 +259,19 @@ class TestOTLPSpanExporter:
 
         from voiceobs.exporters.otlp import OTLPSpanExporter
 
-        exporter = OTLPSpanExporter(batch_size=1, max_retries=2)
+        exporter = OTLPSpanExporter(batch_size=1, max_retries=2, initial_backoff_ms=1)
         mock_otlp_grpc.export.return_value = SpanExportResult.FAILURE
 
         provider = TracerProvider()
         tracer = provider.get_tracer("test")
 
         with tracer.start_as_current_span("test.span") as span:
-            result = exporter.export([span])
+            exporter.export([span])
 
         # Should have failed after all retries
-        assert result == SpanExportResult.FAILURE
+        assert exporter.force_flush() is False
         assert mock_otlp_grpc.export.call_count == 3  # Initial + 2 retries
+        assert exporter.failed_spans == 1
 
     def test_handles_exceptions_during_export(self, mock_otlp_grpc):
         """Test that exceptions during export are handled with retries."""
@@ -263,7 +280,7 @@ class TestOTLPSpanExporter:
 
         from voiceobs.exporters.otlp import OTLPSpanExporter
 
-        exporter = OTLPSpanExporter(batch_size=1, max_retries=1)
+        exporter = OTLPSpanExporter(batch_size=1, max_retries=1, initial_backoff_ms=1)
         # First call raises exception, second succeeds
         mock_otlp_grpc.export.side_effect = [
             ConnectionError("Connection failed"),
@@ -278,6 +295,7 @@ class TestOTLPSpanExporter:
 
         # Should succeed after retry
         assert result == SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
         assert mock_otlp_grpc.export.call_count == 2
 
     def test_shutdown_flushes_pending_spans(self, mock_otlp_grpc):
@@ -372,12 +390,200 @@ class TestOTLPSpanExporter:
             result = exporter.export([span])
 
         assert result == SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
         # Verify that export was called with spans
         assert mock_otlp_grpc.export.call_count == 1
         call_args = mock_otlp_grpc.export.call_args[0][0]
         assert len(call_args) == 1
 
 
+def _make_spans(count: int) -> list:
+    """Create finished spans for export."""
+    from opentelemetry.sdk.trace import TracerProvider
+
+    tracer = TracerProvider().get_tracer("test")
+    spans = []
+    for i in range(count):
+        with tracer.start_as_current_span(f"span.{i}") as span:
+            spans.append(span)
+    return spans
+
+
+class TestOTLPBackgroundSender:
+    """Tests for the queue and background sender of OTLPSpanExporter."""
+
+    def test_export_does_not_block_on_slow_backend(self, mock_otlp_grpc):
+        """Test that export returns while the backend is still sending."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        release = threading.Event()
+        mock_otlp_grpc.export.side_effect = lambda spans: (
+            release.wait(5) and SpanExportResult.SUCCESS
+        )
+        exporter = OTLPSpanExporter(batch_size=1)
+
+        start = time.monotonic()
+        for span in _make_spans(5):
+            assert exporter.export([span]) == SpanExportResult.SUCCESS
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        assert exporter.force_flush() is True
+        assert exporter.exported_spans == 5
+
+    def test_flushes_on_timer_without_new_exports(self, mock_otlp_grpc):
+        """Test that a partial batch is sent once batch_timeout_ms elapses."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        mock_otlp_grpc.export.return_value = SpanExportResult.SUCCESS
+        exporter = OTLPSpanExporter(batch_size=100, batch_timeout_ms=50)
+
+        exporter.export(_make_spans(2))
+
+        assert _wait_for(lambda: exporter.exported_spans == 2)
+        assert mock_otlp_grpc.export.call_count == 1
+        exporter.shutdown()
+
+    def test_leftover_spans_keep_their_enqueue_time(self, mock_otlp_grpc):
+        """Test that spans left after a partial drain are sent by their own deadline."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        release = threading.Event()
+        mock_otlp_grpc.export.side_effect = lambda spans: (
+            release.wait(5) and SpanExportResult.SUCCESS
+        )
+        exporter = OTLPSpanExporter(batch_size=2, batch_timeout_ms=500)
+
+        exporter.export(_make_spans(2))
+        assert _wait_for(lambda: exporter.queue_size == 0)
+        # Queued while the first batch is still being sent
+        start = time.monotonic()
+        exporter.export(_make_spans(3))
+        time.sleep(0.5)
+        release.set()
+
+        # The third span's deadline has passed, so it goes out right after the
+        # second batch instead of batch_timeout_ms after that batch was drained
+        assert _wait_for(lambda: exporter.exported_spans == 5)
+        assert time.monotonic() - start < 0.85
+        exporter.shutdown()
+
+    def test_drops_spans_when_queue_full(self, mock_otlp_grpc):
+        """Test that spans beyond max_queue_size are dropped and counted."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        mock_otlp_grpc.export.return_value = SpanExportResult.SUCCESS
+        exporter = OTLPSpanExporter(batch_size=100, batch_timeout_ms=60_000, max_queue_size=3)
+
+        result = exporter.export(_make_spans(5))
+
+        assert result == SpanExportResult.FAILURE
+        assert exporter.queue_size == 3
+        assert exporter.dropped_spans == 2
+        exporter.shutdown()
+
+    def test_backoff_is_jittered_and_capped(self, mock_otlp_grpc):
+        """Test that retry delays are drawn below a doubling, capped bound."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        mock_otlp_grpc.export.return_value = SpanExportResult.FAILURE
+        exporter = OTLPSpanExporter(
+            batch_size=1, max_retries=4, initial_backoff_ms=100, max_backoff_ms=300
+        )
+
+        with patch("voiceobs.exporters.otlp.random.uniform", return_value=0.0) as uniform:
+            exporter.export(_make_spans(1))
+            assert exporter.force_flush() is False
+
+        assert [c.args for c in uniform.call_args_list] == [
+            (0, 100),
+            (0, 200),
+            (0, 300),
+            (0, 300),
+        ]
+
+    def test_force_flush_honors_timeout(self, mock_otlp_grpc):
+        """Test that force_flush gives up after timeout_millis."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        release = threading.Event()
+        mock_otlp_grpc.export.side_effect = lambda spans: (
+            release.wait(5) and SpanExportResult.SUCCESS
+        )
+        exporter = OTLPSpanExporter(batch_size=1)
+        exporter.export(_make_spans(1))
+
+        start = time.monotonic()
+        assert exporter.force_flush(timeout_millis=50) is False
+        assert time.monotonic() - start < 1.0
+
+        release.set()
+        exporter.shutdown()
+
+    def test_shutdown_honors_timeout_and_counts_drops(self, mock_otlp_grpc):
+        """Test that shutdown stops retrying at the timeout and drops the rest."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        mock_otlp_grpc.export.return_value = SpanExportResult.FAILURE
+        exporter = OTLPSpanExporter(
+            batch_size=1, max_retries=10, initial_backoff_ms=10_000, max_backoff_ms=10_000
+        )
+        exporter.export(_make_spans(3))
+
+        start = time.monotonic()
+        exporter.shutdown(timeout_millis=100)
+        assert time.monotonic() - start < 1.0
+
+        # The in-flight batch fails once its backoff wait is interrupted
+        assert _wait_for(lambda: exporter.failed_spans == 1)
+        assert exporter.dropped_spans == 2
+        mock_otlp_grpc.shutdown.assert_called_once()
+
+    def test_export_after_shutdown_fails(self, mock_otlp_grpc):
+        """Test that spans exported after shutdown are dropped."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter()
+        exporter.shutdown()
+
+        assert exporter.export(_make_spans(1)) == SpanExportResult.FAILURE
+        assert exporter.dropped_spans == 1
+
+    def test_force_flush_with_nothing_queued(self, mock_otlp_grpc):
+        """Test that force_flush returns True without starting a sender."""
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter()
+
+        assert exporter.force_flush() is True
+        assert exporter._sender is None
+
+    def test_passes_export_timeout_to_backend(self, setup_opentelemetry_mocks):
+        """Test that export_timeout_ms is passed to the underlying exporter in seconds."""
+        from voiceobs.exporters.otlp import OTLPSpanExporter
+
+        grpc_exporter_class, _ = setup_opentelemetry_mocks
+        OTLPSpanExporter(export_timeout_ms=2500)
+
+        assert grpc_exporter_class.call_args.kwargs["timeout"] == 2.5
+
+
 class TestGetOTLPExporterFromConfig:
     """Tests for get_otlp_exporter_from_config function."""
 
@@ -430,6 +636,8 @@ class TestGetOTLPExporterFromConfig:
                     batch_size=256,
                     batch_timeout_ms=3000,
                     max_retries=5,
+                    max_queue_size=100,
+                    export_timeout_ms=2000,
                 )
             )
         )
@@ -441,6 +649,8 @@ class TestGetOTLPExporterFromConfig:
             assert exporter._batch_size == 256
             assert exporter._batch_timeout_ms == 3000
             assert exporter._max_retries == 5
+            assert exporter._max_queue_size == 100
+            assert exporter._export_timeout_ms == 2000
 
 
 class TestOTLPIntegration:
@@ -470,6 +680,7 @@ class TestOTLPIntegration:
                 result = exporter.export([turn_span])
 
         assert result == SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
         assert mock_otlp_grpc.export.call_count == 1
 
     def test_preserves_custom_attributes(self, mock_otlp_grpc):
@@ -493,6 +704,7 @@ class TestOTLPIntegration:
             result = exporter.export([span])
 
         assert result == SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
         # Verify attributes were passed through
         call_args = mock_otlp_grpc.export.call_args[0][0]
         exported_span = call_args[0]
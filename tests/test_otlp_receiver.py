@@ -0,0 +1,109 @@
+"""Tests for OTLP export against a local stub OTLP/HTTP receiver."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+pytest.importorskip("opentelemetry.exporter.otlp.proto.http.trace_exporter")
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (  # noqa: E402
+    ExportTraceServiceRequest,
+)
+
+from voiceobs.exporters.otlp import OTLPSpanExporter  # noqa: E402
+
+
+class StubReceiver(ThreadingHTTPServer):
+    """OTLP/HTTP receiver that records span names and can fail requests."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.span_names: list[str] = []
+        self.requests = 0
+        self.fail_first = 0
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/traces"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubReceiver
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests += 1
+            failing = self.server.requests <= self.server.fail_first
+            if not failing:
+                request = ExportTraceServiceRequest.FromString(body)
+                for resource_spans in request.resource_spans:
+                    for scope_spans in resource_spans.scope_spans:
+                        self.server.span_names.extend(s.name for s in scope_spans.spans)
+
+        # 4xx is not retried by the OTLP client itself, so retries are ours
+        self.send_response(400 if failing else 200)
+        self.send_header("Content-Type", "application/x-protobuf")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def receiver() -> Iterator[StubReceiver]:
+    """Run a stub receiver on a free local port."""
+    server = StubReceiver()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestOTLPStubReceiver:
+    """End-to-end tests of OTLPSpanExporter over HTTP/protobuf."""
+
+    def test_delivers_spans_through_batch_processor(self, receiver):
+        """Test that spans reach the receiver through a BatchSpanProcessor."""
+        exporter = OTLPSpanExporter(
+            endpoint=receiver.endpoint, protocol="http/protobuf", batch_size=4
+        )
+        provider = TracerProvider()
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+        tracer = provider.get_tracer("test")
+
+        for i in range(10):
+            with tracer.start_as_current_span(f"voice.turn.{i}"):
+                pass
+        provider.shutdown()
+
+        assert sorted(receiver.span_names) == sorted(f"voice.turn.{i}" for i in range(10))
+        assert exporter.exported_spans == 10
+        assert exporter.dropped_spans == 0
+
+    def test_retries_failed_requests(self, receiver):
+        """Test that rejected batches are retried on the sender thread."""
+        receiver.fail_first = 2
+        exporter = OTLPSpanExporter(
+            endpoint=receiver.endpoint,
+            protocol="http/protobuf",
+            max_retries=3,
+            initial_backoff_ms=10,
+        )
+        tracer = TracerProvider().get_tracer("test")
+        with tracer.start_as_current_span("voice.turn") as span:
+            pass
+
+        exporter.export([span])
+
+        assert exporter.force_flush(timeout_millis=5000) is True
+        assert receiver.requests == 3
+        assert receiver.span_names == ["voice.turn"]
+        exporter.shutdown()
@@ -0,0 +1,270 @@
+"""Tests for the single-pass span pipeline."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from voiceobs.analyzer import analyze_spans, analyze_stream
+from voiceobs.classifier import FailureClassifier
+from voiceobs.failures import FailureThresholds
+from voiceobs.pipeline import (
+    MetricPlugin,
+    NormalizedSpan,
+    list_metric_plugins,
+    load_metric_plugin,
+    normalize_span,
+    register_metric_plugin,
+    run_pipeline,
+    unregister_metric_plugin,
+)
+
+
+def random_spans(count: int, seed: int = 3) -> list[dict]:
+    """Random stage, turn, eval and other spans with some threshold breaches."""
+    rng = random.Random(seed)
+    spans = []
+    for i in range(count):
+        attrs: dict[str, Any] = {
+            "voice.conversation.id": f"conv-{i // 25}",
+            "voice.turn.id": f"turn-{i}",
+            "voice.turn.index": i % 10,
+        }
+        choice = rng.randrange(4)
+        if choice == 0:
+            name = rng.choice(["voice.asr", "voice.stage.llm", "voice.tts"])
+            if name == "voice.asr":
+                attrs["voice.asr.confidence"] = rng.random()
+            if rng.random() < 0.3:
+                attrs["voice.stage.duration_ms"] = rng.uniform(10.0, 5000.0)
+        elif choice == 1:
+            name = "voice.turn"
+            attrs["voice.actor"] = rng.choice(["agent", "user"])
+            attrs["voice.silence.after_user_ms"] = rng.uniform(0.0, 6000.0)
+            attrs["voice.turn.overlap_ms"] = rng.uniform(-300.0, 800.0)
+            attrs["voice.interruption.detected"] = rng.random() < 0.3
+        elif choice == 2:
+            name = "voiceobs.eval"
+            attrs["eval.intent_correct"] = rng.choice([True, False, None])
+            attrs["eval.relevance_score"] = rng.random()
+        else:
+            name = "voice.conversation"
+        spans.append({"name": name, "duration_ms": rng.uniform(10.0, 5000.0), "attributes": attrs})
+    return spans
+
+
+class TurnCounter(MetricPlugin):
+    """Counts turns by actor."""
+
+    name = "turn_counter"
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.finished = False
+
+    def visit(self, span: NormalizedSpan) -> None:
+        if span.kind == "turn":
+            actor = span.attributes.get("voice.actor", "unknown")
+            self.counts[actor] = self.counts.get(actor, 0) + 1
+
+    def finish(self) -> None:
+        self.finished = True
+
+    def result(self) -> dict[str, Any]:
+        return dict(sorted(self.counts.items()))
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    """Isolate tests from registered metric plugins."""
+    monkeypatch.setattr("voiceobs.pipeline._metric_plugins", {})
+
+
+class TestNormalizeSpan:
+    """Tests for normalize_span."""
+
+    def test_stage_span(self):
+        """Test stage type and duration are derived like the analyzer does."""
+        span = normalize_span(
+            {
+                "name": "voice.stage.llm",
+                "duration_ms": 900.0,
+                "attributes": {"voice.conversation.id": "c", "voice.stage.duration_ms": 450.0},
+            }
+        )
+
+        assert span.kind == "stage"
+        assert span.stage_type == "llm"
+        assert span.stage_duration_ms == 450.0
+        assert span.duration_ms == 900.0
+        assert span.conversation_id == "c"
+
+    def test_other_spans(self):
+        """Test turn, eval and unknown spans get their kind and no stage fields."""
+        assert normalize_span({"name": "voice.turn", "attributes": {}}).kind == "turn"
+        assert normalize_span({"name": "voiceobs.eval"}).kind == "eval"
+        other = normalize_span({"name": "custom.span", "duration_ms": 5})
+        assert other.kind == "other"
+        assert other.stage_type is None
+        assert other.attributes == {}
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline."""
+
+    @pytest.mark.parametrize("seed", [1, 2])
+    def test_matches_separate_passes(self, seed):
+        """Test results equal analyze_spans and FailureClassifier.classify."""
+        spans = random_spans(1000, seed)
+
+        result = run_pipeline(spans)
+
+        expected_failures = FailureClassifier().classify(spans)
+        assert result.analysis.to_dict() == analyze_spans(spans).to_dict()
+        assert result.analysis.conversation_ids == analyze_spans(spans).conversation_ids
+        assert result.failures.failure_count > 0
+        assert result.failures.failures == expected_failures.failures
+        assert result.failures.total_spans == expected_failures.total_spans
+        assert result.failures.total_turns == expected_failures.total_turns
+        assert result.failures.total_agent_turns == expected_failures.total_agent_turns
+        assert result.metrics == {}
+
+    def test_streaming(self):
+        """Test streaming mode matches analyze_stream."""
+        spans = random_spans(500)
+
+        result = run_pipeline(spans, streaming=True)
+
+        assert result.analysis.llm_metrics.sketch is not None
+        assert result.analysis.to_dict() == analyze_stream(spans).to_dict()
+
+    def test_consumes_iterator_once(self):
+        """Test a generator of spans is enough: the spans are read in one pass."""
+        spans = random_spans(300)
+
+        result = run_pipeline(span for span in spans)
+
+        assert result.analysis.total_spans == 300
+        assert result.failures.failures == FailureClassifier().classify(spans).failures
+
+    def test_custom_thresholds(self):
+        """Test thresholds are passed to the classifier."""
+        spans = random_spans(500)
+        thresholds = FailureThresholds(slow_llm_ms=100.0, excessive_silence_ms=500.0)
+
+        result = run_pipeline(spans, thresholds=thresholds)
+
+        assert result.failures.failures == FailureClassifier(thresholds).classify(spans).failures
+
+    def test_empty(self):
+        """Test no spans give empty results."""
+        result = run_pipeline([])
+
+        assert result.analysis.total_spans == 0
+        assert result.failures.failures == []
+
+
+class TestMetricPlugins:
+    """Tests for custom metric plugins."""
+
+    def test_explicit_plugins(self):
+        """Test plugin instances see every span and are finished."""
+        spans = random_spans(200)
+        plugin = TurnCounter()
+
+        result = run_pipeline(spans, plugins=[plugin])
+
+        turns = analyze_spans(spans).turn_metrics.total_agent_turns
+        assert plugin.finished
+        assert result.metrics["turn_counter"]["agent"] == turns
+        assert sum(result.metrics["turn_counter"].values()) == analyze_spans(spans).total_turns
+
+    def test_registered_plugins_run_by_default(self):
+        """Test registered plugins are instantiated for each run."""
+        register_metric_plugin(TurnCounter)
+
+        first = run_pipeline([{"name": "voice.turn", "attributes": {"voice.actor": "user"}}])
+        second = run_pipeline([])
+
+        assert list_metric_plugins() == ["turn_counter"]
+        assert first.metrics == {"turn_counter": {"user": 1}}
+        assert second.metrics == {"turn_counter": {}}
+
+    def test_register_as_decorator(self):
+        """Test register_metric_plugin returns the class."""
+
+        @register_metric_plugin
+        class Spans(MetricPlugin):
+            name = "spans"
+
+            def __init__(self) -> None:
+                self.count = 0
+
+            def visit(self, span: NormalizedSpan) -> None:
+                self.count += 1
+
+            def result(self) -> dict[str, Any]:
+                return {"count": self.count}
+
+        assert Spans.name == "spans"
+        assert run_pipeline(random_spans(10)).metrics == {"spans": {"count": 10}}
+
+    def test_register_without_name_fails(self):
+        """Test a plugin without a name is rejected."""
+
+        class Unnamed(MetricPlugin):
+            def visit(self, span: NormalizedSpan) -> None:
+                pass
+
+            def result(self) -> dict[str, Any]:
+                return {}
+
+        with pytest.raises(ValueError, match="must set a name"):
+            register_metric_plugin(Unnamed)
+
+    def test_unregister(self):
+        """Test plugins can be unregistered, and unknown names are rejected."""
+        register_metric_plugin(TurnCounter)
+        unregister_metric_plugin("turn_counter")
+
+        assert list_metric_plugins() == []
+        with pytest.raises(ValueError, match="Unknown metric plugin"):
+            unregister_metric_plugin("turn_counter")
+
+    def test_load_metric_plugin(self, tmp_path, monkeypatch):
+        """Test a plugin can be imported by 'module:ClassName' and is registered."""
+        (tmp_path / "my_metrics.py").write_text(
+            "from voiceobs.pipeline import MetricPlugin\n"
+            "\n"
+            "class Evals(MetricPlugin):\n"
+            "    name = 'evals'\n"
+            "\n"
+            "    def __init__(self):\n"
+            "        self.count = 0\n"
+            "\n"
+            "    def visit(self, span):\n"
+            "        self.count += span.kind == 'eval'\n"
+            "\n"
+            "    def result(self):\n"
+            "        return {'count': self.count}\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        plugin = load_metric_plugin("my_metrics:Evals")
+
+        assert plugin.name == "evals"
+        assert list_metric_plugins() == ["evals"]
+        assert run_pipeline([{"name": "voiceobs.eval"}]).metrics == {"evals": {"count": 1}}
+
+    @pytest.mark.parametrize("spec", ["my_metrics", ":Evals", "voiceobs.pipeline:run_pipeline"])
+    def test_load_invalid_plugin(self, spec):
+        """Test malformed specs and non-plugin objects are rejected."""
+        with pytest.raises(ValueError):
+            load_metric_plugin(spec)
+
+    def test_load_missing_module(self):
+        """Test a missing module raises ImportError."""
+        with pytest.raises(ImportError):
+            load_metric_plugin("voiceobs_no_such_module:Plugin")
@@ -244,6 +244,25 @@ class TestGenerateMarkdownReport:
         # Should still have section but indicate no data
         assert "## Semantic Evaluation" in markdown
 
+    def test_custom_metrics_section(
+        self, empty_analysis: AnalysisResult, empty_failures: ClassificationResult
+    ) -> None:
+        """Test that custom metrics are listed per plugin, and omitted when absent."""
+        data = ReportData(
+            analysis=empty_analysis,
+            failures=empty_failures,
+            custom_metrics={"long_turns": {"count": 3, "share": 0.125, "max_ms": None}},
+        )
+        markdown = generate_markdown_report(data)
+        assert "## Custom Metrics" in markdown
+        assert "### long_turns" in markdown
+        assert "- count: 3" in markdown
+        assert "- share: 0.12" in markdown
+        assert "- max_ms: -" in markdown
+
+        data.custom_metrics = {}
+        assert "## Custom Metrics" not in generate_markdown_report(data)
+
 
 class TestGenerateHtmlReport:
     """Tests for HTML report generation."""
@@ -322,6 +341,20 @@ class TestGenerateHtmlReport:
         assert "<html" in html
         assert "</html>" in html
 
+    def test_custom_metrics_section(
+        self, empty_analysis: AnalysisResult, empty_failures: ClassificationResult
+    ) -> None:
+        """Test that custom metrics are rendered as escaped tables."""
+        data = ReportData(
+            analysis=empty_analysis,
+            failures=empty_failures,
+            custom_metrics={"<plugin>": {"count": 3}},
+        )
+        html = generate_html_report(data)
+        assert "<h2>Custom Metrics</h2>" in html
+        assert "<h3>&lt;plugin&gt;</h3>" in html
+        assert "<tr><td>count</td><td>3</td></tr>" in html
+
 
 class TestGenerateReport:
     """Tests for the unified generate_report function."""
@@ -440,6 +473,38 @@ class TestGenerateReportFromFile:
         with pytest.raises(FileNotFoundError):
             generate_report_from_file(Path("/nonexistent/file.jsonl"))
 
+    def test_generate_with_plugins(self, tmp_path: Path) -> None:
+        """Test metric plugins run in the same pass and appear in the report."""
+        import json
+
+        from voiceobs.pipeline import MetricPlugin, NormalizedSpan
+
+        class StageCount(MetricPlugin):
+            name = "stage_count"
+
+            def __init__(self) -> None:
+                self.count = 0
+
+            def visit(self, span: NormalizedSpan) -> None:
+                self.count += span.kind == "stage"
+
+            def result(self) -> dict:
+                return {"stages": self.count}
+
+        path = tmp_path / "run.jsonl"
+        spans = [
+            {"name": "voice.llm", "duration_ms": 4000, "attributes": {}},
+            {"name": "voice.asr", "duration_ms": 100, "attributes": {}},
+            {"name": "voice.turn", "attributes": {"voice.actor": "agent"}},
+        ]
+        path.write_text("\n".join(json.dumps(span) for span in spans) + "\n")
+
+        report = generate_report_from_file(path, plugins=[StageCount()])
+
+        assert "### stage_count" in report
+        assert "- stages: 2" in report
+        assert "LLM took 4000ms" in report
+
 
 class TestRecommendations:
     """Tests for recommendation generation based on failures."""
@@ -0,0 +1,194 @@
+"""Tests for voiceobs quantile sketch."""
+
+import json
+import math
+import random
+
+import pytest
+
+from voiceobs.sketch import QuantileSketch
+
+
+def exact_quantile(values: list[float], q: float) -> float:
+    """Value at the same rank the sketch targets."""
+    sorted_values = sorted(values)
+    return sorted_values[min(int(len(sorted_values) * q), len(sorted_values) - 1)]
+
+
+def assert_within(estimate: float, exact: float, accuracy: float) -> None:
+    """Assert the estimate is within the relative error bound."""
+    assert abs(estimate - exact) <= accuracy * abs(exact) + 1e-9, (estimate, exact)
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch class."""
+
+    def test_empty_sketch(self):
+        """Test an empty sketch returns None for all statistics."""
+        sketch = QuantileSketch()
+        assert sketch.count == 0
+        assert len(sketch) == 0
+        assert not sketch
+        assert sketch.mean is None
+        assert sketch.min is None
+        assert sketch.max is None
+        assert sketch.quantile(0.5) is None
+
+    def test_single_value(self):
+        """Test a single value is returned exactly for every quantile."""
+        sketch = QuantileSketch()
+        sketch.add(123.4)
+        assert sketch.count == 1
+        assert sketch.mean == 123.4
+        assert sketch.quantile(0.0) == 123.4
+        assert sketch.quantile(0.99) == 123.4
+
+    def test_exact_aggregates(self):
+        """Test count, sum, mean, min and max are exact."""
+        sketch = QuantileSketch()
+        for value in [5.0, 1.0, 3.0, 7.0]:
+            sketch.add(value)
+        assert sketch.count == 4
+        assert sketch.sum == 16.0
+        assert sketch.mean == 4.0
+        assert sketch.min == 1.0
+        assert sketch.max == 7.0
+
+    @pytest.mark.parametrize("accuracy", [0.01, 0.05])
+    @pytest.mark.parametrize(
+        "distribution",
+        ["uniform", "lognormal", "exponential"],
+    )
+    def test_error_bound_against_exact_percentiles(self, accuracy, distribution):
+        """Test estimates stay within the relative error bound."""
+        rng = random.Random(42)
+        generators = {
+            "uniform": lambda: rng.uniform(1.0, 5000.0),
+            "lognormal": lambda: rng.lognormvariate(5.0, 1.5),
+            "exponential": lambda: rng.expovariate(1 / 300.0),
+        }
+        values = [generators[distribution]() for _ in range(20_000)]
+
+        sketch = QuantileSketch(relative_accuracy=accuracy)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.0, 0.1, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0):
+            assert_within(sketch.quantile(q), exact_quantile(values, q), accuracy)
+
+    def test_memory_is_bounded(self):
+        """Test bucket count does not grow with the number of values."""
+        rng = random.Random(7)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for _ in range(100_000):
+            sketch.add(rng.uniform(10.0, 10_000.0))
+
+        # One bucket per factor of gamma between min and max, whatever the count
+        gamma = 1.01 / 0.99
+        assert sketch.bucket_count <= math.ceil(math.log(10_000.0 / 10.0, gamma)) + 1
+
+    def test_max_buckets_collapses_lowest(self):
+        """Test the bucket cap keeps high quantiles accurate."""
+        sketch = QuantileSketch(max_buckets=50)
+        values = [1.05**i for i in range(400)]
+        for value in values:
+            sketch.add(value)
+
+        assert sketch.bucket_count <= 50
+        assert_within(sketch.quantile(0.99), exact_quantile(values, 0.99), 0.01)
+
+    def test_zero_and_negative_values(self):
+        """Test zeros and negative values are ordered correctly."""
+        values = [-100.0, -10.0, 0.0, 0.0, 10.0, 100.0]
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        assert_within(sketch.quantile(0.0), -100.0, 0.01)
+        assert_within(sketch.quantile(0.2), -10.0, 0.01)
+        assert sketch.quantile(0.4) == 0.0
+        assert_within(sketch.quantile(1.0), 100.0, 0.01)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merging partial sketches equals sketching everything at once."""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(4.0, 1.0) for _ in range(10_000)]
+
+        whole = QuantileSketch()
+        for value in values:
+            whole.add(value)
+
+        left, right = QuantileSketch(), QuantileSketch()
+        for value in values[:3000]:
+            left.add(value)
+        for value in values[3000:]:
+            right.add(value)
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.min == whole.min
+        assert left.max == whole.max
+        assert left.sum == pytest.approx(whole.sum)
+        for q in (0.5, 0.95, 0.99):
+            assert left.quantile(q) == whole.quantile(q)
+
+    def test_merge_empty(self):
+        """Test merging an empty sketch is a no-op and into empty copies stats."""
+        sketch = QuantileSketch()
+        sketch.add(1.0)
+        sketch.merge(QuantileSketch())
+        assert sketch.count == 1
+
+        empty = QuantileSketch()
+        empty.merge(sketch)
+        assert empty.count == 1
+        assert empty.min == 1.0
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test sketches with different accuracy cannot be merged."""
+        with pytest.raises(ValueError, match="different relative accuracy"):
+            QuantileSketch(relative_accuracy=0.01).merge(QuantileSketch(relative_accuracy=0.02))
+
+    def test_dict_round_trip(self):
+        """Test to_dict/from_dict preserves stats and quantiles through JSON."""
+        rng = random.Random(5)
+        sketch = QuantileSketch()
+        for value in [0.0, -3.0] + [rng.lognormvariate(4.0, 1.0) for _ in range(1000)]:
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.count == sketch.count
+        assert restored.sum == sketch.sum
+        assert (restored.min, restored.max) == (sketch.min, sketch.max)
+        for q in (0.0, 0.001, 0.5, 0.95, 0.99):
+            assert restored.quantile(q) == sketch.quantile(q)
+
+    def test_from_dict_with_int_keys_and_defaults(self):
+        """Test externally counted buckets with int keys can be loaded."""
+        sketch = QuantileSketch.from_dict(
+            {
+                "relative_accuracy": 0.01,
+                "count": 2,
+                "sum": 200.0,
+                "min": 100.0,
+                "max": 100.0,
+                "positive": {QuantileSketch()._index(100.0): 2},
+            }
+        )
+
+        assert sketch.bucket_count == 1
+        assert_within(sketch.quantile(0.5), 100.0, 0.01)
+
+    @pytest.mark.parametrize("kwargs", [{"relative_accuracy": 0}, {"max_buckets": 0}])
+    def test_invalid_parameters(self, kwargs):
+        """Test invalid constructor arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            QuantileSketch(**kwargs)
+
+    def test_invalid_quantile(self):
+        """Test quantiles outside [0, 1] raise ValueError."""
+        sketch = QuantileSketch()
+        sketch.add(1.0)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
@@ -1,6 +1,7 @@
 """Tests for AudioStorage wrapper class."""
 
 import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -97,3 +98,12 @@ class TestAudioStorage:
 
         assert deleted is True
         assert not (tmp_path / "conv-123.wav").exists()
+
+    def test_close_delegates_to_provider(self, tmp_path):
+        """Test that close delegates to provider."""
+        storage = AudioStorage(provider="local", base_path=str(tmp_path))
+
+        with patch.object(storage._provider, "close") as mock_close:
+            storage.close()
+
+        mock_close.assert_called_once()
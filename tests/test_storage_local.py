@@ -114,3 +114,46 @@ class TestLocalFileStorage:
         deleted = await storage.delete("nonexistent")
 
         assert deleted is False
+
+    async def test_stat_returns_size_and_validators(self, tmp_path):
+        """Test that stat returns size, ETag and modification time."""
+        storage = LocalFileStorage(base_path=str(tmp_path))
+        await storage.save(b"0123456789", "conv-123")
+
+        info = await storage.stat("conv-123")
+
+        assert info is not None
+        assert info.size == 10
+        assert info.etag.startswith('"') and info.etag.endswith('"')
+        assert info.last_modified.tzinfo is not None
+        assert await storage.stat("nonexistent") is None
+
+    async def test_stat_etag_changes_when_file_changes(self, tmp_path):
+        """Test that rewriting a file changes its ETag."""
+        storage = LocalFileStorage(base_path=str(tmp_path))
+        await storage.save(b"first", "conv-123")
+        first = await storage.stat("conv-123")
+
+        await storage.save(b"second version", "conv-123")
+        second = await storage.stat("conv-123")
+
+        assert first is not None and second is not None
+        assert first.etag != second.etag
+
+    async def test_iter_range_reads_only_the_range(self, tmp_path):
+        """Test that iter_range yields the requested bytes in chunks."""
+        storage = LocalFileStorage(base_path=str(tmp_path))
+        audio_data = bytes(range(256)) * 4
+        await storage.save(audio_data, "conv-123")
+
+        chunks = [chunk async for chunk in storage.iter_range("conv-123", 100, 299, chunk_size=64)]
+
+        assert [len(chunk) for chunk in chunks] == [64, 64, 64, 8]
+        assert b"".join(chunks) == audio_data[100:300]
+
+    async def test_iter_range_empty_range(self, tmp_path):
+        """Test that iter_range yields nothing when end is before start."""
+        storage = LocalFileStorage(base_path=str(tmp_path))
+        await storage.save(b"", "conv-123")
+
+        assert [chunk async for chunk in storage.iter_range("conv-123", 0, -1)] == []
@@ -4,6 +4,7 @@
 
 import os
 import sys
+from datetime import datetime, timezone
 
 import pytest
 
@@ -33,16 +34,34 @@ class MockS3Client:  # noqa: N803
         self.put_object_body = Body
         self.objects[Key] = Body
 
-    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+    def upload_fileobj(  # noqa: N803
+        self, Fileobj, Bucket: str, Key: str, ExtraArgs: dict, Config
+    ) -> None:
+        """Mock managed (multipart) upload."""
+        self.upload_fileobj_config = Config
+        self.upload_fileobj_extra_args = ExtraArgs
+        self.objects[Key] = Fileobj.read()
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict:  # noqa: N803
         """Mock get_object."""
         if Key not in self.objects:
             raise Exception("NoSuchKey")
-        return {"Body": MockS3Body(self.objects[Key])}
-
-    def head_object(self, Bucket: str, Key: str) -> None:  # noqa: N803
+        self.get_object_range = Range
+        data = self.objects[Key]
+        if Range is not None:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start) : int(end) + 1]
+        return {"Body": MockS3Body(data)}
+
+    def head_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
         """Mock head_object."""
         if Key not in self.objects:
             raise Exception("NoSuchKey")
+        return {
+            "ContentLength": len(self.objects[Key]),
+            "ETag": '"etag-1"',
+            "LastModified": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        }
 
     def delete_object(self, Bucket: str, Key: str) -> None:  # noqa: N803
         """Mock delete_object."""
@@ -67,9 +86,17 @@ class MockS3Body:
         """Initialize mock body."""
         self._data = data
 
-    def read(self) -> bytes:
+    def read(self, amt: int | None = None) -> bytes:
         """Read data."""
-        return self._data
+        if amt is None:
+            data, self._data = self._data, b""
+        else:
+            data, self._data = self._data[:amt], self._data[amt:]
+        return data
+
+    def close(self) -> None:
+        """Close the body."""
+        self.closed = True
 
 
 class TestS3Storage:
@@ -230,3 +257,122 @@ class TestS3Storage:
 
         assert url.startswith("https://")
         assert "conv-123.wav" in url
+
+    async def test_stat_uses_head_object(self, monkeypatch):
+        """Test that stat returns size, ETag and modification time from HeadObject."""
+        mock_boto3 = type(sys)("boto3")
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+
+        mock_client = MockS3Client()
+        storage = S3Storage(bucket_name="test-bucket")
+        storage._s3_client = mock_client
+        mock_client.objects["conv-123.wav"] = b"0123456789"
+
+        info = await storage.stat("conv-123")
+
+        assert info is not None
+        assert info.size == 10
+        assert info.etag == '"etag-1"'
+        assert info.last_modified == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert await storage.stat("missing") is None
+
+    async def test_iter_range_uses_ranged_get(self, monkeypatch):
+        """Test that iter_range downloads only the requested range, in chunks."""
+        mock_boto3 = type(sys)("boto3")
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+
+        mock_client = MockS3Client()
+        storage = S3Storage(bucket_name="test-bucket")
+        storage._s3_client = mock_client
+        audio_data = bytes(range(256))
+        mock_client.objects["conv-123.wav"] = audio_data
+
+        chunks = [chunk async for chunk in storage.iter_range("conv-123", 10, 109, chunk_size=40)]
+
+        assert mock_client.get_object_range == "bytes=10-109"
+        assert [len(chunk) for chunk in chunks] == [40, 40, 20]
+        assert b"".join(chunks) == audio_data[10:110]
+
+    async def test_large_upload_uses_multipart(self, monkeypatch):
+        """Test that uploads above the threshold go through a managed multipart upload."""
+        mock_boto3 = type(sys)("boto3")
+        mock_transfer = type(sys)("boto3.s3.transfer")
+        mock_transfer.TransferConfig = lambda **kwargs: kwargs
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+        monkeypatch.setitem(sys.modules, "boto3.s3", type(sys)("boto3.s3"))
+        monkeypatch.setitem(sys.modules, "boto3.s3.transfer", mock_transfer)
+
+        mock_client = MockS3Client()
+        storage = S3Storage(
+            bucket_name="test-bucket", multipart_threshold=1024, multipart_chunksize=512
+        )
+        storage._s3_client = mock_client
+
+        await storage.save(b"small", "conv-small")
+        url = await storage.store_audio(b"x" * 2048, "recordings", content_type="audio/mpeg")
+
+        assert mock_client.put_object_key == "conv-small.wav"
+        key = url.removeprefix("s3://test-bucket/")
+        assert mock_client.objects[key] == b"x" * 2048
+        assert mock_client.upload_fileobj_extra_args == {"ContentType": "audio/mpeg"}
+        assert mock_client.upload_fileobj_config["multipart_chunksize"] == 512
+
+    async def test_calls_run_on_dedicated_executor(self, monkeypatch):
+        """Test that S3 calls run on the storage's own bounded thread pool."""
+        import threading
+
+        mock_boto3 = type(sys)("boto3")
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+
+        mock_client = MockS3Client()
+        thread_names = []
+        head_object = mock_client.head_object
+
+        def recording_head_object(**kwargs):
+            thread_names.append(threading.current_thread().name)
+            return head_object(**kwargs)
+
+        mock_client.head_object = recording_head_object
+        storage = S3Storage(bucket_name="test-bucket", max_concurrency=2)
+        storage._s3_client = mock_client
+
+        await storage.exists("conv-123")
+        storage.close()
+
+        assert storage._executor._max_workers == 2
+        assert thread_names[0].startswith("voiceobs-s3")
+
+    async def test_get_reads_body_on_executor(self, monkeypatch):
+        """Test that get reads the response body on the S3 thread pool and closes it."""
+        import threading
+
+        mock_boto3 = type(sys)("boto3")
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+
+        body = MockS3Body(b"fake audio data")
+        read = body.read
+        thread_names = []
+
+        def recording_read(amt=None):
+            thread_names.append(threading.current_thread().name)
+            return read(amt)
+
+        body.read = recording_read
+        mock_client = MockS3Client()
+        mock_client.get_object = lambda **kwargs: {"Body": body}
+        storage = S3Storage(bucket_name="test-bucket")
+        storage._s3_client = mock_client
+
+        assert await storage.get("conv-123") == b"fake audio data"
+        storage.close()
+
+        assert thread_names[0].startswith("voiceobs-s3")
+        assert body.closed
+
+    def test_rejects_invalid_concurrency(self, monkeypatch):
+        """Test that max_concurrency must be positive."""
+        mock_boto3 = type(sys)("boto3")
+        monkeypatch.setitem(sys.modules, "boto3", mock_boto3)
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            S3Storage(bucket_name="test-bucket", max_concurrency=0)
@@ -0,0 +1,262 @@
+"""Tests for the voiceobs indexed trace store."""
+
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+from voiceobs.analyzer import analyze_file, analyze_spans, analyze_stream, parse_jsonl
+from voiceobs.tracestore import (
+    StaleIndexError,
+    TraceStore,
+    build_index,
+    index_path_for,
+    open_fresh_index,
+)
+
+
+def make_spans() -> list[dict]:
+    """Spans from two conversations covering every metric the analyzer reads."""
+    spans = []
+    for conv_id, offset in (("conv-1", 0.0), ("conv-2", 50.0)):
+        spans.extend(
+            [
+                {
+                    "name": "voice.turn",
+                    "duration_ms": 900,
+                    "attributes": {"voice.conversation.id": conv_id, "voice.actor": "user"},
+                },
+                {
+                    "name": "voice.asr",
+                    "duration_ms": 120.0 + offset,
+                    "attributes": {"voice.conversation.id": conv_id, "voice.stage.type": "asr"},
+                },
+                {
+                    "name": "voice.stage.llm",
+                    "duration_ms": 999.0,
+                    "attributes": {
+                        "voice.conversation.id": conv_id,
+                        "voice.stage.duration_ms": 400.0 + offset,
+                    },
+                },
+                {
+                    "name": "voice.tts",
+                    "duration_ms": 80.5 + offset,
+                    "attributes": {"voice.conversation.id": conv_id, "voice.stage.type": "tts"},
+                },
+                {
+                    "name": "voice.turn",
+                    "duration_ms": 1500,
+                    "attributes": {
+                        "voice.conversation.id": conv_id,
+                        "voice.actor": "agent",
+                        "voice.silence.after_user_ms": 300.0 + offset,
+                        "voice.turn.overlap_ms": -20.0,
+                        "voice.interruption.detected": conv_id == "conv-2",
+                    },
+                },
+                {
+                    "name": "voiceobs.eval",
+                    "attributes": {
+                        "voice.conversation.id": conv_id,
+                        "eval.intent_correct": conv_id == "conv-1",
+                        "eval.relevance_score": 0.75 + offset / 1000,
+                    },
+                },
+            ]
+        )
+    spans.append({"name": "voice.stage.custom", "duration_ms": 10.0, "attributes": {}})
+    spans.append({"name": "voice.turn", "attributes": {"voice.actor": "agent"}})
+    return spans
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """A JSONL trace file with blank and padded lines."""
+    path = tmp_path / "run.jsonl"
+    lines = [json.dumps(span) for span in make_spans()]
+    lines.insert(3, "")
+    lines[5] = "  " + lines[5] + "  "
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestBuildIndex:
+    """Tests for build_index and TraceStore."""
+
+    def test_default_index_path(self, trace_file):
+        """Test the index is written next to the trace file."""
+        assert build_index(trace_file) == index_path_for(trace_file)
+        assert index_path_for(trace_file).name == "run.jsonl.vidx"
+        assert index_path_for(trace_file).exists()
+
+    def test_span_and_conversation_counts(self, trace_file):
+        """Test the store exposes span and conversation counts."""
+        build_index(trace_file)
+
+        with TraceStore.open(trace_file) as store:
+            assert len(store) == len(make_spans())
+            assert store.conversations == ["conv-1", "conv-2"]
+
+    def test_analyze_matches_parsed_analysis(self, trace_file):
+        """Test column analysis matches analyze_spans on the parsed file."""
+        build_index(trace_file)
+        expected = analyze_spans(parse_jsonl(trace_file))
+
+        with TraceStore.open(trace_file) as store:
+            result = store.analyze()
+
+        assert result.to_dict() == expected.to_dict()
+        assert result.conversation_ids == {"conv-1", "conv-2"}
+
+    def test_streaming_analyze_matches_analyze_stream(self, trace_file):
+        """Test sketch-backed column analysis matches analyze_stream."""
+        build_index(trace_file)
+        expected = analyze_stream(parse_jsonl(trace_file))
+
+        with TraceStore.open(trace_file) as store:
+            result = store.analyze(streaming=True)
+
+        assert result.llm_metrics.sketch is not None
+        assert result.to_dict() == expected.to_dict()
+
+    def test_analyze_one_conversation(self, trace_file):
+        """Test analysis restricted to one conversation."""
+        build_index(trace_file)
+        conv_spans = [
+            span
+            for span in make_spans()
+            if span["attributes"].get("voice.conversation.id") == "conv-2"
+        ]
+
+        with TraceStore.open(trace_file) as store:
+            result = store.analyze("conv-2")
+
+        assert result.to_dict() == analyze_spans(conv_spans).to_dict()
+        assert result.total_conversations == 1
+        assert result.turn_metrics.interruptions == 1
+
+    def test_iter_spans_by_conversation(self, trace_file):
+        """Test per-conversation lookups return that conversation's spans in order."""
+        build_index(trace_file)
+
+        with TraceStore.open(trace_file) as store:
+            spans = list(store.iter_spans("conv-1"))
+            missing = list(store.iter_spans("conv-404"))
+
+        assert spans == make_spans()[:6]
+        assert missing == []
+
+    def test_round_trips_to_jsonl(self, trace_file):
+        """Test to_jsonl copies every span line back out unchanged."""
+        build_index(trace_file)
+        out = io.BytesIO()
+
+        with TraceStore.open(trace_file) as store:
+            written = store.to_jsonl(out)
+
+        expected = [line.rstrip() for line in trace_file.read_bytes().splitlines() if line.strip()]
+        assert written == len(make_spans())
+        assert out.getvalue().splitlines() == expected
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == make_spans()
+
+    def test_empty_trace_file(self, tmp_path):
+        """Test an empty trace file can be indexed and analyzed."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        build_index(path)
+
+        with TraceStore.open(path) as store:
+            assert len(store) == 0
+            assert store.analyze().total_spans == 0
+            assert list(store.iter_spans()) == []
+
+    def test_compressed_trace_file_is_not_indexed(self, tmp_path):
+        """Test compressed files are rejected and analyzed without an index."""
+        path = tmp_path / "run.jsonl.gz"
+        with gzip.open(path, "wt") as f:
+            f.write("\n".join(json.dumps(span) for span in make_spans()) + "\n")
+
+        with pytest.raises(ValueError, match="cannot be indexed"):
+            build_index(path)
+        assert open_fresh_index(path) is None
+        assert analyze_file(path).to_dict() == analyze_spans(make_spans()).to_dict()
+
+    def test_invalid_json_raises(self, tmp_path):
+        """Test indexing a file with invalid JSON fails without writing an index."""
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"name": "voice.turn"}\nnot json\n')
+
+        with pytest.raises(json.JSONDecodeError):
+            build_index(path)
+        assert not index_path_for(path).exists()
+
+
+class TestStaleIndex:
+    """Tests for detecting indexes that no longer match their trace file."""
+
+    def test_modified_trace_file_is_stale(self, trace_file):
+        """Test appending to the trace file invalidates the index."""
+        build_index(trace_file)
+        with trace_file.open("a") as f:
+            f.write(json.dumps({"name": "voice.turn", "attributes": {}}) + "\n")
+
+        with pytest.raises(StaleIndexError):
+            TraceStore.open(trace_file)
+        assert open_fresh_index(trace_file) is None
+
+    def test_touched_trace_file_is_stale(self, trace_file):
+        """Test a changed modification time invalidates the index."""
+        build_index(trace_file)
+        stat = trace_file.stat()
+        os.utime(trace_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert open_fresh_index(trace_file) is None
+
+    def test_not_an_index(self, trace_file):
+        """Test a file that is not an index is rejected."""
+        index_path_for(trace_file).write_bytes(b"garbage")
+
+        with pytest.raises(StaleIndexError):
+            TraceStore.open(trace_file)
+
+    def test_missing_index(self, trace_file):
+        """Test open_fresh_index returns None without an index."""
+        assert open_fresh_index(trace_file) is None
+
+
+class TestAnalyzeFileWithIndex:
+    """Tests for analyze_file picking up indexes."""
+
+    def test_analyze_file_uses_fresh_index(self, trace_file, monkeypatch):
+        """Test analyze_file reads an up-to-date index instead of the JSONL."""
+        build_index(trace_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("JSONL should not be parsed")
+
+        monkeypatch.setattr("voiceobs.analyzer.iter_jsonl", fail)
+
+        assert analyze_file(trace_file).total_spans == len(make_spans())
+
+    def test_analyze_file_ignores_stale_index(self, trace_file):
+        """Test analyze_file falls back to parsing when the index is stale."""
+        build_index(trace_file)
+        with trace_file.open("a") as f:
+            f.write(json.dumps({"name": "voice.turn", "attributes": {}}) + "\n")
+
+        assert analyze_file(trace_file).total_spans == len(make_spans()) + 1
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_analyze_file_conversation_filter(self, trace_file, indexed):
+        """Test conversation filtering gives the same result with or without an index."""
+        if indexed:
+            build_index(trace_file)
+
+        result = analyze_file(trace_file, conversation_id="conv-1")
+
+        assert result.total_spans == 6
+        assert result.conversation_ids == {"conv-1"}
+        assert result.eval_metrics.intent_correct_count == 1